@@ -8,6 +8,10 @@ from flask import Flask
 from flask_login import LoginManager
 from flask_sqlalchemy import SQLAlchemy
 from importlib import import_module
+from apps.log import configure_logging, register_logging
+
+# create_app 이전에 import 되는 모듈(data_cache 등)의 로그도 같은 형식으로 출력
+configure_logging()
 
 db = SQLAlchemy()
 login_manager = LoginManager()
@@ -16,6 +20,18 @@ def register_extensions(app):
     db.init_app(app)
     login_manager.init_app(app)
 
+def register_commands(app):
+    from apps.output_store import load_outputs_command
+    app.cli.add_command(load_outputs_command)
+
+def register_metrics(app):
+    from apps.metrics import register_metrics as register
+    register(app)
+
+def register_profiling(app):
+    from apps.profiling import register_profiling as register
+    register(app)
+
 def register_blueprints(app):
     for module_name in ('authentication', 'home', 'dyn_dt', 'charts', ):
         module = import_module('apps.{}.routes'.format(module_name))
@@ -38,8 +54,12 @@ def create_app(config):
     app = Flask(__name__, static_url_path=static_prefix, template_folder=TEMPLATES_FOLDER, static_folder=STATIC_FOLDER)
 
     app.config.from_object(config)
+    register_logging(app)
     register_extensions(app)
     register_blueprints(app)
+    register_commands(app)
+    register_metrics(app)
+    register_profiling(app)
     app.register_blueprint(github_blueprint, url_prefix="/login")    
     app.register_blueprint(google_blueprint, url_prefix="/login")    
     return app
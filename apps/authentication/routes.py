@@ -123,6 +123,14 @@ def logout():
     return redirect(url_for('authentication_blueprint.login'))
 
 
+@blueprint.route('/auth-check')
+def auth_check():
+    """nginx auth_request 용 로그인 확인 (정적 JSON API 제공 전 세션 검사)"""
+    if current_user.is_authenticated:
+        return '', 204
+    return '', 401
+
+
 # Errors
 
 @login_manager.unauthorized_handler
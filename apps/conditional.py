@@ -0,0 +1,73 @@
+# -*- encoding: utf-8 -*-
+"""
+Conditional GET (ETag / Last-Modified) for data API responses
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from flask import request, make_response
+from apps.data_cache import data_cache
+
+# 프로세스(배포) 단위 식별자: 코드가 바뀌어 재시작되면 데이터가 같아도 ETag가 달라진다
+# (gunicorn preload_app 사용 시 마스터에서 한 번 계산되어 모든 워커가 공유)
+ETAG_SALT = str(time.time_ns())
+
+# 브라우저는 응답을 저장하되 매번 서버에 재검증 (로그인 사용자 전용 데이터이므로 공유 캐시 금지)
+CACHE_CONTROL = {'private': True, 'no_cache': True}
+
+
+def _build_etag(version):
+    """데이터 버전 + 요청 경로/쿼리로 강한 ETag 계산"""
+    key = f"{ETAG_SALT}\n{version}\n{request.full_path}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _apply_validators(response, etag, last_modified):
+    """응답에 ETag / Last-Modified / Cache-Control 헤더 설정"""
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.private = CACHE_CONTROL['private']
+    response.cache_control.no_cache = CACHE_CONTROL['no_cache']
+    return response
+
+
+def _is_not_modified(etag, last_modified):
+    """If-None-Match 우선, 없으면 If-Modified-Since로 변경 여부 판단"""
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def conditional_data(view):
+    """
+    데이터 API용 조건부 GET 데코레이터
+
+    월별 데이터 버전(스냅샷 버전 또는 결과 파일 mtime)과 요청 파라미터로 ETag를 만들고,
+    클라이언트가 같은 ETag를 보내면 프레임을 읽기 전에 304를 반환한다.
+    URL 변수 month가 없는 API(월 목록 등)는 전체 월 버전을 사용한다.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        data_version = data_cache.get_data_version(kwargs.get('month'))
+        if data_version is None:
+            # 데이터가 없으면 검증자 없이 그대로 응답
+            return view(*args, **kwargs)
+
+        version, mtime = data_version
+        etag = _build_etag(version)
+        last_modified = datetime.fromtimestamp(mtime, tz=timezone.utc)
+
+        if _is_not_modified(etag, last_modified):
+            return _apply_validators(make_response('', 304), etag, last_modified)
+
+        response = make_response(view(*args, **kwargs))
+        # 오류 응답은 캐시하지 않음
+        if response.status_code == 200:
+            _apply_validators(response, etag, last_modified)
+        return response
+
+    return wrapper
@@ -73,8 +73,13 @@ class Config(object):
 
     if USE_SQLITE:
 
-        # This will create a file in <app> FOLDER
-        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(BASE_DIR, 'db.sqlite3')
+        # This will create a file in <app> FOLDER (SQLITE_PATH 로 위치 변경 가능, 예: 부하 테스트용 임시 DB)
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.getenv('SQLITE_PATH', os.path.join(BASE_DIR, 'db.sqlite3'))
+
+    # 파이프라인 결과 분석용 SQL 저장소 (apps/output_store.py, 기본값: 내장 SQLite)
+    SQLALCHEMY_BINDS = {
+        'outputs': os.getenv('OUTPUT_STORE_URI', 'sqlite:///' + os.path.join(BASE_DIR, 'outputs.sqlite3'))
+    }
 
     DYNAMIC_DATATB = {
         "products": "apps.models.Product"
@@ -83,6 +88,27 @@ class Config(object):
     CDN_DOMAIN = os.getenv('CDN_DOMAIN')
     CDN_HTTPS = os.getenv('CDN_HTTPS', True)
 
+    # 웹 로그 레벨 (apps/log.py)
+    # LOG_LEVELS: 모듈별 레벨 (예: apps.home.routes=DEBUG,apps.data_cache=WARNING)
+    LOG_LEVEL  = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+
+    # /metrics 지표 엔드포인트 (apps/metrics.py)
+    # 기본값은 프록시(nginx)를 거치지 않은 로컬(METRICS_ALLOWED_IPS) 스크레이퍼 요청만 허용
+    # METRICS_TOKEN 을 설정하면 주소와 관계없이 Authorization: Bearer <token> 요청만 허용
+    METRICS_ENABLED       = (os.getenv('METRICS_ENABLED', 'True') == 'True')
+    METRICS_ALLOW_PROXIED = (os.getenv('METRICS_ALLOW_PROXIED', 'False') == 'True')
+    METRICS_ALLOWED_IPS   = os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1')
+    METRICS_TOKEN         = os.getenv('METRICS_TOKEN', None)
+
+    # 요청 단위 프로파일링 (apps/profiling.py, X-Profile: 1 헤더 또는 ?_profile=1)
+    # PROFILING_ADMINS: 프로파일링을 요청할 수 있는 사용자명 (쉼표 구분)
+    PROFILING_ENABLED         = (os.getenv('PROFILING_ENABLED', 'False') == 'True')
+    PROFILING_ADMINS          = os.getenv('PROFILING_ADMINS', '')
+    PROFILING_DIR             = os.getenv('PROFILING_DIR', os.path.join(BASE_DIR.parent, 'logs', 'profiles'))
+    PROFILING_KEEP            = int(os.getenv('PROFILING_KEEP', '50'))
+    PROFILING_SAMPLE_INTERVAL = float(os.getenv('PROFILING_SAMPLE_INTERVAL', '0.005'))
+
 class ProductionConfig(Config):
     DEBUG = False
 
@@ -94,6 +120,8 @@ class ProductionConfig(Config):
 class DebugConfig(Config):
     DEBUG = True
 
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
+
 # Load all possible configurations
 config_dict = {
     'Production': ProductionConfig,
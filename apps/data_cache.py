@@ -3,495 +3,656 @@
 Data caching module for subsidiary and other data
 """
 
+import logging
 import os
+import threading
+import time
 import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
+from apps.frame_store import frame_store
+from apps.metrics import metrics
+from apps.headcount import HeadcountCube
+from apps.trends import LogicTimeSeries
+from partition_catalog import CATALOG_FILE, read_catalog, latest_partitions
+from metrics_cube import LOGIC_CUBE_FILE, LOGIC_TIMESERIES_FILE, SUM_COLUMNS, build_logic_cube, rollup, derive_rates
 
-class DataCache:
-    """데이터 캐싱 클래스"""
+logger = logging.getLogger(__name__)
+
+# 파이프라인 스냅샷 설정 (snapshot_publisher.py 와 동일한 이름을 사용해야 함)
+SNAPSHOT_DIR_NAME = "snapshots"
+POINTER_FILE_NAME = "CURRENT"
+
+# 스냅샷 포인터 감시 주기 (초)
+SNAPSHOT_POLL_INTERVAL = float(os.getenv('DATA_SNAPSHOT_POLL_INTERVAL', '5'))
+
+class ReadWriteLock:
+    """
+    읽기/쓰기 락
+    여러 요청 스레드가 동시에 읽을 수 있고, 캐시 교체(쓰기)는 단독으로 수행된다.
+    쓰기 대기 중에는 새 읽기를 막아 교체가 무한정 밀리지 않도록 한다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_lock(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class SingleFlight:
+    """
+    키별 단일 로딩
+    같은 키로 동시에 들어온 요청은 첫 번째 요청의 로딩 결과를 함께 기다린다.
+    """
 
     def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = {'event': threading.Event(), 'result': None, 'error': None}
+                self._calls[key] = call
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            call['event'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = fn()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call['event'].set()
+
+
+class DataCache:
+    """
+    데이터 캐싱 클래스
+
+    Args:
+        months: 로드할 월 목록 (정적 API 렌더링처럼 특정 월만 필요할 때, 없으면 데이터가 있는 모든 월)
+    """
+
+    def __init__(self, months=None):
         self.subsidiary_cache = {}
         self.region_cache = {}
         self.logic_region_cache = {}
         self.logic_global_cache = {}
+        self.headcount_cache = {}
+        self.metrics_cube_cache = {}
+        self._timeseries = None
+        self.course_aggregate_cache = {}
+        self.month_frame_cache = {}
+        self.month_dirs = {}
+        self._pointer_states = {}
+        # 파티션 카탈로그: {월: 최신 년도 파티션} (카탈로그가 없으면 None → 이전 data/<월> 구조)
+        self._partitions = None
+        self._catalog_mtime = None
+        self._watcher_thread = None
+        self._scoped_months = set(months) if months is not None else None
+        # 동시 요청 보호: 읽기는 공유, 캐시 교체는 단독 / 같은 월의 로딩은 한 번만
+        self._rw_lock = ReadWriteLock()
+        self._single_flight = SingleFlight()
         # 상대 경로로 변경 (실행 위치 기준)
         # __file__은 apps/data_cache.py이므로 parent.parent가 프로젝트 root
+        # DASHBOARD_DATA_DIR 이 있으면 그 경로를 데이터 루트로 사용 (벤치마크 / 부하 테스트용 합성 데이터)
         base_dir = Path(__file__).resolve().parent.parent
-        self.base_path = base_dir / "data"
-        self._load_subsidiary_data()
-        self._load_region_data()
-        self._load_logic_region_data()
-        self._load_logic_global_data()
-
-    def _load_subsidiary_data(self):
-        """모든 월의 subsidiary 데이터를 로드"""
-        print("Loading subsidiary data for all months...")
+        self.base_path = Path(os.getenv('DASHBOARD_DATA_DIR', base_dir / "data"))
+        self._load_all_months()
 
-        for month in range(1, 13):
-            month_folder = str(month)
-            csv_file = self.base_path / month_folder / "hr_index_final.csv"
+    # ==================== 파티션 카탈로그 ====================
 
-            if csv_file.exists():
-                try:
-                    df = pd.read_csv(csv_file)
-                    if 'Final Sub.' in df.columns:
-                        # NaN 값 제거하고 unique 값만 추출
-                        subsidiaries = df['Final Sub.'].dropna().unique().tolist()
-                        # 빈 문자열 제거
-                        subsidiaries = [s for s in subsidiaries if s and str(s).strip()]
-                        self.subsidiary_cache[month] = sorted(subsidiaries)
-                        print(f"Loaded {len(subsidiaries)} subsidiaries for {month}월")
-                    else:
-                        print(f"Warning: 'Final Sub.' column not found in {csv_file}")
-                        self.subsidiary_cache[month] = []
-                except Exception as e:
-                    print(f"Error loading {csv_file}: {e}")
-                    self.subsidiary_cache[month] = []
-            else:
-                print(f"File not found: {csv_file}")
-                self.subsidiary_cache[month] = []
+    def _refresh_catalog(self):
+        """
+        catalog.json 이 바뀌었으면 다시 읽어 월별 파티션 갱신
 
-        print(f"Subsidiary cache loaded for {len(self.subsidiary_cache)} months")
-
-    def _load_region_data(self):
-        """모든 월의 region 데이터를 로드"""
-        print("Loading region data for all months...")
+        Returns:
+            set: 파티션(년도/경로)이 바뀐 월
+        """
+        catalog_file = self.base_path / CATALOG_FILE
+        try:
+            mtime = catalog_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self._catalog_mtime:
+            return set()
+
+        previous = self._partitions or {}
+        partitions = read_catalog(str(self.base_path)) if mtime is not None else None
+        self._partitions = latest_partitions(partitions) if partitions is not None else None
+        self._catalog_mtime = mtime
+
+        current = self._partitions or {}
+        changed = {month for month in set(previous) | set(current) if previous.get(month) != current.get(month)}
+        logger.info("파티션 카탈로그 로드: %s", sorted(current) if self._partitions is not None else '없음 (data/<월> 구조)')
+        return changed
+
+    def _known_months(self):
+        """로드 대상 월 (카탈로그가 있으면 카탈로그의 월만, 없으면 1~12월 폴더, months 지정 시 그 중 지정한 월만)"""
+        if self._partitions is not None:
+            months = sorted(self._partitions)
+        else:
+            months = list(range(1, 13))
+        if self._scoped_months is not None:
+            months = [month for month in months if month in self._scoped_months]
+        return months
+
+    def _is_known_month(self, month):
+        """캐시에 올릴 수 있는 월인지 (1~12월 중 카탈로그에 있거나, 카탈로그가 없으면 월 폴더가 있는 월)"""
+        if not isinstance(month, int) or isinstance(month, bool) or not 1 <= month <= 12:
+            return False
+        if self._scoped_months is not None and month not in self._scoped_months:
+            return False
+        if self._partitions is not None:
+            return month in self._partitions
+        return self._month_base_dir(month).is_dir()
+
+    def _month_base_dir(self, month):
+        """월의 파티션 디렉토리 (카탈로그에 없으면 이전 data/<월> 폴더)"""
+        partition = (self._partitions or {}).get(month)
+        if partition is not None:
+            return self.base_path / partition['path']
+        return self.base_path / str(month)
+
+    def get_partitions(self):
+        """데이터가 있는 월의 파티션 목록 [{'year', 'month'}] (카탈로그가 없으면 year 는 None)"""
+        partitions = self._partitions or {}
+        return [
+            {'year': partitions[month]['year'] if month in partitions else None, 'month': month}
+            for month in sorted(self.get_all_months_with_data())
+        ]
+
+    # ==================== 스냅샷 경로 ====================
+
+    def _get_pointer_state(self, month):
+        """월별 CURRENT 포인터의 (mtime, 버전) 반환 (포인터가 없으면 None)"""
+        pointer_file = self._month_base_dir(month) / POINTER_FILE_NAME
+        try:
+            mtime = pointer_file.stat().st_mtime_ns
+            version = pointer_file.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        return (mtime, version)
+
+    def _resolve_month_dir(self, month, pointer_state=None):
+        """포인터가 가리키는 스냅샷 디렉토리 반환 (스냅샷이 없으면 기존 월 폴더)"""
+        month_dir = self._month_base_dir(month)
+        if pointer_state and pointer_state[1]:
+            snapshot_dir = month_dir / SNAPSHOT_DIR_NAME / pointer_state[1]
+            if snapshot_dir.is_dir():
+                return snapshot_dir
+            logger.warning("snapshot not found: %s", snapshot_dir)
+        return month_dir
+
+    def get_month_dir(self, month):
+        """특정 월의 현재 데이터 디렉토리 반환 (캐시와 같은 스냅샷 기준)"""
+        with self._rw_lock.read_lock():
+            month_dir = self.month_dirs.get(month)
+        if month_dir is None:
+            month_dir = self._resolve_month_dir(month, self._get_pointer_state(month))
+        return month_dir
+
+    def get_data_version(self, month=None):
+        """
+        응답 캐시 검증(ETag/Last-Modified)용 데이터 버전 반환
+
+        스냅샷은 한 번 발행되면 바뀌지 않으므로 버전명을 그대로 사용하고,
+        스냅샷이 없는 월 폴더는 결과 파일의 mtime/크기로 버전을 만든다.
+        month가 None이면 전체 월 기준 버전 (월 목록 API 용).
+
+        Returns:
+            tuple: (버전 문자열, 최종 수정 시각 epoch 초) / 데이터가 없으면 None
+        """
+        if month is None:
+            month_versions = [(m, self.get_data_version(m)) for m in self._known_months()]
+            month_versions = [(m, v) for m, v in month_versions if v is not None]
+            if not month_versions:
+                return None
+            version = '|'.join(f"{m}:{v[0]}" for m, v in month_versions)
+            return (version, max(v[1] for _, v in month_versions))
+
+        with self._rw_lock.read_lock():
+            pointer_state = self._pointer_states.get(month)
+            month_dir = self.month_dirs.get(month)
+        if month_dir is None:
+            pointer_state = self._get_pointer_state(month)
+            month_dir = self._resolve_month_dir(month, pointer_state)
+
+        if pointer_state and month_dir.name == pointer_state[1]:
+            return (f"snapshot-{pointer_state[1]}", pointer_state[0] / 1e9)
+
+        # 스냅샷이 없는 월 폴더: 디렉토리 스캔 없이 결과 파일 stat만 확인
+        try:
+            stats = [csv_file.stat() for csv_file in month_dir.glob('*.csv')]
+        except OSError:
+            return None
+        if not stats:
+            return None
+        mtime_ns = max(s.st_mtime_ns for s in stats)
+        total_size = sum(s.st_size for s in stats)
+        return (f"files-{len(stats)}-{mtime_ns}-{total_size}", mtime_ns / 1e9)
+
+    # ==================== 월별 캐시 구성 ====================
+
+    def _load_all_months(self):
+        """모든 월의 캐시를 로드 (전부 계산한 뒤 쓰기 락 안에서 한 번에 교체)"""
+        logger.info("Loading data cache for all months...")
+
+        # 카탈로그에 등록된 파티션만 로드 (이력이 늘어나도 시작 시간은 월 수에 비례)
+        self._refresh_catalog()
+        month_states = {
+            month: self._single_flight.do(('month', month), lambda m=month: self._build_month(m))
+            for month in self._known_months()
+        }
+        with self._rw_lock.write_lock():
+            for month, month_state in month_states.items():
+                self._swap_month(month, month_state)
+
+        logger.info("Data cache loaded for %s months", len(self.subsidiary_cache))
+
+    def _build_month(self, month, pointer_state=None):
+        """특정 월의 모든 캐시 값을 새로 계산 (기존 캐시는 건드리지 않음)"""
+        if pointer_state is None:
+            pointer_state = self._get_pointer_state(month)
+        month_dir = self._resolve_month_dir(month, pointer_state)
+
+        hr_df = self._read_month_csv(month_dir / "hr_index_final.csv")
+        metrics_cube = self._build_metrics_cube(month_dir, month)
+
+        return {
+            'pointer_state': pointer_state,
+            'month_dir': month_dir,
+            'subsidiaries': self._build_unique_list(hr_df, 'Final Sub.', month),
+            'regions': self._build_unique_list(hr_df, 'Final Region', month),
+            'headcount': HeadcountCube.from_frame(hr_df),
+            'metrics_cube': metrics_cube,
+            'logic_region': self._build_logic_region_data(metrics_cube, month),
+            'logic_global': self._build_logic_global_data(metrics_cube, month),
+        }
+
+    def _swap_month(self, month, month_state):
+        """새로 계산한 월 캐시를 한 번에 교체 (호출자가 쓰기 락을 잡고 있어야 함)"""
+        self.month_dirs[month] = month_state['month_dir']
+        self.subsidiary_cache[month] = month_state['subsidiaries']
+        self.region_cache[month] = month_state['regions']
+        self.logic_region_cache[month] = month_state['logic_region']
+        self.logic_global_cache[month] = month_state['logic_global']
+        self._pointer_states[month] = month_state['pointer_state']
+        self.headcount_cache[month] = month_state['headcount']
+        self.metrics_cube_cache[month] = month_state['metrics_cube']
+        self.course_aggregate_cache.pop(month, None)
+        self.month_frame_cache.pop(month, None)
+
+    def _read_month_csv(self, csv_file, columns=None):
+        """월별 CSV 로드 (파일이 없거나 읽기 실패 시 None)"""
+        if not csv_file.exists():
+            logger.warning("File not found: %s", csv_file)
+            return None
+        try:
+            return frame_store.read_frame(csv_file, columns=columns)
+        except Exception as e:
+            logger.exception("Error loading %s: %s", csv_file, e)
+            return None
 
-        for month in range(1, 13):
-            month_folder = str(month)
-            csv_file = self.base_path / month_folder / "hr_index_final.csv"
+    def _build_unique_list(self, df, column, month):
+        """hr_index_final의 특정 컬럼 고유값 목록 (subsidiary / region)"""
+        if df is None:
+            return []
+        if column not in df.columns:
+            logger.warning("'%s' column not found for %s월", column, month)
+            return []
 
-            if csv_file.exists():
-                try:
-                    df = pd.read_csv(csv_file)
-                    if 'Final Region' in df.columns:
-                        # NaN 값 제거하고 unique 값만 추출
-                        regions = df['Final Region'].dropna().unique().tolist()
-                        # 빈 문자열 제거
-                        regions = [r for r in regions if r and str(r).strip()]
-                        self.region_cache[month] = sorted(regions)
-                        print(f"Loaded {len(regions)} regions for {month}월")
-                    else:
-                        print(f"Warning: 'Final Region' column not found in {csv_file}")
-                        self.region_cache[month] = []
-                except Exception as e:
-                    print(f"Error loading {csv_file}: {e}")
-                    self.region_cache[month] = []
-            else:
-                print(f"File not found: {csv_file}")
-                self.region_cache[month] = []
+        # NaN 값 제거하고 unique 값만 추출
+        values = df[column].dropna().unique().tolist()
+        # 빈 문자열 제거
+        values = [v for v in values if v and str(v).strip()]
+        logger.debug("Loaded %s '%s' values for %s월", len(values), column, month)
+        return sorted(values)
+
+    def _build_metrics_cube(self, month_dir, month):
+        """
+        logic_cube.csv 로드
+        큐브 파일이 없는 이전 결과는 logic.csv 에서 한 번 생성 (make_logic.create_logic_cube 와 같은 규칙)
+        """
+        cube_file = month_dir / LOGIC_CUBE_FILE
+        if cube_file.exists():
+            return self._read_month_csv(cube_file)
+
+        logic_df = self._read_month_csv(month_dir / "logic.csv")
+        if logic_df is None:
+            return None
 
-        print(f"Region cache loaded for {len(self.region_cache)} months")
+        try:
+            logger.debug("%s 없음, logic.csv 에서 생성: %s", LOGIC_CUBE_FILE, month_dir)
+            return build_logic_cube(logic_df)
+        except Exception as e:
+            logger.exception("Error building metrics cube for %s월: %s", month, e)
+            return None
 
-    def _load_logic_region_data(self):
-        """모든 월의 logic.csv 지역별 데이터를 로드"""
-        print("Loading logic region data for all months...")
+    def _build_logic_region_data(self, cube, month):
+        """지표 큐브를 지역 단위로 합산하여 지역별 logic 데이터 계산"""
+        if cube is None:
+            return {}
 
-        for month in range(1, 13):
-            month_folder = str(month)
-            csv_file = self.base_path / month_folder / "logic.csv"
+        try:
+            month_data = {}
+            for region, totals in rollup(cube, 'Final Region').to_dict('index').items():
+                region_data = {col: totals[col] for col in SUM_COLUMNS}
+                region_data.update(derive_rates(totals))
+                month_data[region] = region_data
+                logger.debug("%s월 %s 지역 데이터: %s 컬럼 (Score 평균: %.2f점)", month, region, len(region_data), region_data['Score'])
 
-            if csv_file.exists():
-                try:
-                    df = pd.read_csv(csv_file)
-                    print(f"Debug - {month}월 logic.csv 로드 완료: {len(df)} 행")
-
-                    # Final Region 컬럼이 있는지 확인
-                    if 'Final Region' not in df.columns:
-                        print(f"Warning: 'Final Region' column not found in {csv_file}")
-                        self.logic_region_cache[month] = {}
-                        continue
-
-                    # sum할 컬럼들 정의
-                    sum_columns = [
-                        'Planned_Courses', 'Completed_Courses', 'Planned_Hours', 'Actual_Hours',
-                        'New_Hire_Completed', 'New_Hire_Not_Completed', 'New_Hire_Pending', 'New_Hire_Total',
-                        'EIP_Completed', 'EIP_Not_Completed', 'EIP_Total',
-                        'GLP_Completed', 'GLP_Not_Completed', 'GLP_Total',
-                        'New_Leader_Completed', 'New_Leader_Not_Completed', 'New_Leader_Total'
-                    ]
-
-                    # 존재하는 컬럼만 선택
-                    available_columns = [col for col in sum_columns if col in df.columns]
-                    print(f"Debug - {month}월 사용 가능한 컬럼: {available_columns}")
-
-                    # Final Region으로 그룹핑하고 sum 계산
-                    region_groups = df.groupby('Final Region')[available_columns].sum()
-
-                    # 모든 컬럼 정의 (29개 컬럼: 기존 25개 + New_Leader 4개)
-                    all_columns = [
-                        'Planned_Courses', 'Completed_Courses', 'Planned_Hours', 'Actual_Hours',
-                        'New_Hire_Completed', 'New_Hire_Not_Completed', 'New_Hire_Pending', 'New_Hire_Total',
-                        'EIP_Completed', 'EIP_Not_Completed', 'EIP_Total',
-                        'GLP_Completed', 'GLP_Not_Completed', 'GLP_Total',
-                        'New_Leader_Completed', 'New_Leader_Not_Completed', 'New_Leader_Total',
-                        'Course_Completion_Rate', 'Hours_Completion_Rate', 'New_Hire_Completion_Rate',
-                        'EIP_Completion_Rate', 'GLP_Completion_Rate', 'New_Leader_Completion_Rate',
-                        'JAM_Member_Rate', 'Annual_Plan_Setup_Rate', 'New_LMS_Course_Rate',
-                        'LMS_Mission_Rate', 'Global_LD_Council_Rate', 'Infra_Index_Response_Rate'
-                    ]
-
-                    # 각 지역별로 데이터 처리
-                    month_data = {}
-                    for region in region_groups.index:
-                        # 기본 sum 데이터 가져오기
-                        region_sum_data = region_groups.loc[region].to_dict()
-
-                        # 모든 컬럼을 0으로 초기화
-                        region_data = {col: 0 for col in all_columns}
-
-                        # sum 컬럼들 값을 설정
-                        for col in available_columns:
-                            if col in region_sum_data:
-                                region_data[col] = region_sum_data[col]
-
-                        # 비율 계산 (소수 둘째자리에서 반올림)
-                        # Course_Completion_Rate = Completed_Courses / Planned_Courses * 100
-                        if region_data['Planned_Courses'] > 0:
-                            region_data['Course_Completion_Rate'] = round(region_data['Completed_Courses'] / region_data['Planned_Courses'] * 100, 2)
-
-                        # Hours_Completion_Rate = Actual_Hours / Planned_Hours * 100
-                        if region_data['Planned_Hours'] > 0:
-                            region_data['Hours_Completion_Rate'] = round(region_data['Actual_Hours'] / region_data['Planned_Hours'] * 100, 2)
-
-                        # New_Hire_Completion_Rate = (New_Hire_Completed + New_Hire_Pending) / New_Hire_Total * 100
-                        if region_data['New_Hire_Total'] > 0:
-                            region_data['New_Hire_Completion_Rate'] = round((region_data['New_Hire_Completed'] + region_data['New_Hire_Pending']) / region_data['New_Hire_Total'] * 100, 2)
-
-                        # EIP_Completion_Rate = EIP_Completed / EIP_Total * 100
-                        if region_data['EIP_Total'] > 0:
-                            region_data['EIP_Completion_Rate'] = round(region_data['EIP_Completed'] / region_data['EIP_Total'] * 100, 2)
-
-                        # GLP_Completion_Rate = GLP_Completed / GLP_Total * 100
-                        if region_data['GLP_Total'] > 0:
-                            region_data['GLP_Completion_Rate'] = round(region_data['GLP_Completed'] / region_data['GLP_Total'] * 100, 2)
-
-                        # New_Leader_Completion_Rate = New_Leader_Completed / New_Leader_Total * 100
-                        if region_data['New_Leader_Total'] > 0:
-                            region_data['New_Leader_Completion_Rate'] = round(region_data['New_Leader_Completed'] / region_data['New_Leader_Total'] * 100, 2)
-
-                        # 6개 Y/N 컬럼의 Y 비율 계산
-                        # 해당 지역의 법인 수
-                        region_df = df[df['Final Region'] == region]
-                        total_subsidiaries = len(region_df)
-
-                        if total_subsidiaries > 0:
-                            # JAM Member
-                            if 'JAM Member' in df.columns:
-                                y_count = len(region_df[region_df['JAM Member'].astype(str).str.upper() == 'Y'])
-                                region_data['JAM_Member_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-
-                            # Annual Plan Setup
-                            if 'Annual Plan Setup' in df.columns:
-                                y_count = len(region_df[region_df['Annual Plan Setup'].astype(str).str.upper() == 'Y'])
-                                region_data['Annual_Plan_Setup_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-
-                            # New LMS Course
-                            if 'New LMS Course' in df.columns:
-                                y_count = len(region_df[region_df['New LMS Course'].astype(str).str.upper() == 'Y'])
-                                region_data['New_LMS_Course_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-
-                            # LMS Mission
-                            if 'LMS Mission' in df.columns:
-                                y_count = len(region_df[region_df['LMS Mission'].astype(str).str.upper() == 'Y'])
-                                region_data['LMS_Mission_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-
-                            # Global L&D Council
-                            if 'Global L&D Council' in df.columns:
-                                y_count = len(region_df[region_df['Global L&D Council'].astype(str).str.upper() == 'Y'])
-                                region_data['Global_LD_Council_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-
-                            # Infra index response
-                            if 'Infra index response' in df.columns:
-                                y_count = len(region_df[region_df['Infra index response'].astype(str).str.upper() == 'Y'])
-                                region_data['Infra_Index_Response_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-
-                        # Score 평균 계산
-                        if 'Score' in df.columns:
-                            region_scores = region_df['Score'].dropna()
-                            if len(region_scores) > 0:
-                                region_data['Score'] = round(region_scores.mean(), 2)
-                            else:
-                                region_data['Score'] = 0
-                        else:
-                            region_data['Score'] = 0
-
-                        month_data[region] = region_data
-                        print(f"Debug - {month}월 {region} 지역 데이터: {len(region_data)} 컬럼 (모든 컬럼 포함, Score 평균: {region_data.get('Score', 0):.2f}점)")
-
-                    self.logic_region_cache[month] = month_data
-                    print(f"Debug - {month}월 logic 지역 캐시 완료: {len(month_data)} 지역")
+            logger.debug("%s월 logic 지역 캐시 완료: %s 지역", month, len(month_data))
+            return month_data
 
-                except Exception as e:
-                    print(f"Error loading {csv_file}: {e}")
-                    self.logic_region_cache[month] = {}
-            else:
-                print(f"File not found: {csv_file}")
-                self.logic_region_cache[month] = {}
+        except Exception as e:
+            logger.exception("Error building logic region data for %s월: %s", month, e)
+            return {}
 
-        print(f"Logic region cache loaded for {len(self.logic_region_cache)} months")
+    def _build_logic_global_data(self, cube, month):
+        """지표 큐브 전체 합계로 Global logic 데이터 계산"""
+        if cube is None:
+            return {}
 
-    def _load_logic_global_data(self):
-        """모든 월의 logic 데이터를 Global 단위로 로드"""
-        print("Loading logic global data for all months...")
+        try:
+            totals = rollup(cube).to_dict()
+            global_data = {col: totals[col] for col in SUM_COLUMNS}
+            global_data.update(derive_rates(totals))
 
-        for month in range(1, 13):
-            month_folder = str(month)
-            csv_file = self.base_path / month_folder / "logic.csv"
+            logger.debug("%s월 logic global 캐시 완료: %s 컬럼 (Score 평균: %.2f점)", month, len(global_data), global_data['Score'])
+            return global_data
 
-            if csv_file.exists():
+        except Exception as e:
+            logger.exception("Error building logic global data for %s월: %s", month, e)
+            return {}
+
+    # ==================== 스냅샷 감시 ====================
+
+    def refresh_month(self, month):
+        """
+        특정 월의 캐시를 백그라운드에서 재구성한 뒤 교체
+        요청 처리 중에는 기존 캐시가 그대로 사용되며, 계산이 끝난 뒤 한 번에 교체된다
+        """
+        month_state = self._single_flight.do(('month', month), lambda: self._build_month(month))
+        with self._rw_lock.write_lock():
+            self._swap_month(month, month_state)
+        logger.info("%s월 캐시 갱신 완료: %s", month, month_state['month_dir'])
+
+    def check_for_updates(self):
+        """카탈로그와 각 월의 CURRENT 포인터를 확인하여 변경된 월만 재구성"""
+        refreshed = []
+        changed_partitions = self._refresh_catalog()
+        for month in self._known_months():
+            pointer_state = self._get_pointer_state(month)
+            with self._rw_lock.read_lock():
+                changed = month in changed_partitions or pointer_state != self._pointer_states.get(month)
+            if changed:
                 try:
-                    df = pd.read_csv(csv_file)
-                    print(f"Debug - {month}월 logic.csv 로드 완료: {len(df)} 행")
-
-                    # 모든 데이터를 하나의 그룹으로 합치기 (Global)
-                    # 합계할 컬럼들
-                    sum_columns = [
-                        'Planned_Courses', 'Completed_Courses', 'Planned_Hours', 'Actual_Hours',
-                        'New_Hire_Completed', 'New_Hire_Not_Completed', 'New_Hire_Pending', 'New_Hire_Total',
-                        'EIP_Completed', 'EIP_Not_Completed', 'EIP_Total',
-                        'GLP_Completed', 'GLP_Not_Completed', 'GLP_Total',
-                        'New_Leader_Completed', 'New_Leader_Not_Completed', 'New_Leader_Total'
-                    ]
-
-                    # Global 데이터 초기화 (모든 컬럼을 0으로 설정)
-                    global_data = {}
-                    for col in sum_columns:
-                        global_data[col] = 0
-
-                    # 실제 데이터가 있는 경우에만 합계 계산
-                    if not df.empty:
-                        global_sum_data = df[sum_columns].sum()
-                        for col in sum_columns:
-                            global_data[col] = global_sum_data[col]
-
-                    # 비율 계산 (소수 둘째자리에서 반올림)
-                    # Course_Completion_Rate = Completed_Courses / Planned_Courses * 100
-                    if global_data['Planned_Courses'] > 0:
-                        global_data['Course_Completion_Rate'] = round(global_data['Completed_Courses'] / global_data['Planned_Courses'] * 100, 2)
-                    else:
-                        global_data['Course_Completion_Rate'] = 0
-
-                    # Hours_Completion_Rate = Actual_Hours / Planned_Hours * 100
-                    if global_data['Planned_Hours'] > 0:
-                        global_data['Hours_Completion_Rate'] = round(global_data['Actual_Hours'] / global_data['Planned_Hours'] * 100, 2)
-                    else:
-                        global_data['Hours_Completion_Rate'] = 0
-
-                    # New_Hire_Completion_Rate = (New_Hire_Completed + New_Hire_Pending) / New_Hire_Total * 100
-                    if global_data['New_Hire_Total'] > 0:
-                        global_data['New_Hire_Completion_Rate'] = round((global_data['New_Hire_Completed'] + global_data['New_Hire_Pending']) / global_data['New_Hire_Total'] * 100, 2)
-                    else:
-                        global_data['New_Hire_Completion_Rate'] = 0
-
-                    # EIP_Completion_Rate = EIP_Completed / EIP_Total * 100
-                    if global_data['EIP_Total'] > 0:
-                        global_data['EIP_Completion_Rate'] = round(global_data['EIP_Completed'] / global_data['EIP_Total'] * 100, 2)
-                    else:
-                        global_data['EIP_Completion_Rate'] = 0
-
-                    # GLP_Completion_Rate = GLP_Completed / GLP_Total * 100
-                    if global_data['GLP_Total'] > 0:
-                        global_data['GLP_Completion_Rate'] = round(global_data['GLP_Completed'] / global_data['GLP_Total'] * 100, 2)
-                    else:
-                        global_data['GLP_Completion_Rate'] = 0
-
-                    # New_Leader_Completion_Rate = New_Leader_Completed / New_Leader_Total * 100
-                    if global_data['New_Leader_Total'] > 0:
-                        global_data['New_Leader_Completion_Rate'] = round(global_data['New_Leader_Completed'] / global_data['New_Leader_Total'] * 100, 2)
-                    else:
-                        global_data['New_Leader_Completion_Rate'] = 0
-
-                    # 6개 Y/N 컬럼의 Y 비율 계산 (전체 법인 기준)
-                    total_subsidiaries = len(df)
-
-                    if total_subsidiaries > 0:
-                        # JAM Member
-                        if 'JAM Member' in df.columns:
-                            y_count = len(df[df['JAM Member'].astype(str).str.upper() == 'Y'])
-                            global_data['JAM_Member_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-                        else:
-                            global_data['JAM_Member_Rate'] = 0
-
-                        # Annual Plan Setup
-                        if 'Annual Plan Setup' in df.columns:
-                            y_count = len(df[df['Annual Plan Setup'].astype(str).str.upper() == 'Y'])
-                            global_data['Annual_Plan_Setup_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-                        else:
-                            global_data['Annual_Plan_Setup_Rate'] = 0
-
-                        # New LMS Course
-                        if 'New LMS Course' in df.columns:
-                            y_count = len(df[df['New LMS Course'].astype(str).str.upper() == 'Y'])
-                            global_data['New_LMS_Course_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-                        else:
-                            global_data['New_LMS_Course_Rate'] = 0
-
-                        # LMS Mission
-                        if 'LMS Mission' in df.columns:
-                            y_count = len(df[df['LMS Mission'].astype(str).str.upper() == 'Y'])
-                            global_data['LMS_Mission_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-                        else:
-                            global_data['LMS_Mission_Rate'] = 0
-
-                        # Global L&D Council
-                        if 'Global L&D Council' in df.columns:
-                            y_count = len(df[df['Global L&D Council'].astype(str).str.upper() == 'Y'])
-                            global_data['Global_LD_Council_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-                        else:
-                            global_data['Global_LD_Council_Rate'] = 0
-
-                        # Infra index response
-                        if 'Infra index response' in df.columns:
-                            y_count = len(df[df['Infra index response'].astype(str).str.upper() == 'Y'])
-                            global_data['Infra_Index_Response_Rate'] = round(y_count / total_subsidiaries * 100, 2)
-                        else:
-                            global_data['Infra_Index_Response_Rate'] = 0
-
-                    # Score 평균 계산
-                    if 'Score' in df.columns:
-                        global_scores = df['Score'].dropna()
-                        if len(global_scores) > 0:
-                            global_data['Score'] = round(global_scores.mean(), 2)
-                        else:
-                            global_data['Score'] = 0
-                    else:
-                        global_data['Score'] = 0
-
-                    self.logic_global_cache[month] = global_data
-                    print(f"Debug - {month}월 logic global 캐시 완료: {len(global_data)} 컬럼 (Score 평균: {global_data.get('Score', 0):.2f}점)")
-
+                    self.refresh_month(month)
+                    refreshed.append(month)
                 except Exception as e:
-                    print(f"Error loading {csv_file}: {e}")
-                    self.logic_global_cache[month] = {}
-            else:
-                print(f"File not found: {csv_file}")
-                self.logic_global_cache[month] = {}
+                    logger.exception("Error refreshing cache for %s월: %s", month, e)
+        return refreshed
 
-        print(f"Logic global cache loaded for {len(self.logic_global_cache)} months")
+    def _watch_snapshots(self, interval):
+        """포인터 mtime 폴링 루프 (데몬 스레드, 확인 중 오류가 나도 다음 주기에 다시 확인)"""
+        while True:
+            time.sleep(interval)
+            try:
+                self.check_for_updates()
+            except Exception as e:
+                # 반쯤 쓰인 catalog.json 등으로 실패해도 스레드가 죽으면 이후 갱신이 멈추므로 계속 감시
+                logger.exception("Error checking snapshot updates: %s", e)
+
+    def start_snapshot_watcher(self, interval=None):
+        """스냅샷 포인터 감시 스레드 시작 (프로세스당 한 번)"""
+        if self._watcher_thread is not None and self._watcher_thread.is_alive():
+            return self._watcher_thread
+
+        interval = interval or SNAPSHOT_POLL_INTERVAL
+        self._watcher_thread = threading.Thread(
+            target=self._watch_snapshots,
+            args=(interval,),
+            name='data-cache-snapshot-watcher',
+            daemon=True
+        )
+        self._watcher_thread.start()
+        logger.info("스냅샷 감시 시작 (주기: %s초)", interval)
+        return self._watcher_thread
+
+    # ==================== 조회 ====================
+
+    def _get_cached(self, cache, month, default):
+        """읽기 락 안에서 월 캐시 조회 (캐시에 없으면 단일 로딩 후 재조회)"""
+        with self._rw_lock.read_lock():
+            if month in cache:
+                metrics.cache_hit('data_cache')
+                return cache[month]
+        # 캐시에 없으면 파일에서 직접 읽기 (데이터가 없는 월은 캐시하지 않음)
+        metrics.cache_miss('data_cache')
+        if not self._is_known_month(month):
+            return default
+        self._load_month_data(month)
+        with self._rw_lock.read_lock():
+            return cache.get(month, default)
 
     def get_subsidiaries_by_month(self, month):
         """특정 월의 subsidiary 목록 반환"""
-        # 캐시에 없으면 파일에서 직접 읽기
-        if month not in self.subsidiary_cache:
-            self._load_month_data(month)
-        return self.subsidiary_cache.get(month, [])
+        return self._get_cached(self.subsidiary_cache, month, [])
 
     def get_regions_by_month(self, month):
         """특정 월의 region 목록 반환"""
-        # 캐시에 없으면 파일에서 직접 읽기
-        if month not in self.region_cache:
-            self._load_month_data(month)
-        return self.region_cache.get(month, [])
+        return self._get_cached(self.region_cache, month, [])
 
     def get_all_months_with_data(self):
         """데이터가 있는 모든 월 목록 반환"""
-        return [month for month, data in self.subsidiary_cache.items() if data]
+        with self._rw_lock.read_lock():
+            return sorted(month for month, data in self.subsidiary_cache.items() if data)
 
     def has_data_for_month(self, month):
         """특정 월에 데이터가 있는지 확인"""
-        return month in self.subsidiary_cache and len(self.subsidiary_cache[month]) > 0
+        with self._rw_lock.read_lock():
+            return month in self.subsidiary_cache and len(self.subsidiary_cache[month]) > 0
+
+    def get_logic_region_map(self, month):
+        """특정 월의 지역별 logic 데이터 전체 반환 (없으면 None)"""
+        with self._rw_lock.read_lock():
+            return self.logic_region_cache.get(month)
 
     def get_logic_region_data(self, month, region):
         """특정 월과 지역의 logic 데이터 반환"""
-        if month in self.logic_region_cache and region in self.logic_region_cache[month]:
-            return self.logic_region_cache[month][region]
+        with self._rw_lock.read_lock():
+            if month in self.logic_region_cache and region in self.logic_region_cache[month]:
+                return self.logic_region_cache[month][region]
         return None
 
     def get_logic_global_data(self, month):
         """특정 월의 Global logic 데이터 반환"""
-        if month in self.logic_global_cache:
-            return self.logic_global_cache[month]
+        with self._rw_lock.read_lock():
+            if month in self.logic_global_cache:
+                return self.logic_global_cache[month]
         return None
 
-    def get_subsidiary_summary_data(self, month):
-        """특정 월의 Subsidiary 요약 데이터 반환"""
-        month_folder = str(month)
-        csv_file = self.base_path / month_folder / "hr_index_final.csv"
+    def get_headcount(self, month):
+        """특정 월의 인원 집계(HeadcountCube) 반환 (hr_index_final이 없으면 None)"""
+        return self._get_cached(self.headcount_cache, month, None)
 
-        if not csv_file.exists():
-            return []
+    def get_metrics_cube(self, month):
+        """특정 월의 지표 큐브 반환 (logic.csv 가 없으면 None, 호출 측에서 수정 금지)"""
+        return self._get_cached(self.metrics_cube_cache, month, None)
 
+    def get_logic_timeseries(self):
+        """
+        월 누적 지표 시계열(LogicTimeSeries) 반환 (파일이 없으면 None)
+        data/logic_timeseries.csv 가 갱신되면(mtime 변경) 다음 요청에서 한 번 다시 로드
+        """
+        timeseries_file = self.base_path / LOGIC_TIMESERIES_FILE
         try:
-            df = pd.read_csv(csv_file)
-
-            # 필요한 컬럼들이 있는지 확인
-            required_columns = ['Final Sub.', 'Final Region', 'New Hire', 'HIPO Type', 'Staff/Operator']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                print(f"Warning: Missing columns in {csv_file}: {missing_columns}")
-                return []
-
-            # Final Sub.로 그룹핑
-            grouped = df.groupby('Final Sub.').agg({
-                'Final Region': 'max',  # max(Final Region)
-                'New Hire': 'count',   # 전체 count
-                'HIPO Type': lambda x: (x == 'EIP').sum(),  # EIP count
-                'Staff/Operator': lambda x: (x == 'Staff').sum()  # Staff count
-            }).reset_index()
-
-            # GLP count 계산
-            glp_count = df[df['HIPO Type'] == 'GLP'].groupby('Final Sub.').size().reset_index(name='GLP Count')
-            grouped = grouped.merge(glp_count, left_on='Final Sub.', right_on='Final Sub.', how='left')
-            grouped['GLP Count'] = grouped['GLP Count'].fillna(0).astype(int)
+            mtime = timeseries_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with self._rw_lock.read_lock():
+            if self._timeseries is not None and self._timeseries[0] == mtime:
+                metrics.cache_hit('logic_timeseries')
+                return self._timeseries[1]
+
+        metrics.cache_miss('logic_timeseries')
+        timeseries = self._single_flight.do(
+            ('timeseries', mtime),
+            lambda: LogicTimeSeries.from_frame(self._read_month_csv(timeseries_file))
+        )
+        with self._rw_lock.write_lock():
+            self._timeseries = (mtime, timeseries)
+        return timeseries
 
-            # Operator count 계산
-            grouped['Operator Count'] = grouped['New Hire'] - grouped['Staff/Operator']
-
-            # 컬럼명 정리
-            grouped.columns = ['Subsidiary', 'Region', 'Total Count', 'EIP Count', 'Staff Count', 'GLP Count', 'Operator Count']
-
-            # New Hire가 Y인 것만 count
-            new_hire_count = df[df['New Hire'] == 'Y'].groupby('Final Sub.').size().reset_index(name='New Hire Count')
-            grouped = grouped.merge(new_hire_count, left_on='Subsidiary', right_on='Final Sub.', how='left')
-            grouped = grouped.drop('Final Sub.', axis=1)
-            grouped['New Hire Count'] = grouped['New Hire Count'].fillna(0).astype(int)
-
-            # 최종 컬럼 순서 정리
-            result = grouped[['Subsidiary', 'Region', 'Total Count', 'New Hire Count', 'EIP Count', 'GLP Count', 'Staff Count', 'Operator Count']]
+    def get_subsidiary_summary_data(self, month):
+        """특정 월의 Subsidiary 요약 데이터 반환 (인원 집계에서 조회)"""
+        headcount = self.get_headcount(month)
+        return headcount.subsidiary_summary() if headcount is not None else []
+
+    def get_course_aggregates(self, month):
+        """
+        특정 월의 과정별 집계 테이블 반환 (월별로 한 번만 로드, 없으면 None)
+        (완료 년월, Final Region, Final Sub., Course name) 단위 - 호출 측에서 수정 금지
+        """
+        with self._rw_lock.read_lock():
+            if month in self.course_aggregate_cache:
+                metrics.cache_hit('course_aggregates')
+                return self.course_aggregate_cache[month]
+
+        metrics.cache_miss('course_aggregates')
+        month_dir = self.get_month_dir(month)
+        result = self._single_flight.do(('course_aggregates', month_dir), lambda: self._build_course_aggregates(month_dir))
+
+        with self._rw_lock.read_lock():
+            # 계산 중 스냅샷이 교체되었으면 저장하지 않음
+            is_current = self.month_dirs.get(month) == month_dir
+        if is_current:
+            with self._rw_lock.write_lock():
+                self.course_aggregate_cache[month] = result
+        return result
+
+    def get_month_frame(self, month, file_name, columns=None):
+        """
+        특정 월 결과 파일의 DataFrame 반환 (스냅샷 / 파일 / 컬럼 목록별로 한 번만 변환, 없으면 None)
+        여러 요청이 같은 프레임을 공유하므로 호출 측에서 수정 금지
+
+        Args:
+            month: 기준 월
+            file_name: 결과 파일명 (예: logic.csv)
+            columns: 필요한 컬럼 목록 (없으면 전체)
+        """
+        key = (file_name, tuple(columns) if columns is not None else None)
+        with self._rw_lock.read_lock():
+            frame = self.month_frame_cache.get(month, {}).get(key)
+            if frame is not None:
+                metrics.cache_hit('month_frame')
+                return frame
+
+        metrics.cache_miss('month_frame')
+        month_dir = self.get_month_dir(month)
+        csv_file = month_dir / file_name
+        frame = self._single_flight.do(('month_frame', month_dir, key), lambda: self._read_month_csv(csv_file, columns))
+
+        with self._rw_lock.read_lock():
+            # 계산 중 스냅샷이 교체되었으면 저장하지 않음
+            is_current = self.month_dirs.get(month) == month_dir
+        if is_current and frame is not None:
+            with self._rw_lock.write_lock():
+                self.month_frame_cache.setdefault(month, {})[key] = frame
+        return frame
+
+    def _build_course_aggregates(self, month_dir):
+        """
+        course_aggregates.csv 로드
+        집계 파일이 없는 이전 결과는 join_hr_lms.csv 에서 한 번 집계 (make_logic.create_course_aggregates 와 같은 규칙)
+        """
+        csv_file = month_dir / "course_aggregates.csv"
+        if csv_file.exists():
+            return self._read_month_csv(csv_file)
 
-            return result.to_dict('records')
+        join_df = self._read_month_csv(month_dir / "join_hr_lms.csv")
+        if join_df is None:
+            return None
 
+        try:
+            logger.debug("course_aggregates.csv 없음, join_hr_lms.csv 에서 집계: %s", month_dir)
+            completed = join_df[join_df['Completion status'].astype(str).str.endswith('-C', na=False)]
+            completion_date = pd.to_datetime(
+                completed['Completion Date'].astype(str).str.replace('.0', '', regex=False),
+                format='%Y%m%d', errors='coerce'
+            )
+            completed = completed[completion_date.notna()].assign(Year_Month=completion_date.dt.strftime('%Y-%m'))
+            return (
+                completed
+                .groupby(['Year_Month', 'Final Region', 'Final Sub.', 'Course name'], dropna=False, sort=False)
+                .agg(
+                    category_1=('category_1', 'first'),
+                    category_2=('category_2', 'first'),
+                    Category=('Category', 'first'),
+                    participant_count=('Final Sub.', 'size'),
+                    total_hours=('Education Hours', 'sum')
+                )
+                .reset_index()
+            )
         except Exception as e:
-            print(f"Error processing {csv_file}: {e}")
-            return []
+            logger.exception("Error building course aggregates for %s: %s", month_dir, e)
+            return None
 
     def _load_month_data(self, month):
-        """특정 월의 데이터만 로드 (캐시에 없을 때)"""
-        month_folder = str(month)
-        csv_file = self.base_path / month_folder / "hr_index_final.csv"
-
-        if csv_file.exists():
-            try:
-                df = pd.read_csv(csv_file)
-
-                # Subsidiary 로드
-                if 'Final Sub.' in df.columns:
-                    subsidiaries = df['Final Sub.'].dropna().unique().tolist()
-                    subsidiaries = [s for s in subsidiaries if s and str(s).strip()]
-                    self.subsidiary_cache[month] = sorted(subsidiaries)
-
-                # Region 로드
-                if 'Final Region' in df.columns:
-                    regions = df['Final Region'].dropna().unique().tolist()
-                    regions = [r for r in regions if r and str(r).strip()]
-                    self.region_cache[month] = sorted(regions)
-
-                print(f"Loaded data for {month}월 from file")
-            except Exception as e:
-                print(f"Error loading data for {month}월: {e}")
+        """특정 월의 데이터만 로드 (캐시에 없을 때, 동시 요청은 한 번의 로딩을 공유)"""
+        month_state = self._single_flight.do(('month', month), lambda: self._build_month(month))
+        with self._rw_lock.write_lock():
+            if month not in self.subsidiary_cache:
+                self._swap_month(month, month_state)
+        logger.info("Loaded data for %s월 from file", month)
 
     def reload_cache(self):
-        """캐시 재로드"""
-        self.subsidiary_cache = {}
-        self.region_cache = {}
-        self.logic_region_cache = {}
-        self.logic_global_cache = {}
-        self._load_subsidiary_data()
-        self._load_region_data()
-        self._load_logic_region_data()
-        self._load_logic_global_data()
+        """캐시 재로드 (월별로 재구성 후 쓰기 락 안에서 교체, 재구성 중에도 기존 캐시로 응답)"""
+        self._load_all_months()
 
 # 전역 인스턴스 생성
 data_cache = DataCache()
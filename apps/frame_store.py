@@ -0,0 +1,114 @@
+# -*- encoding: utf-8 -*-
+"""
+Frame store for pipeline outputs (memory-mapped Arrow IPC with CSV fallback)
+"""
+
+import logging
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from apps.metrics import metrics
+
+# pyarrow는 선택 의존성: 없으면 기존처럼 CSV를 직접 읽는다
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+ARROW_SUFFIX = ".arrow"
+
+
+class FrameStore:
+    """
+    파이프라인 결과 프레임 저장소
+
+    스냅샷에 <name>.arrow (Arrow IPC, 비압축) 파일이 있으면 메모리 맵으로 연다.
+    메모리 맵은 OS 페이지 캐시를 공유하므로 gunicorn 워커가 여러 개여도
+    같은 물리 페이지를 읽고, 워커별 상주 메모리가 파일 크기만큼 늘어나지 않는다.
+    Arrow 파일이 없거나 pyarrow가 설치되지 않은 경우 CSV를 읽는다.
+    """
+
+    def __init__(self, max_tables=64):
+        self.max_tables = max_tables
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def arrow_path(csv_file):
+        """CSV 경로에 대응하는 Arrow IPC 파일 경로"""
+        return Path(csv_file).with_suffix(ARROW_SUFFIX)
+
+    def _open_table(self, arrow_file):
+        """메모리 맵 Arrow 테이블 반환 (파일별로 한 번만 열고 LRU로 유지)"""
+        key = str(arrow_file)
+        mtime = arrow_file.stat().st_mtime_ns
+
+        with self._lock:
+            entry = self._tables.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._tables.move_to_end(key)
+                metrics.cache_hit('frame_store')
+                return entry[1]
+
+        metrics.cache_miss('frame_store')
+        source = pa.memory_map(key, 'r')
+        table = pa.ipc.open_file(source).read_all()
+
+        with self._lock:
+            self._tables[key] = (mtime, table)
+            self._tables.move_to_end(key)
+            # 오래된 스냅샷 테이블은 닫아서 매핑 해제
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+        return table
+
+    @staticmethod
+    def _to_pandas(table):
+        """Arrow 테이블을 CSV 로드와 같은 형태의 DataFrame으로 변환"""
+        df = table.to_pandas(split_blocks=True)
+        # 문자열 컬럼의 null은 None으로 변환되므로 read_csv와 같이 NaN으로 맞춘다
+        for col in df.columns[df.dtypes == object]:
+            series = df[col]
+            if series.isna().any():
+                df[col] = series.mask(series.isna(), np.nan)
+        return df
+
+    def read_frame(self, csv_file, columns=None):
+        """
+        파이프라인 결과 파일을 DataFrame으로 반환
+
+        Args:
+            csv_file: 결과 CSV 경로 (같은 이름의 .arrow 파일이 있으면 우선 사용)
+            columns: 필요한 컬럼 목록 (없으면 전체)
+        """
+        csv_file = Path(csv_file)
+
+        if pa is not None:
+            arrow_file = self.arrow_path(csv_file)
+            if arrow_file.exists():
+                try:
+                    table = self._open_table(arrow_file)
+                    if columns is not None:
+                        table = table.select([col for col in columns if col in table.column_names])
+                    df = self._to_pandas(table)
+                    # 메모리 맵에서 실제로 변환한 컬럼의 크기
+                    metrics.record_frame_read('arrow', table.nbytes, len(df))
+                    return df
+                except Exception as e:
+                    logger.warning("Arrow 파일 로드 실패, CSV 사용: %s (%s)", arrow_file, e)
+
+        if columns is not None:
+            wanted = set(columns)
+            df = pd.read_csv(csv_file, usecols=lambda col: col in wanted)
+        else:
+            df = pd.read_csv(csv_file)
+        metrics.record_frame_read('csv', csv_file.stat().st_size, len(df))
+        return df
+
+
+# 전역 인스턴스 생성
+frame_store = FrameStore()
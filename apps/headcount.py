@@ -0,0 +1,165 @@
+# -*- encoding: utf-8 -*-
+"""
+Headcount cube built from hr_index_final (subsidiary grain with region / global rollups)
+"""
+
+import pandas as pd
+
+# 인원 집계 항목 {출력 키: (컬럼, 값)} - total_count 는 전체 행 수
+HEADCOUNT_FLAGS = {
+    'new_hire_count': ('New Hire', 'Y'),
+    'eip_count': ('HIPO Type', 'EIP'),
+    'glp_count': ('HIPO Type', 'GLP'),
+    'staff_count': ('Staff/Operator', 'Staff'),
+    'operator_count': ('Staff/Operator', 'Operator'),
+}
+HEADCOUNT_COLUMNS = ['total_count'] + list(HEADCOUNT_FLAGS)
+
+# Staff 고유 인원 계산용 컬럼 후보
+EMPLOYEE_COLUMN_CANDIDATES = ['Emp. No.', 'Employee Number', 'Employee_Number', 'EmployeeNumber']
+STAFF_COLUMN_CANDIDATES = ['Staff/Operator', 'Staff_Operator', 'StaffOperator']
+
+
+def _first_column(df, candidates):
+    """후보 중 DataFrame에 있는 첫 번째 컬럼명 (없으면 None)"""
+    for col in candidates:
+        if col in df.columns:
+            return col
+    return None
+
+
+def _counts(row):
+    """집계 행을 파이썬 int 인원 dict로 변환"""
+    return {col: int(row[col]) for col in HEADCOUNT_COLUMNS}
+
+
+class HeadcountCube:
+    """
+    월별 인원 집계
+
+    hr_index_final을 (Final Region, Final Sub.) 단위로 한 번만 groupby 하고,
+    법인 / 지역 / Global 값은 그 결과를 롤업하여 조회용 dict로 미리 만들어 둔다.
+    Staff 고유 인원(nunique)은 합산할 수 없으므로 지역 / 법인 단위로 따로 계산한다.
+    """
+
+    def __init__(self, cells, sub_names, region_staff_unique, subsidiary_staff_unique):
+        self.cells = cells
+        self._region_staff_unique = region_staff_unique
+        self._subsidiary_staff_unique = subsidiary_staff_unique
+
+        cell_rows = cells.reset_index()
+        self._global = _counts(cells[HEADCOUNT_COLUMNS].sum())
+
+        # 법인별: 지역은 첫 번째 행 기준 (행 순서대로 집계했으므로 첫 셀 = 첫 행)
+        self._subsidiaries = {}
+        by_subsidiary = cell_rows.dropna(subset=['subsidiary']).groupby('subsidiary', sort=False)
+        sub_totals = by_subsidiary[HEADCOUNT_COLUMNS].sum()
+        sub_regions = by_subsidiary['region'].first()
+        for subsidiary, row in sub_totals.iterrows():
+            info = _counts(row)
+            region = sub_regions.get(subsidiary)
+            info['region'] = region if pd.notna(region) else '-'
+            info['sub_name_mp'] = sub_names.get(subsidiary, '')
+            self._subsidiaries[subsidiary] = info
+
+        # 지역별 (대소문자 구분 없이 조회), 지역명은 첫 번째 행 표기 사용
+        self._regions = {}
+        self._region_subsidiaries = {}
+        region_rows = cell_rows.dropna(subset=['region'])
+        region_keys = region_rows['region'].astype(str).str.lower()
+        for region_key, group in region_rows.groupby(region_keys, sort=False):
+            info = _counts(group[HEADCOUNT_COLUMNS].sum())
+            info['region_name'] = group['region'].iloc[0]
+            self._regions[region_key] = info
+
+            per_subsidiary = group.dropna(subset=['subsidiary']).groupby('subsidiary')[HEADCOUNT_COLUMNS].sum()
+            self._region_subsidiaries[region_key] = [
+                {'final_sub': subsidiary, **_counts(row)} for subsidiary, row in per_subsidiary.iterrows()
+            ]
+
+        # 법인 요약 (Subsidiary 요약 API 형식, 법인명 정렬)
+        summary_regions = by_subsidiary['region'].max()
+        self._summary = []
+        for subsidiary in sorted(self._subsidiaries):
+            info = self._subsidiaries[subsidiary]
+            region = summary_regions.get(subsidiary)
+            self._summary.append({
+                'Subsidiary': subsidiary,
+                'Region': region if pd.notna(region) else None,
+                'Total Count': info['total_count'],
+                'New Hire Count': info['new_hire_count'],
+                'EIP Count': info['eip_count'],
+                'GLP Count': info['glp_count'],
+                'Staff Count': info['staff_count'],
+                'Operator Count': info['total_count'] - info['staff_count'],
+            })
+
+    @classmethod
+    def from_frame(cls, df):
+        """hr_index_final DataFrame에서 인원 집계 생성 (Final Sub. 컬럼이 없으면 None)"""
+        if df is None or 'Final Sub.' not in df.columns:
+            return None
+
+        # 조건별 플래그를 만든 뒤 한 번의 groupby sum 으로 집계 (컬럼이 없으면 0)
+        flags = {'total_count': 1}
+        for key, (col, value) in HEADCOUNT_FLAGS.items():
+            flags[key] = (df[col] == value) if col in df.columns else False
+        flags = pd.DataFrame(flags, index=df.index).astype(int)
+
+        region = df['Final Region'] if 'Final Region' in df.columns else pd.Series(None, index=df.index, dtype=object)
+        cells = flags.groupby([region.rename('region'), df['Final Sub.'].rename('subsidiary')], dropna=False, sort=False).sum()
+
+        # 법인 표시명 (첫 번째 값)
+        sub_names = {}
+        if 'Sub. Name(MP)' in df.columns:
+            names = df.groupby('Final Sub.', sort=False)['Sub. Name(MP)'].first()
+            sub_names = {sub: (name if pd.notna(name) else '') for sub, name in names.items()}
+
+        # Staff 고유 인원 (지역 / 법인 단위, 대소문자 구분 없이 조회)
+        region_staff_unique = {}
+        subsidiary_staff_unique = {}
+        emp_col = _first_column(df, EMPLOYEE_COLUMN_CANDIDATES)
+        staff_col = _first_column(df, STAFF_COLUMN_CANDIDATES)
+        if emp_col and staff_col:
+            staff = df[df[staff_col].astype(str).str.strip().str.lower() == 'staff']
+            if 'Final Region' in df.columns:
+                region_staff_unique = staff.groupby(staff['Final Region'].str.lower())[emp_col].nunique().to_dict()
+            subsidiary_staff_unique = staff.groupby(staff['Final Sub.'].astype(str).str.lower())[emp_col].nunique().to_dict()
+        else:
+            region_staff_unique = subsidiary_staff_unique = None
+
+        return cls(cells, sub_names, region_staff_unique, subsidiary_staff_unique)
+
+    def global_totals(self):
+        """Global 인원 집계"""
+        return dict(self._global)
+
+    def region(self, region):
+        """지역 인원 집계 (대소문자 구분 없음, 없으면 None)"""
+        info = self._regions.get(str(region).lower())
+        return dict(info) if info is not None else None
+
+    def subsidiary(self, subsidiary):
+        """법인 인원 집계 + 지역 / 표시명 (없으면 None)"""
+        info = self._subsidiaries.get(subsidiary)
+        return dict(info) if info is not None else None
+
+    def region_subsidiaries(self, region):
+        """지역 내 법인별 인원 집계 목록 (법인명 정렬, 지역이 없으면 None)"""
+        return self._region_subsidiaries.get(str(region).lower())
+
+    def subsidiary_summary(self):
+        """전체 법인 요약 목록 (Subsidiary 요약 API 형식)"""
+        return self._summary
+
+    def region_staff_unique(self, region):
+        """지역 Staff 고유 인원 (사번 컬럼이 없으면 None)"""
+        if self._region_staff_unique is None:
+            return None
+        return int(self._region_staff_unique.get(str(region).lower(), 0))
+
+    def subsidiary_staff_unique(self, subsidiary):
+        """법인 Staff 고유 인원 (대소문자 구분 없음, 사번 컬럼이 없으면 None)"""
+        if self._subsidiary_staff_unique is None:
+            return None
+        return int(self._subsidiary_staff_unique.get(str(subsidiary).lower(), 0))
@@ -0,0 +1,88 @@
+# -*- encoding: utf-8 -*-
+"""
+Web-tier logging: leveled per-module loggers with request-id correlation
+"""
+
+import logging
+import os
+import sys
+import uuid
+from flask import g, has_request_context, request
+
+# 요청 ID 헤더 (nginx 등 앞단에서 전달되면 그대로 사용하고 응답에도 포함)
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+# 로그 형식 (요청 밖의 로그는 request_id 가 '-')
+LOG_FORMAT = '%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s'
+
+# 웹 계층 로거 이름 (apps.* 모듈이 모두 이 로거 아래에 있음)
+ROOT_LOGGER = 'apps'
+
+
+class RequestIdFilter(logging.Filter):
+    """레코드에 현재 요청 ID를 붙이는 필터"""
+
+    def filter(self, record):
+        record.request_id = g.get('request_id', '-') if has_request_context() else '-'
+        return True
+
+
+def parse_levels(value):
+    """
+    모듈별 로그 레벨 설정 파싱
+
+    Args:
+        value: 'apps.home.routes=DEBUG,apps.data_cache=WARNING' 형식 문자열
+
+    Returns:
+        dict: {로거 이름: 레벨}
+    """
+    levels = {}
+    for item in (value or '').split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _assign_request_id():
+    g.request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex[:16]
+
+
+def _attach_request_id(response):
+    request_id = g.get('request_id')
+    if request_id:
+        response.headers[REQUEST_ID_HEADER] = request_id
+    return response
+
+
+def configure_logging(level=None, levels=None):
+    """
+    apps.* 로거 설정 (stdout 핸들러 하나 + 모듈별 레벨)
+
+    level 은 웹 계층 기본 레벨, levels 는 'apps.home.routes=DEBUG,...' 형식의 모듈별 레벨이다.
+    인자가 없으면 LOG_LEVEL / LOG_LEVELS 환경 변수를 사용한다 (create_app 이전에 import 되는 모듈용).
+    로그 호출은 %s 지연 포맷을 사용하므로 비활성 레벨의 메시지는 문자열로 만들지 않는다.
+    """
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel((level or os.getenv('LOG_LEVEL', 'INFO')).upper())
+
+    if not any(getattr(handler, '_apps_handler', False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler._apps_handler = True
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler.addFilter(RequestIdFilter())
+        logger.addHandler(handler)
+        logger.propagate = False
+
+    for name, module_level in parse_levels(levels if levels is not None else os.getenv('LOG_LEVELS')).items():
+        logging.getLogger(name).setLevel(module_level)
+    return logger
+
+
+def register_logging(app):
+    """앱 설정의 로그 레벨 적용과 요청 ID 훅 등록"""
+    configure_logging(app.config.get('LOG_LEVEL'), app.config.get('LOG_LEVELS'))
+    app.before_request(_assign_request_id)
+    app.after_request(_attach_request_id)
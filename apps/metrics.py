@@ -0,0 +1,381 @@
+# -*- encoding: utf-8 -*-
+"""
+Prometheus-style metrics for the dashboard service (/metrics text endpoint)
+
+gunicorn 워커가 여러 개이면 각 워커가 자기 값을 METRICS_MULTIPROC_DIR 의 워커별 파일에 주기적으로 저장하고,
+/metrics 는 모든 워커 파일을 합산해 응답한다 (prometheus_client multiprocess 모드와 같은 방식).
+"""
+
+import glob
+import hmac
+import ipaddress
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from flask import Response, abort, current_app, g, has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+# Prometheus 텍스트 형식 Content-Type
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 요청 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 결과 파일 로드 횟수 히스토그램 구간
+FRAME_READ_BUCKETS = (0, 1, 2, 5, 10, 25, 50)
+
+# 라우트에 매칭되지 않은 요청(404 등)의 route 라벨 (URL별 라벨이 무한히 늘어나지 않도록)
+UNMATCHED_ROUTE = '<unmatched>'
+
+# 워커별 지표 파일 디렉토리 (없으면 프로세스 메모리 값만 응답, gunicorn-cfg.py 에서 설정)
+MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR')
+
+# 워커별 지표 파일 저장 주기 (초)
+FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '2'))
+
+
+def _escape(value):
+    """라벨 값 이스케이프 (역슬래시, 따옴표, 줄바꿈)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=None):
+    """{name="value",...} 라벨 문자열 (라벨이 없으면 빈 문자열)"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    """정수는 그대로, 실수는 repr (Prometheus float 형식)"""
+    if isinstance(value, float):
+        return repr(value) if value != int(value) else str(int(value))
+    return str(value)
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    @staticmethod
+    def merge(total, value):
+        return value if total is None else total + value
+
+    def samples(self, values=None):
+        values = sorted((values if values is not None else self.snapshot()).items())
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """라벨별 누적 구간 히스토그램 (_bucket / _sum / _count)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [구간별 개수..., 합계, 전체 개수]
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {key: list(state) for key, state in self._values.items()}
+
+    @staticmethod
+    def merge(total, state):
+        return list(state) if total is None else [a + b for a, b in zip(total, state)]
+
+    def samples(self, values=None):
+        values = sorted((values if values is not None else self.snapshot()).items())
+
+        lines = []
+        for key, state in values:
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += state[i]
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(float(bound))}"')
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f'{self.name}_bucket{labels} {state[-1]}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(state[-2])}')
+            lines.append(f'{self.name}_count{labels} {state[-1]}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    대시보드 서비스 지표 저장소
+
+    값은 각 프로세스 메모리에서 집계한다. multiproc_dir 가 있으면 프로세스별 파일(metrics_<pid>_<token>.json)에
+    주기적으로 저장하고, render() 는 자기 값을 먼저 저장한 뒤 모든 파일을 합산한다.
+    파일의 값은 줄어들지 않고 종료된 워커의 파일도 남겨 두므로 어느 워커가 응답해도 합계가 뒤로 가지 않는다.
+    (디렉토리는 서버 시작 시 비움, gunicorn-cfg.py 의 on_starting 참고)
+    파일 이름에 프로세스별 토큰을 붙여 PID 가 재사용되어도 종료된 워커의 파일을 덮어쓰지 않는다.
+    """
+
+    def __init__(self, multiproc_dir=MULTIPROC_DIR, flush_interval=FLUSH_INTERVAL):
+        self._metrics = []
+        self._started = time.time()
+        self._process_token = uuid.uuid4().hex
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self._flush_lock = threading.Lock()
+        self._flusher_thread = None
+
+        self.request_duration = self._add(Histogram(
+            'dashboard_request_duration_seconds', '라우트별 요청 처리 시간',
+            ('route', 'method')))
+        self.requests = self._add(Counter(
+            'dashboard_requests_total', '라우트 / 상태 코드별 요청 수',
+            ('route', 'method', 'status')))
+        self.frame_reads = self._add(Histogram(
+            'dashboard_request_frame_reads', '요청당 결과 파일(data/) 로드 횟수',
+            ('route',), buckets=FRAME_READ_BUCKETS))
+        self.bytes_read = self._add(Counter(
+            'dashboard_data_bytes_read_total', 'data/ 결과 파일에서 읽은 바이트 수 (source: csv / arrow)',
+            ('source',)))
+        self.rows_loaded = self._add(Counter(
+            'dashboard_rows_loaded_total', '결과 파일 / SQL 저장소에서 로드한 행 수',
+            ('source',)))
+        self.cache_hits = self._add(Counter(
+            'dashboard_cache_hits_total', '캐시별 적중 수', ('cache',)))
+        self.cache_misses = self._add(Counter(
+            'dashboard_cache_misses_total', '캐시별 미적중 수', ('cache',)))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    # ==================== 기록 ====================
+
+    def cache_hit(self, cache):
+        self.cache_hits.inc(cache=cache)
+
+    def cache_miss(self, cache):
+        self.cache_misses.inc(cache=cache)
+
+    def record_frame_read(self, source, nbytes, rows):
+        """결과 파일 로드 기록 (요청 처리 중이면 요청당 로드 횟수에도 반영)"""
+        self.bytes_read.inc(nbytes, source=source)
+        self.rows_loaded.inc(rows, source=source)
+        if has_request_context():
+            g.metrics_frame_reads = g.get('metrics_frame_reads', 0) + 1
+
+    def record_rows(self, source, rows):
+        """파일이 아닌 저장소(SQL 등)에서 로드한 행 수 기록"""
+        self.rows_loaded.inc(rows, source=source)
+
+    def observe_request(self, route, method, status, elapsed, frame_reads):
+        self.request_duration.observe(elapsed, route=route, method=method)
+        self.requests.inc(route=route, method=method, status=status)
+        self.frame_reads.observe(frame_reads, route=route)
+
+    # ==================== 워커 간 공유 ====================
+
+    def _process_file(self):
+        return os.path.join(self.multiproc_dir, f"metrics_{os.getpid()}_{self._process_token}.json")
+
+    def flush(self):
+        """현재 프로세스 값을 워커별 파일에 저장 (임시 파일 작성 후 원자적 교체)"""
+        if not self.multiproc_dir:
+            return
+        state = {
+            'started': self._started,
+            'metrics': {metric.name: [[list(key), value] for key, value in metric.snapshot().items()] for metric in self._metrics},
+        }
+        path = self._process_file()
+        with self._flush_lock:
+            os.makedirs(self.multiproc_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+
+    def _flush_loop(self):
+        """워커별 파일 저장 루프 (데몬 스레드)"""
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception("Error flushing metrics: %s", e)
+
+    def start_flusher(self):
+        """워커별 파일 저장 스레드 시작 (프로세스당 한 번, gunicorn post_fork 에서 호출)"""
+        if not self.multiproc_dir:
+            return None
+        # fork 로 복사된 마스터의 값은 워커 값이 아니므로 비우고 시작
+        if self._flusher_thread is None or not self._flusher_thread.is_alive():
+            self._started = time.time()
+            self._process_token = uuid.uuid4().hex
+            for metric in self._metrics:
+                with metric._lock:
+                    metric._values.clear()
+            self._flusher_thread = threading.Thread(target=self._flush_loop, name='metrics-flusher', daemon=True)
+            self._flusher_thread.start()
+        return self._flusher_thread
+
+    def _collect(self):
+        """
+        모든 프로세스 파일을 합산한 {지표 이름: {라벨: 값}} 과 가장 이른 시작 시각
+        (파일 디렉토리가 없으면 현재 프로세스 값)
+        """
+        if not self.multiproc_dir:
+            return {metric.name: metric.snapshot() for metric in self._metrics}, self._started
+
+        self.flush()
+        totals = {metric.name: {} for metric in self._metrics}
+        merges = {metric.name: metric.merge for metric in self._metrics}
+        started = self._started
+        for path in glob.glob(os.path.join(self.multiproc_dir, "metrics_*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("metrics file unreadable: %s (%s)", path, e)
+                continue
+            started = min(started, state.get('started', started))
+            for name, entries in state.get('metrics', {}).items():
+                if name not in totals:
+                    continue
+                for key, value in entries:
+                    key = tuple(key)
+                    totals[name][key] = merges[name](totals[name].get(key), value)
+        return totals, started
+
+    # ==================== 출력 ====================
+
+    def render(self):
+        """Prometheus 텍스트 형식 (exposition format 0.0.4, 워커 파일이 있으면 전체 워커 합계)"""
+        totals, started = self._collect()
+        lines = [
+            '# HELP dashboard_process_start_time_seconds 서비스(가장 먼저 시작한 워커) 시작 시각 (unix time)',
+            '# TYPE dashboard_process_start_time_seconds gauge',
+            f'dashboard_process_start_time_seconds {_format_value(started)}',
+        ]
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.samples(totals[metric.name]))
+        return '\n'.join(lines) + '\n'
+
+
+def _route_label():
+    """요청의 라우트 규칙 (예: /api/logic-global-data/<int:month>)"""
+    rule = request.url_rule
+    return rule.rule if rule is not None else UNMATCHED_ROUTE
+
+
+def _start_timer():
+    g.metrics_started = time.perf_counter()
+
+
+def _record_response(response):
+    started = g.pop('metrics_started', None)
+    if started is not None:
+        metrics.observe_request(
+            _route_label(), request.method, response.status_code,
+            time.perf_counter() - started, g.pop('metrics_frame_reads', 0)
+        )
+    return response
+
+
+def _record_failure(exc):
+    # 처리되지 않은 예외로 after_request 가 실행되지 않은 요청은 500으로 기록
+    started = g.pop('metrics_started', None)
+    if started is not None and exc is not None:
+        metrics.observe_request(
+            _route_label(), request.method, 500,
+            time.perf_counter() - started, g.pop('metrics_frame_reads', 0)
+        )
+
+
+def _metrics_allowed():
+    """
+    /metrics 접근 허용 여부
+    METRICS_TOKEN 이 설정되어 있으면 Authorization: Bearer <token> 이 일치하는 요청,
+    아니면 METRICS_ALLOWED_IPS 에 있는 주소에서 프록시(nginx)를 거치지 않고 직접 들어온 요청만 허용
+    (gunicorn 은 0.0.0.0 에 바인딩되므로 포트에 접근할 수 있는 모든 클라이언트를 막아야 함)
+    """
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        header = request.headers.get('Authorization', '')
+        return hmac.compare_digest(header.encode('utf-8'), f"Bearer {token}".encode('utf-8'))
+
+    if not current_app.config.get('METRICS_ALLOW_PROXIED') and request.headers.get('X-Forwarded-For'):
+        return False
+    try:
+        address = ipaddress.ip_address(request.remote_addr or '')
+    except ValueError:
+        return False
+    for allowed in current_app.config.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(','):
+        allowed = allowed.strip()
+        try:
+            if allowed and address in ipaddress.ip_network(allowed, strict=False):
+                return True
+        except ValueError:
+            logger.warning("invalid METRICS_ALLOWED_IPS entry: %s", allowed)
+    return False
+
+
+def metrics_view():
+    """/metrics - 허용된 스크레이퍼에만 제공 (그 외에는 404)"""
+    if not _metrics_allowed():
+        abort(404)
+    return Response(metrics.render(), mimetype=None, content_type=CONTENT_TYPE)
+
+
+def register_metrics(app):
+    """요청 지표 수집 훅과 /metrics 라우트 등록 (METRICS_ENABLED=False 이면 등록하지 않음)"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    app.before_request(_start_timer)
+    app.after_request(_record_response)
+    app.teardown_request(_record_failure)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+
+
+# 전역 인스턴스 생성
+metrics = MetricsRegistry()
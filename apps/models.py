@@ -63,3 +63,21 @@ class Product(db.Model):
             error = str(e.__dict__['orig'])
             raise InvalidUsage(error, 422)
         return
+
+
+class OutputLoad(db.Model):
+    """파이프라인 결과 SQL 적재 이력 (월별 최신 적재 버전 확인용)"""
+
+    __tablename__ = 'output_loads'
+    __bind_key__  = 'outputs'
+
+    id            = db.Column(db.Integer,      primary_key=True)
+    year_month    = db.Column(db.String(7),    nullable=False, unique=True)
+    month         = db.Column(db.Integer,      nullable=False, index=True)
+    data_version  = db.Column(db.String(255),  nullable=False)
+    row_counts    = db.Column(db.Text,         nullable=True)
+    loaded_at     = db.Column(db.DateTime,     default=db.func.current_timestamp(),
+                                               onupdate=db.func.current_timestamp())
+
+    def __repr__(self):
+        return f"{self.year_month} / {self.data_version}"
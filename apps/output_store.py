@@ -0,0 +1,285 @@
+# -*- encoding: utf-8 -*-
+"""
+Embedded SQL store for pipeline outputs (bulk load + repository for pushed-down filtering)
+"""
+
+import json
+import logging
+import click
+import pandas as pd
+import sqlalchemy as sa
+from flask import current_app
+from apps import db
+from apps.models import OutputLoad
+from apps.data_cache import POINTER_FILE_NAME, SNAPSHOT_DIR_NAME, data_cache
+from apps.metrics import metrics
+from partition_catalog import partition_dir
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_BIND = 'outputs'
+
+# 적재 대상 {출력 이름: (CSV 파일, 테이블명)}
+OUTPUT_TABLES = {
+    'hr_index': ('hr_index_final.csv', 'output_hr_index'),
+    'lms_learning': ('lms_learning_final.csv', 'output_lms_learning'),
+    'join_hr_lms': ('join_hr_lms.csv', 'output_join_hr_lms'),
+    'logic': ('logic.csv', 'output_logic'),
+    'hong_manager': ('hong_data_manager_final.csv', 'output_hong_manager'),
+    'hong_plan': ('hong_data_plan_final.csv', 'output_hong_plan'),
+}
+
+YEAR_MONTH_COLUMN = 'year_month'
+
+# 인덱스 대상 컬럼 (테이블에 있는 컬럼만 생성)
+INDEXED_COLUMN_GROUPS = {
+    'month_region': [YEAR_MONTH_COLUMN, 'Final Region'],
+    'month_sub': [YEAR_MONTH_COLUMN, 'Final Sub.'],
+    'emp_no': ['Emp. No.'],
+    'employee_number': ['Employee Number'],
+    'course_name': ['Course name'],
+}
+
+LOAD_CHUNK_SIZE = 5000
+
+
+def _sql_type(dtype):
+    """pandas dtype → 컬럼 추가용 SQL 타입"""
+    if pd.api.types.is_integer_dtype(dtype):
+        return sa.BigInteger()
+    if pd.api.types.is_float_dtype(dtype):
+        return sa.Float()
+    return sa.Text()
+
+
+class OutputRepository:
+    """
+    파이프라인 결과 SQL 저장소
+
+    월별 결과 CSV를 year_month 컬럼과 함께 테이블에 적재하고,
+    라우트에서는 전체 파일 대신 인덱스를 타는 조건 조회로 필요한 행만 가져온다.
+    적재 시점의 데이터 버전(DataCache.get_data_version)을 기록해 두고,
+    웹 서버가 보고 있는 스냅샷과 같은 버전이 적재된 경우에만 SQL 조회 결과를 반환한다.
+    """
+
+    def __init__(self):
+        self._tables = {}
+        # {(month, data_version): year_month} - 적재가 확인된 스냅샷
+        self._loaded_versions = {}
+
+    @property
+    def engine(self):
+        return db.engines[OUTPUT_BIND]
+
+    def _reflect(self, table_name, connection):
+        """테이블 메타데이터 (없으면 None)"""
+        if not sa.inspect(connection).has_table(table_name):
+            return None
+        return sa.Table(table_name, sa.MetaData(), autoload_with=connection)
+
+    def _get_table(self, table_name):
+        """조회용 테이블 메타데이터 캐시"""
+        table = self._tables.get(table_name)
+        if table is None:
+            with self.engine.connect() as connection:
+                table = self._reflect(table_name, connection)
+            if table is not None:
+                self._tables[table_name] = table
+        return table
+
+    # ==================== 적재 ====================
+
+    def _add_missing_columns(self, connection, table, df):
+        """기존 테이블에 없는 컬럼 추가 (월별로 결과 컬럼이 늘어난 경우)"""
+        preparer = connection.dialect.identifier_preparer
+        for col in df.columns:
+            if col in table.columns:
+                continue
+            col_type = _sql_type(df[col].dtype).compile(dialect=connection.dialect)
+            connection.execute(sa.text(
+                f"ALTER TABLE {preparer.quote(table.name)} ADD COLUMN {preparer.quote(col)} {col_type}"
+            ))
+
+    def _create_indexes(self, connection, table_name):
+        """조회 컬럼 인덱스 생성 (이미 있으면 건너뜀)"""
+        table = self._reflect(table_name, connection)
+        for suffix, columns in INDEXED_COLUMN_GROUPS.items():
+            if all(col in table.columns for col in columns):
+                sa.Index(f"ix_{table_name}_{suffix}", *[table.c[col] for col in columns]).create(connection, checkfirst=True)
+
+    def load_table(self, connection, table_name, df, year_month):
+        """한 결과 파일을 year_month 단위로 교체 적재"""
+        df = df.copy()
+        df.insert(0, YEAR_MONTH_COLUMN, year_month)
+
+        table = self._reflect(table_name, connection)
+        if table is not None:
+            self._add_missing_columns(connection, table, df)
+            connection.execute(sa.delete(table).where(table.c[YEAR_MONTH_COLUMN] == year_month))
+
+        df.to_sql(table_name, connection, if_exists='append', index=False, chunksize=LOAD_CHUNK_SIZE)
+        self._create_indexes(connection, table_name)
+        return len(df)
+
+    def _snapshot_dir(self, month, year):
+        """
+        year / month 파티션의 CURRENT 스냅샷 디렉토리와 데이터 버전
+        (웹 서버가 보는 최신 년도 파티션이 아니라 요청한 년도 파티션 기준)
+        """
+        partition = data_cache.base_path / partition_dir(year, month, data_root='')
+        try:
+            version = (partition / POINTER_FILE_NAME).read_text(encoding='utf-8').strip()
+        except OSError:
+            version = None
+        snapshot_dir = partition / SNAPSHOT_DIR_NAME / version if version else None
+        if snapshot_dir is None or not snapshot_dir.is_dir():
+            raise FileNotFoundError(f"{year}년 {month}월 발행된 스냅샷이 없습니다: {partition}")
+        # DataCache.get_data_version 과 같은 형식 (웹 서버가 같은 스냅샷을 보고 있을 때만 SQL 조회)
+        return snapshot_dir, f"snapshot-{version}"
+
+    def load_month(self, month, year):
+        """
+        year 년 month 월 파티션의 현재 스냅샷 결과를 SQL 저장소에 적재 (한 트랜잭션으로 교체)
+
+        Returns:
+            dict: {출력 이름: 적재 행 수}
+        """
+        year_month = f"{year}-{month:02d}"
+        month_dir, data_version = self._snapshot_dir(month, year)
+
+        row_counts = {}
+        with self.engine.begin() as connection:
+            for output, (file_name, table_name) in OUTPUT_TABLES.items():
+                csv_file = month_dir / file_name
+                if not csv_file.exists():
+                    logger.warning("%s 없음 (적재 건너뜀)", csv_file)
+                    continue
+                df = pd.read_csv(csv_file, low_memory=False)
+                row_counts[output] = self.load_table(connection, table_name, df, year_month)
+                logger.info("%s 적재: %s행 (%s)", table_name, row_counts[output], year_month)
+
+        load = OutputLoad.query.filter_by(year_month=year_month).first() or OutputLoad(year_month=year_month)
+        load.month = month
+        load.data_version = data_version
+        load.row_counts = json.dumps(row_counts)
+        db.session.add(load)
+        db.session.commit()
+
+        # 스키마가 바뀌었을 수 있으므로 조회용 메타데이터 초기화
+        self._tables.clear()
+        return row_counts
+
+    # ==================== 조회 ====================
+
+    def _has_load_table(self):
+        """적재 기록 테이블(output_loads) 존재 여부 (저장소에 연결할 수 없으면 False)"""
+        try:
+            with self.engine.connect() as connection:
+                return sa.inspect(connection).has_table(OutputLoad.__tablename__)
+        except Exception:
+            return False
+
+    def current_year_month(self, month):
+        """
+        웹 서버가 보고 있는 스냅샷이 적재되어 있으면 해당 year_month 반환 (아니면 None)
+        """
+        data_version = data_cache.get_data_version(month)
+        if data_version is None:
+            return None
+
+        key = (month, data_version[0])
+        if key in self._loaded_versions:
+            return self._loaded_versions[key]
+
+        try:
+            load = OutputLoad.query.filter_by(month=month, data_version=data_version[0]).first()
+        except Exception as e:
+            # 저장소를 사용할 수 없으면 파일 조회로 대체
+            if not self._has_load_table():
+                # 첫 적재 전 (output_loads 테이블 없음): 적재되지 않은 상태
+                logger.debug("output store 미적재: %s월", month)
+            else:
+                logger.warning("output store 조회 실패: %s", e)
+            return None
+        if load is None:
+            return None
+
+        self._loaded_versions[key] = load.year_month
+        return load.year_month
+
+    def select(self, output, month, filters=None, columns=None, ignore_case=False):
+        """
+        조건에 맞는 행만 DataFrame으로 반환
+
+        Args:
+            output: 출력 이름 (OUTPUT_TABLES 키)
+            month: 기준 월
+            filters: {컬럼: 값} 동등 조건
+            columns: 가져올 컬럼 목록 (없으면 전체, year_month 제외)
+            ignore_case: 문자열 조건을 대소문자 구분 없이 비교
+
+        Returns:
+            DataFrame / 현재 스냅샷이 적재되지 않았으면 None (호출 측에서 파일 조회로 대체)
+        """
+        year_month = self.current_year_month(month)
+        if year_month is None:
+            return None
+
+        table = self._get_table(OUTPUT_TABLES[output][1])
+        if table is None:
+            return None
+
+        if columns is None:
+            selected = [col for col in table.columns if col.name != YEAR_MONTH_COLUMN]
+        else:
+            selected = [table.c[col] for col in columns if col in table.columns]
+
+        statement = sa.select(*selected).where(table.c[YEAR_MONTH_COLUMN] == year_month)
+        for col, value in (filters or {}).items():
+            if col not in table.columns:
+                return None
+            if ignore_case and isinstance(value, str):
+                statement = statement.where(sa.func.lower(table.c[col]) == value.lower())
+            else:
+                statement = statement.where(table.c[col] == value)
+
+        with self.engine.connect() as connection:
+            df = pd.read_sql(statement, connection)
+        metrics.record_rows('sql', len(df))
+        return df
+
+
+# 전역 인스턴스 생성
+output_repository = OutputRepository()
+
+
+@click.command('load-outputs')
+@click.argument('month', type=int)
+@click.option('--year', type=int, required=True, help='분석 기준 년도')
+def load_outputs_command(month, year):
+    """파이프라인 결과를 SQL 저장소에 적재: flask load-outputs <month> --year <year>"""
+    db.create_all(bind_key=OUTPUT_BIND)
+    row_counts = output_repository.load_month(month, year)
+    click.echo(f"{year}-{month:02d} 적재 완료 ({current_app.config['SQLALCHEMY_BINDS'][OUTPUT_BIND]}): {row_counts}")
+
+
+def load_output_store(month, year):
+    """
+    파이프라인에서 호출: 발행된 스냅샷 결과를 SQL 저장소에 적재
+
+    Returns:
+        bool: 성공 여부
+    """
+    from apps import create_app
+    from apps.config import config_dict
+
+    try:
+        app = create_app(config_dict['Production'])
+        with app.app_context():
+            db.create_all(bind_key=OUTPUT_BIND)
+            row_counts = output_repository.load_month(month, year)
+        logger.info("SQL 저장소 적재 완료: %s-%02d %s", year, month, row_counts)
+        return True
+    except Exception as e:
+        logger.exception("Error loading output store: %s", e)
+        return False
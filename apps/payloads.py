@@ -0,0 +1,1359 @@
+# -*- encoding: utf-8 -*-
+"""
+Data API payload builders
+
+데이터 API 응답 payload 를 계산한다. 웹 요청(apps/home/routes.py)은 전역 data_cache 와 SQL 결과 저장소로,
+정적 API 렌더링(static_api_renderer.py)은 렌더링할 월만 로드한 DataCache 로 같은 계산을 사용한다.
+각 함수는 payload 또는 (payload, status) 를 반환한다.
+"""
+
+import os
+import logging
+from functools import wraps
+from urllib.parse import unquote
+import numpy as np
+import pandas as pd
+from apps.serializers import frame_records
+from metrics_cube import SUBSIDIARY_COUNT, rollup, derive_rates
+
+logger = logging.getLogger(__name__)
+
+
+# Region 요약 API 항목 (지표 큐브 합계 / 비율)
+REGION_SUMMARY_SUM_COLUMNS = [
+    'Planned_Courses', 'Completed_Courses', 'Planned_Hours', 'Actual_Hours',
+    'New_Hire_Completed', 'New_Hire_Not_Completed', 'New_Hire_Pending', 'New_Hire_Total',
+    'EIP_Completed', 'EIP_Not_Completed', 'EIP_Total',
+    'GLP_Completed', 'GLP_Not_Completed', 'GLP_Total'
+]
+REGION_SUMMARY_RATE_COLUMNS = [
+    'Course_Completion_Rate', 'Hours_Completion_Rate', 'New_Hire_Completion_Rate',
+    'EIP_Completion_Rate', 'GLP_Completion_Rate'
+]
+
+
+# Subsidiary 지표 API 공통 필드 {출력 키: logic.csv 컬럼}
+METRIC_RATE_FIELDS = {
+    'total_score': 'Score',  # logic.csv의 Score 값
+    'course_completion_rate': 'Course_Completion_Rate',
+    'hours_completion_rate': 'Hours_Completion_Rate',
+    'new_hire_completion_rate': 'New_Hire_Completion_Rate',
+    'eip_completion_rate': 'EIP_Completion_Rate',
+    'glp_completion_rate': 'GLP_Completion_Rate',
+    'new_leader_rate': 'New_Leader_Completion_Rate',
+}
+METRIC_FLAG_FIELDS = {
+    'lms_education_rate': 'New LMS Course',
+    'lms_mission_rate': 'LMS Mission',
+    'annual_plan': 'Annual Plan Setup',
+    'jam_community': 'JAM Member',
+    'global_council': 'Global L&D Council',
+    'infra_index': 'Infra index response',
+}
+# Y/N 컬럼이 없으면 'N'
+METRIC_FLAG_DEFAULTS = {key: 'N' for key in METRIC_FLAG_FIELDS}
+# Subsidiary 지표 API 가 읽는 logic.csv 컬럼
+METRIC_COLUMNS = ['Subsidiary', 'Final Region', *METRIC_RATE_FIELDS.values(), *METRIC_FLAG_FIELDS.values()]
+
+# 과정리스트 API 필드 {출력 키: 과정별 집계 컬럼}
+COURSE_FIELDS = {
+    'course_name': 'Course name',
+    'category_large': 'category_1',
+    'category_medium': 'category_2',
+    'category_small': 'Category',
+    'participant_count': 'participant_count',
+    'total_hours': 'total_hours',
+}
+
+
+def section_payload(result):
+    """번들 API용: payload 계산 결과에서 payload만 추출 (섹션별 success/error 유지)"""
+    if isinstance(result, tuple):
+        return result[0]
+    return result
+
+
+def _section(method):
+    """섹션 payload 를 인스턴스 안에서 한 번만 계산 (memoize=True 일 때, 번들과 단독 API 가 같은 결과 공유)"""
+    @wraps(method)
+    def wrapper(self, *args):
+        if self._sections is None:
+            return method(self, *args)
+        key = (method.__name__, args)
+        if key not in self._sections:
+            self._sections[key] = method(self, *args)
+        return self._sections[key]
+    return wrapper
+
+
+class ApiPayloads:
+    """
+    데이터 API payload 계산
+
+    Args:
+        cache: DataCache (월별 캐시 / 결과 파일 위치)
+        repository: SQL 결과 저장소 (없으면 결과 파일에서 조회)
+        memoize: 같은 섹션을 한 번만 계산 (정적 API 렌더링용, 캐시가 한 스냅샷만 볼 때만 사용)
+    """
+
+    def __init__(self, cache, repository=None, memoize=False):
+        self.cache = cache
+        self.repository = repository
+        self._sections = {} if memoize else None
+
+    def _load_month_frame(self, month, file_name, columns=None):
+        """
+        월별 결과 파일을 필요한 컬럼만 로드
+        변환된 프레임은 스냅샷별로 DataCache 에 남아 요청 간에 공유된다 (호출 측에서 수정 금지)
+        """
+        return self.cache.get_month_frame(month, file_name, columns)
+
+    def _select_month_rows(self, output, month, file_name, column, value, ignore_case=False, columns=None):
+        """
+        결과 파일에서 column == value 인 행만 조회
+        SQL 저장소에 현재 스냅샷이 적재되어 있으면 인덱스 조회로, 아니면 파일을 읽어 필터링한다
+        """
+        if self.repository is not None:
+            rows = self.repository.select(output, month, {column: value}, columns=columns, ignore_case=ignore_case)
+            if rows is not None:
+                return rows
+
+        df = self._load_month_frame(month, file_name, columns)
+        if column not in df.columns:
+            return df.iloc[0:0]
+        if ignore_case:
+            return df[df[column].astype(str).str.lower() == str(value).lower()]
+        return df[df[column] == value]
+
+    # ==================== 월 단위 ====================
+
+    def months(self):
+        """데이터가 있는 모든 월 목록"""
+        try:
+            return {
+                'success': True,
+                'months': self.cache.get_all_months_with_data(),
+                # 파티션 카탈로그 기준 월별 데이터 년도
+                'partitions': self.cache.get_partitions()
+            }
+        except Exception as e:
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    def subsidiaries(self, month):
+        """특정 월의 subsidiary 목록"""
+        try:
+            return {
+                'success': True,
+                'month': month,
+                'subsidiaries': self.cache.get_subsidiaries_by_month(month)
+            }
+        except Exception as e:
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    def regions(self, month):
+        """특정 월의 region 목록"""
+        try:
+            return {
+                'success': True,
+                'month': month,
+                'regions': self.cache.get_regions_by_month(month)
+            }
+        except Exception as e:
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    def subsidiary_summary(self, month):
+        """특정 월의 Subsidiary 요약 데이터"""
+        try:
+            return {
+                'success': True,
+                'month': month,
+                'data': self.cache.get_subsidiary_summary_data(month)
+            }
+        except Exception as e:
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    def all_subsidiary_metrics(self, month):
+        """모든 Subsidiary의 지표 데이터 (logic.csv 전체)"""
+        try:
+            logger.debug("전체 Subsidiary 지표 요청: month=%s", month)
+
+            # logic.csv 파일 경로
+            csv_path = str(self.cache.get_month_dir(month) / "logic.csv")
+
+            if not os.path.exists(csv_path):
+                logger.debug("파일 없음: %s", csv_path)
+                return ({
+                    'success': False,
+                    'error': f'{month}월 logic.csv 데이터가 존재하지 않습니다.'
+                }), 404
+
+            # CSV 파일 읽기
+            df = self._load_month_frame(month, "logic.csv", METRIC_COLUMNS)
+            logger.debug("CSV 파일 로드 완료: %s 행", len(df))
+
+            # Subsidiary별 지표 데이터 구성 (컬럼 단위 변환: 지표는 NaN → 0 후 반올림, Y/N 값은 그대로)
+            subsidiaries = frame_records(
+                df,
+                {'subsidiary': 'Subsidiary', 'final_region': 'Final Region', **METRIC_RATE_FIELDS, **METRIC_FLAG_FIELDS},
+                round_fields=METRIC_RATE_FIELDS,
+                defaults={'subsidiary': '-', 'final_region': '-', **METRIC_FLAG_DEFAULTS}
+            )
+
+            logger.debug("응답 데이터 준비 완료: %s 개 Subsidiary 지표", len(subsidiaries))
+            return {
+                'success': True,
+                'subsidiaries': subsidiaries
+            }
+
+        except Exception as e:
+            logger.exception("All subsidiary metrics API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    @_section
+    def global_logic_data(self, month):
+        """Global logic 데이터를 계산 - (payload, status) 반환"""
+        try:
+            logger.debug("Global logic data request: month: %s", month)
+
+            # 캐시에서 Global 데이터 가져오기
+            global_data = self.cache.get_logic_global_data(month)
+
+            if global_data is None:
+                return ({
+                    'success': False,
+                    'error': f'No data found for month {month}'
+                }), 404
+
+            logger.debug("Global logic data found: %s fields", len(global_data))
+            logger.debug("Global logic data: %s", global_data)
+
+            response_data = {
+                'success': True,
+                'month': month,
+                'data': global_data
+            }
+
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Error getting global logic data: %s", e)
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @_section
+    def global_region_metrics(self, month):
+        """모든 지역의 지표 데이터를 계산 (캐시 사용) - (payload, status) 반환"""
+        try:
+            logger.debug("Global region metrics request: month: %s", month)
+
+            # 캐시에서 해당 월의 모든 region 데이터 가져오기
+            region_cache = self.cache.get_logic_region_map(month)
+            if region_cache is None:
+                return ({
+                    'success': False,
+                    'error': f'{month}월 데이터가 존재하지 않습니다.'
+                }), 404
+
+            logger.debug("%s월 region 캐시: %s 개 지역", month, len(region_cache))
+
+            # 각 region별 데이터를 리스트로 변환
+            regions = []
+            for region_name, region_data in region_cache.items():
+                new_leader_rate = round(region_data.get('New_Leader_Completion_Rate', 0), 1)
+                logger.debug("%s New_Leader_Completion_Rate: %s%% (원본: %s)", region_name, new_leader_rate, region_data.get('New_Leader_Completion_Rate'))
+
+                region_metrics = {
+                    'region': region_name,
+                    'total_score': round(region_data.get('Score', 0), 1),  # 캐시된 Region Score 평균
+                    'course_completion_rate': round(region_data.get('Course_Completion_Rate', 0), 1),
+                    'hours_completion_rate': round(region_data.get('Hours_Completion_Rate', 0), 1),
+                    'new_hire_completion_rate': round(region_data.get('New_Hire_Completion_Rate', 0), 1),
+                    'eip_completion_rate': round(region_data.get('EIP_Completion_Rate', 0), 1),
+                    'glp_completion_rate': round(region_data.get('GLP_Completion_Rate', 0), 1),
+                    'new_leader_rate': new_leader_rate,
+                    'lms_education_rate': round(region_data.get('New_LMS_Course_Rate', 0), 1),
+                    'lms_mission_rate': round(region_data.get('LMS_Mission_Rate', 0), 1),
+                    'annual_plan': round(region_data.get('Annual_Plan_Setup_Rate', 0), 1),
+                    'jam_community': round(region_data.get('JAM_Member_Rate', 0), 1),
+                    'global_council': round(region_data.get('Global_LD_Council_Rate', 0), 1),
+                    'infra_index': round(region_data.get('Infra_Index_Response_Rate', 0), 1)
+                }
+                regions.append(region_metrics)
+
+            # Global 평균 데이터 가져오기
+            global_data = self.cache.get_logic_global_data(month)
+            global_avg = None
+            if global_data:
+                global_avg = {
+                    'region': 'Global',
+                    'total_score': round(global_data.get('Score', 0), 1),  # 캐시된 Global Score 평균
+                    'course_completion_rate': round(global_data.get('Course_Completion_Rate', 0), 1),
+                    'hours_completion_rate': round(global_data.get('Hours_Completion_Rate', 0), 1),
+                    'new_hire_completion_rate': round(global_data.get('New_Hire_Completion_Rate', 0), 1),
+                    'eip_completion_rate': round(global_data.get('EIP_Completion_Rate', 0), 1),
+                    'glp_completion_rate': round(global_data.get('GLP_Completion_Rate', 0), 1),
+                    'new_leader_rate': round(global_data.get('New_Leader_Completion_Rate', 0), 1),
+                    'lms_education_rate': round(global_data.get('New_LMS_Course_Rate', 0), 1),
+                    'lms_mission_rate': round(global_data.get('LMS_Mission_Rate', 0), 1),
+                    'annual_plan': round(global_data.get('Annual_Plan_Setup_Rate', 0), 1),
+                    'jam_community': round(global_data.get('JAM_Member_Rate', 0), 1),
+                    'global_council': round(global_data.get('Global_LD_Council_Rate', 0), 1),
+                    'infra_index': round(global_data.get('Infra_Index_Response_Rate', 0), 1)
+                }
+
+            response_data = {
+                'success': True,
+                'regions': regions,
+                'global_avg': global_avg
+            }
+
+            logger.debug("응답 데이터 준비 완료: %s 개 Region + Global 평균", len(regions))
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Global region metrics API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    @_section
+    def global_infos(self, month):
+        """Global hr_index_final 데이터를 계산 - (payload, status) 반환"""
+        try:
+            logger.debug("Global infos request: month: %s", month)
+
+            # 월별 인원 집계 (hr_index_final 기준, 캐시)
+            headcount = self.cache.get_headcount(month)
+
+            if headcount is None:
+                return ({
+                    'success': False,
+                    'error': f'hr_index_final.csv not found for month: {month}'
+                }), 404
+
+            # 전체 데이터 집계 (Global)
+            global_totals = headcount.global_totals()
+
+            response_data = {
+                'success': True,
+                'month': month,
+                'data': global_totals
+            }
+
+            logger.debug("Global infos 응답: %s", response_data)
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Error getting global infos: %s", e)
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    # ==================== Region 단위 ====================
+
+    @_section
+    def region_logic_data(self, region, month):
+        """특정 지역의 logic 데이터를 계산 - (payload, status) 반환"""
+        try:
+            # URL 디코딩
+            region = unquote(region)
+            logger.debug("Region logic data request: %s, month: %s", region, month)
+
+            # 캐시에서 지역 데이터 가져오기
+            region_data = self.cache.get_logic_region_data(month, region)
+
+            if region_data is None:
+                return ({
+                    'success': False,
+                    'error': f'No data found for region {region} in month {month}'
+                }), 404
+
+            logger.debug("Region logic data found: %s fields", len(region_data))
+            logger.debug("Region logic data: %s", region_data)
+
+            # Global 데이터 가져오기
+            global_data = self.cache.get_logic_global_data(month)
+
+            # NaN 값 처리 함수
+            def safe_convert(obj):
+                """numpy 타입과 NaN을 JSON 직렬화 가능한 형태로 변환"""
+                if isinstance(obj, (np.integer, np.int64)):
+                    return int(obj)
+                elif isinstance(obj, (np.floating, np.float64)):
+                    if np.isnan(obj):
+                        return 0  # NaN을 0으로 변환
+                    return float(obj)
+                elif isinstance(obj, dict):
+                    return {key: safe_convert(value) for key, value in obj.items()}
+                elif isinstance(obj, list):
+                    return [safe_convert(item) for item in obj]
+                else:
+                    return obj
+
+            response_data = {
+                'success': True,
+                'region': region,
+                'month': month,
+                'data': safe_convert(region_data),
+                'global_data': safe_convert(global_data)
+            }
+
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Error getting region logic data: %s", e)
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @_section
+    def region_infos(self, region, month):
+        """특정 지역의 hr_index_final 데이터를 계산 - (payload, status) 반환"""
+        try:
+            # URL 디코딩
+            region = unquote(region)
+            logger.debug("Region infos request: %s, month: %s", region, month)
+
+            # 월별 인원 집계 (hr_index_final 기준, 캐시)
+            headcount = self.cache.get_headcount(month)
+
+            if headcount is None:
+                return ({
+                    'success': False,
+                    'error': f'hr_index_final.csv not found for month: {month}'
+                }), 404
+
+            # 대소문자 구분 없이 region 조회
+            region_info = headcount.region(region)
+
+            if region_info is None:
+                return ({
+                    'success': False,
+                    'error': f'No data found for region: {region}'
+                }), 404
+
+            response_data = {
+                'success': True,
+                'region': region,
+                'month': month,
+                'data': {
+                    'region_name': region_info['region_name'],
+                    'total_count': region_info['total_count'],
+                    'new_hire_count': region_info['new_hire_count'],
+                    'eip_count': region_info['eip_count'],
+                    'glp_count': region_info['glp_count'],
+                    'staff_count': region_info['staff_count'],
+                    'operator_count': region_info['operator_count']
+                }
+            }
+
+            logger.debug("Region infos 응답: %s", response_data)
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Error getting region infos: %s", e)
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @_section
+    def region_course_list(self, region, month):
+        """특정 지역의 완료된 과정 리스트를 계산 - (payload, status) 반환"""
+        try:
+            # URL 디코딩
+            region = unquote(region)
+            logger.debug("지역 과정리스트 요청: region=%s, month=%s", region, month)
+
+            # 과정별 집계 테이블 (make_logic 에서 생성, 월별 캐시)
+            course_aggregates = self.cache.get_course_aggregates(month)
+
+            if course_aggregates is None:
+                logger.debug("과정 집계 데이터 없음: %s월", month)
+                return ({
+                    'success': False,
+                    'error': f'{month}월 데이터가 존재하지 않습니다.'
+                }), 404
+
+            # 요청된 region이 해당 월에 존재하는지 확인 (대소문자 구분 없이)
+            available_regions = self.cache.get_regions_by_month(month)
+            if region.lower() not in [str(r).lower() for r in available_regions]:
+                return ({
+                    'success': False,
+                    'error': f'{region} 지역의 데이터를 찾을 수 없습니다. 사용 가능한 지역: {list(available_regions)[:20]}...'
+                }), 404
+
+            # 해당 region, 기준월 집계 행만 선택
+            region_rows = course_aggregates[course_aggregates['Final Region'].str.lower() == region.lower()]
+            month_rows = region_rows[region_rows['Year_Month'].astype(str).str.endswith(f"-{month:02d}", na=False)]
+
+            if month_rows.empty:
+                return ({
+                    'success': True,
+                    'courses': [],
+                    'staff_unique_count': 0,
+                    'message': f'{region} 지역에 {month}월 완료된 과정이 없습니다.'
+                })
+
+            logger.debug("%s월 완료 과정 집계 행: %s 행", month, len(month_rows))
+
+            # 법인별 집계를 과정 단위로 병합
+            course_summary = month_rows.groupby('Course name').agg(
+                category_1=('category_1', 'first'),   # 카테고리 대 (첫 번째 값 사용)
+                category_2=('category_2', 'first'),   # 카테고리 중 (첫 번째 값 사용)
+                Category=('Category', 'first'),       # 카테고리 소 (첫 번째 값 사용)
+                participant_count=('participant_count', 'sum'),  # 이수인원
+                total_hours=('total_hours', 'sum')               # 총 이수시간
+            ).reset_index()
+
+            logger.debug("과정별 집계 완료: %s 과정", len(course_summary))
+
+            # 과정 리스트 생성 (컬럼 단위 변환, NaN → null)
+            course_summary['participant_count'] = course_summary['participant_count'].astype(int)
+            course_summary['total_hours'] = course_summary['total_hours'].astype(float)
+            courses = frame_records(course_summary, COURSE_FIELDS)
+
+            logger.debug("첫 번째 과정명: %s", courses[0]['course_name'] if courses else 'None')
+
+            # Staff 고유 인원 수: 인원 집계의 지역별 Staff 사번 고유값
+            headcount = self.cache.get_headcount(month)
+            staff_unique_count = headcount.region_staff_unique(region) if headcount is not None else 0
+            logger.debug("%s 지역 Staff 고유 인원: %s명", region, staff_unique_count)
+
+            response_data = {
+                'success': True,
+                'courses': courses,
+                'staff_unique_count': staff_unique_count or 0
+            }
+
+            logger.debug("응답 데이터 준비 완료: %s 과정, Staff %s명", len(courses), staff_unique_count)
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Region course list API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    @_section
+    def region_subsidiary_metrics(self, region, month):
+        """특정 지역의 Subsidiary별 지표 데이터를 계산 - (payload, status) 반환"""
+        try:
+            # URL 디코딩
+            region = unquote(region)
+            logger.debug("지역 Subsidiary 지표 요청: region=%s, month=%s", region, month)
+
+            # logic.csv 파일 경로
+            csv_path = str(self.cache.get_month_dir(month) / "logic.csv")
+
+            if not os.path.exists(csv_path):
+                logger.debug("파일 없음: %s", csv_path)
+                return ({
+                    'success': False,
+                    'error': f'{month}월 logic.csv 데이터가 존재하지 않습니다.'
+                }), 404
+
+            # CSV 파일 읽기
+            df = self._load_month_frame(month, "logic.csv", METRIC_COLUMNS)
+            logger.debug("CSV 파일 로드 완료: %s 행", len(df))
+
+            # 컬럼명 확인
+            if 'Final Region' not in df.columns:
+                return ({
+                    'success': False,
+                    'error': 'Final Region 컬럼을 찾을 수 없습니다.'
+                }), 400
+
+            # NaN 값을 안전하게 처리하는 함수
+            def safe_round(value, decimals=1):
+                """NaN을 0으로 처리하고 round"""
+                if pd.isna(value):
+                    return 0
+                return round(float(value), decimals)
+
+            # 해당 region 데이터 필터링 (대소문자 구분 없이)
+            region_data = df[df['Final Region'].str.lower() == region.lower()]
+            logger.debug("%s 지역 데이터 필터링 완료: %s 행", region, len(region_data))
+
+            if region_data.empty:
+                return ({
+                    'success': False,
+                    'error': f'{region} 지역의 데이터를 찾을 수 없습니다.'
+                }), 404
+
+            # Subsidiary별 지표 데이터 구성 (컬럼 단위 변환: 지표는 NaN → 0 후 반올림, Y/N 값은 그대로)
+            subsidiaries = frame_records(
+                region_data,
+                {'subsidiary': 'Subsidiary', **METRIC_RATE_FIELDS, **METRIC_FLAG_FIELDS},
+                round_fields=METRIC_RATE_FIELDS,
+                defaults={'subsidiary': '-', **METRIC_FLAG_DEFAULTS}
+            )
+
+            # Region 평균 데이터 가져오기 (캐시에서)
+            region_avg = self.cache.get_logic_region_data(month, region)
+            region_avg_data = None
+
+            if region_avg:
+                region_avg_data = {
+                    'subsidiary': 'Region',
+                    'total_score': safe_round(region_avg.get('Score', 0)),  # 캐시된 Region Score 평균
+                    'course_completion_rate': safe_round(region_avg.get('Course_Completion_Rate', 0)),
+                    'hours_completion_rate': safe_round(region_avg.get('Hours_Completion_Rate', 0)),
+                    'new_hire_completion_rate': safe_round(region_avg.get('New_Hire_Completion_Rate', 0)),
+                    'eip_completion_rate': safe_round(region_avg.get('EIP_Completion_Rate', 0)),
+                    'glp_completion_rate': safe_round(region_avg.get('GLP_Completion_Rate', 0)),
+                    'new_leader_rate': safe_round(region_avg.get('New_Leader_Completion_Rate', 0)),
+                    'lms_education_rate': safe_round(region_avg.get('New_LMS_Course_Rate', 0)),
+                    'lms_mission_rate': safe_round(region_avg.get('LMS_Mission_Rate', 0)),
+                    'annual_plan': safe_round(region_avg.get('Annual_Plan_Setup_Rate', 0)),
+                    'jam_community': safe_round(region_avg.get('JAM_Member_Rate', 0)),
+                    'global_council': safe_round(region_avg.get('Global_LD_Council_Rate', 0)),
+                    'infra_index': safe_round(region_avg.get('Infra_Index_Response_Rate', 0))
+                }
+
+            response_data = {
+                'success': True,
+                'subsidiaries': subsidiaries,
+                'region_avg': region_avg_data
+            }
+
+            logger.debug("응답 데이터 준비 완료: %s 개 Subsidiary 지표 + Region 평균", len(subsidiaries))
+            return (response_data)
+
+        except Exception as e:
+            logger.exception("Region subsidiary metrics API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    def region_subsidiary_list(self, region, month):
+        """특정 지역의 Subsidiary 리스트를 계산 - (payload, status) 반환"""
+        try:
+            # URL 디코딩
+            region = unquote(region)
+            logger.debug("지역 Subsidiary 리스트 요청: region=%s, month=%s", region, month)
+
+            # 월별 인원 집계 (hr_index_final 기준, 캐시)
+            headcount = self.cache.get_headcount(month)
+
+            if headcount is None:
+                logger.debug("인원 집계 없음: %s월", month)
+                return ({
+                    'success': False,
+                    'error': f'{month}월 데이터가 존재하지 않습니다.'
+                }), 404
+
+            # 해당 region의 법인별 집계 (대소문자 구분 없이)
+            subsidiaries = headcount.region_subsidiaries(region)
+
+            if not subsidiaries:
+                return ({
+                    'success': False,
+                    'error': f'{region} 지역의 데이터를 찾을 수 없습니다.'
+                }), 404
+
+            logger.debug("응답 데이터 준비 완료: %s 개 Subsidiary", len(subsidiaries))
+            return {
+                'success': True,
+                'subsidiaries': subsidiaries
+            }
+
+        except Exception as e:
+            logger.exception("Region subsidiary list API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    def region_summary(self, region, month):
+        """특정 지역의 logic.csv 요약 데이터를 계산 - (payload, status) 반환"""
+        try:
+            logger.debug("지역 요약 요청: region=%s, month=%s", region, month)
+
+            # 지표 큐브 (logic.csv 법인 단위 합산 값)
+            cube = self.cache.get_metrics_cube(month)
+
+            if cube is None:
+                logger.debug("%s월 지표 큐브 없음", month)
+                return ({
+                    'success': False,
+                    'error': f'{month}월 데이터를 찾을 수 없습니다.'
+                }), 404
+
+            # Final Region이 선택된 region과 같은 셀만 선택 (대소문자 구분 없음)
+            region_data = cube[cube['Final Region'].astype(str).str.lower() == str(region).lower()]
+            logger.debug("%s 지역 데이터: %s 셀", region, len(region_data))
+
+            if region_data.empty:
+                logger.debug("%s 지역 데이터 없음", region)
+                return {
+                    'success': True,
+                    'data': {},
+                    'message': f'{region} 지역의 데이터가 없습니다.'
+                }
+
+            # 큐브 합산 후 공통 공식으로 비율 계산 (소수 첫째자리)
+            totals = rollup(region_data)
+            rates = derive_rates(totals, decimals=1)
+            result = {col: float(totals[col]) for col in REGION_SUMMARY_SUM_COLUMNS}
+            result.update({rate: rates[rate] for rate in REGION_SUMMARY_RATE_COLUMNS})
+
+            logger.debug("계산된 평균 데이터: %s", result)
+
+            return {
+                'success': True,
+                'data': result,
+                'region': region,
+                'month': month,
+                'total_records': int(totals[SUBSIDIARY_COUNT])
+            }
+
+        except Exception as e:
+            logger.exception("지역 요약 오류: %s", e)
+            return ({
+                'success': False,
+                'error': f'지역 요약을 불러오는 중 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    # ==================== Subsidiary 단위 ====================
+
+    @_section
+    def subsidiary_detail(self, subsidiary, month):
+        """특정 법인의 상세 정보를 계산 - (payload, status) 반환"""
+        try:
+            # 월별 인원 집계 (hr_index_final 기준, 캐시)
+            month_folder = str(month)
+            headcount = self.cache.get_headcount(month)
+
+            if headcount is None:
+                return ({
+                    'success': False,
+                    'error': f'{month_folder} 데이터가 존재하지 않습니다.'
+                }), 404
+
+            # 해당 subsidiary 집계 조회
+            subsidiary_info = headcount.subsidiary(subsidiary)
+
+            if subsidiary_info is None:
+                return ({
+                    'success': False,
+                    'error': f'{subsidiary} 법인의 데이터를 찾을 수 없습니다.'
+                }), 404
+
+            # 기본 정보 (지역은 첫 번째 행 기준)
+            region = subsidiary_info['region']
+
+            # 법인명과 Sub. Name(MP)
+            subsidiary_name = subsidiary
+            sub_name_mp = subsidiary_info['sub_name_mp']
+
+            # 담당자 정보 가져오기 (hong_data_manager_final.csv)
+            manager_email = '-'
+            try:
+                manager_file = self.cache.get_month_dir(month) / "hong_data_manager_final.csv"
+
+                if manager_file.exists():
+                    manager_data = self._select_month_rows('hong_manager', month, manager_file.name, 'Final Sub.', subsidiary,
+                                                      columns=['Final Sub.', 'L&D PIC e-mail'])
+
+                    if 'L&D PIC e-mail' in manager_data.columns and not manager_data.empty:
+                        manager_email = manager_data['L&D PIC e-mail'].iloc[0]
+                        if pd.isna(manager_email):
+                            manager_email = '-'
+            except Exception as e:
+                logger.warning("Error loading manager data: %s", e)
+                manager_email = '-'
+
+            response_data = {
+                'success': True,
+                'subsidiary': subsidiary,
+                'month': month,
+                'data': {
+                    'region': region,
+                    'total_count': subsidiary_info['total_count'],
+                    'new_hire_count': subsidiary_info['new_hire_count'],
+                    'eip_count': subsidiary_info['eip_count'],
+                    'glp_count': subsidiary_info['glp_count'],
+                    'staff_count': subsidiary_info['staff_count'],
+                    'operator_count': subsidiary_info['operator_count']
+                },
+                'company_info': {
+                    'subsidiary_name': subsidiary_name,
+                    'sub_name_mp': sub_name_mp,
+                    'region': region,
+                    'manager_email': manager_email
+                }
+            }
+
+            return (response_data)
+
+        except Exception as e:
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @_section
+    def logic_course_completion(self, subsidiary, month):
+        """logic.csv 에서 특정 법인의 Course_Completion_Rate 를 계산 - (payload, status) 반환"""
+        try:
+            month_folder = str(month)
+            csv_file = self.cache.get_month_dir(month) / "logic.csv"
+
+            if not csv_file.exists():
+                return ({
+                    'success': False,
+                    'error': f'{month_folder} logic.csv 파일이 존재하지 않습니다.'
+                }), 404
+
+            # 법인 / 지표 컬럼을 이름으로 찾으므로 전체 컬럼 로드
+            df = self._load_month_frame(month, csv_file.name)
+
+            # 디버깅: 컬럼명 출력 (DEBUG 레벨에서만 목록 생성)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available columns: %s", list(df.columns))
+            logger.debug("Looking for subsidiary: %s", subsidiary)
+
+            # 법인 컬럼 찾기 (대소문자 무관)
+            sub_col = None
+            for col in df.columns:
+                if col.lower() in ['subsidiary', 'final sub.', 'final_sub', 'final_sub.']:
+                    sub_col = col
+                    break
+
+            if sub_col is None:
+                return ({
+                    'success': False,
+                    'error': f'logic.csv 에서 법인 식별 컬럼을 찾을 수 없습니다. 사용 가능한 컬럼: {list(df.columns)}'
+                }), 400
+
+            # Course_Completion_Rate 컬럼 찾기 (대소문자 무관)
+            rate_col = None
+            for col in df.columns:
+                if col.lower() in ['course_completion_rate', 'course completion rate', 'completion_rate']:
+                    rate_col = col
+                    break
+
+            if rate_col is None:
+                return ({
+                    'success': False,
+                    'error': f'logic.csv 에서 Course_Completion_Rate 컬럼을 찾을 수 없습니다. 사용 가능한 컬럼: {list(df.columns)}'
+                }), 400
+
+            logger.debug("Using subsidiary column: %s", sub_col)
+            logger.debug("Using rate column: %s", rate_col)
+
+            # 해당 subsidiary 데이터 찾기 (대소문자 무관)
+            # 양쪽 모두 소문자로 변환해서 매칭
+            subsidiary_lower = subsidiary.lower()
+
+            row = df[df[sub_col].astype(str).str.lower() == subsidiary_lower]
+            if row.empty:
+                # 디버깅: 사용 가능한 subsidiary 값들 출력
+                available_subs = df[sub_col].unique()[:10]  # 처음 10개만
+                return ({
+                    'success': False,
+                    'error': f'{subsidiary} 법인의 logic.csv 데이터가 없습니다. 사용 가능한 법인: {list(available_subs)}'
+                }), 404
+
+            value = row[rate_col].iloc[0]
+            logger.debug("Found value: %r", value)
+
+            # Planned_Courses와 Completed_Courses 값 가져오기
+            planned_courses = '-'
+            completed_courses = '-'
+
+            # Planned_Courses 컬럼 찾기
+            planned_col = None
+            for col in df.columns:
+                if col.lower() in ['planned_courses', 'planned courses', 'planned']:
+                    planned_col = col
+                    break
+
+            # Completed_Courses 컬럼 찾기
+            completed_col = None
+            for col in df.columns:
+                if col.lower() in ['completed_courses', 'completed courses', 'completed']:
+                    completed_col = col
+                    break
+
+            if planned_col and planned_col in row.columns:
+                planned_courses = row[planned_col].iloc[0]
+                if pd.isna(planned_courses):
+                    planned_courses = '-'
+
+            if completed_col and completed_col in row.columns:
+                completed_courses = row[completed_col].iloc[0]
+                if pd.isna(completed_courses):
+                    completed_courses = '-'
+
+            # Hours_Completion_Rate, Planned_Hours, Actual_Hours 값 가져오기
+            hours_completion_rate = '-'
+            planned_hours = '-'
+            actual_hours = '-'
+
+            # Hours_Completion_Rate 컬럼 찾기
+            hours_rate_col = None
+            for col in df.columns:
+                if col.lower() in ['hours_completion_rate', 'hours completion rate', 'completion_rate']:
+                    hours_rate_col = col
+                    break
+
+            # Planned_Hours 컬럼 찾기
+            planned_hours_col = None
+            for col in df.columns:
+                if col.lower() in ['planned_hours', 'planned hours', 'planned']:
+                    planned_hours_col = col
+                    break
+
+            # Actual_Hours 컬럼 찾기
+            actual_hours_col = None
+            for col in df.columns:
+                if col.lower() in ['actual_hours', 'actual hours', 'actual']:
+                    actual_hours_col = col
+                    break
+
+            if hours_rate_col and hours_rate_col in row.columns:
+                hours_completion_rate = row[hours_rate_col].iloc[0]
+                if pd.isna(hours_completion_rate):
+                    hours_completion_rate = '-'
+
+            if planned_hours_col and planned_hours_col in row.columns:
+                planned_hours = row[planned_hours_col].iloc[0]
+                if pd.isna(planned_hours):
+                    planned_hours = '-'
+
+            if actual_hours_col and actual_hours_col in row.columns:
+                actual_hours = row[actual_hours_col].iloc[0]
+                if pd.isna(actual_hours):
+                    actual_hours = '-'
+
+            # New Hire 지표: New_Hire_Completion_Rate, New_Hire_Total, New_Hire_Completed,
+            #                New_Hire_Not_Completed, New_Hire_Pending
+            nh_completion_rate = '-'
+            nh_total = '-'
+            nh_completed = '-'
+            nh_not_completed = '-'
+            nh_pending = '-'
+
+            def find_col(candidates):
+                for col in df.columns:
+                    if col.lower() in candidates:
+                        return col
+                return None
+
+            nh_rate_col = find_col(['new_hire_completion_rate', 'new hire completion rate'])
+            nh_total_col = find_col(['new_hire_total', 'new hire total'])
+            nh_completed_col = find_col(['new_hire_completed', 'new hire completed'])
+            nh_not_completed_col = find_col(['new_hire_not_completed', 'new hire not completed'])
+            nh_pending_col = find_col(['new_hire_pending', 'new hire pending'])
+
+            if nh_rate_col and nh_rate_col in row.columns:
+                nh_completion_rate = row[nh_rate_col].iloc[0]
+                if pd.isna(nh_completion_rate):
+                    nh_completion_rate = '-'
+
+            if nh_total_col and nh_total_col in row.columns:
+                nh_total = row[nh_total_col].iloc[0]
+                if pd.isna(nh_total):
+                    nh_total = '-'
+
+            if nh_completed_col and nh_completed_col in row.columns:
+                nh_completed = row[nh_completed_col].iloc[0]
+                if pd.isna(nh_completed):
+                    nh_completed = '-'
+
+            if nh_not_completed_col and nh_not_completed_col in row.columns:
+                nh_not_completed = row[nh_not_completed_col].iloc[0]
+                if pd.isna(nh_not_completed):
+                    nh_not_completed = '-'
+
+            if nh_pending_col and nh_pending_col in row.columns:
+                nh_pending = row[nh_pending_col].iloc[0]
+                if pd.isna(nh_pending):
+                    nh_pending = '-'
+
+            # EIP 지표: EIP_Completion_Rate, EIP_Total, EIP_Completed, EIP_Not_Completed
+            eip_completion_rate = '-'
+            eip_total = '-'
+            eip_completed = '-'
+            eip_not_completed = '-'
+
+            eip_rate_col = find_col(['eip_completion_rate', 'eip completion rate'])
+            eip_total_col = find_col(['eip_total', 'eip total'])
+            eip_completed_col = find_col(['eip_completed', 'eip completed'])
+            eip_not_completed_col = find_col(['eip_not_completed', 'eip not completed'])
+
+            if eip_rate_col and eip_rate_col in row.columns:
+                eip_completion_rate = row[eip_rate_col].iloc[0]
+                if pd.isna(eip_completion_rate):
+                    eip_completion_rate = '-'
+
+            if eip_total_col and eip_total_col in row.columns:
+                eip_total = row[eip_total_col].iloc[0]
+                if pd.isna(eip_total):
+                    eip_total = '-'
+
+            if eip_completed_col and eip_completed_col in row.columns:
+                eip_completed = row[eip_completed_col].iloc[0]
+                if pd.isna(eip_completed):
+                    eip_completed = '-'
+
+            if eip_not_completed_col and eip_not_completed_col in row.columns:
+                eip_not_completed = row[eip_not_completed_col].iloc[0]
+                if pd.isna(eip_not_completed):
+                    eip_not_completed = '-'
+
+            # GLP 지표: GLP_Completion_Rate, GLP_Total, GLP_Completed, GLP_Not_Completed
+            glp_completion_rate = '-'
+            glp_total = '-'
+            glp_completed = '-'
+            glp_not_completed = '-'
+
+            glp_rate_col = find_col(['glp_completion_rate', 'glp completion rate'])
+            glp_total_col = find_col(['glp_total', 'glp total'])
+            glp_completed_col = find_col(['glp_completed', 'glp completed'])
+            glp_not_completed_col = find_col(['glp_not_completed', 'glp not completed'])
+
+            if glp_rate_col and glp_rate_col in row.columns:
+                glp_completion_rate = row[glp_rate_col].iloc[0]
+                if pd.isna(glp_completion_rate):
+                    glp_completion_rate = '-'
+
+            if glp_total_col and glp_total_col in row.columns:
+                glp_total = row[glp_total_col].iloc[0]
+                if pd.isna(glp_total):
+                    glp_total = '-'
+
+            if glp_completed_col and glp_completed_col in row.columns:
+                glp_completed = row[glp_completed_col].iloc[0]
+                if pd.isna(glp_completed):
+                    glp_completed = '-'
+
+            if glp_not_completed_col and glp_not_completed_col in row.columns:
+                glp_not_completed = row[glp_not_completed_col].iloc[0]
+                if pd.isna(glp_not_completed):
+                    glp_not_completed = '-'
+
+            # New Leader 지표: New_Leader_Completion_Rate, New_Leader_Total, New_Leader_Completed, New_Leader_Not_Completed
+            new_leader_completion_rate = '-'
+            new_leader_total = '-'
+            new_leader_completed = '-'
+            new_leader_not_completed = '-'
+
+            new_leader_rate_col = find_col(['new_leader_completion_rate', 'new leader completion rate'])
+            new_leader_total_col = find_col(['new_leader_total', 'new leader total'])
+            new_leader_completed_col = find_col(['new_leader_completed', 'new leader completed'])
+            new_leader_not_completed_col = find_col(['new_leader_not_completed', 'new leader not completed'])
+
+            if new_leader_rate_col and new_leader_rate_col in row.columns:
+                new_leader_completion_rate = row[new_leader_rate_col].iloc[0]
+                if pd.isna(new_leader_completion_rate):
+                    new_leader_completion_rate = '-'
+
+            if new_leader_total_col and new_leader_total_col in row.columns:
+                new_leader_total = row[new_leader_total_col].iloc[0]
+                if pd.isna(new_leader_total):
+                    new_leader_total = '-'
+
+            if new_leader_completed_col and new_leader_completed_col in row.columns:
+                new_leader_completed = row[new_leader_completed_col].iloc[0]
+                if pd.isna(new_leader_completed):
+                    new_leader_completed = '-'
+
+            if new_leader_not_completed_col and new_leader_not_completed_col in row.columns:
+                new_leader_not_completed = row[new_leader_not_completed_col].iloc[0]
+                if pd.isna(new_leader_not_completed):
+                    new_leader_not_completed = '-'
+
+            try:
+                # 퍼센트 표기 정규화 (0-1 값이면 0-100으로 변환)
+                if pd.notna(value):
+                    if isinstance(value, str) and value.strip().endswith('%'):
+                        value_num = float(value.strip().replace('%', ''))
+                    else:
+                        value_num = float(value)
+                        if value_num <= 1:
+                            value_num = value_num * 100.0
+                    value = round(value_num, 1)
+            except Exception:
+                # 숫자 변환 실패 시 문자열 그대로 반환
+                pass
+
+            # Global 데이터 가져오기
+            global_data = self.cache.get_logic_global_data(month)
+
+            # Region 데이터 가져오기 (subsidiary detail API에서 region 정보 사용)
+            region_data = None
+            if 'Final Region' in df.columns:
+                region = row['Final Region'].iloc[0] if not row.empty else None
+                if region and pd.notna(region):
+                    region_data = self.cache.get_logic_region_data(month, region)
+                    logger.debug("Region 데이터 로드: %s, 데이터 존재: %s", region, region_data is not None)
+                    # region_data가 None이면 빈 딕셔너리로 설정
+                    if region_data is None:
+                        region_data = {}
+
+            # global_data가 None이면 빈 딕셔너리로 설정
+            if global_data is None:
+                global_data = {}
+
+            # Score 값 가져오기
+            score = '-'
+            score_col = find_col(['score'])
+            if score_col and score_col in row.columns:
+                score_val = row[score_col].iloc[0]
+                if pd.notna(score_val):
+                    score = round(float(score_val), 1)
+
+            # Index Management에서 추가된 6개 컬럼 값 가져오기
+            new_lms_course = '-'
+            lms_mission = '-'
+            annual_plan_setup = '-'
+            jam_member = '-'
+            global_ld_council = '-'
+            infra_index_response = '-'
+
+            # 컬럼명 매핑 (logic.csv의 컬럼명과 매칭)
+            new_lms_col = find_col(['new lms course', 'new_lms_course'])
+            lms_mission_col = find_col(['lms mission', 'lms_mission'])
+            annual_plan_col = find_col(['annual plan setup', 'annual_plan_setup'])
+            jam_member_col = find_col(['jam member', 'jam_member'])
+            global_ld_col = find_col(['global l&d council', 'global_l&d_council'])
+            infra_index_col = find_col(['infra index response', 'infra_index_response'])
+
+            if new_lms_col and new_lms_col in row.columns:
+                new_lms_course = row[new_lms_col].iloc[0]
+                if pd.isna(new_lms_course):
+                    new_lms_course = '-'
+
+            if lms_mission_col and lms_mission_col in row.columns:
+                lms_mission = row[lms_mission_col].iloc[0]
+                if pd.isna(lms_mission):
+                    lms_mission = '-'
+
+            if annual_plan_col and annual_plan_col in row.columns:
+                annual_plan_setup = row[annual_plan_col].iloc[0]
+                if pd.isna(annual_plan_setup):
+                    annual_plan_setup = '-'
+
+            if jam_member_col and jam_member_col in row.columns:
+                jam_member = row[jam_member_col].iloc[0]
+                if pd.isna(jam_member):
+                    jam_member = '-'
+
+            if global_ld_col and global_ld_col in row.columns:
+                global_ld_council = row[global_ld_col].iloc[0]
+                if pd.isna(global_ld_council):
+                    global_ld_council = '-'
+
+            if infra_index_col and infra_index_col in row.columns:
+                infra_index_response = row[infra_index_col].iloc[0]
+                if pd.isna(infra_index_response):
+                    infra_index_response = '-'
+
+            # 모든 값을 JSON 직렬화 가능하도록 변환
+            def safe_convert(val):
+                if pd.isna(val):
+                    return None
+                # numpy 타입을 Python 기본 타입으로 변환
+                if isinstance(val, (np.integer, np.int64, np.int32)):
+                    return int(val)
+                if isinstance(val, (np.floating, np.float64, np.float32)):
+                    return float(val)
+                if isinstance(val, (int, float)):
+                    return val
+                return str(val)
+
+            return ({
+                'success': True,
+                'subsidiary': subsidiary,
+                'month': month,
+                'score': safe_convert(score),
+                'course_completion_rate': safe_convert(value),
+                'planned_courses': safe_convert(planned_courses),
+                'completed_courses': safe_convert(completed_courses),
+                'hours_completion_rate': safe_convert(hours_completion_rate),
+                'planned_hours': safe_convert(planned_hours),
+                'actual_hours': safe_convert(actual_hours),
+                'new_hire_completion_rate': safe_convert(nh_completion_rate),
+                'new_hire_total': safe_convert(nh_total),
+                'new_hire_completed': safe_convert(nh_completed),
+                'new_hire_not_completed': safe_convert(nh_not_completed),
+                'new_hire_pending': safe_convert(nh_pending),
+                'eip_completion_rate': safe_convert(eip_completion_rate),
+                'eip_total': safe_convert(eip_total),
+                'eip_completed': safe_convert(eip_completed),
+                'eip_not_completed': safe_convert(eip_not_completed),
+                'glp_completion_rate': safe_convert(glp_completion_rate),
+                'glp_total': safe_convert(glp_total),
+                'glp_completed': safe_convert(glp_completed),
+                'glp_not_completed': safe_convert(glp_not_completed),
+                'new_leader_completion_rate': safe_convert(new_leader_completion_rate),
+                'new_leader_total': safe_convert(new_leader_total),
+                'new_leader_completed': safe_convert(new_leader_completed),
+                'new_leader_not_completed': safe_convert(new_leader_not_completed),
+                'new_lms_course': safe_convert(new_lms_course),
+                'lms_mission': safe_convert(lms_mission),
+                'annual_plan_setup': safe_convert(annual_plan_setup),
+                'jam_member': safe_convert(jam_member),
+                'global_ld_council': safe_convert(global_ld_council),
+                'infra_index_response': safe_convert(infra_index_response),
+                'global_data': global_data if global_data else {},
+                'region_data': region_data if region_data else {}
+            })
+        except Exception as e:
+            logger.exception("logic course completion API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @_section
+    def course_list(self, subsidiary, month):
+        """특정 법인의 완료된 과정 리스트를 계산 - (payload, status) 반환"""
+        try:
+            logger.debug("과정리스트 요청: subsidiary=%s, month=%s", subsidiary, month)
+
+            # 과정별 집계 테이블 (make_logic 에서 생성, 월별 캐시)
+            course_aggregates = self.cache.get_course_aggregates(month)
+
+            if course_aggregates is None:
+                logger.debug("과정 집계 데이터 없음: %s월", month)
+                return ({
+                    'success': False,
+                    'error': f'{month}월 데이터를 찾을 수 없습니다.'
+                }), 404
+
+            # 선택된 subsidiary(케이스 무시), 기준월 집계 행만 선택
+            sub_rows = course_aggregates[course_aggregates['Final Sub.'].astype(str).str.lower() == str(subsidiary).lower()]
+            subsidiary_data = sub_rows[sub_rows['Year_Month'].astype(str).str.endswith(f"-{month:02d}", na=False)]
+            logger.debug("%s %s월 완료 과정 집계 행: %s", subsidiary, month, len(subsidiary_data))
+
+            if subsidiary_data.empty:
+                logger.debug("%s 법인의 완료된 과정이 없음", subsidiary)
+                return ({
+                    'success': True,
+                    'courses': [],
+                    'message': '해당 법인의 완료된 과정이 없습니다.'
+                })
+
+            # 완료 년월별 집계를 과정 단위로 병합
+            course_summary = (
+                subsidiary_data
+                .groupby('Course name', dropna=False)
+                .agg(
+                    category_1=('category_1', 'max'),     # 카테고리 대
+                    category_2=('category_2', 'max'),     # 카테고리 중
+                    Category=('Category', 'max'),         # 카테고리 소
+                    participant_count=('participant_count', 'sum'),  # 이수인원
+                    total_hours=('total_hours', 'sum')               # 총 이수시간
+                )
+                .reset_index()
+            )
+
+            # 결과를 리스트로 변환 (컬럼 단위 변환, NaN → null)
+            course_summary['participant_count'] = course_summary['participant_count'].astype(int)
+            course_summary['total_hours'] = course_summary['total_hours'].astype(float)
+            courses = frame_records(course_summary, COURSE_FIELDS)
+
+            logger.debug("최종 과정 수: %s", len(courses))
+            if courses:
+                logger.debug("첫 번째 과정명: %s", courses[0]['course_name'])
+
+            # Staff 고유 인원 수: 인원 집계의 법인별 Staff 사번 고유값 (필수 컬럼이 없으면 None)
+            headcount = self.cache.get_headcount(month)
+            staff_unique_count = headcount.subsidiary_staff_unique(subsidiary) if headcount is not None else None
+            logger.debug("Staff 고유 인원 수: %s", staff_unique_count)
+
+            return ({
+                'success': True,
+                'courses': courses,
+                'total_courses': len(courses),
+                'staff_unique_count': staff_unique_count
+            })
+
+        except Exception as e:
+            logger.exception("과정리스트 오류: %s", e)
+            return ({
+                'success': False,
+                'error': f'과정리스트를 불러오는 중 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    # ==================== 페이지 번들 ====================
+
+    def global_bundle(self, month):
+        """Global 페이지의 모든 섹션(Infos, 지표점수, Region 지표)을 한 번에 계산"""
+        try:
+            return {
+                'success': True,
+                'month': month,
+                'infos': section_payload(self.global_infos(month)),
+                'logic': section_payload(self.global_logic_data(month)),
+                'region_metrics': section_payload(self.global_region_metrics(month))
+            }
+        except Exception as e:
+            logger.exception("Global bundle API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    def region_bundle(self, region, month):
+        """Region 상세 페이지의 모든 섹션(Infos, 지표, 과정리스트, Subsidiary 지표)을 한 번에 계산"""
+        try:
+            return {
+                'success': True,
+                'region': region,
+                'month': month,
+                'infos': section_payload(self.region_infos(region, month)),
+                'logic': section_payload(self.region_logic_data(region, month)),
+                'courses': section_payload(self.region_course_list(region, month)),
+                'subsidiary_metrics': section_payload(self.region_subsidiary_metrics(region, month))
+            }
+        except Exception as e:
+            logger.exception("Region bundle API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
+
+    def subsidiary_bundle(self, subsidiary, month):
+        """Subsidiary 상세 페이지의 모든 섹션(상세 정보, logic 지표, 과정리스트)을 한 번에 계산"""
+        try:
+            return {
+                'success': True,
+                'subsidiary': subsidiary,
+                'month': month,
+                'detail': section_payload(self.subsidiary_detail(subsidiary, month)),
+                'logic': section_payload(self.logic_course_completion(subsidiary, month)),
+                'courses': section_payload(self.course_list(subsidiary, month))
+            }
+        except Exception as e:
+            logger.exception("Subsidiary bundle API 에러: %s", e)
+            return ({
+                'success': False,
+                'error': f'서버 오류가 발생했습니다: {str(e)}'
+            }), 500
@@ -0,0 +1,297 @@
+# -*- encoding: utf-8 -*-
+"""
+Opt-in per-request profiler (admin-only, cProfile + stack sampler, bounded profile ring directory)
+"""
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from flask import Blueprint, abort, current_app, g, render_template, request, send_from_directory
+from flask_login import current_user
+
+logger = logging.getLogger(__name__)
+
+# 프로파일 요청 헤더 / 쿼리 파라미터 (예: X-Profile: 1, ?_profile=1)
+PROFILE_HEADER = 'X-Profile'
+PROFILE_QUERY = '_profile'
+
+# 프로파일 파일 종류 {종류: 확장자}
+#   prof: pstats 덤프 (snakeviz 등으로 열기)
+#   folded: 샘플링 스택 (collapsed 형식, flamegraph.pl / speedscope 에서 바로 열림)
+#   json: 요청 정보와 pandas 연산 시간
+PROFILE_FILES = {
+    'prof': '.prof',
+    'folded': '.folded',
+    'json': '.json',
+}
+
+# 다운로드 Content-Type
+PROFILE_MIMETYPES = {
+    'prof': 'application/octet-stream',
+    'folded': 'text/plain',
+    'json': 'application/json',
+}
+
+# pandas 연산 시간 집계 시 라이브러리 내부 호출로 보는 경로
+LIBRARY_MARKERS = (f'{os.sep}pandas{os.sep}', f'{os.sep}numpy{os.sep}', f'{os.sep}pyarrow{os.sep}')
+
+blueprint = Blueprint(
+    'profiling_blueprint',
+    __name__,
+    url_prefix='/profiles'
+)
+
+
+def _is_library(filename):
+    return any(marker in filename for marker in LIBRARY_MARKERS)
+
+
+def _function_label(func):
+    """pstats 함수 키 (파일, 줄, 이름) → 'pandas/core/frame.py:groupby'"""
+    filename, _, name = func
+    if filename == '~':
+        return name
+    parts = Path(filename).parts
+    if 'pandas' in parts:
+        filename = '/'.join(parts[parts.index('pandas'):])
+    else:
+        filename = Path(filename).name
+    return f'{filename}:{name}'
+
+
+def pandas_timings(stats, limit=20):
+    """
+    애플리케이션 코드에서 직접 호출한 pandas 함수별 누적 시간
+
+    pandas 내부 호출은 제외하고 호출 지점(라우트 / data_cache 코드)에서 본 cumtime 만 합산한다.
+
+    Returns:
+        list: [{'function', 'calls', 'seconds'}] (시간 내림차순)
+    """
+    timings = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if f'{os.sep}pandas{os.sep}' not in func[0]:
+            continue
+        calls = 0
+        seconds = 0.0
+        for caller, (_, nc, _, ct) in callers.items():
+            if _is_library(caller[0]):
+                continue
+            calls += nc
+            seconds += ct
+        if calls:
+            timings.append({'function': _function_label(func), 'calls': calls, 'seconds': round(seconds, 6)})
+    timings.sort(key=lambda item: item['seconds'], reverse=True)
+    return timings[:limit]
+
+
+class StackSampler:
+    """요청 스레드의 호출 스택을 주기적으로 수집 (collapsed 스택 형식)"""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-profiler-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{Path(code.co_filename).name}:{code.co_name}')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+
+class RequestProfiler:
+    """
+    요청 단위 프로파일러
+
+    관리자가 X-Profile 헤더나 ?_profile=1 로 요청한 경우에만 뷰 실행 구간을
+    cProfile(결정적)과 스택 샘플러로 동시에 측정하고 결과를 프로파일 디렉토리에 저장한다.
+    디렉토리는 최근 PROFILING_KEEP 개만 보관하는 링 구조다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    # ==================== 요청 선택 ====================
+
+    @staticmethod
+    def _admins(app):
+        return {name.strip() for name in app.config.get('PROFILING_ADMINS', '').split(',') if name.strip()}
+
+    def is_admin(self):
+        """현재 로그인 사용자가 프로파일링 관리자 목록에 있는지"""
+        return bool(
+            current_user
+            and current_user.is_authenticated
+            and getattr(current_user, 'username', None) in self._admins(current_app)
+        )
+
+    def is_requested(self):
+        return (request.headers.get(PROFILE_HEADER) == '1'
+                or request.args.get(PROFILE_QUERY) == '1')
+
+    # ==================== 측정 ====================
+
+    def start(self):
+        if not self.is_requested() or request.blueprint == blueprint.name or not self.is_admin():
+            return
+        sampler = StackSampler(threading.get_ident(), current_app.config['PROFILING_SAMPLE_INTERVAL'])
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Python 3.12+ 에서는 프로세스 전체에서 프로파일러가 하나만 동작할 수 있음
+            logger.warning("다른 요청을 프로파일링 중이므로 건너뜀: %s", e)
+            return
+        sampler.start()
+        g.profiling = (profiler, sampler, time.perf_counter())
+
+    def _finish(self, status):
+        state = g.pop('profiling', None)
+        if state is None:
+            return None
+        profiler, sampler, started = state
+        profiler.disable()
+        elapsed = time.perf_counter() - started
+        sampler.stop()
+        try:
+            return self.save(profiler, sampler, elapsed, status)
+        except Exception as e:
+            logger.warning("프로파일 저장 실패: %s", e)
+            return None
+
+    def finish_response(self, response):
+        profile_id = self._finish(response.status_code)
+        if profile_id is not None:
+            response.headers['X-Profile-Id'] = profile_id
+        return response
+
+    def finish_failure(self, exc):
+        # 처리되지 않은 예외로 after_request 가 실행되지 않은 요청
+        if exc is not None:
+            self._finish(500)
+
+    # ==================== 저장소 ====================
+
+    @staticmethod
+    def directory():
+        return Path(current_app.config['PROFILING_DIR'])
+
+    def save(self, profiler, sampler, elapsed, status):
+        """프로파일 3종 저장 후 오래된 프로파일 정리 (프로파일 ID 반환)"""
+        directory = self.directory()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        stats = pstats.Stats(profiler)
+        profile_id = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}-{os.getpid()}"
+        rule = request.url_rule
+
+        summary = {
+            'id': profile_id,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'route': rule.rule if rule is not None else None,
+            'status': status,
+            'user': getattr(current_user, 'username', None),
+            'elapsed_seconds': round(elapsed, 6),
+            'samples': sum(sampler.stacks.values()),
+            'sample_interval': sampler.interval,
+            'pandas': pandas_timings(stats),
+        }
+
+        stats.dump_stats(str(directory / f"{profile_id}{PROFILE_FILES['prof']}"))
+        (directory / f"{profile_id}{PROFILE_FILES['folded']}").write_text(sampler.folded(), encoding='utf-8')
+        # 목록 페이지는 json 파일만 읽으므로 마지막에 작성
+        tmp_path = directory / f".{profile_id}.json.tmp"
+        tmp_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp_path, directory / f"{profile_id}{PROFILE_FILES['json']}")
+
+        self.prune(directory, current_app.config['PROFILING_KEEP'])
+        logger.info("프로파일 저장: %s (%s, %.3f초)", profile_id, summary['path'], elapsed)
+        return profile_id
+
+    def prune(self, directory, keep):
+        """최근 keep 개를 제외한 프로파일 삭제"""
+        with self._lock:
+            profile_ids = sorted(path.stem for path in directory.glob('*.json'))
+            for profile_id in profile_ids[:-keep]:
+                for suffix in PROFILE_FILES.values():
+                    (directory / f"{profile_id}{suffix}").unlink(missing_ok=True)
+
+    def list_profiles(self):
+        """저장된 프로파일 요약 목록 (최신순)"""
+        directory = self.directory()
+        profiles = []
+        for path in sorted(directory.glob('*.json'), reverse=True):
+            try:
+                profiles.append(json.loads(path.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                # 정리 중 삭제된 파일
+                continue
+        return profiles
+
+
+# ==================== 라우트 ====================
+
+def _require_admin():
+    if not request_profiler.is_admin():
+        abort(404)
+
+
+@blueprint.route('/')
+def profile_index():
+    """저장된 프로파일 목록 페이지"""
+    _require_admin()
+    return render_template('home/profiles.html', segment='profiles', profiles=request_profiler.list_profiles())
+
+
+@blueprint.route('/<profile_id>.<kind>')
+def profile_file(profile_id, kind):
+    """프로파일 파일 다운로드 (prof / folded / json)"""
+    _require_admin()
+    if kind not in PROFILE_FILES:
+        abort(404)
+    return send_from_directory(
+        request_profiler.directory().resolve(), f"{profile_id}{PROFILE_FILES[kind]}",
+        as_attachment=(kind == 'prof'), mimetype=PROFILE_MIMETYPES[kind]
+    )
+
+
+def register_profiling(app):
+    """프로파일링 훅과 목록 페이지 등록 (PROFILING_ENABLED=False 이면 등록하지 않음)"""
+    if not app.config.get('PROFILING_ENABLED'):
+        return
+    app.before_request(request_profiler.start)
+    app.after_request(request_profiler.finish_response)
+    app.teardown_request(request_profiler.finish_failure)
+    app.register_blueprint(blueprint)
+
+
+# 전역 인스턴스 생성
+request_profiler = RequestProfiler()
@@ -0,0 +1,261 @@
+# -*- encoding: utf-8 -*-
+"""
+Declarative query engine over the cached metrics cube and headcount cube
+"""
+
+import hashlib
+import json
+import threading
+import pandas as pd
+from collections import OrderedDict
+from apps.data_cache import data_cache
+from apps.headcount import HEADCOUNT_COLUMNS
+from apps.metrics import metrics
+from metrics_cube import CUBE_MEASURES, RATE_FORMULAS, derive_rates
+
+# 차원 (지표 큐브 / 인원 집계 공통 이름)
+QUERY_DIMENSIONS = ['month', 'region', 'subsidiary']
+
+# 측정값 {이름: 원천} - metrics: 지표 큐브 합계, rate: 큐브 합계에서 계산, headcount: 인원 집계
+QUERY_MEASURES = {
+    **{measure: 'metrics' for measure in CUBE_MEASURES},
+    **{rate: 'rate' for rate in list(RATE_FORMULAS) + ['Score']},
+    **{measure: 'headcount' for measure in HEADCOUNT_COLUMNS},
+}
+
+QUERY_MAX_LIMIT = 10000
+QUERY_CACHE_SIZE = 256
+
+
+class QuerySpecError(ValueError):
+    """잘못된 쿼리 명세 (400 응답)"""
+
+
+def _as_list(value, name):
+    """문자열 또는 목록을 목록으로 변환"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    raise QuerySpecError(f"'{name}' 는 문자열 또는 목록이어야 합니다.")
+
+
+def _is_int(value):
+    """JSON 정수 여부 (bool 은 int 의 하위 클래스이므로 제외)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _normalize_months(value):
+    """months 명세 → 정렬된 월 목록 (기본값: 데이터가 있는 모든 월)"""
+    if value is None:
+        return sorted(data_cache.get_all_months_with_data())
+
+    if isinstance(value, dict):
+        unknown = set(value) - {'from', 'to'}
+        if unknown:
+            raise QuerySpecError(f"months 범위에 알 수 없는 키가 있습니다: {sorted(unknown)}")
+        start, end = value.get('from', 1), value.get('to', 12)
+        if not _is_int(start) or not _is_int(end) or not 1 <= start <= 12 or not 1 <= end <= 12:
+            raise QuerySpecError("months 범위의 from / to 는 1~12 사이의 정수여야 합니다.")
+        months = list(range(start, end + 1))
+    else:
+        months = _as_list(value, 'months')
+
+    if not all(_is_int(month) and 1 <= month <= 12 for month in months):
+        raise QuerySpecError("months 는 1~12 사이의 정수여야 합니다.")
+    return sorted(set(months))
+
+
+def normalize_spec(spec):
+    """
+    쿼리 명세 검증 및 정규화 (허용 목록에 없는 차원/측정값/키는 QuerySpecError)
+
+    명세 예:
+        {
+            "dimensions": ["region"],
+            "measures": ["Course_Completion_Rate", "total_count"],
+            "filters": {"region": ["Asia", "China"]},
+            "months": {"from": 7, "to": 9},
+            "sort": ["-Course_Completion_Rate"],
+            "limit": 10
+        }
+    """
+    if not isinstance(spec, dict):
+        raise QuerySpecError("쿼리 명세는 JSON 객체여야 합니다.")
+
+    unknown = set(spec) - {'dimensions', 'measures', 'filters', 'months', 'sort', 'limit'}
+    if unknown:
+        raise QuerySpecError(f"알 수 없는 명세 키입니다: {sorted(unknown)}")
+
+    dimensions = _as_list(spec.get('dimensions'), 'dimensions')
+    invalid = [dim for dim in dimensions if dim not in QUERY_DIMENSIONS]
+    if invalid or len(set(dimensions)) != len(dimensions):
+        raise QuerySpecError(f"허용되지 않거나 중복된 차원입니다: {invalid or dimensions} (허용: {QUERY_DIMENSIONS})")
+
+    measures = _as_list(spec.get('measures'), 'measures')
+    if not measures:
+        raise QuerySpecError("measures 를 하나 이상 지정해야 합니다.")
+    invalid = [measure for measure in measures if measure not in QUERY_MEASURES]
+    if invalid:
+        raise QuerySpecError(f"허용되지 않는 측정값입니다: {invalid}")
+    measures = list(dict.fromkeys(measures))
+
+    filters = spec.get('filters') or {}
+    if not isinstance(filters, dict):
+        raise QuerySpecError("filters 는 {차원: 값 목록} 객체여야 합니다.")
+    invalid = [dim for dim in filters if dim not in QUERY_DIMENSIONS or dim == 'month']
+    if invalid:
+        raise QuerySpecError(f"필터는 region / subsidiary 차원만 사용할 수 있습니다 (월은 months 사용): {invalid}")
+    filters = {dim: sorted(set(map(str, _as_list(filters[dim], dim)))) for dim in sorted(filters)}
+
+    fields = dimensions + measures
+    sort = []
+    for item in _as_list(spec.get('sort'), 'sort'):
+        field = str(item).lstrip('-')
+        if field not in fields:
+            raise QuerySpecError(f"정렬 필드는 dimensions / measures 중 하나여야 합니다: {field}")
+        sort.append(str(item))
+
+    limit = spec.get('limit')
+    if limit is not None and (not _is_int(limit) or not 1 <= limit <= QUERY_MAX_LIMIT):
+        raise QuerySpecError(f"limit 은 1~{QUERY_MAX_LIMIT} 사이의 정수여야 합니다.")
+
+    return {
+        'dimensions': dimensions,
+        'measures': measures,
+        'filters': filters,
+        'months': _normalize_months(spec.get('months')),
+        'sort': sort,
+        'limit': limit,
+    }
+
+
+class QueryEngine:
+    """
+    지표 큐브 / 인원 집계 캐시 위의 group-by 쿼리
+
+    월별 큐브 셀을 모아 차원 필터 → groupby sum 으로 한 번에 집계하고,
+    비율은 합계에서 metrics_cube.derive_rates 로 계산한다 (화면별 라우트와 같은 공식).
+    결과는 정규화된 명세 + 대상 월의 데이터 버전 해시로 캐시한다.
+    """
+
+    def __init__(self, max_entries=QUERY_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cache_key(self, spec):
+        """정규화된 명세 + 월별 데이터 버전 해시 (스냅샷이 바뀌면 다른 키)"""
+        versions = [str(data_cache.get_data_version(month)) for month in spec['months']]
+        payload = json.dumps({'spec': spec, 'versions': versions}, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _cells(self, source, months):
+        """월별 원천 셀을 공통 차원 이름으로 모은 DataFrame (데이터가 없는 월은 제외)"""
+        frames = []
+        for month in months:
+            if source == 'headcount':
+                headcount = data_cache.get_headcount(month)
+                if headcount is None:
+                    continue
+                cells = headcount.cells.reset_index()
+            else:
+                cube = data_cache.get_metrics_cube(month)
+                if cube is None:
+                    continue
+                cells = cube.rename(columns={'Final Region': 'region', 'Final Sub.': 'subsidiary'})
+            frames.append(cells.assign(month=month))
+
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True)
+
+    def _aggregate(self, cells, spec, measures):
+        """필터 적용 후 차원별 합계"""
+        for dim, values in spec['filters'].items():
+            cells = cells[cells[dim].astype(str).isin(values)]
+
+        if spec['dimensions']:
+            return cells.groupby(spec['dimensions'], dropna=False, sort=False)[measures].sum().reset_index()
+        return cells[measures].sum().to_frame().T
+
+    def _evaluate(self, spec):
+        """명세 실행 → 결과 DataFrame (dimensions + measures 컬럼)"""
+        sources = {QUERY_MEASURES[measure] for measure in spec['measures']}
+        parts = []
+
+        if sources & {'metrics', 'rate'}:
+            cells = self._cells('metrics', spec['months'])
+            if cells is not None:
+                result = self._aggregate(cells, spec, CUBE_MEASURES)
+                rates = [measure for measure in spec['measures'] if QUERY_MEASURES[measure] == 'rate']
+                if rates:
+                    derived = pd.DataFrame([derive_rates(totals) for totals in result[CUBE_MEASURES].to_dict('records')], index=result.index)
+                    result = result.join(derived[rates])
+                parts.append(result)
+
+        if 'headcount' in sources:
+            cells = self._cells('headcount', spec['months'])
+            if cells is not None:
+                parts.append(self._aggregate(cells, spec, HEADCOUNT_COLUMNS))
+
+        columns = spec['dimensions'] + spec['measures']
+        if not parts:
+            return pd.DataFrame(columns=columns)
+
+        result = parts[0]
+        for part in parts[1:]:
+            if spec['dimensions']:
+                result = result.merge(part, on=spec['dimensions'], how='outer')
+            else:
+                result = pd.concat([result, part], axis=1)
+
+        # 한쪽 원천에만 있는 그룹의 합계는 0 (비율은 계산할 수 없으므로 결측 유지)
+        sums = [measure for measure in spec['measures'] if QUERY_MEASURES[measure] != 'rate']
+        result[sums] = result[sums].fillna(0)
+        result = result[columns]
+
+        if spec['sort']:
+            by = [item.lstrip('-') for item in spec['sort']]
+            ascending = [not item.startswith('-') for item in spec['sort']]
+            result = result.sort_values(by, ascending=ascending, na_position='last', kind='stable')
+        if spec['limit'] is not None:
+            result = result.head(spec['limit'])
+        return result.reset_index(drop=True)
+
+    def run(self, spec):
+        """
+        쿼리 명세 실행 (결과 캐시 사용)
+
+        Returns:
+            dict: {'spec': 정규화된 명세, 'columns': 컬럼 목록, 'rows': 행 목록} - 호출 측에서 수정 금지
+        """
+        spec = normalize_spec(spec)
+        key = self._cache_key(spec)
+
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                metrics.cache_hit('query')
+                return cached
+
+        metrics.cache_miss('query')
+        result = self._evaluate(spec)
+        columns = list(result.columns)
+        # object 변환 시 numpy 스칼라가 파이썬 기본 타입으로 바뀌고, 결측값은 None(null)이 된다
+        rows = result.astype(object).where(result.notna(), None).values.tolist()
+        payload = {'spec': spec, 'columns': columns, 'rows': rows}
+
+        with self._lock:
+            self._results[key] = payload
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return payload
+
+
+# 전역 인스턴스 생성
+query_engine = QueryEngine()
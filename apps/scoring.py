@@ -0,0 +1,298 @@
+# -*- encoding: utf-8 -*-
+"""
+Vectorized what-if scorer over the cached logic.csv metrics (same rules as make_logic step 8.3)
+"""
+
+import math
+import threading
+import numpy as np
+import pandas as pd
+from apps.data_cache import data_cache
+from apps.frame_store import frame_store
+from apps.metrics import metrics
+
+# 완료율 점수 항목 {이름: (비율 컬럼, 전체 수 컬럼, 기본 점수 기준표 {최소 비율: 점수}, 전체 수 0 → 만점 여부)}
+RATE_COMPONENTS = {
+    'lms_course': ('Course_Completion_Rate', 'Planned_Courses', {90: 10, 80: 8, 60: 6, 40: 4, 0: 2}, False),
+    'plan_execution': ('Hours_Completion_Rate', 'Planned_Hours', {90: 20, 80: 16, 60: 12, 40: 8, 0: 4}, False),
+    'new_hire': ('New_Hire_Completion_Rate', 'New_Hire_Total', {90: 15, 80: 12, 60: 10, 40: 8, 0: 6}, True),
+    'new_leader': ('New_Leader_Completion_Rate', 'New_Leader_Total', {90: 15, 80: 12, 60: 10, 40: 8, 0: 6}, True),
+    'eip': ('EIP_Completion_Rate', 'EIP_Total', {90: 15, 80: 12, 60: 10, 40: 8, 0: 6}, True),
+    'glp': ('GLP_Completion_Rate', 'GLP_Total', {90: 15, 80: 12, 60: 10, 40: 8, 0: 6}, True),
+}
+
+# Y/N 점수 항목 {이름: (컬럼, 기본 Y 점수)} - N 또는 빈 값은 0점
+FLAG_COMPONENTS = {
+    'jam_member': ('JAM Member', 10),
+    'new_lms_course': ('New LMS Course', 10),
+    'lms_mission': ('LMS Mission', 10),
+    'annual_plan_setup': ('Annual Plan Setup', 10),
+    'global_ld_council': ('Global L&D Council', 15),
+    'infra_index_response': ('Infra index response', 15),
+}
+
+# Monthly Index 항목 (70점)
+MONTHLY_COMPONENTS = ['lms_course', 'plan_execution', 'new_hire', 'new_leader', 'jam_member']
+
+# 분기별 Quarterly Index 항목 (30점)
+QUARTERLY_COMPONENTS = {
+    1: ['new_lms_course', 'lms_mission', 'annual_plan_setup'],
+    2: ['eip', 'glp'],
+    3: ['eip', 'glp'],
+    4: ['global_ld_council', 'infra_index_response'],
+}
+
+SCORE_COMPONENTS = list(RATE_COMPONENTS) + list(FLAG_COMPONENTS)
+
+
+class ScoringSpecError(ValueError):
+    """잘못된 시뮬레이션 명세 (400 응답)"""
+
+
+def quarter_of(month):
+    """분석 월의 분기 (1~3월 → 1Q ...)"""
+    return (month - 1) // 3 + 1
+
+
+def _number(value, name):
+    """숫자 검증 (bool / NaN / 무한대 제외)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ScoringSpecError(f"{name} 은(는) 숫자여야 합니다: {value!r}")
+    return value
+
+
+def _normalize_table(name, table):
+    """점수 기준표 {최소 비율: 점수} 검증 (JSON 키는 문자열이므로 숫자로 변환)"""
+    if not isinstance(table, dict) or not table:
+        raise ScoringSpecError(f"'{name}' 기준표는 {{최소 비율: 점수}} 객체여야 합니다.")
+    normalized = {}
+    for key, score in table.items():
+        try:
+            threshold = float(key)
+        except (TypeError, ValueError):
+            threshold = math.nan
+        if not math.isfinite(threshold):
+            raise ScoringSpecError(f"'{name}' 기준표의 비율이 숫자가 아닙니다: {key!r}")
+        normalized[threshold] = _number(score, f"'{name}' 기준표의 점수")
+    return normalized
+
+
+def _components_list(value, name):
+    """항목 목록 검증"""
+    if not isinstance(value, list) or any(component not in SCORE_COMPONENTS for component in value):
+        raise ScoringSpecError(f"{name} 은(는) 항목 목록이어야 합니다 (허용: {SCORE_COMPONENTS})")
+    return list(dict.fromkeys(value))
+
+
+def normalize_scoring_spec(spec, month):
+    """
+    시뮬레이션 명세 검증 및 기본값 적용
+
+    명세 예:
+        {
+            "tables": {"new_hire": {"85": 15, "80": 12, "60": 10, "40": 8, "0": 6}, "jam_member": 5},
+            "quarter": 3,
+            "monthly": ["lms_course", "plan_execution", "new_hire", "new_leader", "jam_member"],
+            "quarterly": {"3": ["eip", "glp"]}
+        }
+
+    Returns:
+        dict: {'tables': 모든 항목의 기준표 / Y 점수, 'quarter', 'monthly', 'quarterly': 적용 분기 항목}
+    """
+    spec = spec or {}
+    if not isinstance(spec, dict):
+        raise ScoringSpecError("시뮬레이션 명세는 JSON 객체여야 합니다.")
+
+    unknown = set(spec) - {'tables', 'quarter', 'monthly', 'quarterly'}
+    if unknown:
+        raise ScoringSpecError(f"알 수 없는 명세 키입니다: {sorted(unknown)}")
+
+    tables = {name: dict(table) for name, (_, _, table, _) in RATE_COMPONENTS.items()}
+    tables.update({name: score for name, (_, score) in FLAG_COMPONENTS.items()})
+
+    overrides = spec.get('tables') or {}
+    if not isinstance(overrides, dict):
+        raise ScoringSpecError("tables 는 {항목: 기준표 또는 Y 점수} 객체여야 합니다.")
+    for name, value in overrides.items():
+        if name in RATE_COMPONENTS:
+            tables[name] = _normalize_table(name, value)
+        elif name in FLAG_COMPONENTS:
+            tables[name] = _number(value, f"'{name}' Y 점수")
+        else:
+            raise ScoringSpecError(f"알 수 없는 점수 항목입니다: {name} (허용: {SCORE_COMPONENTS})")
+
+    quarter = spec.get('quarter', quarter_of(month))
+    if quarter not in QUARTERLY_COMPONENTS or isinstance(quarter, bool):
+        raise ScoringSpecError("quarter 는 1~4 사이의 정수여야 합니다.")
+
+    monthly = _components_list(spec['monthly'], 'monthly') if 'monthly' in spec else list(MONTHLY_COMPONENTS)
+
+    quarterly_overrides = spec.get('quarterly') or {}
+    if not isinstance(quarterly_overrides, dict):
+        raise ScoringSpecError("quarterly 는 {분기: 항목 목록} 객체여야 합니다.")
+    quarterly = {str(q): components for q, components in QUARTERLY_COMPONENTS.items()}
+    for q, components in quarterly_overrides.items():
+        if str(q) not in quarterly:
+            raise ScoringSpecError(f"quarterly 의 분기는 1~4 여야 합니다: {q!r}")
+        quarterly[str(q)] = _components_list(components, f"quarterly[{q}]")
+
+    return {
+        'tables': tables,
+        'quarter': quarter,
+        'monthly': monthly,
+        'quarterly': quarterly[str(quarter)],
+    }
+
+
+def rate_scores(rates, totals, table, check_total):
+    """
+    완료율 점수 (make_logic 의 calculate_rate_score 를 배열 단위로 계산)
+    높은 기준부터 처음 만족하는 점수, 비율이 없거나 모든 기준 미만이면 최소 점수,
+    check_total 이면 전체 수가 없거나 0인 법인은 최대 점수
+    """
+    thresholds = sorted(table, reverse=True)
+    with np.errstate(invalid='ignore'):
+        scores = np.select(
+            [rates >= threshold for threshold in thresholds],
+            [table[threshold] for threshold in thresholds],
+            default=min(table.values())
+        )
+    if check_total:
+        scores = np.where(np.isnan(totals) | (totals == 0), max(table.values()), scores)
+    return scores
+
+
+class ScoringInputs:
+    """
+    월별 점수 계산 입력 (logic.csv 에서 한 번만 추출한 배열)
+    """
+
+    def __init__(self, df):
+        def numeric(col):
+            if col not in df.columns:
+                return np.full(len(df), np.nan)
+            return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
+
+        self.subsidiaries = df['Subsidiary'].astype(str).tolist()
+        regions = df['Final Region'] if 'Final Region' in df.columns else pd.Series([None] * len(df))
+        self.regions = regions.astype(object).where(regions.notna(), None).tolist()
+
+        self.rates = {name: numeric(rate_col) for name, (rate_col, _, _, _) in RATE_COMPONENTS.items()}
+        self.totals = {name: numeric(total_col) for name, (_, total_col, _, _) in RATE_COMPONENTS.items()}
+        self.flags = {
+            name: (df[col].astype(str).str.strip().str.upper() == 'Y').to_numpy() if col in df.columns else np.zeros(len(df), dtype=bool)
+            for name, (col, _) in FLAG_COMPONENTS.items()
+        }
+
+        self.baseline = numeric('Score')
+        self.baseline_rank = pd.Series(self.baseline).rank(method='min', ascending=False).to_numpy()
+
+    def component_scores(self, name, tables):
+        """항목별 점수 배열"""
+        if name in RATE_COMPONENTS:
+            check_total = RATE_COMPONENTS[name][3]
+            return rate_scores(self.rates[name], self.totals[name], tables[name], check_total)
+        return np.where(self.flags[name], tables[name], 0)
+
+
+def _optional(values):
+    """NaN → None 인 파이썬 목록"""
+    return [None if np.isnan(value) else value for value in values.tolist()]
+
+
+class ScoreSimulator:
+    """
+    logic.csv 지표로 법인별 Score 를 다시 계산하는 what-if 시뮬레이터
+
+    월별 입력 배열은 데이터 버전(스냅샷)별로 한 번만 만들고,
+    요청마다 점수 기준표만 바꿔 numpy 로 전체 법인을 한 번에 채점한다.
+    """
+
+    def __init__(self):
+        self._inputs = {}
+        self._lock = threading.Lock()
+
+    def get_inputs(self, month):
+        """월별 입력 배열 (데이터가 없으면 None)"""
+        version = data_cache.get_data_version(month)
+        if version is None:
+            return None
+
+        with self._lock:
+            cached = self._inputs.get(month)
+            if cached is not None and cached[0] == version:
+                metrics.cache_hit('score_inputs')
+                return cached[1]
+
+        metrics.cache_miss('score_inputs')
+        logic_path = data_cache.get_month_dir(month) / "logic.csv"
+        if not logic_path.exists():
+            return None
+        inputs = ScoringInputs(frame_store.read_frame(str(logic_path)))
+
+        with self._lock:
+            self._inputs[month] = (version, inputs)
+        return inputs
+
+    def simulate(self, month, spec=None):
+        """
+        대체 점수 기준으로 모든 법인 재채점
+
+        Returns:
+            dict: {'spec': 적용된 기준, 'subsidiaries': 법인별 점수 / 순위 / 변화량, 'summary'} / 데이터가 없으면 None
+        """
+        spec = normalize_scoring_spec(spec, month)
+        inputs = self.get_inputs(month)
+        if inputs is None:
+            return None
+
+        components = {
+            name: inputs.component_scores(name, spec['tables'])
+            for name in dict.fromkeys(spec['monthly'] + spec['quarterly'])
+        }
+        count = len(inputs.subsidiaries)
+        monthly_index = sum((components[name] for name in spec['monthly']), np.zeros(count))
+        quarterly_index = sum((components[name] for name in spec['quarterly']), np.zeros(count))
+        scores = monthly_index + quarterly_index
+        ranks = pd.Series(scores).rank(method='min', ascending=False).to_numpy()
+
+        delta = scores - inputs.baseline
+        rank_change = inputs.baseline_rank - ranks
+        component_lists = {name: values.tolist() for name, values in components.items()}
+
+        subsidiaries = []
+        for i, (score, rank, baseline, baseline_rank, score_delta, rank_delta) in enumerate(zip(
+                scores.tolist(), ranks.tolist(), _optional(inputs.baseline), _optional(inputs.baseline_rank),
+                _optional(delta), _optional(rank_change))):
+            subsidiaries.append({
+                'subsidiary': inputs.subsidiaries[i],
+                'region': inputs.regions[i],
+                'score': score,
+                'rank': int(rank),
+                'baseline_score': baseline,
+                'baseline_rank': int(baseline_rank) if baseline_rank is not None else None,
+                'delta': score_delta,
+                'rank_change': int(rank_delta) if rank_delta is not None else None,
+                'monthly_index': monthly_index[i].item(),
+                'quarterly_index': quarterly_index[i].item(),
+                'components': {name: values[i] for name, values in component_lists.items()},
+            })
+
+        subsidiaries.sort(key=lambda row: (row['rank'], row['subsidiary']))
+        return {
+            'spec': {**spec, 'tables': {
+                name: {f"{threshold:g}": score for threshold, score in table.items()} if isinstance(table, dict) else table
+                for name, table in spec['tables'].items()
+            }},
+            'subsidiaries': subsidiaries,
+            'summary': {
+                'subsidiary_count': count,
+                'average_score': round(float(scores.mean()), 2) if count else 0,
+                'baseline_average_score': round(float(np.nanmean(inputs.baseline)), 2) if count and not np.isnan(inputs.baseline).all() else None,
+                'changed_count': int(np.sum(np.abs(np.nan_to_num(delta, nan=0)) > 0)),
+            },
+        }
+
+
+# 전역 인스턴스 생성
+score_simulator = ScoreSimulator()
@@ -0,0 +1,75 @@
+# -*- encoding: utf-8 -*-
+"""
+JSON serialization helpers for data API responses
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from flask import Response
+
+# orjson은 선택 의존성: 없으면 표준 json 모듈로 인코딩
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_MIMETYPE = 'application/json'
+
+
+def frame_records(df, fields, round_fields=(), decimals=1, defaults=None):
+    """
+    DataFrame을 컬럼 단위로 변환하여 레코드(dict) 리스트로 반환
+
+    행 단위 루프(iterrows) 없이 컬럼 전체에 대해 이름 변경, 반올림, NaN → None 변환을 수행한다.
+
+    Args:
+        df: 원본 DataFrame
+        fields: {출력 키: 원본 컬럼명} (출력 순서 유지)
+        round_fields: 반올림할 출력 키 (숫자가 아니거나 NaN이면 0, 기존 safe_round 와 같은 규칙)
+        decimals: 반올림 자릿수
+        defaults: 원본 컬럼이 없을 때 사용할 값 {출력 키: 값} (지정하지 않으면 None)
+    """
+    defaults = defaults or {}
+    round_fields = set(round_fields)
+
+    columns = {}
+    for key, source in fields.items():
+        if source in df.columns:
+            series = df[source]
+        else:
+            series = pd.Series(defaults.get(key), index=df.index, dtype=object)
+
+        if key in round_fields:
+            series = pd.to_numeric(series, errors='coerce').fillna(0).astype(float).round(decimals)
+        columns[key] = series
+
+    out = pd.DataFrame(columns, index=df.index)
+    # object 변환 시 numpy 스칼라가 파이썬 기본 타입으로 바뀌고, 결측값은 None(null)이 된다
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict('records')
+
+
+def _default(value):
+    """표준 json 인코더가 처리하지 못하는 numpy/pandas 값 변환"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload):
+    """payload를 JSON bytes로 인코딩 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def json_response(payload, status=200):
+    """jsonify 대체: 빠른 인코더로 JSON 응답 생성"""
+    return Response(dumps(payload), status=status, mimetype=JSON_MIMETYPE)
@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+"""
+Cross-month KPI time series built from logic_timeseries (subsidiary / region / global trends)
+"""
+
+from apps.serializers import frame_records
+from metrics_cube import CUBE_MEASURES, SUM_COLUMNS, SUBSIDIARY_COUNT, SUBSIDIARY_RATE_COLUMNS, derive_rates
+
+
+def _rollup_points(frame):
+    """(년월별) 큐브 합계에서 비율을 계산한 추이 포인트 목록"""
+    totals = frame.groupby('Year_Month', sort=True)[CUBE_MEASURES].sum()
+    points = []
+    for year_month, row in totals.to_dict('index').items():
+        point = {'year_month': year_month, 'subsidiary_count': int(row[SUBSIDIARY_COUNT])}
+        point.update({col: row[col] for col in SUM_COLUMNS})
+        point.update(derive_rates(row))
+        points.append(point)
+    return points
+
+
+class LogicTimeSeries:
+    """
+    월 누적 지표 시계열
+
+    파이프라인이 갱신하는 logic_timeseries.csv 를 한 번 읽어
+    법인 / 지역 / Global 추이를 조회용 목록으로 미리 만들어 둔다.
+    지역 / Global 비율은 월별 큐브 합계에서 derive_rates 로 계산하므로 월별 화면 값과 같다.
+    """
+
+    def __init__(self, df):
+        self.months = sorted(df['Year_Month'].dropna().unique().tolist())
+
+        # 법인별 (대소문자 구분 없이 조회): logic.csv 값 그대로
+        fields = {'year_month': 'Year_Month', 'region': 'Final Region',
+                  **{col: col for col in SUM_COLUMNS + SUBSIDIARY_RATE_COLUMNS}}
+        self._subsidiaries = {}
+        rows = df.dropna(subset=['Final Sub.']).sort_values('Year_Month', kind='stable')
+        for key, group in rows.groupby(rows['Final Sub.'].astype(str).str.lower(), sort=False):
+            self._subsidiaries[key] = frame_records(group, fields)
+
+        # 지역별 (대소문자 구분 없이 조회)
+        self._regions = {}
+        region_rows = df.dropna(subset=['Final Region'])
+        for key, group in region_rows.groupby(region_rows['Final Region'].astype(str).str.lower(), sort=False):
+            self._regions[key] = _rollup_points(group)
+
+        self._global = _rollup_points(df)
+
+    @classmethod
+    def from_frame(cls, df):
+        """logic_timeseries DataFrame에서 시계열 생성 (필수 컬럼이 없으면 None)"""
+        if df is None or not {'Year_Month', 'Final Region', 'Final Sub.'}.issubset(df.columns):
+            return None
+        return cls(df)
+
+    def subsidiary(self, subsidiary):
+        """법인 추이 (없으면 None)"""
+        return self._subsidiaries.get(str(subsidiary).lower())
+
+    def region(self, region):
+        """지역 추이 (없으면 None)"""
+        return self._regions.get(str(region).lower())
+
+    def global_series(self):
+        """Global 추이"""
+        return self._global
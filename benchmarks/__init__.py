@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+파이프라인 / 대시보드 성능 측정 도구 (합성 입력 데이터 생성기, 벤치마크 하네스)
+"""
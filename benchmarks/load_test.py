@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대시보드 API 부하 테스트 하네스 (localhost 전용)
+합성 데이터(benchmarks.pipeline_bench 결과)를 읽는 앱 서버를 로컬에서 띄우고,
+월 마감 시점처럼 여러 담당자가 동시에 Global / Region / Subsidiary 상세 페이지를 여는 상황을 재현합니다.
+
+페이지 한 번 열기 = 페이지 HTML 요청 후 브라우저가 보내는 fetch 묶음을 동시에 요청
+    global             /global              + 사이드바(/api/subsidiaries, /api/regions) + /api/global-bundle
+    region_detail      /region/<region>     + 사이드바 + /api/region-bundle
+    subsidiary_detail  /subsidiary/<sub>    + 사이드바 + /api/subsidiary-bundle
+
+가상 사용자는 각자 로그인 세션과 ETag 캐시를 가지며(브라우저처럼 If-None-Match 재검증),
+엔드포인트별 처리량과 지연 시간 백분위수(p50 / p90 / p95 / p99)를 보고합니다.
+기준 결과(--save-baseline)와 비교하면 p95 지연 / 처리량 회귀를 표시하고 실패 코드로 종료합니다.
+
+참고:
+    - 운영에서는 nginx 가 정적 JSON API(static_api)를 먼저 제공하지만, 이 하네스는 Flask(gunicorn)를 직접 호출합니다.
+    - 서버와 부하 발생기가 같은 장비의 CPU 를 나눠 쓰므로 결과는 같은 장비의 이전 결과와만 비교하세요.
+
+사용법:
+    python -m benchmarks.pipeline_bench --lms-rows 100000 --no-tracemalloc
+    python -m benchmarks.load_test --concurrency 30 --duration 60
+    python -m benchmarks.load_test --concurrency 30 --duration 60 --mix global=1,region_detail=1,subsidiary_detail=3
+    python -m benchmarks.load_test --concurrency 30 --duration 60 --baseline benchmarks/baselines/load_30
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import requests
+
+from benchmarks.pipeline_bench import DEFAULT_THRESHOLD, DEFAULT_WORKDIR, REPO_ROOT
+
+RESULT_FILE = "load_result.json"
+SERVER_LOG_FILE = "server.log"
+SERVER_DB_FILE = "loadtest.sqlite3"
+
+# 부하 테스트 계정 (작업 디렉토리의 임시 DB 에만 생성)
+LOADTEST_USER = {'username': 'loadtest', 'email': 'loadtest@localhost', 'password': 'loadtest'}
+
+# 사이드바(includes/sidebar.html)가 모든 페이지에서 보내는 요청
+SIDEBAR_FETCHES = ['/api/subsidiaries/{month}', '/api/regions/{month}']
+
+# 페이지별 요청 묶음 {페이지: (페이지 HTML, 브라우저 fetch 목록)}
+PAGE_MIXES = {
+    'global': ('/global?month={month}', SIDEBAR_FETCHES + ['/api/global-bundle/{month}']),
+    'region_detail': ('/region/{region}?month={month}', SIDEBAR_FETCHES + ['/api/region-bundle/{region}/{month}']),
+    'subsidiary_detail': ('/subsidiary/{subsidiary}?month={month}', SIDEBAR_FETCHES + ['/api/subsidiary-bundle/{subsidiary}/{month}']),
+}
+
+# 기본 페이지 비중 (법인 담당자가 가장 많고 Global 은 일부 관리자만 봄)
+DEFAULT_MIX = 'global=2,region_detail=3,subsidiary_detail=5'
+
+# 브라우저의 호스트당 동시 연결 수
+BROWSER_CONNECTIONS = 6
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def parse_mix(value):
+    """'global=2,region_detail=3' → {'global': 2.0, 'region_detail': 3.0}"""
+    mix = {}
+    for item in value.split(','):
+        page, _, weight = item.partition('=')
+        page = page.strip()
+        if page not in PAGE_MIXES:
+            raise argparse.ArgumentTypeError(f"알 수 없는 페이지: {page} (가능: {', '.join(PAGE_MIXES)})")
+        mix[page] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+# ==================== 서버 ====================
+
+def ensure_data(workdir, lms_rows):
+    """작업 디렉토리에 파이프라인 결과가 없으면 pipeline_bench 로 합성 데이터 생성"""
+    if (workdir / 'data' / 'catalog.json').exists():
+        return
+    print(f"합성 데이터가 없어 생성합니다: {workdir / 'data'} (LMS {lms_rows}행)")
+    subprocess.run(
+        [sys.executable, '-m', 'benchmarks.pipeline_bench', '--lms-rows', str(lms_rows),
+         '--workdir', str(workdir), '--no-tracemalloc'],
+        cwd=REPO_ROOT, check=True,
+    )
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workdir, port, workers, threads):
+    """
+    gunicorn-cfg.py 설정(preload, gthread)으로 운영과 같은 방식의 서버 시작
+    데이터 / 정적 API / SQL 저장소 / 사용자 DB 는 모두 작업 디렉토리를 사용한다.
+    """
+    env = dict(os.environ)
+    env.update({
+        'DEBUG': 'False',
+        'DASHBOARD_DATA_DIR': str(workdir / 'data'),
+        'STATIC_API_DIR': str(workdir / 'data' / 'static_api'),
+        'OUTPUT_STORE_URI': 'sqlite:///' + str(workdir / 'outputs.sqlite3'),
+        'SQLITE_PATH': str(workdir / SERVER_DB_FILE),
+        'GUNICORN_WORKERS': str(workers),
+        'GUNICORN_THREADS': str(threads),
+        'PROFILING_ENABLED': 'False',
+        'LOG_LEVEL': 'WARNING',
+    })
+    log_file = open(workdir / SERVER_LOG_FILE, 'w', encoding='utf-8')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn-cfg.py',
+         '--bind', f'127.0.0.1:{port}', '--access-logfile', str(workdir / 'access.log'), 'run:app'],
+        cwd=REPO_ROOT, env=env, stdout=log_file, stderr=subprocess.STDOUT,
+    )
+    process.log_file = log_file
+    return process
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    process.log_file.close()
+
+
+def wait_until_ready(process, base_url, timeout):
+    """서버가 /login 에 응답할 때까지 대기 (preload 로 DataCache 를 읽는 시간 포함)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 종료되었습니다 (코드 {process.returncode}), {SERVER_LOG_FILE} 를 확인하세요.")
+        try:
+            if requests.get(f"{base_url}/login", timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"서버가 {timeout}초 안에 준비되지 않았습니다.")
+
+
+def login(base_url):
+    """부하 테스트 계정으로 로그인한 세션 (계정이 없으면 등록)"""
+    session = requests.Session()
+    session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=BROWSER_CONNECTIONS))
+    session.post(f"{base_url}/register", data={'register': '1', **LOADTEST_USER}, timeout=30)
+    session.post(f"{base_url}/login", data={'login': '1', 'username': LOADTEST_USER['username'],
+                                           'password': LOADTEST_USER['password']}, timeout=30)
+    response = session.get(f"{base_url}/api/months", allow_redirects=False, timeout=30)
+    if response.status_code != 200:
+        raise RuntimeError(f"로그인 실패 (/api/months {response.status_code})")
+    return session
+
+
+def discover_targets(session, base_url, months=None):
+    """
+    요청 대상 (월별 Region / Subsidiary 목록)
+
+    Returns:
+        dict: {월: {'regions': [...], 'subsidiaries': [...]}}
+    """
+    available = session.get(f"{base_url}/api/months", timeout=30).json().get('months', [])
+    targets = {}
+    for month in (months or available):
+        regions = session.get(f"{base_url}/api/regions/{month}", timeout=30).json().get('regions', [])
+        subsidiaries = session.get(f"{base_url}/api/subsidiaries/{month}", timeout=30).json().get('subsidiaries', [])
+        if regions and subsidiaries:
+            targets[month] = {'regions': regions, 'subsidiaries': subsidiaries}
+    if not targets:
+        raise RuntimeError(f"요청할 데이터가 없습니다 (사용 가능한 월: {available})")
+    return targets
+
+
+# ==================== 부하 발생 ====================
+
+class LoadStats:
+    """엔드포인트 / 페이지별 지연 시간 기록 (워밍업 구간 제외)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.pages = {}
+        self.recording = False
+
+    def _entry(self, table, name):
+        return table.setdefault(name, {'latencies': [], 'statuses': Counter(), 'errors': Counter()})
+
+    def add_request(self, endpoint, latency, status=None, error=None):
+        if not self.recording:
+            return
+        with self._lock:
+            entry = self._entry(self.requests, endpoint)
+            entry['latencies'].append(latency)
+            if status is not None:
+                entry['statuses'][status] += 1
+            if error is not None:
+                entry['errors'][error] += 1
+
+    def add_page(self, page, latency, ok):
+        if not self.recording:
+            return
+        with self._lock:
+            entry = self._entry(self.pages, page)
+            entry['latencies'].append(latency)
+            entry['statuses']['ok' if ok else 'failed'] += 1
+
+
+class VirtualUser(threading.Thread):
+    """
+    가상 사용자 (로그인 세션 1개, 페이지 선택 → HTML 요청 → fetch 묶음 동시 요청 반복)
+    ETag 를 기억해 두었다가 같은 URL 을 다시 열면 If-None-Match 로 재검증한다 (--no-etag 로 끔).
+    """
+
+    def __init__(self, index, base_url, targets, mix, stats, stop_event, think_time, use_etag, seed):
+        super().__init__(name=f'virtual-user-{index}', daemon=True)
+        self.base_url = base_url
+        self.targets = targets
+        self.pages = list(mix)
+        self.weights = [mix[page] for page in self.pages]
+        self.stats = stats
+        self.stop_event = stop_event
+        self.think_time = think_time
+        self.use_etag = use_etag
+        self.random = random.Random(seed + index)
+        self.etags = {}
+        self.session = None
+
+    def _request(self, template, path):
+        headers = {}
+        etag = self.etags.get(path) if self.use_etag else None
+        if etag:
+            headers['If-None-Match'] = etag
+        started = time.perf_counter()
+        try:
+            # 로그인이 풀리면 /login 으로 리다이렉트되므로 따라가지 않고 오류로 집계
+            response = self.session.get(self.base_url + path, headers=headers, allow_redirects=False, timeout=60)
+            response.content  # 본문까지 수신한 시간으로 측정
+        except requests.RequestException as e:
+            self.stats.add_request(template, time.perf_counter() - started, error=type(e).__name__)
+            return False
+        latency = time.perf_counter() - started
+        ok = response.status_code in (200, 304)
+        self.stats.add_request(template, latency, status=response.status_code)
+        if ok and response.headers.get('ETag'):
+            self.etags[path] = response.headers['ETag']
+        return ok
+
+    def load_page(self, page, executor):
+        month = self.random.choice(list(self.targets))
+        values = {
+            'month': month,
+            'region': quote(self.random.choice(self.targets[month]['regions']), safe=''),
+            'subsidiary': quote(self.random.choice(self.targets[month]['subsidiaries']), safe=''),
+        }
+        html, fetches = PAGE_MIXES[page]
+        started = time.perf_counter()
+        ok = self._request(html, html.format(**values))
+        results = executor.map(lambda template: self._request(template, template.format(**values)), fetches)
+        ok = all(results) and ok
+        self.stats.add_page(page, time.perf_counter() - started, ok)
+
+    def run(self):
+        self.session = login(self.base_url)
+        with ThreadPoolExecutor(max_workers=BROWSER_CONNECTIONS) as executor:
+            while not self.stop_event.is_set():
+                page = self.random.choices(self.pages, weights=self.weights)[0]
+                self.load_page(page, executor)
+                if self.think_time:
+                    self.stop_event.wait(self.random.uniform(0.5, 1.5) * self.think_time)
+
+
+def run_load(base_url, targets, args):
+    """
+    가상 사용자 실행 (워밍업 후 측정 구간만 기록)
+
+    Returns:
+        tuple: (LoadStats, 측정 구간 초)
+    """
+    stats = LoadStats()
+    stop_event = threading.Event()
+    mix = args.mix
+    users = [
+        VirtualUser(i, base_url, targets, mix, stats, stop_event, args.think_time, args.etag, args.seed)
+        for i in range(args.concurrency)
+    ]
+    for user in users:
+        user.start()
+
+    time.sleep(args.warmup)
+    stats.recording = True
+    started = time.perf_counter()
+    time.sleep(args.duration)
+    stats.recording = False
+    elapsed = time.perf_counter() - started
+
+    stop_event.set()
+    for user in users:
+        user.join(timeout=120)
+    return stats, elapsed
+
+
+# ==================== 보고 ====================
+
+def summarize(table, elapsed):
+    """{이름: 기록} → {이름: 요약 통계 (지연 시간 ms)}"""
+    summary = {}
+    for name, entry in sorted(table.items()):
+        latencies = sorted(entry['latencies'])
+        count = len(latencies)
+        failures = sum(entry['errors'].values()) + sum(
+            n for status, n in entry['statuses'].items() if status not in (200, 304, 'ok')
+        )
+        summary[name] = {
+            'count': count,
+            'rps': round(count / elapsed, 2),
+            'errors': failures,
+            'statuses': {str(status): n for status, n in entry['statuses'].items()},
+            **{f'p{pct}_ms': round(percentile(latencies, pct) * 1000, 1) for pct in PERCENTILES},
+            'max_ms': round(latencies[-1] * 1000, 1),
+        }
+    return summary
+
+
+def print_table(title, summary):
+    print(f"\n{title}")
+    print(f"{'':<48} {'요청':>7} {'req/s':>8} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8} {'오류':>5}")
+    for name, row in summary.items():
+        print(f"{name:<48} {row['count']:>7} {row['rps']:>8.2f} {row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} "
+              f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f} {row['errors']:>5}")
+
+
+def compare_baseline(result, baseline, threshold):
+    """
+    기준 결과 대비 p95 지연 증가 / 처리량 감소 비교
+
+    Returns:
+        list: 회귀 항목
+    """
+    regressions = []
+    print(f"\n{'':<48} {'기준 p95':>9} {'현재 p95':>9} {'변화':>8}")
+    for section in ('pages', 'endpoints'):
+        base_rows = baseline[section]
+        for name, row in result[section].items():
+            base = base_rows.get(name)
+            if base is None or not base['p95_ms']:
+                continue
+            ratio = row['p95_ms'] / base['p95_ms'] - 1
+            regressed = ratio > threshold
+            print(f"{name:<48} {base['p95_ms']:>9.1f} {row['p95_ms']:>9.1f} {ratio:>+8.1%}{'  ← 회귀' if regressed else ''}")
+            if regressed:
+                regressions.append(f"{name} p95")
+
+    base_rps, rps = baseline['total']['rps'], result['total']['rps']
+    ratio = rps / base_rps - 1 if base_rps else 0.0
+    print(f"{'전체 처리량 (req/s)':<48} {base_rps:>9.2f} {rps:>9.2f} {ratio:>+8.1%}")
+    if ratio < -threshold:
+        regressions.append('total rps')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 앱 서버 대상 대시보드 페이지 부하 테스트")
+    parser.add_argument('--workdir', default=str(DEFAULT_WORKDIR), help="합성 데이터 작업 디렉토리 (pipeline_bench 와 같은 기본값)")
+    parser.add_argument('--lms-rows', type=int, default=100000, help="데이터가 없을 때 생성할 LMS 행 수")
+    parser.add_argument('--concurrency', type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument('--duration', type=float, default=30, help="측정 시간 (초)")
+    parser.add_argument('--warmup', type=float, default=5, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument('--think-time', type=float, default=0, help="페이지 사이 평균 대기 시간 (초, 0: 쉬지 않고 요청)")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"페이지 비중 (기본값: {DEFAULT_MIX})")
+    parser.add_argument('--months', type=lambda v: [int(m) for m in v.split(',')], default=None, help="요청할 월 (쉼표 구분, 기본값: 데이터가 있는 모든 월)")
+    parser.add_argument('--no-etag', dest='etag', action='store_false', help="If-None-Match 재검증 없이 항상 전체 응답 요청")
+    parser.add_argument('--workers', type=int, default=int(os.getenv('GUNICORN_WORKERS', '4')), help="gunicorn 워커 수")
+    parser.add_argument('--threads', type=int, default=int(os.getenv('GUNICORN_THREADS', '4')), help="gunicorn 워커당 스레드 수")
+    parser.add_argument('--port', type=int, default=None, help="서버 포트 (기본값: 빈 포트)")
+    parser.add_argument('--url', default=None, help="이미 실행 중인 로컬 서버 주소 (지정하면 서버를 띄우지 않음)")
+    parser.add_argument('--startup-timeout', type=float, default=180, help="서버 준비 대기 시간 (초)")
+    parser.add_argument('--seed', type=int, default=42, help="페이지 / 대상 선택 난수 시드")
+    parser.add_argument('--save-baseline', metavar='DIR', help="이번 결과를 기준 결과로 저장")
+    parser.add_argument('--baseline', metavar='DIR', help="기준 결과와 비교 (p95 지연 / 처리량)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="회귀로 볼 변화 비율 (기본값 0.10)")
+    args = parser.parse_args(argv)
+
+    workdir = Path(args.workdir).resolve()
+    process = None
+    if args.url:
+        base_url = args.url.rstrip('/')
+        if not base_url.startswith(('http://127.0.0.1', 'http://localhost')):
+            parser.error("--url 은 localhost 서버만 지정할 수 있습니다.")
+    else:
+        ensure_data(workdir, args.lms_rows)
+        port = args.port or _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = start_server(workdir, port, args.workers, args.threads)
+
+    try:
+        if process is not None:
+            started = time.perf_counter()
+            wait_until_ready(process, base_url, args.startup_timeout)
+            print(f"서버 준비 완료: {base_url} ({time.perf_counter() - started:.1f}초, 워커 {args.workers} × 스레드 {args.threads})")
+
+        targets = discover_targets(login(base_url), base_url, args.months)
+        for month, target in targets.items():
+            print(f"대상: {month}월 Region {len(target['regions'])}개 / Subsidiary {len(target['subsidiaries'])}개")
+        print(f"가상 사용자 {args.concurrency}명, 워밍업 {args.warmup:.0f}초 + 측정 {args.duration:.0f}초 ...")
+
+        stats, elapsed = run_load(base_url, targets, args)
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    endpoints = summarize(stats.requests, elapsed)
+    pages = summarize(stats.pages, elapsed)
+    total_requests = sum(row['count'] for row in endpoints.values())
+    result = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'params': {
+            'concurrency': args.concurrency,
+            'duration': args.duration,
+            'think_time': args.think_time,
+            'mix': args.mix,
+            'etag': args.etag,
+            'workers': args.workers,
+            'threads': args.threads,
+        },
+        'cpu_count': os.cpu_count(),
+        'elapsed_s': round(elapsed, 2),
+        'total': {
+            'requests': total_requests,
+            'rps': round(total_requests / elapsed, 2),
+            'errors': sum(row['errors'] for row in endpoints.values()),
+        },
+        'pages': pages,
+        'endpoints': endpoints,
+    }
+
+    print_table("페이지 로드 (HTML + fetch 묶음, ms)", pages)
+    print_table("엔드포인트 (ms)", endpoints)
+    print(f"\n전체: {total_requests}건, {result['total']['rps']:.2f} req/s, 오류 {result['total']['errors']}건")
+
+    workdir.mkdir(parents=True, exist_ok=True)
+    with open(workdir / RESULT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {workdir / RESULT_FILE}")
+
+    if args.save_baseline:
+        baseline_dir = Path(args.save_baseline)
+        baseline_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(workdir / RESULT_FILE, baseline_dir / RESULT_FILE)
+        print(f"기준 결과 저장: {baseline_dir}")
+
+    if args.baseline:
+        with open(Path(args.baseline) / RESULT_FILE, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline['params'] != result['params']:
+            print(f"⚠ 기준 결과와 실행 조건이 다릅니다: 기준 {baseline['params']} / 현재 {result['params']}")
+        regressions = compare_baseline(result, baseline, args.threshold)
+        if regressions:
+            print(f"✗ 회귀 ({args.threshold:.0%} 초과): {regressions}")
+            return 1
+    return 1 if result['total']['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
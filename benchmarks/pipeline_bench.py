@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 벤치마크 하네스
+합성 원본 Excel(benchmarks.synthetic_data)을 격리된 작업 디렉토리에 생성한 뒤 main.main() 을 실행하고,
+main.main() 이 남기는 실행 리포트(run_report)의 단계별 경과 시간 / CPU 시간 / Python 할당 피크(tracemalloc) /
+최대 RSS 를 결과로 기록합니다. 3 / 4단계의 세부 계산 함수도 단계로 추가 측정합니다.
+
+저장된 기준 결과(--save-baseline)와 비교하면 단계별 시간 회귀를 표시하고,
+logic.csv 가 기준 결과와 한 글자라도 다르면 다른 행 / 컬럼을 출력한 뒤 실패 코드로 종료합니다.
+
+작업 디렉토리 구성 (저장소의 data / logs / SQL 저장소는 건드리지 않음):
+    <workdir>/data/year=YYYY/month=MM   합성 원본 + 파이프라인 결과
+    <workdir>/data/static_api           정적 JSON API (STATIC_API_DIR)
+    <workdir>/outputs.sqlite3           SQL 저장소 (OUTPUT_STORE_URI)
+    <workdir>/logs                      파이프라인 로그
+    <workdir>/result.json               이번 실행 결과
+
+참고:
+    - HONG 연간교육계획 날짜는 전처리기가 실행 시점의 년도로 만들기 때문에
+      logic.csv 는 같은 달력 년도 안에서만 기준 결과와 비교할 수 있습니다.
+    - tracemalloc 은 할당마다 추적 비용이 들어 경과 시간이 늘어납니다.
+      시간만 비교할 때는 --no-tracemalloc 으로 측정하고, 기준 결과도 같은 설정으로 저장하세요.
+    - --workers 2 이상이면 3~7단계는 작업 프로세스에서 측정되고, 경과 시간 합이 run_logic_steps 보다 클 수 있습니다.
+
+사용법:
+    python -m benchmarks.pipeline_bench --lms-rows 100000 --save-baseline benchmarks/baselines/100k
+    python -m benchmarks.pipeline_bench --lms-rows 100000 --baseline benchmarks/baselines/100k
+    python -m benchmarks.pipeline_bench --lms-rows 1000000 --no-tracemalloc --workdir /tmp/bench_1m
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.synthetic_data import DEFAULT_LMS_ROWS, DEFAULT_SEED, generate_inputs  # noqa: E402
+
+# 기본 작업 디렉토리 (.gitignore 대상)
+DEFAULT_WORKDIR = REPO_ROOT / "benchmarks" / "runs" / "latest"
+RESULT_FILE = "result.json"
+LOGIC_FILE = "logic.csv"
+
+# 기준 결과 대비 이 비율 이상 느려지면 회귀로 표시 (0.10: 10%)
+DEFAULT_THRESHOLD = 0.10
+# 이보다 짧은 차이는 측정 잡음으로 보고 회귀로 표시하지 않음 (초)
+MIN_REGRESSION_SECONDS = 0.05
+# logic.csv 불일치 출력 시 최대 행 수
+MAX_DIFF_ROWS = 20
+
+# 실행 리포트의 단계 외에 추가로 측정할 run_step3 / run_step4 세부 계산 함수 (make_logic 모듈 전역)
+DETAIL_STAGES = [
+    'calculate_current_education_plans',
+    'calculate_completed_courses_by_subsidiary',
+    'calculate_completion_rate',
+    'calculate_cumulative_hours',
+    'calculate_monthly_completion_rate',
+]
+
+
+def instrument_details():
+    """make_logic 의 세부 계산 함수를 실행 리포트 단계로 교체"""
+    import make_logic
+    from run_report import run_report
+
+    for attr in DETAIL_STAGES:
+        setattr(make_logic, attr, run_report.wrap(attr, getattr(make_logic, attr)))
+
+
+def prepare_workdir(workdir):
+    """
+    작업 디렉토리 초기화 및 파이프라인 / 웹 앱이 작업 디렉토리를 쓰도록 환경 변수 설정
+    (main / apps 를 import 하기 전에 호출해야 함)
+    """
+    workdir = Path(workdir).resolve()
+    for name in ('data', 'outputs.sqlite3', RESULT_FILE):
+        path = workdir / name
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    os.environ['DASHBOARD_DATA_DIR'] = str(workdir / 'data')
+    os.environ['STATIC_API_DIR'] = str(workdir / 'data' / 'static_api')
+    os.environ['OUTPUT_STORE_URI'] = 'sqlite:///' + str(workdir / 'outputs.sqlite3')
+    # main.py 의 경로는 작업 디렉토리 기준 상대 경로 (data/year=YYYY/month=MM)
+    os.chdir(workdir)
+    return workdir
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_benchmark(args):
+    """
+    합성 입력 생성 → main.main() 실행 → 결과 기록
+
+    Returns:
+        dict: 실행 결과 (result.json 내용)
+    """
+    workdir = prepare_workdir(args.workdir)
+
+    from partition_catalog import partition_dir
+    file_directory = partition_dir(args.year, args.month)
+
+    started = time.perf_counter()
+    generate_inputs(file_directory, args.lms_rows, args.employees, args.year, args.month, args.seed)
+    generate_s = round(time.perf_counter() - started, 2)
+    inputs = {name: os.path.getsize(os.path.join(file_directory, name)) for name in sorted(os.listdir(file_directory))}
+
+    import main as pipeline
+    pipeline.ANALYSIS_YEAR = args.year
+    pipeline.ANALYSIS_MONTH = args.month
+    pipeline.FILE_DIRECTORY = file_directory
+    pipeline.MAKE_LOGIC_WORKERS = args.workers
+    pipeline.PIPELINE_VERBOSITY = args.verbosity
+    pipeline.RUN_REPORT_TRACEMALLOC = args.tracemalloc
+    instrument_details()
+
+    success = pipeline.main()
+
+    from run_report import load_reports
+    reports = load_reports(file_directory, last=1)
+    report = reports[-1] if reports else None
+
+    logic_path = os.path.join(file_directory, LOGIC_FILE)
+    logic = None
+    if os.path.exists(logic_path):
+        with open(logic_path, encoding='utf-8-sig') as f:
+            rows = sum(1 for _ in f) - 1
+        logic = {'path': str(workdir / logic_path), 'sha256': file_sha256(logic_path), 'rows': rows}
+
+    result = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'params': {
+            'lms_rows': args.lms_rows,
+            'employees': args.employees,
+            'seed': args.seed,
+            'year': args.year,
+            'month': args.month,
+            'workers': args.workers,
+            'verbosity': args.verbosity,
+            'tracemalloc': args.tracemalloc,
+        },
+        'python': sys.version.split()[0],
+        'cpu_count': os.cpu_count(),
+        'success': bool(success),
+        'generate_s': generate_s,
+        'inputs': inputs,
+        'run_report': report['path'] if report else None,
+        'memory': report['memory'] if report else None,
+        'stages': report['stages'] if report else [],
+        'logic': logic,
+    }
+    with open(workdir / RESULT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return result
+
+
+def print_stages(result):
+    """단계별 측정 결과 출력 (호출 트리 순서, 하위 단계는 들여쓰기)"""
+    from run_report import stage_tree
+
+    print(f"{'단계':<56} {'호출':>4} {'경과(s)':>9} {'CPU(s)':>9} {'Py피크(MB)':>11} {'RSS(MB)':>9}")
+    for depth, stage in stage_tree(result):
+        label = '  ' * depth + stage['name']
+        py_peak = '-' if stage['py_peak_mb'] is None else f"{stage['py_peak_mb']:.1f}"
+        rss = '-' if stage['rss_peak_mb'] is None else f"{stage['rss_peak_mb']:.1f}"
+        print(f"{label:<56} {stage['calls']:>4} {stage['wall_s']:>9.3f} {stage['cpu_s']:>9.3f} {py_peak:>11} {rss:>9}")
+
+
+def save_baseline(result, baseline_dir):
+    """기준 결과 저장 (result.json + logic.csv 사본)"""
+    baseline_dir = Path(baseline_dir)
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    if result['logic']:
+        shutil.copyfile(result['logic']['path'], baseline_dir / LOGIC_FILE)
+    with open(baseline_dir / RESULT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"기준 결과 저장: {baseline_dir}")
+
+
+def compare_timings(result, baseline, threshold):
+    """
+    단계별 경과 시간 비교
+
+    Returns:
+        list: 회귀 단계 이름
+    """
+    baseline_stages = {stage['name']: stage for stage in baseline['stages']}
+    regressions = []
+    print(f"\n{'단계':<56} {'기준(s)':>9} {'현재(s)':>9} {'변화':>8}")
+    for stage in result['stages']:
+        base = baseline_stages.get(stage['name'])
+        if base is None:
+            continue
+        diff = stage['wall_s'] - base['wall_s']
+        ratio = diff / base['wall_s'] if base['wall_s'] else 0.0
+        regressed = ratio > threshold and diff > MIN_REGRESSION_SECONDS
+        marker = '  ← 회귀' if regressed else ''
+        print(f"{stage['name']:<56} {base['wall_s']:>9.3f} {stage['wall_s']:>9.3f} {ratio:>+8.1%}{marker}")
+        if regressed:
+            regressions.append(stage['name'])
+    return regressions
+
+
+def compare_logic(result, baseline_dir):
+    """
+    logic.csv 가 기준 결과와 같은지 비교 (다르면 다른 컬럼 / 행 출력)
+
+    Returns:
+        bool: 동일 여부
+    """
+    baseline_path = Path(baseline_dir) / LOGIC_FILE
+    if result['logic'] is None or not baseline_path.exists():
+        print("✗ logic.csv 가 없어 비교할 수 없습니다.")
+        return False
+    if result['logic']['sha256'] == file_sha256(baseline_path):
+        print(f"✓ logic.csv 동일 ({result['logic']['rows']}행, sha256 {result['logic']['sha256'][:12]})")
+        return True
+
+    import pandas as pd
+
+    current = pd.read_csv(result['logic']['path'], dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    expected = pd.read_csv(baseline_path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    print("✗ logic.csv 가 기준 결과와 다릅니다.")
+    if list(current.columns) != list(expected.columns):
+        print(f"  - 컬럼 차이: 추가 {sorted(set(current.columns) - set(expected.columns))}, "
+              f"누락 {sorted(set(expected.columns) - set(current.columns))}")
+    if len(current) != len(expected):
+        print(f"  - 행 수 차이: 기준 {len(expected)}행, 현재 {len(current)}행")
+
+    columns = [col for col in expected.columns if col in current.columns]
+    rows = min(len(current), len(expected))
+    differences = (current.loc[:rows - 1, columns] != expected.loc[:rows - 1, columns])
+    changed_columns = differences.any()
+    print(f"  - 값이 다른 컬럼: {list(changed_columns[changed_columns].index)}")
+    for index in differences.index[differences.any(axis=1)][:MAX_DIFF_ROWS]:
+        cols = list(differences.columns[differences.loc[index]])
+        print(f"    행 {index}: " + ', '.join(f"{col}: {expected.at[index, col]!r} → {current.at[index, col]!r}" for col in cols))
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 데이터로 파이프라인(main.main) 단계별 시간 / 메모리 측정")
+    parser.add_argument('--lms-rows', type=int, default=DEFAULT_LMS_ROWS, help="LMS 수강 기록 행 수 (예: 10000 ~ 1000000)")
+    parser.add_argument('--employees', type=int, default=None, help="HR 직원 수 (기본값: LMS 행 수 / 15)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="합성 데이터 난수 시드")
+    parser.add_argument('--year', type=int, default=2025, help="분석 기준 년도")
+    parser.add_argument('--month', type=int, default=9, help="분석 기준 월")
+    parser.add_argument('--workers', type=int, default=1, help="3~7단계 프로세스 수 (기본값 1: 단계별 측정을 위해 순차 실행)")
+    parser.add_argument('--verbosity', default='quiet', choices=['quiet', 'summary', 'diagnostic'], help="파이프라인 로그 상세도")
+    parser.add_argument('--no-tracemalloc', dest='tracemalloc', action='store_false', help="Python 할당 피크 측정 생략 (시간 측정 정확도 우선)")
+    parser.add_argument('--workdir', default=str(DEFAULT_WORKDIR), help="작업 디렉토리 (data 하위는 실행마다 초기화)")
+    parser.add_argument('--save-baseline', metavar='DIR', help="이번 실행 결과를 기준 결과로 저장")
+    parser.add_argument('--baseline', metavar='DIR', help="기준 결과와 비교 (시간 회귀 / logic.csv 동일 여부)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="회귀로 볼 경과 시간 증가 비율 (기본값 0.10)")
+    args = parser.parse_args(argv)
+
+    # 작업 디렉토리로 이동하기 전에 기준 결과 경로를 절대 경로로 변환
+    baseline_dir = Path(args.baseline).resolve() if args.baseline else None
+    save_dir = Path(args.save_baseline).resolve() if args.save_baseline else None
+
+    result = run_benchmark(args)
+    print(f"\n합성 입력 생성: {result['generate_s']:.2f}초 ({', '.join(f'{k} {v / 1024 / 1024:.1f}MB' for k, v in result['inputs'].items() if k.endswith('.xlsx'))})")
+    print_stages(result)
+    print(f"\n결과 저장: {Path(args.workdir).resolve() / RESULT_FILE}")
+
+    if not result['success']:
+        print("✗ 파이프라인 실행 실패")
+        return 1
+
+    if save_dir:
+        save_baseline(result, save_dir)
+
+    if baseline_dir:
+        with open(baseline_dir / RESULT_FILE, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline['params'] != result['params']:
+            print(f"⚠ 기준 결과와 실행 조건이 다릅니다: 기준 {baseline['params']} / 현재 {result['params']}")
+        regressions = compare_timings(result, baseline, args.threshold)
+        identical = compare_logic(result, baseline_dir)
+        if regressions:
+            print(f"✗ 경과 시간 회귀 ({args.threshold:.0%} 초과): {regressions}")
+        if regressions or not identical:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
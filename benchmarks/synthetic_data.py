@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+합성 입력 데이터 생성기
+실제 HR / LMS 원본을 보안 공유 폴더 밖으로 가져올 수 없으므로, 전처리기가 기대하는
+컬럼명과 값 분포를 그대로 따르는 원본 Excel 5종을 원하는 규모로 생성합니다.
+
+생성 파일 (main.py 가 월 디렉토리에서 읽는 이름 그대로):
+    hr_index.xlsx          Summary / Detail 시트 (Detail: 직원별 1행)
+    prev_hr_index.xlsx     Detail 시트 (전년도 말 기준 직원 / 직책)
+    lms_learning.xlsx      수강 기록 (연초 ~ 분석 월 누적)
+    hong_data.xlsx         법인담당자 / 연간교육계획 시트
+    index_management.xlsx  법인별 Manage Area 및 Y/N 지표
+
+전처리기의 특수 처리 경로도 모두 포함됩니다:
+    Integrated Sub. Name(MP) 공란 → Sub. Name(MP) 사용 / 둘 다 공란 → ETC,
+    Finland Lab → LGEFL, Monterrey Factory → LGEMN, ~~Branch, LGECA → LGECL, LGEIC → LGERC,
+    LGECE + Czech → LGECZ, LGECH + Asia Region → China, Manage Area = N 법인, HONG 법인명 매핑 등
+
+같은 인자(시드 포함)로 생성하면 항상 같은 파일이 만들어집니다.
+
+사용법:
+    python -m benchmarks.synthetic_data --out data/year=2025/month=09 --lms-rows 100000
+    python -m benchmarks.synthetic_data --out /tmp/bench --lms-rows 1000000 --employees 60000 --seed 7
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# 기본 규모 / 시드
+DEFAULT_LMS_ROWS = 100000
+DEFAULT_SEED = 42
+LMS_ROWS_PER_EMPLOYEE = 15  # 직원 수를 지정하지 않으면 LMS 행 수 / 15 명
+
+# Excel 한 시트의 최대 행 수 (헤더 제외)
+EXCEL_MAX_ROWS = 1048575
+
+# 법인 구성: (Integrated Sub. Name(MP), Sub. Name(MP), Region(MP), 인원 비중)
+# Integrated 가 None 이면 전처리기가 Sub. Name(MP) 를 법인명으로 사용한다.
+SUBSIDIARIES = [
+    ('LGEUS', 'LGEUS', 'North America Region', 6.0),
+    ('LGECI', 'LGECI', 'North America Region', 1.5),
+    ('LGEMU', 'LGEMU', 'North America Region', 1.0),
+    ('LGEMS', 'LGEMS', 'Latin America Region', 2.0),
+    (None, 'Monterrey Factory', 'Latin America Region', 2.5),
+    ('LGESP', 'LGESP', 'Latin America Region', 3.0),
+    ('LGEAR', 'LGEAR', 'Latin America Region', 0.6),
+    ('LGECA', 'LGECA', 'Latin America Region', 0.5),
+    ('LGEPR', 'LGEPR', 'Latin America Region', 0.5),
+    ('LGECB', 'LGECB', 'Latin America Region', 0.6),
+    ('LGEUK', 'LGEUK', 'Europe Region', 1.0),
+    ('LGEDG', 'LGEDG', 'Europe Region', 1.2),
+    ('LGEFS', 'LGEFS', 'Europe Region', 0.9),
+    ('LGEFS', 'Tunisia Branch', 'Europe Region', 0.2),
+    ('LGEIS', 'LGEIS', 'Europe Region', 0.7),
+    ('LGEES', 'LGEES', 'Europe Region', 0.8),
+    ('LGEPL', 'LGEPL', 'Europe Region', 0.8),
+    ('LGEWR', 'LGEWR', 'Europe Region', 4.0),
+    ('LGECE', 'LGECE', 'Europe Region', 0.6),
+    ('LGECE', 'Czech', 'Europe Region', 0.3),
+    ('LGENO', 'LGENO', 'Europe Region', 0.4),
+    ('LGEBN', 'LGEBN', 'Europe Region', 0.5),
+    ('Finland Lab', 'Finland Lab', 'Europe Region', 0.2),
+    ('LGERU', 'LGERU', 'CIS Region', 1.5),
+    ('LGERA', 'LGERA', 'CIS Region', 2.0),
+    ('LGEAK', 'LGEAK', 'CIS Region', 0.4),
+    ('LGEUR', 'LGEUR', 'CIS Region', 0.3),
+    ('LGEIL', 'LGEIL', 'Asia Region', 8.0),
+    ('LGEIN', 'LGEIN', 'Asia Region', 3.0),
+    ('LGETH', 'LGETH', 'Asia Region', 3.5),
+    ('LGEVH', 'LGEVH', 'Asia Region', 5.0),
+    ('LGEML', 'LGEML', 'Asia Region', 0.8),
+    ('LGESL', 'LGESL', 'Asia Region', 0.4),
+    ('LGEPH', 'LGEPH', 'Asia Region', 0.5),
+    ('LGEAP', 'LGEAP', 'Asia Region', 0.6),
+    ('LGEJP', 'LGEJP', 'Asia Region', 0.5),
+    ('LGECH', 'LGECH', 'Asia Region', 1.5),
+    ('LGECH', 'LGECH', 'China Region', 1.0),
+    ('LGENP', 'LGENP', 'China Region', 3.0),
+    ('LGETA', 'LGETA', 'China Region', 2.0),
+    ('LGEHZ', 'LGEHZ', 'China Region', 1.5),
+    ('LGEQH', 'LGEQH', 'China Region', 1.2),
+    ('LGESA', 'LGESA', 'Middle East & Africa Region', 0.6),
+    ('LGEEG', 'LGEEG', 'Middle East & Africa Region', 2.0),
+    ('LGEME', 'LGEME', 'Middle East & Africa Region', 1.0),
+    ('LGEMK', 'LGEMK', 'Middle East & Africa Region', 0.5),
+    ('LGETK', 'LGETK', 'Middle East & Africa Region', 0.8),
+    ('LGESR', 'LGESR', 'Middle East & Africa Region', 1.2),
+    ('LGEIC', 'LGEIC', 'Middle East & Africa Region', 0.4),
+    ('LGEAF', 'LGEAF', 'Middle East & Africa Region', 0.4),
+    ('LGEMK', 'Israel Branch', 'Middle East & Africa Region', 0.1),
+    (None, None, None, 0.1),
+]
+
+# HR 전처리 결과 법인명 (index_management 의 Final Sub. 목록을 만들 때 사용)
+FINAL_SUB_OVERRIDES = {
+    'Monterrey Factory': 'LGEMN',
+    'Finland Lab': 'LGEFL',
+    'LGECA': 'LGECL',
+    'LGEIC': 'LGERC',
+    'Czech': 'LGECZ',
+}
+
+# Manage Area = 'N' 법인 (HR / HONG 에서 필터링되는 경로)
+UNMANAGED_SUBSIDIARIES = {'LGEMU', 'LGEAF'}
+
+# HONG 연간교육계획의 법인명 표기 (전처리기 update_subsidiary_mapping 대상 포함)
+HONG_SUBSIDIARY_ALIASES = {
+    'ISRAEL BRANCH': 'LGEYK',
+    'TUNISIA BRANCH': 'LGETU',
+}
+
+# 직원 속성 분포
+STAFF_OPERATOR = (['Staff', 'Operator'], [0.62, 0.38])
+FSE_ISE = (['ISE', 'FSE'], [0.96, 0.04])
+HIPO_TYPES = (['EIP', 'GLP', None], [0.035, 0.02, 0.945])
+POSITIONS = ([None, 'Part Leader', 'Team Leader', 'Leader_팀장', 'Director'], [0.80, 0.09, 0.07, 0.025, 0.015])
+LEADER_POSITIONS = ('Team Leader', 'Leader_팀장')
+JOB_FUNCTIONS = ['Sales', 'Marketing', 'Production', 'R&D', 'Quality', 'SCM', 'Finance', 'HR', 'IT', 'Service']
+GRADES = ['G1', 'G2', 'G3', 'G4', 'G5', 'S1', 'S2', 'S3']
+NEW_HIRE_SHARE = 0.08          # 분석 년도 입사자 비율
+LEADER_PROMOTION_SHARE = 0.15  # 팀장 중 전년도에는 팀장이 아니었던 비율
+
+# LMS 과정 / 상태 분포
+NEW_HIRE_COURSES = [
+    'New Employee Orientation', 'New Comer Onboarding Program', 'New Joiner Welcome Day',
+    'New Member Induction', 'New LGer Journey', '新入社員研修',
+]
+NEW_HIRE_ITEM_ID = '20015'
+NEW_LEADER_ITEM_ID = '[LGE_HQ_Assimilation Workshop]'
+COURSE_TOPICS = [
+    'Leadership Essentials', 'Business Writing', 'Negotiation Skills', 'Quality Management Basics',
+    'Lean Manufacturing', 'Data Analysis with Excel', 'AI Literacy', 'Cyber Security Awareness',
+    'Compliance & Ethics', 'Customer Value Mindset', 'Presentation Skills', 'Project Management',
+    'B2B Sales Strategy', 'SCM Fundamentals', 'Financial Statements', 'Coaching for Managers',
+    'Safety & Environment', 'Digital Marketing', 'Product Planning', 'Software Engineering',
+]
+CATEGORIES = [
+    '직무역량', '리더십, 리더십 공통', '품질', '영업, 직무역량', '생산관리', 'AI/빅데이터, DX',
+    '보안관리', 'LG 필수 교육', '환경안전', '재경', 'SCM', 'B2B', 'HR', 'R&D 공통, 직무역량',
+    '리더십, 파트장/팀장', '핵심인재', '고객 가치, 고객마인드', '독서통신', 'Software R&D', '신규입사자',
+]
+COMPLETION_STATUSES = (
+    ['WBT-C', 'ILT-C', 'VILT-C', 'WBT-I', 'ILT-N', 'ILT-R', 'WBT-W'],
+    [0.46, 0.20, 0.09, 0.12, 0.05, 0.05, 0.03],
+)
+EDUCATION_HOURS = ([0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 8.0, 16.0, 24.0], [0.12, 0.25, 0.10, 0.18, 0.08, 0.10, 0.10, 0.05, 0.02])
+
+# Index Management Y/N 지표
+INDEX_YN_COLUMNS = ['New LMS Course', 'LMS Mission', 'Annual Plan Setup', 'JAM Member', 'Global L&D Council', 'Infra index response']
+
+
+def _choice(rng, options, size):
+    values, weights = options
+    weights = np.asarray(weights, dtype=float)
+    return rng.choice(np.array(values, dtype=object), size=size, p=weights / weights.sum())
+
+
+def _final_sub(integrated, sub_name):
+    """HR 전처리 후 Final Sub. (index_management 목록용)"""
+    if integrated is None and sub_name is None:
+        return 'ETC'
+    if sub_name is not None and sub_name.endswith('Branch'):
+        return sub_name.upper()
+    name = integrated if integrated is not None else sub_name
+    return FINAL_SUB_OVERRIDES.get(sub_name, FINAL_SUB_OVERRIDES.get(name, name)).upper()
+
+
+def _final_region(region):
+    return region.replace(' Region', '') if region else None
+
+
+def build_hr(rng, employees, analysis_year, analysis_month):
+    """
+    HR Detail 시트 (직원별 1행)
+
+    Returns:
+        pandas.DataFrame: 현재 HR Detail
+    """
+    weights = np.array([s[3] for s in SUBSIDIARIES])
+    picks = rng.choice(len(SUBSIDIARIES), size=employees, p=weights / weights.sum())
+    integrated = np.array([SUBSIDIARIES[i][0] for i in picks], dtype=object)
+    sub_name = np.array([SUBSIDIARIES[i][1] for i in picks], dtype=object)
+    region = np.array([SUBSIDIARIES[i][2] for i in picks], dtype=object)
+
+    emp_no = np.arange(100001, 100001 + employees)
+    staff_operator = _choice(rng, STAFF_OPERATOR, employees)
+    hipo = _choice(rng, HIPO_TYPES, employees)
+    hipo[staff_operator == 'Operator'] = None
+    position = _choice(rng, POSITIONS, employees)
+    position[staff_operator == 'Operator'] = None
+
+    # 입사일: 대부분 과거 입사, NEW_HIRE_SHARE 만큼 분석 년도 1월 ~ 분석 월 입사
+    analysis_end = pd.Timestamp(analysis_year, analysis_month, 1) + pd.offsets.MonthEnd(0)
+    year_start = pd.Timestamp(analysis_year, 1, 1)
+    new_hire = rng.random(employees) < NEW_HIRE_SHARE
+    past_days = rng.integers(1, 365 * 25, employees)
+    new_days = rng.integers(0, (analysis_end - year_start).days + 1, employees)
+    hire_date = np.where(
+        new_hire,
+        year_start + pd.to_timedelta(new_days, unit='D'),
+        year_start - pd.to_timedelta(past_days, unit='D'),
+    )
+    # 올해 입사자는 직책 없음 (일부 경력 팀장 제외)
+    position[new_hire & (rng.random(employees) > 0.02)] = None
+
+    return pd.DataFrame({
+        'Emp. No.': emp_no,
+        'Name': [f'Employee {n}' for n in emp_no],
+        'E-Mail Adress': [f'employee{n}@lge.com' for n in emp_no],
+        'Integrated Sub. Name(MP)': integrated,
+        'Sub. Name(MP)': sub_name,
+        'Region(MP)': region,
+        'Hire Date': pd.to_datetime(hire_date),
+        'FSE_ISE': _choice(rng, FSE_ISE, employees),
+        'Staff/Operator': staff_operator,
+        'Position': position,
+        'HIPO Type': hipo,
+        'Job Function': rng.choice(JOB_FUNCTIONS, employees),
+        'Grade': rng.choice(GRADES, employees),
+    })
+
+
+def build_prev_hr(rng, hr, analysis_year):
+    """
+    전년도 말 HR Detail (올해 입사자 제외, 일부 팀장은 전년도에 팀장이 아니었음)
+    """
+    prev = hr[hr['Hire Date'] < pd.Timestamp(analysis_year, 1, 1)].copy()
+    is_leader = prev['Position'].isin(LEADER_POSITIONS).to_numpy()
+    promoted = is_leader & (rng.random(len(prev)) < LEADER_PROMOTION_SHARE)
+    prev.loc[promoted, 'Position'] = np.where(rng.random(promoted.sum()) < 0.7, 'Part Leader', None)
+    return prev.reset_index(drop=True)
+
+
+def build_courses(rng, count):
+    """과정 목록 (Item ID, Course name, Category)"""
+    item_ids = [f'CRS{100000 + i}' if i % 3 else str(30000 + i) for i in range(count)]
+    names = [f'{COURSE_TOPICS[i % len(COURSE_TOPICS)]} {"Advanced" if i % 4 == 0 else "Course"} {i // len(COURSE_TOPICS) + 1}' for i in range(count)]
+    categories = rng.choice(CATEGORIES, count)
+    courses = pd.DataFrame({'Item ID': item_ids, 'Course name': names, 'Category': categories})
+
+    special = pd.DataFrame({
+        'Item ID': [NEW_HIRE_ITEM_ID] + [f'NH{i:03d}' for i in range(len(NEW_HIRE_COURSES))] + [NEW_LEADER_ITEM_ID],
+        'Course name': ['Onboarding Program'] + NEW_HIRE_COURSES + ['LGE HQ Assimilation Workshop'],
+        'Category': ['신규입사자'] + ['경력사원, 신규입사자, 신입사원'] * len(NEW_HIRE_COURSES) + ['리더십, 파트장/팀장'],
+    })
+    return pd.concat([courses, special], ignore_index=True)
+
+
+def build_lms(rng, hr, prev_hr, lms_rows, analysis_year, analysis_month):
+    """
+    LMS 수강 기록 (연초 ~ 분석 월 누적)
+    직원별 수강 건수는 한쪽으로 치우친 분포, 신입사원 / 신임 팀장 / 핵심인재 과정 포함
+    """
+    courses = build_courses(rng, max(200, min(5000, lms_rows // 250)))
+    regular = courses[~courses['Item ID'].isin([NEW_HIRE_ITEM_ID, NEW_LEADER_ITEM_ID]) & ~courses['Item ID'].str.startswith('NH')]
+    new_hire_courses = courses[courses['Item ID'].eq(NEW_HIRE_ITEM_ID) | courses['Item ID'].str.startswith('NH')]
+
+    emp_no = hr['Emp. No.'].to_numpy()
+    activity = rng.gamma(0.8, 1.0, len(emp_no))
+    activity[hr['Staff/Operator'].to_numpy() == 'Operator'] *= 0.3
+
+    # 신입사원 / 신임 팀장 대상 과정 (대상자 중 일부만 수강)
+    new_hires = hr.loc[hr['Hire Date'] >= pd.Timestamp(analysis_year, 1, 1), 'Emp. No.'].to_numpy()
+    new_hires = new_hires[rng.random(len(new_hires)) < 0.75]
+    prev_leaders = set(prev_hr.loc[prev_hr['Position'].isin(LEADER_POSITIONS), 'Emp. No.'])
+    leaders = hr.loc[hr['Position'].isin(LEADER_POSITIONS) & hr['FSE_ISE'].eq('ISE'), 'Emp. No.'].to_numpy()
+    new_leaders = np.array([e for e in leaders if e not in prev_leaders], dtype=leaders.dtype)
+    new_leaders = new_leaders[rng.random(len(new_leaders)) < 0.6]
+
+    special_rows = len(new_hires) + len(new_leaders)
+    regular_rows = max(lms_rows - special_rows, 0)
+
+    employee = np.concatenate([
+        rng.choice(emp_no, size=regular_rows, p=activity / activity.sum()),
+        new_hires,
+        new_leaders,
+    ])
+    course_index = np.concatenate([
+        rng.choice(regular.index.to_numpy(), size=regular_rows),
+        rng.choice(new_hire_courses.index.to_numpy(), size=len(new_hires)),
+        np.full(len(new_leaders), courses.index[courses['Item ID'] == NEW_LEADER_ITEM_ID][0]),
+    ])
+    selected = courses.loc[course_index].reset_index(drop=True)
+
+    # 완료일: 분석 년도 1월 1일 ~ 분석 월 말일 (미완료 기록은 절반이 공란)
+    total = len(employee)
+    year_start = pd.Timestamp(analysis_year, 1, 1)
+    analysis_end = year_start + pd.offsets.MonthEnd(analysis_month)
+    days = rng.integers(0, (analysis_end - year_start).days + 1, total)
+    completion_date = (year_start + pd.to_timedelta(days, unit='D')).strftime('%Y%m%d').astype(int).to_numpy().astype(object)
+    status = _choice(rng, COMPLETION_STATUSES, total)
+    incomplete = ~pd.Series(status).str.endswith('-C').to_numpy()
+    completion_date[incomplete & (rng.random(total) < 0.5)] = None
+
+    lms = pd.DataFrame({
+        'Employee Number': employee,
+        'Item ID': selected['Item ID'],
+        'Course name': selected['Course name'],
+        'Category': selected['Category'],
+        'Completion Date': completion_date,
+        'Completion status': status,
+        'Education Hours': _choice(rng, EDUCATION_HOURS, total).astype(float),
+    })
+    # 카테고리 누락 기록
+    lms.loc[rng.random(total) < 0.01, 'Category'] = None
+    return lms.sample(frac=1.0, random_state=int(rng.integers(0, 2 ** 31))).reset_index(drop=True)
+
+
+def _final_subsidiaries():
+    """HR 전처리 후 법인 목록 {Final Sub.: Final Region}"""
+    subsidiaries = {}
+    for integrated, sub_name, region, _ in SUBSIDIARIES:
+        final_sub = _final_sub(integrated, sub_name)
+        if final_sub == 'ETC':
+            continue
+        final_region = 'China' if integrated == 'LGECH' else _final_region(region)
+        subsidiaries.setdefault(final_sub, final_region)
+    return subsidiaries
+
+
+def build_hong(rng, hr, analysis_year):
+    """
+    HONG 법인담당자 / 연간교육계획 시트
+
+    Returns:
+        tuple: (법인담당자 DataFrame, 연간교육계획 DataFrame)
+    """
+    subsidiaries = _final_subsidiaries()
+
+    # 법인담당자: 법인별 HR 직원 1명의 이메일 (일부 법인은 HR 에 없는 이메일)
+    managers = []
+    final_subs = hr['Integrated Sub. Name(MP)'].fillna(hr['Sub. Name(MP)'])
+    for subsidiary in subsidiaries:
+        candidates = hr.loc[final_subs.str.upper() == subsidiary, 'E-Mail Adress']
+        email = candidates.iloc[0] if len(candidates) and rng.random() > 0.1 else f'ld.{subsidiary.lower()}@lge.com'
+        managers.append({'Subsidiary': subsidiary, 'L&D PIC': f'{subsidiary} L&D', 'L&D PIC e-mail': email})
+    manager_df = pd.DataFrame(managers)
+
+    # 연간교육계획: 법인 인원에 비례한 계획 과정 수
+    headcount = final_subs.str.upper().value_counts()
+    plans = []
+    for subsidiary in subsidiaries:
+        count = int(np.clip(headcount.get(subsidiary, 0) // 40, 5, 400))
+        month_start = rng.integers(1, 13, count)
+        month_end = np.minimum(month_start + rng.choice([0, 0, 0, 1, 2, 5], count), 12)
+        plans.append(pd.DataFrame({
+            'Subsidiary': HONG_SUBSIDIARY_ALIASES.get(subsidiary, subsidiary),
+            'Course name': rng.choice(COURSE_TOPICS, count),
+            'Type': rng.choice(['ILT', 'WBT', 'VILT'], count, p=[0.5, 0.35, 0.15]),
+            'Month_start': month_start,
+            'Date_start': rng.integers(1, 29, count),
+            'Month_end': month_end,
+            'Date_end': rng.integers(1, 29, count),
+            'Learning Hrs.': rng.choice([2, 4, 8, 16, 24, 40], count, p=[0.15, 0.25, 0.3, 0.15, 0.1, 0.05]),
+            'Target': rng.choice(['All', 'Staff', 'Leader', 'New Hire'], count),
+        }))
+    plan_df = pd.concat(plans, ignore_index=True)
+    # 월/일 누락 행 (전처리기 기본값 경로)
+    plan_df.loc[rng.random(len(plan_df)) < 0.02, 'Date_end'] = None
+    return manager_df, plan_df
+
+
+def build_index_management(rng):
+    """Index Management (법인별 Manage Area 및 Y/N 지표, 일부 공란)"""
+    rows = []
+    for subsidiary, region in _final_subsidiaries().items():
+        row = {'Final Sub.': subsidiary, 'Final Region': region,
+               'Manage Area': 'N' if subsidiary in UNMANAGED_SUBSIDIARIES else 'Y'}
+        for col in INDEX_YN_COLUMNS:
+            value = rng.choice(['Y', 'N', None], p=[0.6, 0.3, 0.1])
+            row[col] = value
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def write_workbook(path, sheets):
+    """
+    여러 시트를 xlsx 로 저장 (openpyxl write-only 모드, 대용량에서 pandas.to_excel 보다 빠름)
+
+    Args:
+        path (str): 저장 경로
+        sheets (dict): {시트명: DataFrame}
+    """
+    workbook = Workbook(write_only=True)
+    for sheet_name, df in sheets.items():
+        if len(df) > EXCEL_MAX_ROWS:
+            raise ValueError(f"{sheet_name} 시트 행 수({len(df)})가 Excel 최대 행 수를 넘습니다.")
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(list(df.columns))
+        columns = []
+        for col in df.columns:
+            values = df[col].to_numpy(dtype=object)
+            columns.append([None if (v is None or v is pd.NaT or (isinstance(v, float) and np.isnan(v))) else v for v in values])
+        for row in zip(*columns):
+            sheet.append(row)
+    workbook.save(path)
+
+
+def generate_inputs(directory, lms_rows=DEFAULT_LMS_ROWS, employees=None, analysis_year=2025, analysis_month=9, seed=DEFAULT_SEED):
+    """
+    원본 Excel 5종 생성
+
+    Args:
+        directory (str): 출력 디렉토리 (main.py 의 월 디렉토리)
+        lms_rows (int): LMS 수강 기록 행 수
+        employees (int): HR 직원 수 (None 이면 lms_rows / LMS_ROWS_PER_EMPLOYEE)
+        analysis_year (int): 분석 기준 년도
+        analysis_month (int): 분석 기준 월
+        seed (int): 난수 시드
+
+    Returns:
+        dict: {파일명: {시트명: 행 수}}
+    """
+    rng = np.random.default_rng(seed)
+    employees = employees or max(lms_rows // LMS_ROWS_PER_EMPLOYEE, 500)
+    os.makedirs(directory, exist_ok=True)
+
+    hr = build_hr(rng, employees, analysis_year, analysis_month)
+    prev_hr = build_prev_hr(rng, hr, analysis_year)
+    lms = build_lms(rng, hr, prev_hr, lms_rows, analysis_year, analysis_month)
+    manager_df, plan_df = build_hong(rng, hr, analysis_year)
+    index_management = build_index_management(rng)
+
+    summary = (hr.groupby(['Region(MP)', 'Integrated Sub. Name(MP)'], dropna=False)
+                 .size().rename('Headcount').reset_index())
+
+    workbooks = {
+        'index_management.xlsx': {'Index': index_management},
+        'prev_hr_index.xlsx': {'Detail': prev_hr},
+        'hr_index.xlsx': {'Summary': summary, 'Detail': hr},
+        'lms_learning.xlsx': {'Learning History': lms},
+        'hong_data.xlsx': {'법인담당자': manager_df, '연간교육계획': plan_df},
+    }
+    written = {}
+    for file_name, sheets in workbooks.items():
+        write_workbook(os.path.join(directory, file_name), sheets)
+        written[file_name] = {name: len(df) for name, df in sheets.items()}
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="파이프라인 벤치마크용 합성 원본 Excel 생성")
+    parser.add_argument('--out', required=True, help="출력 디렉토리 (예: data/year=2025/month=09)")
+    parser.add_argument('--lms-rows', type=int, default=DEFAULT_LMS_ROWS, help="LMS 수강 기록 행 수")
+    parser.add_argument('--employees', type=int, default=None, help="HR 직원 수 (기본값: LMS 행 수 / 15)")
+    parser.add_argument('--year', type=int, default=2025, help="분석 기준 년도")
+    parser.add_argument('--month', type=int, default=9, help="분석 기준 월")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="난수 시드")
+    args = parser.parse_args(argv)
+
+    started = datetime.now()
+    written = generate_inputs(args.out, args.lms_rows, args.employees, args.year, args.month, args.seed)
+    for file_name, sheets in written.items():
+        print(f"{file_name}: " + ', '.join(f"{name} {rows}행" for name, rows in sheets.items()))
+    print(f"생성 완료: {args.out} ({(datetime.now() - started).total_seconds():.1f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
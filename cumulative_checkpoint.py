@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+월 누적 집계 체크포인트 모듈
+법인별 1월~해당 월 누적 계획 시간 / 누적 실제 수강 시간과 해당 월 완료 과정 수를 월 파티션에 저장하고,
+다음 달 실행은 이전 체크포인트의 누적 실제 수강 시간에 새로 추가된 월의 값만 더해 누적값을 계산합니다.
+
+실행 모드:
+    incremental: 이전 체크포인트 + 추가된 월 (체크포인트가 없거나 이미 집계한 월의 완료 기록이 바뀌었으면 full)
+    full: 1월부터 전체 재계산
+    verify: 두 방식을 모두 계산하여 차이를 기록하고 전체 재계산 결과를 사용
+
+이월하지 않는 값:
+    - 4.1단계 누적 계획 시간은 지난 월 계획도 수정될 수 있으므로 매월 HONG Plan 전체에서 다시 계산
+      (체크포인트에는 기록용으로만 저장)
+    - 3.2단계 완료 과정 수는 기준월의 고유 과정 수라 월별로 더할 수 없으므로 이월하지 않음
+      (체크포인트에는 기록용으로만 저장, 3.2단계는 매월 기준월 완료 기록만 집계)
+    - 체크포인트가 집계한 월의 완료 기록이 이전 월 조인 테이블과 달라졌으면(소급 입력 / 삭제 / 인사정보 변경)
+      이월하지 않고 전체 재계산 (make_logic.count_backdated_changes 참고)
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from logger_config import get_default_logger
+
+# 로거 설정
+logger = get_default_logger(__name__)
+
+# 체크포인트 파일명 (월 파티션 디렉토리)
+CHECKPOINT_FILE = "cumulative_checkpoint.csv"
+
+# 체크포인트 컬럼 (누적값이 없는 법인은 빈 값)
+CHECKPOINT_COLUMNS = ['Year_Month', 'Subsidiary', 'Planned_Hours', 'Actual_Hours', 'Completed_Courses']
+
+# 누적 집계 실행 모드
+CUMULATIVE_MODES = ('incremental', 'full', 'verify')
+
+# verify 모드에서 같은 값으로 보는 오차 (합산 순서에 따른 부동소수점 차이)
+VERIFY_TOLERANCE = 1e-6
+
+
+def save_checkpoint(file_directory, year_month, planned_totals, actual_totals, completed_counts=None):
+    """
+    법인별 누적 상태를 체크포인트로 저장 (임시 파일 작성 후 원자적 교체)
+
+    Args:
+        file_directory: 월 파티션 디렉토리
+        year_month: 기준 년월 (예: '2025-09')
+        planned_totals: 법인별 1월~기준월 누적 계획 시간 Series
+        actual_totals: 법인별 1월~기준월 누적 실제 수강 시간 Series
+        completed_counts: 법인별 기준월 완료 과정 수 Series (월별 고유 과정 수이므로 누적하지 않음)
+
+    Returns:
+        str: 저장된 파일 경로
+    """
+    checkpoint = pd.DataFrame({
+        'Planned_Hours': planned_totals,
+        'Actual_Hours': actual_totals,
+        'Completed_Courses': completed_counts if completed_counts is not None else pd.Series(dtype=float),
+    })
+    checkpoint.index.name = 'Subsidiary'
+    checkpoint = checkpoint.reset_index()
+    checkpoint.insert(0, 'Year_Month', year_month)
+
+    output_path = os.path.join(file_directory, CHECKPOINT_FILE)
+    tmp_path = f"{output_path}.tmp"
+    checkpoint[CHECKPOINT_COLUMNS].to_csv(tmp_path, index=False, encoding='utf-8-sig')
+    os.replace(tmp_path, output_path)
+    logger.info(f"✓ 누적 집계 체크포인트 저장 완료: {output_path} ({len(checkpoint)}개 법인)")
+    return output_path
+
+
+def load_checkpoint(file_directory):
+    """
+    체크포인트 불러오기 (Completed_Courses 는 이월 대상이 아니므로 반환하지 않음, planned 는 기록용)
+
+    Returns:
+        dict: {'year_month', 'month', 'planned', 'actual'} (누적값이 있는 법인만) / 없으면 None
+    """
+    checkpoint_path = os.path.join(file_directory, CHECKPOINT_FILE) if file_directory else None
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return None
+
+    checkpoint = pd.read_csv(checkpoint_path, encoding='utf-8-sig', float_precision='round_trip')
+    if list(checkpoint.columns) != CHECKPOINT_COLUMNS or checkpoint['Year_Month'].nunique() != 1:
+        logger.warning(f"✗ 체크포인트 형식이 올바르지 않습니다: {checkpoint_path}")
+        return None
+
+    checkpoint = checkpoint.set_index('Subsidiary')
+    year_month = str(checkpoint['Year_Month'].iloc[0])
+    return {
+        'year_month': year_month,
+        'month': int(year_month.split('-')[1]),
+        'planned': checkpoint['Planned_Hours'].dropna(),
+        'actual': checkpoint['Actual_Hours'].dropna(),
+    }
+
+
+def carry_forward(base, addition):
+    """이전 누적값 + 추가된 월의 값 (법인별, 내림차순 정렬)"""
+    if addition is None or len(addition) == 0:
+        totals = base.copy()
+    else:
+        totals = base.add(addition, fill_value=0)
+        totals.index.name = addition.index.name
+        totals.name = addition.name
+    return totals.sort_values(ascending=False)
+
+
+def compare_totals(name, carried, recomputed, tolerance=VERIFY_TOLERANCE):
+    """
+    이월 누적값과 전체 재계산 값 비교 (verify 모드)
+
+    Returns:
+        bool: 모든 법인의 값이 일치하면 True
+    """
+    aligned = pd.concat([carried.rename('carried'), recomputed.rename('recomputed')], axis=1)
+    matched = np.isclose(aligned['carried'], aligned['recomputed'], rtol=0, atol=tolerance)
+    mismatches = aligned[~matched]
+
+    if mismatches.empty:
+        logger.info(f"✓ {name} 검증 일치: {len(aligned)}개 법인")
+        return True
+
+    logger.warning(f"✗ {name} 검증 불일치: {len(mismatches)}개 법인 (전체 재계산 값 사용)")
+    for subsidiary, row in mismatches.head(20).iterrows():
+        logger.warning(f"  {subsidiary}: 이월 {row['carried']} / 재계산 {row['recomputed']}")
+    return False
@@ -9,6 +9,7 @@ import pandas as pd
 import os
 import sys
 from logger_config import get_default_logger
+from run_report import run_report
 
 # 로거 설정
 logger = get_default_logger(__name__)
@@ -500,6 +501,7 @@ def run_hong_manager_preprocessing(file_directory, hong_file_name, hr_file_name,
         logger.info("최종단계: 최종 결과를 CSV 파일로 저장합니다...")
         output_path = os.path.join(file_directory, output_file_name)
         df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        run_report.set_rows(rows_in=len(df), rows_out=len(df))
         logger.info(f"✓ CSV 파일 저장 완료: {output_path}")
         logger.info(f"✓ 저장된 데이터: {df.shape[0]}행, {df.shape[1]}열")
         logger.info("=== HONG 법인담당자 전처리 완료 ===")
@@ -561,6 +563,7 @@ def run_hong_plan_preprocessing(file_directory, hong_file_name, output_file_name
                 logger.info("최종단계: 최종 결과를 CSV 파일로 저장합니다...")
                 output_path = os.path.join(file_directory, output_file_name)
                 df_final.to_csv(output_path, index=False, encoding='utf-8-sig')
+                run_report.set_rows(rows_in=len(df_with_dates), rows_out=len(df_final))
                 logger.info(f"✓ CSV 파일 저장 완료: {output_path}")
                 logger.info(f"✓ 저장된 데이터: {df_final.shape[0]}행, {df_final.shape[1]}열")
                 logger.info("=== HONG 연간교육계획 전처리 완료 ===")
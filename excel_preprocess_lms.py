@@ -6,13 +6,18 @@ LMS Learning Excel 파일의 컬럼 리스트를 추출하는 기능을 제공
 """
 
 import pandas as pd
+import io
 import os
 import sys
 from logger_config import get_default_logger
+from run_report import run_report
 
 # 로거 설정
 logger = get_default_logger(__name__)
 
+# 수강 기록 행 키 컬럼 (이전 월 결과에 이미 있는 행을 구분하는 기준)
+LMS_ROW_KEY_COLUMNS = ['Employee Number', 'Item ID', 'Completion Date', 'Completion status']
+
 def load_excel_file(file_path):
     """
     Excel 파일을 불러오는 공통 함수
@@ -56,6 +61,76 @@ def get_lms_columns(file_path):
         logger.error(f"✗ 오류 발생: {e}")
         return None
 
+def map_categories(category):
+    """
+    Category 값을 (category_1, category_2)로 매핑하는 함수 (제공된 매핑 규칙 기반)
+
+    Args:
+        category: LMS Category 값
+
+    Returns:
+        tuple: (상위 카테고리, 하위 카테고리)
+    """
+    if pd.isna(category):
+        return '기타', '기타'
+
+    category_str = str(category)
+
+    # 제공된 매핑 규칙 적용
+    if category_str in ['경력사원, 신규입사자, 신입사원']:
+        return '신입온보딩', '신입온보딩'
+    elif category_str in ['고객 가치, 고객마인드', '고객 가치, 고객중심 일하는 방식']:
+        return '직무', '고객가치'
+    elif category_str in ['구매관리']:
+        return '직무', '구매'
+    elif category_str in ['노경']:
+        return '직무', 'HR'
+    elif category_str in ['독서통신']:
+        return '직무공통', '직무공통'
+    elif category_str in ['리더십', '리더십 공통, 직무역량', '리더십 공통, 직무역량, 휴넷', '리더십 공통, 휴넷', '리더십 기타', '리더십, 리더십 공통', '리더십, 직무역량']:
+        return '리더십', '일반'
+    elif category_str in ['리더십, 직책 리더십, 파트장/팀장', '리더십, 파트장/팀장']:
+        return '리더십', '직책'
+    elif category_str in ['마케팅, 영업, 직무역량']:
+        return '직무', '마케팅/영업'
+    elif category_str in ['보안관리', '비즈니스 기본스킬, 직무역량', '사별특화영역', '산업 연수', '성과 모니터링', '업무시스템', '직무공통', '직무역량', 'IT 기본, Security', 'RPA', 'Security']:
+        return '직무공통', '직무공통'
+    elif category_str in ['생산관리', '생산기술', 'Production R&D']:
+        return '직무', '생산'
+    elif category_str in ['소재 R&D', '시스템 SW', 'Hardware R&D, 직무역량', 'Hardware R&D, Software R&D, 기구 R&D, 직무역량, 품질', 'R&D 공통', 'R&D 공통, 영업, 직무역량', 'R&D 공통, 직무역량', 'R&D 공통, 직무역량, 품질', 'R&D 공통, Software R&D, 직무역량', 'R&D기획/관리', 'Software R&D']:
+        return '직무', 'R&D'
+    elif category_str in ['신규입사자', '신규입사자, 신입사원', '신규입사자, 영업, 직무역량']:
+        return '신입온보딩', '신입온보딩'
+    elif category_str in ['영업', '영업, 직무역량', '영업, 직무역량, 품질']:
+        return '직무', '마케팅/영업'
+    elif category_str in ['자재', '제조']:
+        return '직무', '자재/제조'
+    elif category_str in ['재경']:
+        return '직무', '재경'
+    elif category_str in ['전략기획']:
+        return '직무공통', '직무공통'
+    elif category_str in ['제품설계, 직무역량, 품질', '직무역량, 품질', '품질', '품질관리']:
+        return '직무', '품질'
+    elif category_str in ['조직문화', 'HR', 'HR, 조직문화', 'HR, L&D', 'HRM', 'L&D', 'L&D, 노경, 조직문화', 'L&D, 신규입사자', 'L&D, 신입사원', 'L&D, 직무역량']:
+        return '직무', 'HR'
+    elif category_str in ['직무역량, 직책 리더십, 휴넷', '직무역량, 파트장/팀장', '파트장/팀장']:
+        return '리더십', '직책'
+    elif category_str in ['핵심인재']:
+        return '리더십', '핵심인재'
+    elif category_str in ['환경안전', 'LG 필수 교육']:
+        return '전사필수', '전사필수'
+    elif category_str in ['AI/빅데이터', 'AI/빅데이터, DX', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 데이터분석, 빅데이터, 인공지능, 품질, 품질관리, 프로그래밍', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 데이터분석, 빅데이터, 인공지능, 프로그래밍', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 분석, 빅데이터, 상품기획, 인공지능', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 빅데이터, 인공지능, 품질', 'DX, 인공지능', 'DX, DX 사례연구, LG사례, 글로벌사례, 빅데이터, 인공지능', 'DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 데이터분석, 빅데이터, 인공지능, 통계, 프로그래밍']:
+        return '직무', 'AI/DX'
+    elif category_str in ['B2B', 'B2B, 영업, 직무역량', 'B2B, B2B영업', 'B2B영업']:
+        return '직무', 'B2B'
+    elif category_str in ['LG 경영방침, LG 리더의 사업철학', 'LG 리더의 사업철학', 'LG사례']:
+        return '직무공통', 'LG'
+    elif category_str in ['SCM']:
+        return '직무', 'SCM'
+    else:
+        # 매핑되지 않은 항목
+        return 'UNMAPPED', category_str
+
 def group_category(file_path):
     """
     Category를 그룹핑하는 함수
@@ -73,7 +148,25 @@ def group_category(file_path):
         # 데이터 읽기
         df = pd.read_excel(file_path)
         logger.info(f"✓ 데이터 읽기 완료: {df.shape[0]}행, {df.shape[1]}열")
+        run_report.set_rows(rows_in=len(df))
+
+        return categorize_lms(df)
 
+    except Exception as e:
+        logger.error(f"✗ 오류 발생: {e}")
+        return None
+
+def categorize_lms(df):
+    """
+    LMS 데이터프레임에 category_1, category_2 컬럼을 추가하는 함수 (3.1 ~ 3.3단계)
+
+    Args:
+        df: LMS 데이터프레임 (전체 또는 신규 행만)
+
+    Returns:
+        pandas.DataFrame: category_1, category_2 컬럼이 추가된 데이터프레임
+    """
+    try:
         # Category 컬럼 찾기
         category_col = None
         for col in df.columns:
@@ -125,73 +218,16 @@ def group_category(file_path):
         logger.info("    'SCM' → ('직무', 'SCM')")
         logger.info("    기타 매핑되지 않은 값 → ('UNMAPPED', 원본값)")
 
-        # Category 매핑 함수 (제공된 매핑 규칙 기반)
-        def map_categories(category):
-            if pd.isna(category):
-                return '기타', '기타'
-
-            category_str = str(category)
-
-            # 제공된 매핑 규칙 적용
-            if category_str in ['경력사원, 신규입사자, 신입사원']:
-                return '신입온보딩', '신입온보딩'
-            elif category_str in ['고객 가치, 고객마인드', '고객 가치, 고객중심 일하는 방식']:
-                return '직무', '고객가치'
-            elif category_str in ['구매관리']:
-                return '직무', '구매'
-            elif category_str in ['노경']:
-                return '직무', 'HR'
-            elif category_str in ['독서통신']:
-                return '직무공통', '직무공통'
-            elif category_str in ['리더십', '리더십 공통, 직무역량', '리더십 공통, 직무역량, 휴넷', '리더십 공통, 휴넷', '리더십 기타', '리더십, 리더십 공통', '리더십, 직무역량']:
-                return '리더십', '일반'
-            elif category_str in ['리더십, 직책 리더십, 파트장/팀장', '리더십, 파트장/팀장']:
-                return '리더십', '직책'
-            elif category_str in ['마케팅, 영업, 직무역량']:
-                return '직무', '마케팅/영업'
-            elif category_str in ['보안관리', '비즈니스 기본스킬, 직무역량', '사별특화영역', '산업 연수', '성과 모니터링', '업무시스템', '직무공통', '직무역량', 'IT 기본, Security', 'RPA', 'Security']:
-                return '직무공통', '직무공통'
-            elif category_str in ['생산관리', '생산기술', 'Production R&D']:
-                return '직무', '생산'
-            elif category_str in ['소재 R&D', '시스템 SW', 'Hardware R&D, 직무역량', 'Hardware R&D, Software R&D, 기구 R&D, 직무역량, 품질', 'R&D 공통', 'R&D 공통, 영업, 직무역량', 'R&D 공통, 직무역량', 'R&D 공통, 직무역량, 품질', 'R&D 공통, Software R&D, 직무역량', 'R&D기획/관리', 'Software R&D']:
-                return '직무', 'R&D'
-            elif category_str in ['신규입사자', '신규입사자, 신입사원', '신규입사자, 영업, 직무역량']:
-                return '신입온보딩', '신입온보딩'
-            elif category_str in ['영업', '영업, 직무역량', '영업, 직무역량, 품질']:
-                return '직무', '마케팅/영업'
-            elif category_str in ['자재', '제조']:
-                return '직무', '자재/제조'
-            elif category_str in ['재경']:
-                return '직무', '재경'
-            elif category_str in ['전략기획']:
-                return '직무공통', '직무공통'
-            elif category_str in ['제품설계, 직무역량, 품질', '직무역량, 품질', '품질', '품질관리']:
-                return '직무', '품질'
-            elif category_str in ['조직문화', 'HR', 'HR, 조직문화', 'HR, L&D', 'HRM', 'L&D', 'L&D, 노경, 조직문화', 'L&D, 신규입사자', 'L&D, 신입사원', 'L&D, 직무역량']:
-                return '직무', 'HR'
-            elif category_str in ['직무역량, 직책 리더십, 휴넷', '직무역량, 파트장/팀장', '파트장/팀장']:
-                return '리더십', '직책'
-            elif category_str in ['핵심인재']:
-                return '리더십', '핵심인재'
-            elif category_str in ['환경안전', 'LG 필수 교육']:
-                return '전사필수', '전사필수'
-            elif category_str in ['AI/빅데이터', 'AI/빅데이터, DX', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 데이터분석, 빅데이터, 인공지능, 품질, 품질관리, 프로그래밍', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 데이터분석, 빅데이터, 인공지능, 프로그래밍', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 분석, 빅데이터, 상품기획, 인공지능', 'AI/빅데이터, DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 빅데이터, 인공지능, 품질', 'DX, 인공지능', 'DX, DX 사례연구, LG사례, 글로벌사례, 빅데이터, 인공지능', 'DX, DX Technology, DX 사례연구, Digital Literacy, LG사례, 데이터분석, 빅데이터, 인공지능, 통계, 프로그래밍']:
-                return '직무', 'AI/DX'
-            elif category_str in ['B2B', 'B2B, 영업, 직무역량', 'B2B, B2B영업', 'B2B영업']:
-                return '직무', 'B2B'
-            elif category_str in ['LG 경영방침, LG 리더의 사업철학', 'LG 리더의 사업철학', 'LG사례']:
-                return '직무공통', 'LG'
-            elif category_str in ['SCM']:
-                return '직무', 'SCM'
-            else:
-                # 매핑되지 않은 항목
-                return 'UNMAPPED', category_str
-
         # category_1, category_2 컬럼 생성
         logger.info("  - 매핑 작업 수행 중...")
-        mapped_categories = df[category_col].apply(map_categories)
-        df['category_1'] = [cat[0] for cat in mapped_categories]
-        df['category_2'] = [cat[1] for cat in mapped_categories]
+        # 같은 Category 값은 한 번만 매핑한 뒤 전체 행에 펼침
+        unique_values = df[category_col].drop_duplicates()
+        mapped_categories = pd.DataFrame(
+            [map_categories(category) for category in unique_values],
+            index=unique_values, columns=['category_1', 'category_2']
+        ).reindex(df[category_col])
+        df['category_1'] = mapped_categories['category_1'].to_numpy()
+        df['category_2'] = mapped_categories['category_2'].to_numpy()
         logger.info(f"    ✓ 'category_1' 컬럼 생성 완료: {df['category_1'].nunique()}개 고유값")
         logger.info(f"    ✓ 'category_2' 컬럼 생성 완료: {df['category_2'].nunique()}개 고유값")
 
@@ -230,3 +266,133 @@ def group_category(file_path):
     except Exception as e:
         logger.error(f"✗ 오류 발생: {e}")
         return None
+
+def _key_text(series):
+    """
+    키 컬럼 값을 CSV에 쓴 것과 같은 텍스트로 변환 (CSV를 거치지 않고 컬럼 값에서 직접 변환)
+    결측은 빈 문자열, 날짜 컬럼은 to_csv 와 같은 형식 (모두 자정이면 날짜만)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        dates = series.dropna()
+        date_format = '%Y-%m-%d' if (dates == dates.dt.normalize()).all() else '%Y-%m-%d %H:%M:%S'
+        text = series.dt.strftime(date_format)
+    else:
+        text = series.astype(str)
+    return text.where(series.notna(), '')
+
+def lms_row_keys(df):
+    """
+    수강 기록의 행 키 (사번, 과정 ID, 완료일, 상태 + 같은 값을 가진 행 사이의 순번)
+
+    Excel과 CSV에서 읽은 타입이 달라도 같은 키가 되도록 키 컬럼을 CSV 텍스트와 같은 문자열로 변환하고,
+    정수가 실수로 읽힌 값(20250912.0)의 '.0'을 제거한다.
+
+    Args:
+        df: LMS 데이터프레임 (LMS_ROW_KEY_COLUMNS 포함)
+
+    Returns:
+        pandas.Series: 행 키 (df와 같은 인덱스)
+    """
+    keys = None
+    for col in LMS_ROW_KEY_COLUMNS:
+        value = _key_text(df[col]).str.replace(r'\.0$', '', regex=True)
+        keys = value if keys is None else keys + '|' + value
+
+    # 완전히 같은 기록이 여러 행이면 순번으로 구분
+    keys = keys + '#' + keys.groupby(keys).cumcount().astype(str)
+    keys.index = df.index
+    return keys
+
+def load_previous_lms_output(previous_output_path, columns):
+    """
+    이전 월 lms_learning_final.csv 를 불러오는 함수 (재사용할 수 없으면 None)
+
+    Args:
+        previous_output_path (str): 이전 월 결과 파일 경로
+        columns: 이번 LMS 파일의 컬럼 목록
+
+    Returns:
+        pandas.DataFrame: 이전 월 결과 / None
+    """
+    if not previous_output_path or not os.path.exists(previous_output_path):
+        logger.info("  - 이전 월 LMS 결과가 없어 전체 행을 처리합니다.")
+        return None
+
+    if not set(LMS_ROW_KEY_COLUMNS).issubset(columns):
+        logger.warning(f"  - 행 키 컬럼이 없어 전체 행을 처리합니다: {LMS_ROW_KEY_COLUMNS}")
+        return None
+
+    previous = pd.read_csv(previous_output_path, encoding='utf-8-sig', low_memory=False, float_precision='round_trip')
+    if list(previous.columns) != list(columns) + ['category_1', 'category_2']:
+        logger.warning("  - 이전 월 LMS 결과의 컬럼 구성이 달라 전체 행을 처리합니다.")
+        return None
+
+    logger.info(f"✓ 이전 월 LMS 결과 불러오기 완료: {previous_output_path} ({previous.shape[0]}행)")
+    return previous
+
+def group_category_incremental(file_path, previous_output_path):
+    """
+    이전 월 결과를 재사용하여 Category를 그룹핑하는 함수
+
+    LMS 파일은 연초부터의 누적 자료이므로 이전 월 lms_learning_final.csv 에 같은 행 키가 있는 행은
+    매핑 결과를 그대로 사용하고, 새로 추가된 행만 Category 매핑 후 합친다.
+    결과는 이번 LMS 파일의 행 순서를 따르며, 이번 파일에서 빠진 이전 행은 제외된다.
+    이전 결과를 사용할 수 없으면 전체 행을 매핑한다 (group_category 와 같은 결과).
+
+    한계: 절약되는 것은 신규 행이 아닌 행의 Category 매핑뿐이다. 행 키를 만들려면 연초부터의 누적 Excel 전체를
+    읽어야 하므로 실행 시간은 여전히 누적 행 수에 비례한다 (합성 데이터 20만 행 기준 read_excel 약 38초,
+    행 키 생성은 약 1.3초).
+
+    Args:
+        file_path (str): Excel 파일 경로
+        previous_output_path (str): 이전 월 lms_learning_final.csv 경로
+
+    Returns:
+        pandas.DataFrame: category_1, category_2 컬럼이 추가된 데이터프레임
+    """
+    try:
+        # 3단계: Category 그룹핑 (신규 행만)
+        logger.info("3단계: Category를 그룹핑합니다 (이전 월 결과 재사용)...")
+
+        # 데이터 읽기
+        df = pd.read_excel(file_path)
+        logger.info(f"✓ 데이터 읽기 완료: {df.shape[0]}행, {df.shape[1]}열")
+        run_report.set_rows(rows_in=len(df))
+
+        previous = load_previous_lms_output(previous_output_path, df.columns)
+        if previous is None:
+            return categorize_lms(df)
+
+        # 행 키로 신규 행 구분
+        current_keys = lms_row_keys(df)
+        previous_keys = lms_row_keys(previous)
+        is_new = ~current_keys.isin(previous_keys)
+        is_reused = previous_keys.isin(current_keys)
+
+        logger.info(f"  - 이전 월 결과 재사용: {is_reused.sum()}행")
+        logger.info(f"  - 신규 행 (Category 매핑 대상): {is_new.sum()}행")
+        logger.info(f"  - 이번 파일에서 빠진 이전 행: {(~is_reused).sum()}행")
+
+        delta = categorize_lms(df[is_new].copy())
+        if delta is None:
+            return None
+
+        # 신규 행도 이전 결과와 같은 타입이 되도록 CSV 텍스트를 거쳐 변환 (실수는 값 손실 없이)
+        buffer = io.StringIO()
+        delta.to_csv(buffer, index=False)
+        buffer.seek(0)
+        delta = pd.read_csv(buffer, low_memory=False, float_precision='round_trip')
+
+        parts = [previous[is_reused].set_axis(previous_keys[is_reused].to_numpy())]
+        if len(delta) > 0:
+            parts.append(delta.set_axis(current_keys[is_new].to_numpy()))
+        result = pd.concat(parts) if len(parts) > 1 else parts[0]
+
+        # 이번 LMS 파일의 행 순서로 정렬
+        result = result.loc[current_keys.to_numpy()].reset_index(drop=True)
+        logger.info(f"✓ Category 그룹핑 완료 (이전 월 결과 + 신규 행): {result.shape[0]}행")
+        return result
+
+    except Exception as e:
+        logger.error(f"✗ 오류 발생: {e}")
+        return None
@@ -3,9 +3,55 @@
 Copyright (c) 2019 - present AppSeed.us
 """
 
+import glob
+import os
+import tempfile
+
 bind = '0.0.0.0:5005'
-workers = 1
+workers = int(os.getenv('GUNICORN_WORKERS', '4'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
 accesslog = '-'
-loglevel = 'debug'
+loglevel = 'info'
 capture_output = True
 enable_stdio_inheritance = True
+
+# 마스터에서 앱과 DataCache를 한 번만 로드하고 워커는 fork로 공유 (copy-on-write)
+# 스냅샷 데이터는 Arrow 메모리 맵으로 읽으므로 워커 수가 늘어도 페이지 캐시를 공유한다
+preload_app = True
+
+# 스냅샷 감시 스레드는 fork 이후 각 워커에서 시작 (run.py에서 마스터 스레드 시작을 건너뜀)
+os.environ['DATA_WATCHER_POST_FORK'] = '1'
+
+# /metrics 워커 합산: 각 워커가 지표를 이 디렉토리의 워커별 파일에 저장 (apps/metrics.py)
+# 워커별 파일은 서버 시작 시 비우고, 종료된 워커의 파일은 누적값 유지를 위해 남겨 둔다
+os.environ.setdefault('METRICS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'dashboard-metrics'))
+
+
+def on_starting(server):
+    """마스터 시작: 이전 서버 실행의 워커별 지표 파일 삭제"""
+    metrics_dir = os.environ['METRICS_MULTIPROC_DIR']
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, 'metrics_*.json*')):
+        os.remove(path)
+
+
+def post_fork(server, worker):
+    """워커 fork 직후: 마스터의 DB 연결을 버리고 스냅샷 감시 / 지표 저장 스레드 시작"""
+    from apps import db
+    from apps.data_cache import data_cache
+    from apps.metrics import metrics
+
+    app = server.app.wsgi()
+    with app.app_context():
+        db.engine.dispose()
+
+    data_cache.start_snapshot_watcher()
+    metrics.start_flusher()
+
+
+def worker_exit(server, worker):
+    """워커 종료: 마지막 저장 이후의 지표를 워커별 파일에 저장"""
+    from apps.metrics import metrics
+
+    metrics.flush()
@@ -4,11 +4,36 @@
 다른 Python 파일들에서 재사용 가능한 로깅 설정을 제공합니다.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+import threading
 from datetime import datetime
 
+# ==================== 파이프라인 로그 상세 단계 ====================
+# quiet: 경고 / 오류만, summary: 단계별 진행 / 결과 요약 (기본값),
+# diagnostic: 샘플 행, 값 분포, 결측 수 등 진단용 출력 (계산 비용이 큰 값은 이 단계에서만 계산)
+VERBOSITY_LEVELS = {
+    'quiet': logging.WARNING,
+    'summary': logging.INFO,
+    'diagnostic': logging.DEBUG,
+}
+DEFAULT_VERBOSITY = 'summary'
+
+# 파이프라인 로그 포맷
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_state_lock = threading.Lock()
+_verbosity = os.getenv('PIPELINE_VERBOSITY', DEFAULT_VERBOSITY)
+if _verbosity not in VERBOSITY_LEVELS:
+    _verbosity = DEFAULT_VERBOSITY
+_pipeline_loggers = {}
+_queue_handler = None
+_listener = None
+
 def setup_logger(name=None, log_file=None, level=logging.INFO,
                  log_format=None, include_console=True):
     """
@@ -27,7 +52,7 @@ def setup_logger(name=None, log_file=None, level=logging.INFO,
 
     # 기본 로그 포맷 설정
     if log_format is None:
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        log_format = DEFAULT_LOG_FORMAT
 
     # 로거 생성
     logger = logging.getLogger(name)
@@ -63,7 +88,11 @@ def setup_logger(name=None, log_file=None, level=logging.INFO,
 
 def get_default_logger(module_name=None):
     """
-    기본 설정으로 로거를 생성하는 함수
+    기본 설정으로 로거를 생성하는 함수 (파이프라인 모듈용)
+
+    로거에는 큐 핸들러만 연결하고, 콘솔 / 파일(logs/<모듈>_<날짜>.log) 출력은
+    백그라운드 리스너 스레드가 담당하므로 로그 호출이 파일 쓰기를 기다리지 않습니다.
+    레벨은 현재 상세 단계(quiet / summary / diagnostic)를 따릅니다.
 
     Args:
         module_name (str, optional): 모듈 이름. None이면 __main__ 사용
@@ -74,16 +103,19 @@ def get_default_logger(module_name=None):
     if module_name is None:
         module_name = __name__
 
-    # 기본 로그 파일명 생성
-    timestamp = datetime.now().strftime("%Y%m%d")
-    log_file = f"logs/{module_name}_{timestamp}.log"
+    logger = logging.getLogger(module_name)
+    handler = _ensure_listener()
 
-    return setup_logger(
-        name=module_name,
-        log_file=log_file,
-        level=logging.INFO,
-        include_console=True
-    )
+    with _state_lock:
+        # 기존 핸들러 제거 (중복 방지)
+        for existing in logger.handlers[:]:
+            logger.removeHandler(existing)
+        logger.addHandler(handler)
+        logger.setLevel(VERBOSITY_LEVELS[_verbosity])
+        logger.propagate = False
+        _pipeline_loggers[module_name] = logger
+
+    return logger
 
 def get_simple_logger(name=None):
     """
@@ -102,6 +134,118 @@ def get_simple_logger(name=None):
         include_console=True
     )
 
+class ModuleFileHandler(logging.Handler):
+    """
+    로거 이름별 파일 핸들러 (logs/<모듈>_<날짜>.log)
+    큐 리스너 스레드에서만 호출되므로 파일은 처음 기록할 때 엽니다.
+    """
+
+    def __init__(self, formatter, log_dir="logs"):
+        super().__init__()
+        self.setFormatter(formatter)
+        self.log_dir = log_dir
+        self._handlers = {}
+
+    def emit(self, record):
+        handler = self._handlers.get(record.name)
+        if handler is None:
+            timestamp = datetime.now().strftime("%Y%m%d")
+            os.makedirs(self.log_dir, exist_ok=True)
+            handler = logging.FileHandler(os.path.join(self.log_dir, f"{record.name}_{timestamp}.log"), encoding='utf-8')
+            handler.setFormatter(self.formatter)
+            self._handlers[record.name] = handler
+        handler.emit(record)
+
+    def close(self):
+        for handler in self._handlers.values():
+            handler.close()
+        self._handlers.clear()
+        super().close()
+
+
+def _start_listener():
+    """새 큐와 리스너 스레드 시작 (프로세스마다 하나)"""
+    global _listener
+    formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, ModuleFileHandler(formatter))
+    _listener.start()
+
+
+def _ensure_listener():
+    """공유 큐 핸들러 반환 (처음 호출 시 리스너 시작, 종료 시 남은 로그 기록)"""
+    global _queue_handler
+    with _state_lock:
+        if _queue_handler is None:
+            _queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            _start_listener()
+            atexit.register(stop_logging)
+    return _queue_handler
+
+
+def _restart_listener_in_child():
+    """
+    fork 된 자식 프로세스(로직 생성 병렬 워커 등)에서 리스너 재시작
+    리스너 스레드는 fork 후 복제되지 않으므로 새 큐를 만들고, multiprocessing 워커는
+    atexit 을 실행하지 않으므로 multiprocessing 종료 처리에 남은 로그 기록을 등록합니다.
+    """
+    global _state_lock
+    # fork 시점에 다른 스레드가 잡고 있던 락은 자식에서 풀리지 않으므로 새로 생성
+    _state_lock = threading.Lock()
+    if _queue_handler is None:
+        return
+    _start_listener()
+    import multiprocessing.util
+    multiprocessing.util.Finalize(None, stop_logging, exitpriority=0)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 기록하고 리스너 종료"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def set_verbosity(verbosity):
+    """
+    파이프라인 로그 상세 단계 변경 (이미 생성된 로거 포함)
+
+    Args:
+        verbosity: 'quiet' / 'summary' / 'diagnostic'
+    """
+    global _verbosity
+    if verbosity not in VERBOSITY_LEVELS:
+        raise ValueError(f"알 수 없는 로그 상세 단계: {verbosity} (사용 가능: {', '.join(VERBOSITY_LEVELS)})")
+    with _state_lock:
+        _verbosity = verbosity
+        # spawn 방식 자식 프로세스도 같은 단계를 사용하도록 환경 변수에 기록
+        os.environ['PIPELINE_VERBOSITY'] = verbosity
+        for logger in _pipeline_loggers.values():
+            logger.setLevel(VERBOSITY_LEVELS[verbosity])
+
+
+def get_verbosity():
+    """현재 파이프라인 로그 상세 단계"""
+    return _verbosity
+
+
+def is_diagnostic(logger):
+    """진단용 출력(샘플, 분포, 결측 수 등)을 계산할지 여부"""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 # 사용 예시
 if __name__ == "__main__":
     # 기본 로거 테스트
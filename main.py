@@ -8,21 +8,32 @@
 import os
 import sys
 import pandas as pd
-from logger_config import get_default_logger
+from logger_config import get_default_logger, set_verbosity
 from excel_preprocess_hr import load_excel_file, find_detail_sheet, get_detail_columns, create_final_company_name, update_region_mp_complete, extract_new_hire_complete, update_branch_mapping, create_new_leader_column, filter_manage_area
-from excel_preprocess_lms import get_lms_columns, group_category
+from excel_preprocess_lms import get_lms_columns, group_category, group_category_incremental
 from excel_preprocess_hong import run_hong_manager_preprocessing, run_hong_plan_preprocessing
-from make_logic import run_make_logic
+from make_logic import run_make_logic, update_logic_timeseries
+from snapshot_publisher import publish_month_snapshot
+from static_api_renderer import render_static_api
+from partition_catalog import data_root_of, partition_dir, previous_partition_dir, register_partition
+from metrics_cube import LOGIC_TIMESERIES_FILE
+from run_report import run_report
 
 # ==================== 분석 기준 설정 ====================
 # 이 값들만 변경하면 모든 전처리 및 분석이 해당 월 기준으로 수행됩니다
 ANALYSIS_YEAR = 2025  # 분석 기준 년도
 ANALYSIS_MONTH = 9    # 분석 기준 월 (1~12)
+INCREMENTAL_LMS = True  # 이전 월 결과에 있는 LMS 행은 재사용하고 신규 행만 처리 (False: 전체 행 재처리)
+CUMULATIVE_MODE = "incremental"  # 누적 집계 모드: incremental (이전 월 체크포인트 이월) / full (전체 재계산) / verify (비교 검증)
+# ※ incremental 은 실제 수강 시간만 이월하며, 체크포인트가 집계한 월의 완료 기록이 바뀌었으면 자동으로 전체 재계산 (cumulative_checkpoint.py 참고)
+MAKE_LOGIC_WORKERS = None  # 로직 생성 3~7단계 병렬 프로세스 수 (None: CPU 수 기준 자동, 1: 순차 실행)
+PIPELINE_VERBOSITY = "summary"  # 로그 상세도: quiet (경고/오류만) / summary (단계별 요약) / diagnostic (샘플, 분포 등 진단 정보 계산 및 출력)
+RUN_REPORT_TRACEMALLOC = False  # 실행 리포트에 단계별 tracemalloc 피크 기록 (True: 할당 추적 비용으로 전체 실행이 수 배 느려지므로 메모리 조사 시에만 사용)
 # ========================================================
 
 # 전역 변수 설정
 SOURCE_DIRECTORY = f"원본/{ANALYSIS_MONTH}월"  # 원본 파일이 있는 디렉토리
-FILE_DIRECTORY = f"data/{ANALYSIS_MONTH}"  # 작업 파일이 있는 디렉토리 (월별로 자동 설정)
+FILE_DIRECTORY = partition_dir(ANALYSIS_YEAR, ANALYSIS_MONTH)  # 작업 파일이 있는 디렉토리 (data/year=YYYY/month=MM, 년월별로 자동 설정)
 INDEX_MANAGEMENT_FILE = "index_management.xlsx"  # Index Management 파일명
 HR_FILE_NAME = "hr_index.xlsx"  # HR 처리할 파일명
 LMS_FILE_NAME = "lms_learning.xlsx"  # LMS 처리할 파일명
@@ -95,6 +106,7 @@ def run_index_management_preprocessing():
         output_path = os.path.join(FILE_DIRECTORY, INDEX_MANAGEMENT_OUTPUT)
         logger.info(f"CSV 파일로 저장 중: {output_path}")
         df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        run_report.set_rows(rows_in=len(df), rows_out=len(df))
 
         logger.info(f"✓ CSV 파일 저장 완료: {output_path}")
         logger.info(f"✓ 저장된 데이터: {df.shape[0]}행, {df.shape[1]}열")
@@ -152,6 +164,7 @@ def run_prev_hr_preprocessing():
         # CSV 파일로 저장
         logger.info(f"CSV 파일로 저장 중: {output_path}")
         df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        run_report.set_rows(rows_in=len(df), rows_out=len(df))
 
         logger.info(f"✓ CSV 파일 저장 완료: {output_path}")
         logger.info(f"✓ 저장된 데이터: {df.shape[0]}행, {df.shape[1]}열")
@@ -241,6 +254,7 @@ def run_hr_preprocessing():
 
                         output_path = os.path.join(FILE_DIRECTORY, HR_OUTPUT_FILE_NAME)
                         df_final.to_csv(output_path, index=False, encoding='utf-8-sig')
+                        run_report.set_rows(rows_in=len(df_with_final_company), rows_out=len(df_final))
                         logger.info(f"✓ CSV 파일 저장 완료: {output_path}")
                         logger.info(f"✓ 저장된 데이터: {df_final.shape[0]}행, {df_final.shape[1]}열")
                         logger.info("=== HR 전처리 완료 ===")
@@ -282,14 +296,22 @@ def run_lms_preprocessing():
     columns = get_lms_columns(file_path)
 
     if columns is not None:
-        # 3단계: Category 그룹핑
-        df_with_category = group_category(file_path)
+        # 3단계: Category 그룹핑 (이전 월 결과가 있으면 신규 행만 매핑)
+        previous_directory = previous_partition_dir(ANALYSIS_YEAR, ANALYSIS_MONTH) if INCREMENTAL_LMS else None
+
+        if previous_directory:
+            logger.info(f"이전 월 결과 디렉토리: {previous_directory}")
+            previous_output_path = os.path.join(previous_directory, LMS_OUTPUT_FILE_NAME)
+            df_with_category = group_category_incremental(file_path, previous_output_path)
+        else:
+            df_with_category = group_category(file_path)
 
         if df_with_category is not None:
             # 최종단계: CSV 파일로 저장
             logger.info("최종단계: 최종 결과를 CSV 파일로 저장합니다...")
             output_path = os.path.join(FILE_DIRECTORY, LMS_OUTPUT_FILE_NAME)
             df_with_category.to_csv(output_path, index=False, encoding='utf-8-sig')
+            run_report.set_rows(rows_out=len(df_with_category))
             logger.info(f"✓ CSV 파일 저장 완료: {output_path}")
             logger.info(f"✓ 저장된 데이터: {df_with_category.shape[0]}행, {df_with_category.shape[1]}열")
             logger.info("=== LMS 전처리 완료 ===")
@@ -302,10 +324,17 @@ def run_lms_preprocessing():
         return False
 
 
-def main():
+def _month_files(*file_names):
+    """월 디렉토리의 파일 경로 목록 (실행 리포트 입력 / 출력 파일)"""
+    return [os.path.join(FILE_DIRECTORY, file_name) for file_name in file_names]
+
+
+def run_pipeline():
     """
-    메인 실행 함수
+    전처리 → 로직 생성 → 발행 단계 실행 (각 단계는 실행 리포트에 기록)
     """
+    set_verbosity(PIPELINE_VERBOSITY)
+
     logger.info("=== Excel 전처리 시스템 시작 ===")
     logger.info(f"분석 기준 설정: {ANALYSIS_YEAR}년 {ANALYSIS_MONTH}월")
     logger.info(f"데이터 디렉토리: {FILE_DIRECTORY}")
@@ -313,7 +342,8 @@ def main():
 
     try:
         # Index Management 전처리 실행
-        index_mgmt_success = run_index_management_preprocessing()
+        with run_report.stage('run_index_management_preprocessing', _month_files(INDEX_MANAGEMENT_FILE), _month_files(INDEX_MANAGEMENT_OUTPUT)):
+            index_mgmt_success = run_index_management_preprocessing()
 
         if index_mgmt_success:
             logger.info("Index Management 전처리가 성공적으로 완료되었습니다.")
@@ -322,7 +352,8 @@ def main():
             return False
 
         # Prev HR Index 전처리 실행
-        prev_hr_success = run_prev_hr_preprocessing()
+        with run_report.stage('run_prev_hr_preprocessing', _month_files("prev_hr_index.xlsx"), _month_files("prev_hr_index_final.csv")):
+            prev_hr_success = run_prev_hr_preprocessing()
 
         if prev_hr_success:
             logger.info("Prev HR Index 전처리가 성공적으로 완료되었습니다.")
@@ -331,7 +362,8 @@ def main():
             return False
 
         # HR 전처리 실행
-        hr_success = run_hr_preprocessing()
+        with run_report.stage('run_hr_preprocessing', _month_files(HR_FILE_NAME), _month_files(HR_OUTPUT_FILE_NAME)):
+            hr_success = run_hr_preprocessing()
 
         if hr_success:
             logger.info("HR 전처리가 성공적으로 완료되었습니다.")
@@ -339,7 +371,8 @@ def main():
             logger.error("HR 전처리 중 오류가 발생했습니다.")
 
         # LMS 전처리 실행
-        lms_success = run_lms_preprocessing()
+        with run_report.stage('run_lms_preprocessing', _month_files(LMS_FILE_NAME), _month_files(LMS_OUTPUT_FILE_NAME)):
+            lms_success = run_lms_preprocessing()
 
         if lms_success:
             logger.info("LMS 전처리가 성공적으로 완료되었습니다.")
@@ -347,12 +380,13 @@ def main():
             logger.error("LMS 전처리 중 오류가 발생했습니다.")
 
         # HONG 법인담당자 전처리 실행
-        hong_manager_success = run_hong_manager_preprocessing(
-            FILE_DIRECTORY,
-            HONG_FILE_NAME,
-            HR_OUTPUT_FILE_NAME,
-            HONG_MANAGER_OUTPUT_FILE_NAME
-        )
+        with run_report.stage('run_hong_manager_preprocessing', _month_files(HONG_FILE_NAME), _month_files(HONG_MANAGER_OUTPUT_FILE_NAME)):
+            hong_manager_success = run_hong_manager_preprocessing(
+                FILE_DIRECTORY,
+                HONG_FILE_NAME,
+                HR_OUTPUT_FILE_NAME,
+                HONG_MANAGER_OUTPUT_FILE_NAME
+            )
 
         if hong_manager_success:
             logger.info("HONG 법인담당자 전처리가 성공적으로 완료되었습니다.")
@@ -360,11 +394,12 @@ def main():
             logger.error("HONG 법인담당자 전처리 중 오류가 발생했습니다.")
 
         # HONG 연간교육계획 전처리 실행
-        hong_plan_success = run_hong_plan_preprocessing(
-            FILE_DIRECTORY,
-            HONG_FILE_NAME,
-            HONG_PLAN_OUTPUT_FILE_NAME
-        )
+        with run_report.stage('run_hong_plan_preprocessing', _month_files(HONG_FILE_NAME), _month_files(HONG_PLAN_OUTPUT_FILE_NAME)):
+            hong_plan_success = run_hong_plan_preprocessing(
+                FILE_DIRECTORY,
+                HONG_FILE_NAME,
+                HONG_PLAN_OUTPUT_FILE_NAME
+            )
 
         if hong_plan_success:
             logger.info("HONG 연간교육계획 전처리가 성공적으로 완료되었습니다.")
@@ -372,10 +407,51 @@ def main():
             logger.error("HONG 연간교육계획 전처리 중 오류가 발생했습니다.")
 
         # 로직 생성 실행
-        make_logic_success = run_make_logic(FILE_DIRECTORY, ANALYSIS_YEAR, ANALYSIS_MONTH)
+        with run_report.stage('run_make_logic'):
+            make_logic_success = run_make_logic(FILE_DIRECTORY, ANALYSIS_YEAR, ANALYSIS_MONTH, incremental=INCREMENTAL_LMS, cumulative_mode=CUMULATIVE_MODE, workers=MAKE_LOGIC_WORKERS)
 
         if make_logic_success:
             logger.info("로직 생성이 성공적으로 완료되었습니다.")
+
+            # 결과 스냅샷 발행 (웹 서버가 CURRENT 포인터 변경을 감지하여 자동 갱신)
+            with run_report.stage('publish_month_snapshot'):
+                snapshot_version = publish_month_snapshot(FILE_DIRECTORY)
+
+            if snapshot_version:
+                logger.info(f"결과 스냅샷이 발행되었습니다: {snapshot_version}")
+
+                # 파티션 카탈로그 등록 (웹 서버는 카탈로그에 있는 파티션만 로드)
+                with run_report.stage('register_partition'):
+                    register_partition(ANALYSIS_YEAR, ANALYSIS_MONTH, snapshot=snapshot_version)
+                logger.info(f"파티션 카탈로그에 등록되었습니다: {FILE_DIRECTORY}")
+
+                # 월 누적 시계열 갱신 (추이 API 용, 발행된 스냅샷 기준이므로 발행 / 등록이 끝난 뒤 실행)
+                with run_report.stage('update_logic_timeseries', outputs=[os.path.join(data_root_of(FILE_DIRECTORY), LOGIC_TIMESERIES_FILE)]):
+                    logic_timeseries = update_logic_timeseries(FILE_DIRECTORY, f"{ANALYSIS_YEAR}-{ANALYSIS_MONTH:02d}")
+                    run_report.set_rows(rows_out=len(logic_timeseries) if logic_timeseries is not None else None)
+                if logic_timeseries is not None:
+                    logger.info("월 누적 시계열 갱신이 완료되었습니다.")
+                else:
+                    logger.error("월 누적 시계열 갱신 중 오류가 발생했습니다.")
+
+                # 읽기 전용 API 응답을 정적 JSON으로 렌더링 (nginx가 직접 제공, 실패해도 Flask가 응답)
+                with run_report.stage('render_static_api'):
+                    static_api_success = render_static_api([ANALYSIS_MONTH])
+                if static_api_success:
+                    logger.info("정적 JSON API 렌더링이 완료되었습니다.")
+                else:
+                    logger.error("정적 JSON API 렌더링 중 오류가 발생했습니다.")
+
+                # 결과 파일을 SQL 저장소에 적재 (웹 API 조건 조회용, 실패하면 웹은 파일 조회로 대체)
+                from apps.output_store import load_output_store
+                with run_report.stage('load_output_store'):
+                    output_store_success = load_output_store(ANALYSIS_MONTH, ANALYSIS_YEAR)
+                if output_store_success:
+                    logger.info("SQL 저장소 적재가 완료되었습니다.")
+                else:
+                    logger.error("SQL 저장소 적재 중 오류가 발생했습니다.")
+            else:
+                logger.error("결과 스냅샷 발행 중 오류가 발생했습니다.")
         else:
             logger.error("로직 생성 중 오류가 발생했습니다.")
 
@@ -386,6 +462,25 @@ def main():
     logger.info("=== Excel 전처리 시스템 종료 ===")
     return True
 
+
+def main():
+    """
+    메인 실행 함수 (단계별 시간 / 메모리 / 행 수를 월 디렉토리의 run_reports/ 에 기록)
+    """
+    settings = {
+        'incremental_lms': INCREMENTAL_LMS,
+        'cumulative_mode': CUMULATIVE_MODE,
+        'make_logic_workers': MAKE_LOGIC_WORKERS,
+        'verbosity': PIPELINE_VERBOSITY,
+    }
+    run_report.start(FILE_DIRECTORY, ANALYSIS_YEAR, ANALYSIS_MONTH, trace_memory=RUN_REPORT_TRACEMALLOC, settings=settings)
+    success = False
+    try:
+        success = run_pipeline()
+    finally:
+        run_report.finish(success)
+    return success
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
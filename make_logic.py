@@ -9,7 +9,20 @@ import pandas as pd
 import os
 import sys
 import math
-from logger_config import get_default_logger
+from concurrent.futures import ProcessPoolExecutor
+from logger_config import get_default_logger, is_diagnostic
+from partition_catalog import data_root_of, partition_dir, previous_partition_dir
+from excel_preprocess_lms import LMS_ROW_KEY_COLUMNS, lms_row_keys
+from cumulative_checkpoint import CHECKPOINT_FILE, CUMULATIVE_MODES, carry_forward, compare_totals, load_checkpoint, save_checkpoint
+from metrics_cube import LOGIC_CUBE_FILE, LOGIC_TIMESERIES_FILE, SUBSIDIARY_RATE_COLUMNS, build_logic_cube
+from run_report import run_report
+from snapshot_publisher import SNAPSHOT_DIR_NAME, read_current_version
+
+# pyarrow는 선택 의존성: 없으면 3~7단계를 순차 실행
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 # 로거 설정
 logger = get_default_logger(__name__)
@@ -19,6 +32,9 @@ HR_FINAL_FILE = "hr_index_final.csv"
 LMS_FINAL_FILE = "lms_learning_final.csv"
 HONG_MANAGER_FINAL_FILE = "hong_data_manager_final.csv"
 HONG_PLAN_FINAL_FILE = "hong_data_plan_final.csv"
+COURSE_AGGREGATES_FILE = "course_aggregates.csv"  # 과정별 집계 테이블 (웹 과정리스트 API 용)
+JOIN_TABLE_FILE = "join_hr_lms.csv"  # HR-LMS 조인 테이블
+SHARED_JOIN_TABLE_FILE = ".join_hr_lms.arrow"  # 3~7단계 병렬 실행 중 작업 프로세스가 공유하는 임시 조인 테이블
 
 # 분석 기준 월 설정 (main.py에서 전달받음)
 # 이 변수들은 run_make_logic() 함수 내에서 설정됨
@@ -92,7 +108,77 @@ def load_processed_files(file_directory):
         logger.error(f"✗ 오류 발생: {e}")
         return None
 
-def create_join_table(df_hr, df_lms, file_directory):
+def _unchanged_employees(previous_hr, df_hr, hr_join_col):
+    """
+    이전 월과 인사정보가 같은 사번 목록 (두 달 모두 사번당 1행이고 모든 컬럼 값이 같은 직원)
+    """
+    def row_hashes(df):
+        emp_nos = df[hr_join_col].astype(str).str.replace(r'\.0$', '', regex=True)
+        single = df[hr_join_col].notna() & ~emp_nos.duplicated(keep=False)
+        hashes = pd.util.hash_pandas_object(df[single].astype(str), index=False)
+        return pd.Series(hashes.to_numpy(), index=emp_nos[single].to_numpy())
+
+    previous_hashes = row_hashes(previous_hr)
+    current_hashes = row_hashes(df_hr)
+    common = previous_hashes.index.intersection(current_hashes.index)
+    return common[previous_hashes[common].to_numpy() == current_hashes[common].to_numpy()]
+
+def join_with_previous(df_hr, df_lms, previous_directory, lms_join_col, hr_join_col):
+    """
+    이전 월 조인 결과를 재사용하는 Left Join (2.3단계)
+
+    이전 월 join_hr_lms.csv 에 같은 행 키가 있고 인사정보가 바뀌지 않은 직원의 행은 그대로 사용하고,
+    신규 LMS 행과 인사정보가 바뀐(또는 새로 등록된) 직원의 행만 HR과 다시 조인한다.
+
+    Args:
+        df_hr: HR 데이터프레임
+        df_lms: LMS 데이터프레임
+        previous_directory (str): 이전 월 파티션 디렉토리
+
+    Returns:
+        DataFrame: LMS 행 순서의 조인 결과 / 이전 결과를 사용할 수 없으면 None
+    """
+    previous_join_path = os.path.join(previous_directory, JOIN_TABLE_FILE)
+    previous_hr_path = os.path.join(previous_directory, HR_FINAL_FILE)
+    if not os.path.exists(previous_join_path) or not os.path.exists(previous_hr_path):
+        logger.info("  - 이전 월 조인 결과가 없어 전체 조인을 수행합니다.")
+        return None
+
+    previous_join = pd.read_csv(previous_join_path, encoding='utf-8-sig', low_memory=False)
+    previous_hr = pd.read_csv(previous_hr_path, encoding='utf-8-sig')
+
+    join_columns = pd.merge(df_lms.iloc[:0], df_hr.iloc[:0], left_on=lms_join_col, right_on=hr_join_col, how='left').columns
+    if list(previous_join.columns) != list(join_columns) or list(previous_hr.columns) != list(df_hr.columns):
+        logger.warning("  - 이전 월 결과의 컬럼 구성이 달라 전체 조인을 수행합니다.")
+        return None
+
+    unchanged_emp_nos = _unchanged_employees(previous_hr, df_hr, hr_join_col)
+
+    # 재사용 가능한 이전 조인 행: 이번 LMS에 같은 행 키가 있고 인사정보가 그대로인 직원
+    lms_keys = lms_row_keys(df_lms)
+    previous_keys = lms_row_keys(previous_join)
+    previous_emp_nos = previous_join[lms_join_col].astype(str).str.replace(r'\.0$', '', regex=True)
+    reusable = previous_keys.isin(lms_keys) & previous_emp_nos.isin(unchanged_emp_nos)
+    rejoin = ~lms_keys.isin(previous_keys[reusable])
+
+    logger.info(f"  - 인사정보가 그대로인 직원: {len(unchanged_emp_nos)}명")
+    logger.info(f"  - 이전 월 조인 결과 재사용: {reusable.sum()}행")
+    logger.info(f"  - 다시 조인할 LMS 행 (신규 / 인사정보 변경): {rejoin.sum()}행")
+
+    # LMS 행 위치를 임시 컬럼으로 붙여 조인 후 원래 순서로 정렬
+    position_col = '__lms_position'
+    positions = pd.Series(range(len(df_lms)), index=lms_keys.to_numpy())
+    reused = previous_join[reusable].assign(**{position_col: positions[previous_keys[reusable]].to_numpy()})
+    joined = pd.merge(
+        df_lms[rejoin].assign(**{position_col: positions[lms_keys[rejoin]].to_numpy()}),
+        df_hr, left_on=lms_join_col, right_on=hr_join_col, how='left'
+    )
+
+    join_table = pd.concat([reused, joined], ignore_index=True) if len(joined) > 0 else reused
+    join_table = join_table.sort_values(position_col, kind='stable').drop(columns=position_col)
+    return join_table.reset_index(drop=True)
+
+def create_join_table(df_hr, df_lms, file_directory, previous_directory=None):
     """
     HR과 LMS 테이블을 조인하는 함수 (2단계)
 
@@ -100,6 +186,7 @@ def create_join_table(df_hr, df_lms, file_directory):
         df_hr: HR 데이터프레임
         df_lms: LMS 데이터프레임
         file_directory (str): 파일 저장 디렉토리
+        previous_directory (str): 이전 월 파티션 디렉토리 (지정 시 이전 조인 결과 재사용)
     """
     try:
         # 2단계: 조인 테이블 생성
@@ -126,12 +213,13 @@ def create_join_table(df_hr, df_lms, file_directory):
         logger.info("2.1단계: 조인 컬럼 데이터 타입을 확인합니다...")
 
         # HR Emp. No. 데이터 타입 확인
-        hr_emp_no_sample = df_hr[hr_join_col].dropna().head(5)
-        logger.info(f"HR Emp. No. 샘플 데이터: {hr_emp_no_sample.tolist()}")
+        if is_diagnostic(logger):
+            hr_emp_no_sample = df_hr[hr_join_col].dropna().head(5)
+            logger.debug(f"HR Emp. No. 샘플 데이터: {hr_emp_no_sample.tolist()}")
 
-        # LMS Employee Number 데이터 타입 확인
-        lms_emp_no_sample = df_lms[lms_join_col].dropna().head(5)
-        logger.info(f"LMS Employee Number 샘플 데이터: {lms_emp_no_sample.tolist()}")
+            # LMS Employee Number 데이터 타입 확인
+            lms_emp_no_sample = df_lms[lms_join_col].dropna().head(5)
+            logger.debug(f"LMS Employee Number 샘플 데이터: {lms_emp_no_sample.tolist()}")
 
         # 사번 중복 및 매칭 문제 분석
         logger.info("2.2단계: 사번 중복 및 매칭 문제를 분석합니다...")
@@ -148,34 +236,36 @@ def create_join_table(df_hr, df_lms, file_directory):
             for emp_no, count in hr_dup_values.head(10).items():
                 logger.warning(f"  {emp_no}: {count}개")
 
-        # LMS 사번 통계 (중복 계산 제외)
-        lms_total = len(df_lms[lms_join_col].dropna())
-        lms_unique = df_lms[lms_join_col].nunique()
-        logger.info(f"LMS 사번 통계: 총 {lms_total}개, 고유값 {lms_unique}개")
+        # LMS 사번 통계와 사번 집합 비교는 진단용 (LMS 전체 사번을 문자열 집합으로 만듦)
+        if is_diagnostic(logger):
+            # LMS 사번 통계 (중복 계산 제외)
+            lms_total = len(df_lms[lms_join_col].dropna())
+            lms_unique = df_lms[lms_join_col].nunique()
+            logger.debug(f"LMS 사번 통계: 총 {lms_total}개, 고유값 {lms_unique}개")
 
-        # 매칭 가능한 사번 확인
-        hr_emp_nos = set(df_hr[hr_join_col].dropna().astype(str))
-        lms_emp_nos = set(df_lms[lms_join_col].dropna().astype(str))
+            # 매칭 가능한 사번 확인
+            hr_emp_nos = set(df_hr[hr_join_col].dropna().astype(str))
+            lms_emp_nos = set(df_lms[lms_join_col].dropna().astype(str))
 
-        common_emp_nos = hr_emp_nos.intersection(lms_emp_nos)
-        hr_only = hr_emp_nos - lms_emp_nos
-        lms_only = lms_emp_nos - hr_emp_nos
+            common_emp_nos = hr_emp_nos.intersection(lms_emp_nos)
+            hr_only = hr_emp_nos - lms_emp_nos
+            lms_only = lms_emp_nos - hr_emp_nos
 
-        logger.info(f"매칭 분석:")
-        logger.info(f"  공통 사번: {len(common_emp_nos)}개")
-        logger.info(f"  HR에만 있는 사번: {len(hr_only)}개")
-        logger.info(f"  LMS에만 있는 사번: {len(lms_only)}개")
+            logger.debug(f"매칭 분석:")
+            logger.debug(f"  공통 사번: {len(common_emp_nos)}개")
+            logger.debug(f"  HR에만 있는 사번: {len(hr_only)}개")
+            logger.debug(f"  LMS에만 있는 사번: {len(lms_only)}개")
 
-        if len(hr_only) > 0:
-            logger.warning(f"HR에만 있는 사번 샘플 (상위 10개): {list(hr_only)[:10]}")
-        if len(lms_only) > 0:
-            logger.warning(f"LMS에만 있는 사번 샘플 (상위 10개): {list(lms_only)[:10]}")
+            if len(hr_only) > 0:
+                logger.warning(f"HR에만 있는 사번 샘플 (상위 10개): {list(hr_only)[:10]}")
+            if len(lms_only) > 0:
+                logger.warning(f"LMS에만 있는 사번 샘플 (상위 10개): {list(lms_only)[:10]}")
 
-        # 매칭률 계산
-        hr_match_rate = len(common_emp_nos) / len(hr_emp_nos) * 100 if len(hr_emp_nos) > 0 else 0
-        lms_match_rate = len(common_emp_nos) / len(lms_emp_nos) * 100 if len(lms_emp_nos) > 0 else 0
+            # 매칭률 계산
+            hr_match_rate = len(common_emp_nos) / len(hr_emp_nos) * 100 if len(hr_emp_nos) > 0 else 0
+            lms_match_rate = len(common_emp_nos) / len(lms_emp_nos) * 100 if len(lms_emp_nos) > 0 else 0
 
-        logger.info(f"매칭률: HR 기준 {hr_match_rate:.2f}%, LMS 기준 {lms_match_rate:.2f}%")
+            logger.debug(f"매칭률: HR 기준 {hr_match_rate:.2f}%, LMS 기준 {lms_match_rate:.2f}%")
 
         # 조인 수행 (left join)
         logger.info("2.3단계: Left Join을 수행합니다...")
@@ -189,7 +279,13 @@ def create_join_table(df_hr, df_lms, file_directory):
         logger.info("    - 사번이 매칭되면 HR의 법인정보(Final Sub., Final Region 등)가 추가됨")
         logger.info("    - 사번이 매칭되지 않으면 HR 컬럼들은 null로 채워짐")
 
-        join_table = pd.merge(df_lms, df_hr, left_on=lms_join_col, right_on=hr_join_col, how='left')
+        join_table = None
+        if previous_directory:
+            logger.info(f"  이전 월 조인 결과 재사용: {previous_directory}")
+            join_table = join_with_previous(df_hr, df_lms, previous_directory, lms_join_col, hr_join_col)
+
+        if join_table is None:
+            join_table = pd.merge(df_lms, df_hr, left_on=lms_join_col, right_on=hr_join_col, how='left')
 
         logger.info(f"✓ 조인 완료:")
         logger.info(f"  - 조인 결과: {join_table.shape[0]}행, {join_table.shape[1]}열")
@@ -201,20 +297,21 @@ def create_join_table(df_hr, df_lms, file_directory):
         logger.info("2.4단계: 조인 결과를 분석합니다...")
 
         # 조인 결과 통계 (LMS 기준)
-        join_total = len(join_table)
-        join_unique = join_table[lms_join_col].nunique()
+        if is_diagnostic(logger):
+            join_total = len(join_table)
+            join_unique = join_table[lms_join_col].nunique()
 
-        logger.info(f"조인 결과 사번 통계: 총 {join_total}개, 고유값 {join_unique}개")
+            logger.debug(f"조인 결과 사번 통계: 총 {join_total}개, 고유값 {join_unique}개")
 
-        # Left Join 결과 분석
-        matched_count = join_table[hr_join_col].notna().sum()
-        unmatched_count = join_table[hr_join_col].isna().sum()
+            # Left Join 결과 분석
+            matched_count = join_table[hr_join_col].notna().sum()
+            unmatched_count = join_table[hr_join_col].isna().sum()
 
-        logger.info(f"Left Join 결과:")
-        logger.info(f"  LMS 데이터: {df_lms.shape[0]}개 (모두 유지)")
-        logger.info(f"  HR과 매칭된 LMS: {matched_count}개 ({matched_count/df_lms.shape[0]*100:.2f}%)")
-        logger.info(f"  HR과 매칭되지 않은 LMS: {unmatched_count}개 ({unmatched_count/df_lms.shape[0]*100:.2f}%)")
-        logger.info(f"  HR에서 제외된 행: {df_hr.shape[0] - matched_count}개")
+            logger.debug(f"Left Join 결과:")
+            logger.debug(f"  LMS 데이터: {df_lms.shape[0]}개 (모두 유지)")
+            logger.debug(f"  HR과 매칭된 LMS: {matched_count}개 ({matched_count/df_lms.shape[0]*100:.2f}%)")
+            logger.debug(f"  HR과 매칭되지 않은 LMS: {unmatched_count}개 ({unmatched_count/df_lms.shape[0]*100:.2f}%)")
+            logger.debug(f"  HR에서 제외된 행: {df_hr.shape[0] - matched_count}개")
 
         # 중복 컬럼 확인 및 처리
         logger.info("2.5단계: 중복 컬럼을 확인합니다...")
@@ -277,7 +374,7 @@ def create_join_table(df_hr, df_lms, file_directory):
 
         # CSV 파일로 저장
         logger.info("2.7단계: 조인 테이블을 CSV 파일로 저장합니다...")
-        output_path = os.path.join(file_directory, "join_hr_lms.csv")
+        output_path = os.path.join(file_directory, JOIN_TABLE_FILE)
         join_table.to_csv(output_path, index=False, encoding='utf-8-sig')
 
         logger.info(f"✓ 조인 테이블 저장 완료: {output_path}")
@@ -291,6 +388,141 @@ def create_join_table(df_hr, df_lms, file_directory):
         logger.error(f"✗ 오류 발생: {e}")
         return None
 
+def create_course_aggregates(join_table, file_directory):
+    """
+    과정별 집계 테이블 생성 (2.8단계)
+    완료(-C)된 수강 기록을 (완료 년월, Final Region, Final Sub., Course name) 단위로 집계하여
+    웹 과정리스트 API가 조인 테이블 전체를 다시 읽지 않도록 한다.
+
+    Args:
+        join_table: HR-LMS 조인 테이블
+        file_directory (str): 파일 저장 디렉토리
+
+    Returns:
+        DataFrame: 과정별 집계 테이블 (실패 시 None)
+    """
+    try:
+        logger.info("2.8단계: 과정별 집계 테이블을 생성합니다...")
+
+        # 완료된 과정만 필터링 (-C로 끝나는 것)
+        completed = join_table[join_table['Completion status'].astype(str).str.endswith('-C', na=False)]
+
+        # Completion Date가 float 형태(20250812.0)인 경우를 처리하여 완료 년월 추출
+        completion_date = pd.to_datetime(
+            completed['Completion Date'].astype(str).str.replace('.0', '', regex=False),
+            format='%Y%m%d', errors='coerce'
+        )
+        completed = completed[completion_date.notna()].assign(Year_Month=completion_date.dt.strftime('%Y-%m'))
+
+        course_aggregates = (
+            completed
+            .groupby(['Year_Month', 'Final Region', 'Final Sub.', 'Course name'], dropna=False, sort=False)
+            .agg(
+                category_1=('category_1', 'first'),      # 카테고리 대
+                category_2=('category_2', 'first'),      # 카테고리 중
+                Category=('Category', 'first'),          # 카테고리 소
+                participant_count=('Final Sub.', 'size'),  # 이수인원
+                total_hours=('Education Hours', 'sum')   # 총 이수시간
+            )
+            .reset_index()
+        )
+
+        output_path = os.path.join(file_directory, COURSE_AGGREGATES_FILE)
+        course_aggregates.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        logger.info(f"✓ 과정별 집계 테이블 저장 완료: {output_path}")
+        logger.info(f"✓ 완료 기록 {len(completed)}행 → 집계 {len(course_aggregates)}행")
+
+        return course_aggregates
+
+    except Exception as e:
+        logger.error(f"✗ 과정별 집계 테이블 생성 중 오류 발생: {e}")
+        return None
+
+def create_logic_cube(file_directory):
+    """
+    KPI 지표 큐브 생성 (9단계)
+    최종 logic.csv(법인 단위)의 합산 가능한 값(과정/시간/인원/Y 개수/Score 합계)을
+    (년월, Final Region, Final Sub.) 단위로 저장하여 웹의 지역 / Global 지표가 같은 공식으로 계산되도록 한다.
+
+    Args:
+        file_directory (str): 파일 저장 디렉토리
+
+    Returns:
+        DataFrame: 지표 큐브 (실패 시 None)
+    """
+    try:
+        logger.info("9단계: KPI 지표 큐브를 생성합니다...")
+
+        logic_df = pd.read_csv(os.path.join(file_directory, "logic.csv"), encoding='utf-8-sig')
+        logic_cube = build_logic_cube(logic_df, ANALYSIS_MONTH_STR)
+
+        output_path = os.path.join(file_directory, LOGIC_CUBE_FILE)
+        logic_cube.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        logger.info(f"✓ 지표 큐브 저장 완료: {output_path}")
+        logger.info(f"✓ 법인 {len(logic_df)}행 → 큐브 {len(logic_cube)}셀")
+
+        return logic_cube
+
+    except Exception as e:
+        logger.error(f"✗ 지표 큐브 생성 중 오류 발생: {e}")
+        return None
+
+def update_logic_timeseries(file_directory, year_month):
+    """
+    월 누적 시계열 테이블 갱신 (10단계, 스냅샷 발행 후 main.py 에서 호출)
+    발행된 스냅샷(CURRENT)의 지표 큐브 셀에 법인 단위 비율 / Score 를 붙여 data/logic_timeseries.csv 의 해당 년월 행을 교체한다.
+    웹의 추이(trend) API가 월별 logic.csv 를 하나씩 읽지 않고 한 파일에서 전체 기간을 조회한다.
+    발행 전에 갱신하면 발행이 실패했을 때 추이 API 가 공개되지 않은 월을 보여주므로 발행된 스냅샷에서만 읽는다.
+
+    Args:
+        file_directory (str): 월 작업 디렉토리 (시계열 파일은 데이터 루트에 저장)
+        year_month (str): 분석 기준 년월 (예: '2025-09')
+
+    Returns:
+        DataFrame: 갱신된 전체 시계열 (발행된 스냅샷이 없거나 실패 시 None)
+    """
+    try:
+        logger.info("10단계: 월 누적 시계열 테이블을 갱신합니다...")
+
+        version = read_current_version(file_directory)
+        if version is None:
+            logger.error(f"✗ 발행된 스냅샷이 없습니다: {file_directory}")
+            return None
+        snapshot_dir = os.path.join(file_directory, SNAPSHOT_DIR_NAME, version)
+        logic_cube = pd.read_csv(os.path.join(snapshot_dir, LOGIC_CUBE_FILE), encoding='utf-8-sig')
+        logic_df = pd.read_csv(os.path.join(snapshot_dir, "logic.csv"), encoding='utf-8-sig')
+        rate_columns = [col for col in SUBSIDIARY_RATE_COLUMNS if col in logic_df.columns]
+        subsidiary_rates = logic_df.drop_duplicates('Subsidiary').set_index('Subsidiary')[rate_columns]
+        month_rows = logic_cube.join(subsidiary_rates, on='Final Sub.')
+
+        data_root = data_root_of(file_directory)
+        output_path = os.path.join(data_root, LOGIC_TIMESERIES_FILE)
+
+        # 같은 년월을 다시 실행하면 이전 행을 교체
+        if os.path.exists(output_path):
+            timeseries = pd.read_csv(output_path, encoding='utf-8-sig')
+            previous_rows = timeseries[timeseries['Year_Month'] != year_month]
+            timeseries = pd.concat([previous_rows, month_rows], ignore_index=True)
+        else:
+            timeseries = month_rows
+        timeseries = timeseries.sort_values(['Year_Month', 'Final Sub.'], kind='stable')
+
+        # 웹이 반쯤 쓰인 파일을 읽지 않도록 임시 파일 작성 후 교체
+        tmp_path = f"{output_path}.tmp"
+        timeseries.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+        os.replace(tmp_path, output_path)
+
+        logger.info(f"✓ 시계열 테이블 저장 완료: {output_path}")
+        logger.info(f"✓ {year_month} {len(month_rows)}행 반영, 전체 {timeseries['Year_Month'].nunique()}개월 {len(timeseries)}행")
+
+        return timeseries
+
+    except Exception as e:
+        logger.error(f"✗ 시계열 테이블 갱신 중 오류 발생: {e}")
+        return None
+
 def calculate_current_education_plans(df_hong_plan):
     """
     현재 시간 기준에 포함되는 교육계획 개수를 계산하는 함수 (3.1단계)
@@ -743,10 +975,11 @@ def calculate_monthly_learning_hours(df_hong_plan):
         df_hong_plan['Learning Hrs.'] = pd.to_numeric(df_hong_plan['Learning Hrs.'], errors='coerce')
 
         # 샘플 데이터 확인
-        logger.info("  - 변환 결과 샘플:")
-        logger.info("    Start Date 샘플: " + str(df_hong_plan['Start Date'].dropna().head(3).tolist()))
-        logger.info("    End Date 샘플: " + str(df_hong_plan['End Date'].dropna().head(3).tolist()))
-        logger.info("    Learning Hrs. 샘플: " + str(df_hong_plan['Learning Hrs.'].dropna().head(3).tolist()))
+        if is_diagnostic(logger):
+            logger.debug("  - 변환 결과 샘플:")
+            logger.debug("    Start Date 샘플: " + str(df_hong_plan['Start Date'].dropna().head(3).tolist()))
+            logger.debug("    End Date 샘플: " + str(df_hong_plan['End Date'].dropna().head(3).tolist()))
+            logger.debug("    Learning Hrs. 샘플: " + str(df_hong_plan['Learning Hrs.'].dropna().head(3).tolist()))
 
         # 유효한 데이터만 필터링
         logger.info("  - 유효성 검사:")
@@ -794,15 +1027,16 @@ def calculate_monthly_learning_hours(df_hong_plan):
         logger.info(f"  - 유효한 Month_end 데이터: {len(valid_month_data)}개")
 
         # Month_end 분포 확인 (1월부터 12월까지 전체)
-        month_end_dist = valid_month_data['Month_end'].value_counts().sort_index()
-        logger.info("  - Month_end 분포 (1월~12월):")
-        for month in range(1, 13):
-            count = month_end_dist.get(float(month), 0)
-            if count > 0:
-                status = f"✓ 포함" if month <= ANALYSIS_MONTH else "✗ 제외"
-                logger.info(f"    {month}월: {int(count)}개 교육 계획 ({status})")
-            else:
-                logger.info(f"    {month}월: 0개 교육 계획")
+        if is_diagnostic(logger):
+            month_end_dist = valid_month_data['Month_end'].value_counts().sort_index()
+            logger.debug("  - Month_end 분포 (1월~12월):")
+            for month in range(1, 13):
+                count = month_end_dist.get(float(month), 0)
+                if count > 0:
+                    status = f"✓ 포함" if month <= ANALYSIS_MONTH else "✗ 제외"
+                    logger.debug(f"    {month}월: {int(count)}개 교육 계획 ({status})")
+                else:
+                    logger.debug(f"    {month}월: 0개 교육 계획")
 
         monthly_data = []
 
@@ -826,10 +1060,10 @@ def calculate_monthly_learning_hours(df_hong_plan):
         logger.info(f"✓ 월별 데이터 생성 완료: {len(monthly_df)}개 레코드")
 
         # 샘플 데이터 출력
-        if len(monthly_df) > 0:
+        if is_diagnostic(logger) and len(monthly_df) > 0:
             sample_data = monthly_df.head(3)
             for _, row in sample_data.iterrows():
-                logger.info(f"  샘플: {row['subsidiary']} - {row['month']}월, {row['learning_hrs']}시간")
+                logger.debug(f"  샘플: {row['subsidiary']} - {row['month']}월, {row['learning_hrs']}시간")
 
         # 법인명 공백 제거
         logger.info("4.1.3단계: 법인명 공백을 제거합니다...")
@@ -953,10 +1187,11 @@ def calculate_monthly_actual_hours(join_table):
         logger.info("4.2.1단계: 완료된 과정을 필터링합니다...")
 
         # Completion status 샘플 확인
-        logger.info("Completion status 샘플: " + str(join_table['Completion status'].value_counts().head(10).to_dict()))
+        if is_diagnostic(logger):
+            logger.debug("Completion status 샘플: " + str(join_table['Completion status'].value_counts().head(10).to_dict()))
 
-        # Staff/Operator 샘플 확인
-        logger.info("Staff/Operator 샘플: " + str(join_table['Staff/Operator'].value_counts().head(10).to_dict()))
+            # Staff/Operator 샘플 확인
+            logger.debug("Staff/Operator 샘플: " + str(join_table['Staff/Operator'].value_counts().head(10).to_dict()))
 
         completed_condition = join_table['Completion status'].str.endswith('-C', na=False)
         staff_condition = join_table['Staff/Operator'] == 'Staff'
@@ -1022,10 +1257,11 @@ def calculate_monthly_actual_hours(join_table):
             return None
 
         # 샘플 데이터 확인
-        logger.info(f"  - 최종 필터링된 데이터 샘플:")
-        logger.info(f"    Completion Date 샘플: {date_filtered['Completion Date'].head(3).tolist()}")
-        logger.info(f"    Education Hours 샘플: {date_filtered['Education Hours'].head(3).tolist()}")
-        logger.info(f"    Final Sub. 샘플: {date_filtered['Final Sub.'].head(5).tolist()}")
+        if is_diagnostic(logger):
+            logger.debug(f"  - 최종 필터링된 데이터 샘플:")
+            logger.debug(f"    Completion Date 샘플: {date_filtered['Completion Date'].head(3).tolist()}")
+            logger.debug(f"    Education Hours 샘플: {date_filtered['Education Hours'].head(3).tolist()}")
+            logger.debug(f"    Final Sub. 샘플: {date_filtered['Final Sub.'].head(5).tolist()}")
 
         # 법인명 공백 제거
         logger.info("4.2.3단계: 법인명 공백을 제거합니다...")
@@ -1060,11 +1296,11 @@ def calculate_monthly_actual_hours(join_table):
         logger.info(f"    나머지 {99 - len(subsidiary_actual_totals)}개 법인: 누적 완료된 교육이 0 또는 데이터 없음")
 
         # 법인별 누적 시간 샘플 출력
-        if len(subsidiary_actual_totals) > 0:
-            logger.info("  - 법인별 누적 실제 수강 시간 샘플 (상위 10개):")
+        if is_diagnostic(logger) and len(subsidiary_actual_totals) > 0:
+            logger.debug("  - 법인별 누적 실제 수강 시간 샘플 (상위 10개):")
             for subsidiary, hours in subsidiary_actual_totals.head(10).items():
                 original_name = normalization_map.get(subsidiary, subsidiary)
-                logger.info(f"    {original_name}: {hours:.2f}시간")
+                logger.debug(f"    {original_name}: {hours:.2f}시간")
 
         # 결과 요약
         logger.info("4.2.5단계: 결과를 요약합니다...")
@@ -1095,6 +1331,120 @@ def calculate_monthly_actual_hours(join_table):
         logger.error(f"✗ 오류 발생: {e}")
         return None
 
+# 소급 변경 감지에 사용하는 4.2단계 입력 컬럼 (행 키 외)
+BACKDATED_VALUE_COLUMNS = ['Education Hours', 'Final Sub.', 'Staff/Operator']
+
+def count_backdated_changes(join_table, previous_directory, through_month):
+    """
+    체크포인트가 이미 집계한 월(1월~through_month)의 완료 기록 중 이전 월 조인 테이블과 달라진 행 수
+
+    같은 년도에 완료일이 through_month 이하인 행을 행 키(lms_row_keys)와 4.2단계 입력 컬럼 값으로 비교하여
+    추가 / 삭제 / 변경된 행을 센다. 조인 테이블을 비교하므로 소급 입력된 LMS 완료 기록뿐 아니라
+    인사정보 변경으로 법인 / Staff 구분이 바뀐 과거 완료 기록도 포함된다.
+
+    Args:
+        join_table: 이번 달 HR-LMS 조인 테이블
+        previous_directory (str): 이전 월 파티션 디렉토리
+        through_month (int): 체크포인트 기준 월
+
+    Returns:
+        int: 달라진 행 수 (추가 + 삭제, 변경은 양쪽에 한 번씩) / 이전 조인 테이블을 비교할 수 없으면 None
+    """
+    previous_join_path = os.path.join(previous_directory, JOIN_TABLE_FILE) if previous_directory else None
+    columns = LMS_ROW_KEY_COLUMNS + BACKDATED_VALUE_COLUMNS
+    if not previous_join_path or not os.path.exists(previous_join_path):
+        logger.info("  - 이전 월 조인 테이블이 없어 소급 변경을 확인할 수 없습니다.")
+        return None
+    if not set(columns).issubset(join_table.columns):
+        logger.warning(f"  - 소급 변경 확인에 필요한 컬럼이 없습니다: {columns}")
+        return None
+
+    try:
+        previous_join = pd.read_csv(previous_join_path, encoding='utf-8-sig', usecols=columns, low_memory=False, float_precision='round_trip')
+    except ValueError:
+        logger.warning(f"  - 이전 월 조인 테이블의 컬럼 구성이 달라 소급 변경을 확인할 수 없습니다: {previous_join_path}")
+        return None
+
+    def past_row_signatures(df):
+        completion_date = pd.to_datetime(df['Completion Date'].astype(str).str.replace('.0', ''), format='%Y%m%d', errors='coerce')
+        past = df[(completion_date.dt.year == ANALYSIS_YEAR) & (completion_date.dt.month <= through_month)]
+        signatures = lms_row_keys(past)
+        signatures = signatures + '|' + pd.to_numeric(past['Education Hours'], errors='coerce').astype(str)
+        for col in BACKDATED_VALUE_COLUMNS[1:]:
+            signatures = signatures + '|' + past[col].astype(str).where(past[col].notna(), '')
+        return signatures
+
+    previous_signatures = past_row_signatures(previous_join)
+    current_signatures = past_row_signatures(join_table)
+    added = (~current_signatures.isin(previous_signatures)).sum()
+    removed = (~previous_signatures.isin(current_signatures)).sum()
+    logger.info(f"  - 1~{through_month}월 완료 기록 소급 변경: 추가 {added}행 / 삭제 {removed}행 (변경은 양쪽에 포함)")
+    return int(added + removed)
+
+def calculate_cumulative_hours(df_hong_plan, join_table, previous_directory=None, mode='incremental'):
+    """
+    법인별 1월~기준월 누적 계획 시간과 실제 수강 시간을 계산하는 함수 (4.1 ~ 4.2단계)
+
+    4.1단계 계획 시간은 이전 월 계획도 수정될 수 있으므로 매번 HONG Plan 전체에서 계산한다.
+    4.2단계 실제 수강 시간만 체크포인트에 이후 월 완료 기록을 더하며, 체크포인트가 집계한 월의
+    완료 기록이 이전 월 조인 테이블과 달라졌으면(count_backdated_changes) 전체 재계산한다.
+
+    Args:
+        df_hong_plan: HONG Plan 데이터프레임
+        join_table: HR-LMS 조인 테이블
+        previous_directory (str): 같은 년도 이전 월 파티션 디렉토리 (체크포인트 위치)
+        mode (str): incremental (체크포인트 + 추가된 월) / full (전체 재계산) / verify (둘 다 계산 후 비교)
+
+    Returns:
+        tuple: (4.1단계 결과, 4.2단계 결과) - subsidiary_totals / subsidiary_actual_totals 포함
+    """
+    if mode not in CUMULATIVE_MODES:
+        logger.error(f"✗ 알 수 없는 누적 집계 모드입니다: {mode} (허용: {CUMULATIVE_MODES})")
+        return None, None
+
+    monthly_learning_result = calculate_monthly_learning_hours(df_hong_plan)
+
+    checkpoint = load_checkpoint(previous_directory) if mode != 'full' else None
+    if checkpoint is not None and checkpoint['month'] >= ANALYSIS_MONTH:
+        checkpoint = None
+
+    if mode != 'full':
+        if checkpoint is not None:
+            logger.info(f"누적 집계 체크포인트: {checkpoint['year_month']} ({previous_directory})")
+        else:
+            logger.info("이전 월 누적 집계 체크포인트가 없어 1월부터 전체 계산합니다.")
+
+    if mode == 'incremental' and checkpoint is not None:
+        backdated_changes = count_backdated_changes(join_table, previous_directory, checkpoint['month'])
+        if backdated_changes is None or backdated_changes > 0:
+            logger.info("체크포인트가 집계한 월의 완료 기록이 달라졌거나 확인할 수 없어 1월부터 전체 계산합니다.")
+            checkpoint = None
+
+    if mode != 'incremental' or checkpoint is None:
+        monthly_actual_result = calculate_monthly_actual_hours(join_table)
+        if mode != 'verify' or checkpoint is None or monthly_actual_result is None:
+            return monthly_learning_result, monthly_actual_result
+
+    # 체크포인트 이후 월의 완료 기록만 계산하여 더함
+    since = checkpoint['month']
+    logger.info(f"누적 실제 수강 시간 이월: {checkpoint['year_month']} 누적값 + {since + 1}~{ANALYSIS_MONTH}월 추가분")
+
+    completion_date = pd.to_datetime(join_table['Completion Date'].astype(str).str.replace('.0', ''), format='%Y%m%d', errors='coerce')
+    new_completions = join_table[(completion_date.dt.year == ANALYSIS_YEAR) & (completion_date.dt.month > since)]
+    added_actual = calculate_monthly_actual_hours(new_completions.copy()) if len(new_completions) > 0 else None
+
+    carried_actual = {
+        **(added_actual or {}),
+        'subsidiary_actual_totals': carry_forward(checkpoint['actual'], added_actual['subsidiary_actual_totals'] if added_actual else None),
+    }
+    logger.info(f"✓ 누적 실제 수강 시간 이월 완료: {len(carried_actual['subsidiary_actual_totals'])}개 법인")
+
+    if mode == 'verify':
+        compare_totals("누적 실제 수강 시간", carried_actual['subsidiary_actual_totals'], monthly_actual_result['subsidiary_actual_totals'])
+        return monthly_learning_result, monthly_actual_result
+
+    return monthly_learning_result, carried_actual
+
 def calculate_monthly_completion_rate(monthly_learning_result, monthly_actual_result):
     """
     법인별 누적 이수율을 계산하는 함수 (4.3단계)
@@ -1429,15 +1779,16 @@ def calculate_new_hire_completion_rate(join_table):
         logger.info(f"  - 총 {len(subsidiary_rates)}개 법인 분석 완료")
 
         # 샘플 결과 출력 (상위 5개)
-        logger.info("  - 신입사원 이수 상태 샘플 (5명):")
-        sample_count = 0
-        for emp_no, emp_data in employee_completion.items():
-            if sample_count >= 5:
-                break
-            hire_date_str = emp_data['hire_date'].strftime('%Y-%m-%d') if pd.notna(emp_data['hire_date']) else 'N/A'
-            status_label = {'C': '이수', 'N': '미이수', 'H': '보류'}.get(emp_data['status'], emp_data['status'])
-            logger.info(f"    사번 {emp_no}: {status_label} (입사: {hire_date_str}, 경과: {emp_data['months_since_hire']}개월, 수료: {emp_data['completed_courses']}개)")
-            sample_count += 1
+        if is_diagnostic(logger):
+            logger.debug("  - 신입사원 이수 상태 샘플 (5명):")
+            sample_count = 0
+            for emp_no, emp_data in employee_completion.items():
+                if sample_count >= 5:
+                    break
+                hire_date_str = emp_data['hire_date'].strftime('%Y-%m-%d') if pd.notna(emp_data['hire_date']) else 'N/A'
+                status_label = {'C': '이수', 'N': '미이수', 'H': '보류'}.get(emp_data['status'], emp_data['status'])
+                logger.debug(f"    사번 {emp_no}: {status_label} (입사: {hire_date_str}, 경과: {emp_data['months_since_hire']}개월, 수료: {emp_data['completed_courses']}개)")
+                sample_count += 1
 
         logger.info(f"✓ 5단계 완료: 신입사원 교육 이수율 계산 완료")
 
@@ -1633,25 +1984,26 @@ def calculate_hipo_completion_rate(join_table):
         logger.info(f"    계산: {len(glp_completed_employees)} / {unique_glp_employees} × 100")
 
         # 6.3단계: 이수 상태 샘플
-        logger.info("6.3단계: EIP/GLP 핵심인재 이수 상태 샘플...")
-
-        # EIP 샘플
-        logger.info("  - EIP 핵심인재 이수 상태 샘플 (5명):")
-        sample_count = 0
-        for emp_no, status in eip_completion.items():
-            if sample_count >= 5:
-                break
-            logger.info(f"    사번 {emp_no}: {status}")
-            sample_count += 1
-
-        # GLP 샘플
-        logger.info("  - GLP 핵심인재 이수 상태 샘플 (5명):")
-        sample_count = 0
-        for emp_no, status in glp_completion.items():
-            if sample_count >= 5:
-                break
-            logger.info(f"    사번 {emp_no}: {status}")
-            sample_count += 1
+        if is_diagnostic(logger):
+            logger.debug("6.3단계: EIP/GLP 핵심인재 이수 상태 샘플...")
+
+            # EIP 샘플
+            logger.debug("  - EIP 핵심인재 이수 상태 샘플 (5명):")
+            sample_count = 0
+            for emp_no, status in eip_completion.items():
+                if sample_count >= 5:
+                    break
+                logger.debug(f"    사번 {emp_no}: {status}")
+                sample_count += 1
+
+            # GLP 샘플
+            logger.debug("  - GLP 핵심인재 이수 상태 샘플 (5명):")
+            sample_count = 0
+            for emp_no, status in glp_completion.items():
+                if sample_count >= 5:
+                    break
+                logger.debug(f"    사번 {emp_no}: {status}")
+                sample_count += 1
 
         # 6.4단계: 법인별 EIP, GLP 이수율 분석
         logger.info("6.4단계: 법인별 EIP, GLP 이수율을 분석합니다...")
@@ -1904,13 +2256,14 @@ def calculate_new_leader_completion_rate(join_table):
         logger.info(f"    계산: {len(completed_employees)} / {unique_new_leader_employees} × 100")
 
         # 7.5단계: 이수 상태 샘플
-        logger.info("7.5단계: 신입 팀장 이수 상태 샘플 (최대 10명)...")
-        sample_count = 0
-        for emp_no, status in new_leader_completion.items():
-            if sample_count >= 10:
-                break
-            logger.info(f"  사번 {emp_no}: {status}")
-            sample_count += 1
+        if is_diagnostic(logger):
+            logger.debug("7.5단계: 신입 팀장 이수 상태 샘플 (최대 10명)...")
+            sample_count = 0
+            for emp_no, status in new_leader_completion.items():
+                if sample_count >= 10:
+                    break
+                logger.debug(f"  사번 {emp_no}: {status}")
+                sample_count += 1
 
         # 7.6단계: 법인별 신입 팀장 이수율 분석
         logger.info("7.6단계: 법인별 신입 팀장 이수율을 분석합니다...")
@@ -2095,9 +2448,10 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                         logger.info(f"✓ 4단계 데이터 조인 완료")
 
                         # 4단계 데이터 샘플 출력
-                        logger.info("  - 4단계 데이터 샘플 (3개):")
-                        for i, row in step4_df.head(3).iterrows():
-                            logger.info(f"    {row['Subsidiary']}: 계획 {row['Planned_Hours']:.1f}시간, 실제 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%")
+                        if is_diagnostic(logger):
+                            logger.debug("  - 4단계 데이터 샘플 (3개):")
+                            for i, row in step4_df.head(3).iterrows():
+                                logger.debug(f"    {row['Subsidiary']}: 계획 {row['Planned_Hours']:.1f}시간, 실제 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%")
                     else:
                         logger.warning("✗ 4단계 결과에서 completion_rates 데이터가 없습니다.")
                 else:
@@ -2201,9 +2555,10 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                         logger.info(f"✓ 5단계 데이터 조인 완료")
 
                         # 5단계 데이터 샘플 출력
-                        logger.info("  - 5단계 데이터 샘플 (3개):")
-                        for i, row in step5_df.head(3).iterrows():
-                            logger.info(f"    {row['Subsidiary']}: 이수 {row['New_Hire_Completed']}명, 미이수 {row['New_Hire_Not_Completed']}명, 보류 {row['New_Hire_Pending']}명, 이수율 {row['New_Hire_Completion_Rate']:.2f}%")
+                        if is_diagnostic(logger):
+                            logger.debug("  - 5단계 데이터 샘플 (3개):")
+                            for i, row in step5_df.head(3).iterrows():
+                                logger.debug(f"    {row['Subsidiary']}: 이수 {row['New_Hire_Completed']}명, 미이수 {row['New_Hire_Not_Completed']}명, 보류 {row['New_Hire_Pending']}명, 이수율 {row['New_Hire_Completion_Rate']:.2f}%")
                     else:
                         logger.warning("✗ 5단계 결과에서 subsidiary_completion 데이터가 없습니다.")
                 else:
@@ -2366,9 +2721,10 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                         logger.info(f"✓ 6단계 데이터 조인 완료")
 
                         # 6단계 데이터 샘플 출력
-                        logger.info("  - 6단계 데이터 샘플 (3개):")
-                        for i, row in step6_df.head(3).iterrows():
-                            logger.info(f"    {row['Subsidiary']}: EIP 이수 {row['EIP_Completed']}명/{row['EIP_Total']}명({row['EIP_Completion_Rate']:.2f}%), GLP 이수 {row['GLP_Completed']}명/{row['GLP_Total']}명({row['GLP_Completion_Rate']:.2f}%)")
+                        if is_diagnostic(logger):
+                            logger.debug("  - 6단계 데이터 샘플 (3개):")
+                            for i, row in step6_df.head(3).iterrows():
+                                logger.debug(f"    {row['Subsidiary']}: EIP 이수 {row['EIP_Completed']}명/{row['EIP_Total']}명({row['EIP_Completion_Rate']:.2f}%), GLP 이수 {row['GLP_Completed']}명/{row['GLP_Total']}명({row['GLP_Completion_Rate']:.2f}%)")
                     else:
                         logger.warning("✗ 6단계 결과에서 EIP/GLP 데이터가 없습니다.")
                 else:
@@ -2496,9 +2852,10 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                         logger.info(f"✓ 7단계 데이터 조인 완료")
 
                         # 7단계 데이터 샘플 출력
-                        logger.info("  - 7단계 데이터 샘플 (3개):")
-                        for i, row in step7_df.head(3).iterrows():
-                            logger.info(f"    {row['Subsidiary']}: 신입 팀장 이수 {row['New_Leader_Completed']}명/{row['New_Leader_Total']}명({row['New_Leader_Completion_Rate']:.2f}%)")
+                        if is_diagnostic(logger):
+                            logger.debug("  - 7단계 데이터 샘플 (3개):")
+                            for i, row in step7_df.head(3).iterrows():
+                                logger.debug(f"    {row['Subsidiary']}: 신입 팀장 이수 {row['New_Leader_Completed']}명/{row['New_Leader_Total']}명({row['New_Leader_Completion_Rate']:.2f}%)")
                     else:
                         logger.warning("✗ 7단계 결과에서 신입 팀장 데이터가 없습니다.")
                 else:
@@ -2601,11 +2958,12 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                             logger.info(f"✓ Final Region 조인 완료")
 
                             # Final Region 샘플 데이터 출력
-                            logger.info("  - Final Region 매핑 샘플 (5개):")
-                            sample_data = logic_df[['Subsidiary', 'Final Region']].head(5)
-                            for i, row in sample_data.iterrows():
-                                region = row['Final Region'] if pd.notna(row['Final Region']) else 'null'
-                                logger.info(f"    {row['Subsidiary']}: {region}")
+                            if is_diagnostic(logger):
+                                logger.debug("  - Final Region 매핑 샘플 (5개):")
+                                sample_data = logic_df[['Subsidiary', 'Final Region']].head(5)
+                                for i, row in sample_data.iterrows():
+                                    region = row['Final Region'] if pd.notna(row['Final Region']) else 'null'
+                                    logger.debug(f"    {row['Subsidiary']}: {region}")
 
                         else:
                             logger.warning("✗ hr_index_final.csv에서 'Final Sub.' 또는 'Final Region' 컬럼을 찾을 수 없습니다.")
@@ -2647,6 +3005,7 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                 # CSV 파일로 저장
                 output_path = os.path.join(file_directory, "logic.csv")
                 logic_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+                run_report.set_rows(rows_out=len(logic_df))
 
                 logger.info(f"✓ logic.csv 파일 저장 완료: {output_path}")
                 logger.info(f"✓ 저장된 데이터: {len(logic_df)}행, {len(logic_df.columns)}열")
@@ -2978,16 +3337,17 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
 
                             # Score 분포 출력 (상위 5개, 하위 5개)
                             logger.info("")
-                            logger.info("  - Score 상위 5개 법인:")
-                            top_5 = logic_df.nlargest(5, 'Score')[['Subsidiary', 'Score']]
-                            for idx, row in top_5.iterrows():
-                                logger.info(f"    {row['Subsidiary']}: {row['Score']:.2f}점")
-
-                            logger.info("")
-                            logger.info("  - Score 하위 5개 법인:")
-                            bottom_5 = logic_df.nsmallest(5, 'Score')[['Subsidiary', 'Score']]
-                            for idx, row in bottom_5.iterrows():
-                                logger.info(f"    {row['Subsidiary']}: {row['Score']:.2f}점")
+                            if is_diagnostic(logger):
+                                logger.debug("  - Score 상위 5개 법인:")
+                                top_5 = logic_df.nlargest(5, 'Score')[['Subsidiary', 'Score']]
+                                for idx, row in top_5.iterrows():
+                                    logger.debug(f"    {row['Subsidiary']}: {row['Score']:.2f}점")
+
+                                logger.debug("")
+                                logger.debug("  - Score 하위 5개 법인:")
+                                bottom_5 = logic_df.nsmallest(5, 'Score')[['Subsidiary', 'Score']]
+                                for idx, row in bottom_5.iterrows():
+                                    logger.debug(f"    {row['Subsidiary']}: {row['Score']:.2f}점")
 
                             logger.info("")
                             logger.info(f"✓ 7.3단계 완료: Score 계산 완료")
@@ -2997,6 +3357,7 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                             # 최종 logic.csv 다시 저장
                             logger.info("  - 최종 logic.csv 다시 저장 중...")
                             logic_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+                            run_report.set_rows(rows_out=len(logic_df))
                             logger.info(f"    ✓ 업데이트된 logic.csv 저장 완료: {output_path}")
                             logger.info(f"    ✓ 최종 데이터: {len(logic_df)}행, {len(logic_df.columns)}열")
                         else:
@@ -3009,20 +3370,21 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
                     logger.warning(f"  - 상세 오류: {traceback.format_exc()}")
 
                 # 샘플 데이터 출력
-                logger.info("최종 logic.csv 샘플 데이터:")
-                for i, row in logic_df.head(3).iterrows():
-                    # Final Region 정보 추가
-                    region_info = f", 지역: {row.get('Final Region', '없음')}" if 'Final Region' in logic_df.columns else ""
-
-                    # 6단계 컬럼이 있는지 확인
-                    if 'EIP_Completed' in logic_df.columns:
-                        logger.info(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%, 계획시간 {row['Planned_Hours']:.1f}시간, 수강시간 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%, 신입이수 {row['New_Hire_Completed']}명, 신입미이수 {row['New_Hire_Not_Completed']}명, 신입보류 {row['New_Hire_Pending']}명, 신입전체 {row['New_Hire_Total']}명, 신입이수율 {row['New_Hire_Completion_Rate']:.2f}%, EIP이수 {row['EIP_Completed']}명, EIP미이수 {row['EIP_Not_Completed']}명, EIP전체 {row['EIP_Total']}명, EIP이수율 {row['EIP_Completion_Rate']:.2f}%, GLP이수 {row['GLP_Completed']}명, GLP미이수 {row['GLP_Not_Completed']}명, GLP전체 {row['GLP_Total']}명, GLP이수율 {row['GLP_Completion_Rate']:.2f}%{region_info}")
-                    elif 'New_Hire_Completed' in logic_df.columns:
-                        logger.info(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%, 계획시간 {row['Planned_Hours']:.1f}시간, 수강시간 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%, 신입이수 {row['New_Hire_Completed']}명, 신입미이수 {row['New_Hire_Not_Completed']}명, 신입보류 {row['New_Hire_Pending']}명, 신입전체 {row['New_Hire_Total']}명, 신입이수율 {row['New_Hire_Completion_Rate']:.2f}%{region_info}")
-                    elif 'Planned_Hours' in logic_df.columns:
-                        logger.info(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%, 계획시간 {row['Planned_Hours']:.1f}시간, 수강시간 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%{region_info}")
-                    else:
-                        logger.info(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%{region_info}")
+                if is_diagnostic(logger):
+                    logger.debug("최종 logic.csv 샘플 데이터:")
+                    for i, row in logic_df.head(3).iterrows():
+                        # Final Region 정보 추가
+                        region_info = f", 지역: {row.get('Final Region', '없음')}" if 'Final Region' in logic_df.columns else ""
+
+                        # 6단계 컬럼이 있는지 확인
+                        if 'EIP_Completed' in logic_df.columns:
+                            logger.debug(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%, 계획시간 {row['Planned_Hours']:.1f}시간, 수강시간 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%, 신입이수 {row['New_Hire_Completed']}명, 신입미이수 {row['New_Hire_Not_Completed']}명, 신입보류 {row['New_Hire_Pending']}명, 신입전체 {row['New_Hire_Total']}명, 신입이수율 {row['New_Hire_Completion_Rate']:.2f}%, EIP이수 {row['EIP_Completed']}명, EIP미이수 {row['EIP_Not_Completed']}명, EIP전체 {row['EIP_Total']}명, EIP이수율 {row['EIP_Completion_Rate']:.2f}%, GLP이수 {row['GLP_Completed']}명, GLP미이수 {row['GLP_Not_Completed']}명, GLP전체 {row['GLP_Total']}명, GLP이수율 {row['GLP_Completion_Rate']:.2f}%{region_info}")
+                        elif 'New_Hire_Completed' in logic_df.columns:
+                            logger.debug(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%, 계획시간 {row['Planned_Hours']:.1f}시간, 수강시간 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%, 신입이수 {row['New_Hire_Completed']}명, 신입미이수 {row['New_Hire_Not_Completed']}명, 신입보류 {row['New_Hire_Pending']}명, 신입전체 {row['New_Hire_Total']}명, 신입이수율 {row['New_Hire_Completion_Rate']:.2f}%{region_info}")
+                        elif 'Planned_Hours' in logic_df.columns:
+                            logger.debug(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%, 계획시간 {row['Planned_Hours']:.1f}시간, 수강시간 {row['Actual_Hours']:.1f}시간, 이수율 {row['Hours_Completion_Rate']:.2f}%{region_info}")
+                        else:
+                            logger.debug(f"  {row['Subsidiary']}: 진행중 {row['Planned_Courses']}개, 완료 {row['Completed_Courses']}개, 완료율 {row['Course_Completion_Rate']:.2f}%{region_info}")
 
                 # 8.2단계: 전체 단계 결과 통합 (향후 확장용)
                 logger.info("8.2단계: 전체 단계 결과를 통합합니다...")
@@ -3057,7 +3419,189 @@ def create_final_logic_data(step3_result, step4_result, step5_result, step6_resu
         logger.error(f"✗ 오류 발생: {e}")
         return None
 
-def run_make_logic(file_directory, analysis_year, analysis_month):
+def run_step3(join_table, df_hong_plan):
+    """
+    3단계: LMS 과정등록율 계산 (3.1 이번달 교육계획 → 3.2 완료 과정 → 3.3 완료율)
+
+    Returns:
+        dict: {'completion_rate_result', 'completed_courses_result'} / 실패 시 None
+    """
+    logger.info("3단계: LMS 과정등록율 계산을 위한 과정을 시작합니다...")
+
+    # 3.1단계: 이번달 교육계획 개수 계산
+    current_education_result = calculate_current_education_plans(df_hong_plan)
+    if current_education_result is None:
+        logger.error("✗ 3.1단계 실패")
+        return None
+    logger.info("✓ 3.1단계 완료")
+
+    # 3.2단계: Final Sub.별 완료된 과정 개수 계산
+    completed_courses_result = calculate_completed_courses_by_subsidiary(join_table)
+    if completed_courses_result is None:
+        logger.error("✗ 3.2단계 실패")
+        return None
+    logger.info("✓ 3.2단계 완료")
+
+    # 3.3단계: 완료율 계산
+    completion_rate_result = calculate_completion_rate(current_education_result, completed_courses_result)
+    if completion_rate_result is None:
+        logger.error("✗ 3.3단계 실패")
+        return None
+    logger.info("✓ 3.3단계 완료")
+
+    return {
+        'completion_rate_result': completion_rate_result,
+        'completed_courses_result': completed_courses_result,
+    }
+
+def run_step4(join_table, df_hong_plan, previous_directory, cumulative_mode):
+    """
+    4단계: 법인별 누적 계획 시간 (4.1) / 실제 수강 시간 (4.2) 및 이수율 (4.3) 계산
+    이전 월 체크포인트가 있으면 실제 수강 시간은 추가된 월만 계산한다 (calculate_cumulative_hours 참고).
+
+    Returns:
+        dict: {'monthly_learning_result', 'monthly_actual_result', 'monthly_completion_result'} / 실패 시 None
+    """
+    monthly_learning_result, monthly_actual_result = calculate_cumulative_hours(
+        df_hong_plan, join_table, previous_directory, cumulative_mode
+    )
+    if monthly_learning_result is None:
+        logger.error("✗ 4.1단계 실패")
+        return None
+    logger.info("✓ 4.1단계 완료")
+
+    if monthly_actual_result is None:
+        logger.error("✗ 4.2단계 실패")
+        return None
+    logger.info("✓ 4.2단계 완료")
+
+    # 4.3단계: 법인별 월별 이수율 계산
+    monthly_completion_result = calculate_monthly_completion_rate(monthly_learning_result, monthly_actual_result)
+    if monthly_completion_result is None:
+        logger.error("✗ 4.3단계 실패")
+        return None
+    logger.info("✓ 4.3단계 완료")
+
+    return {
+        'monthly_learning_result': monthly_learning_result,
+        'monthly_actual_result': monthly_actual_result,
+        'monthly_completion_result': monthly_completion_result,
+    }
+
+# 3~7단계 실행 함수 (첫 번째 인자는 조인 테이블)
+LOGIC_STEPS = {
+    'step3': run_step3,                                # LMS 과정등록율
+    'step4': run_step4,                                # Learning Hrs. 이수율
+    'step5': calculate_new_hire_completion_rate,       # 신입사원 교육 이수율
+    'step6': calculate_hipo_completion_rate,           # 핵심인재 교육 이수율
+    'step7': calculate_new_leader_completion_rate,     # 신입 팀장 교육 이수율
+}
+
+# 3~7단계가 조인 테이블에서 읽는 컬럼 (작업 프로세스는 이 컬럼만 pandas로 변환, 단계에서 새 컬럼을 읽으면 함께 추가)
+LOGIC_STEP_COLUMNS = {
+    'step3': ['Course name', 'Completion Date', 'Completion status', 'Final Sub.'],
+    'step4': LMS_ROW_KEY_COLUMNS + BACKDATED_VALUE_COLUMNS,
+    'step5': ['Employee Number', 'Item ID', 'Course name', 'Completion status', 'Hire Date', 'Staff/Operator',
+              'Position', 'Final Sub.', 'New Hire'],
+    'step6': ['Employee Number', 'Completion status', 'Staff/Operator', 'HIPO Type', 'Final Sub.'],
+    'step7': ['Employee Number', 'Item ID', 'Completion status', 'Staff/Operator', 'Final Sub.', 'New Leader'],
+}
+
+# 작업 프로세스에서 메모리 맵으로 연 조인 테이블 (프로세스당 한 번만 열고, 단계마다 필요한 컬럼만 변환)
+_shared_join_table = {}
+
+def _init_step_worker(analysis_year, analysis_month):
+    """작업 프로세스 초기화 (분석 기준 월 전역 변수 설정)"""
+    global ANALYSIS_YEAR, ANALYSIS_MONTH, ANALYSIS_MONTH_STR
+    ANALYSIS_YEAR = analysis_year
+    ANALYSIS_MONTH = analysis_month
+    ANALYSIS_MONTH_STR = f"{ANALYSIS_YEAR}-{ANALYSIS_MONTH:02d}"
+
+def _run_step_in_worker(step, arrow_path, args):
+    """작업 프로세스에서 단계 실행 (조인 테이블은 Arrow 파일을 메모리 맵으로 열어 공유)"""
+    table = _shared_join_table.get(arrow_path)
+    if table is None:
+        # 메모리 맵 테이블은 복사 없이 열리므로 단계가 읽는 컬럼만 pandas로 변환
+        table = pa.ipc.open_file(pa.memory_map(arrow_path, 'r')).read_all()
+        _shared_join_table.clear()
+        _shared_join_table[arrow_path] = table
+    # 단계 측정은 작업 프로세스에서 하고 결과와 함께 부모 프로세스로 전달
+    run_report.begin_worker()
+    with run_report.stage(step):
+        with run_report.stage(f"{step}_load_join_table"):
+            columns = LOGIC_STEP_COLUMNS.get(step)
+            if columns is not None:
+                table = table.select([col for col in table.column_names if col in columns])
+            join_table = table.to_pandas()
+            run_report.set_rows(rows_out=len(join_table))
+        result = LOGIC_STEPS[step](join_table, *args)
+    return result, run_report.take_worker_stages()
+
+def _write_shared_join_table(join_table, arrow_path):
+    """조인 테이블을 비압축 Arrow IPC 파일로 저장 (실패하면 False)"""
+    try:
+        table = pa.Table.from_pandas(join_table, preserve_index=False)
+        with pa.OSFile(arrow_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return True
+    except Exception as e:
+        # 혼합 타입 컬럼 등 Arrow로 변환할 수 없으면 순차 실행
+        logger.warning(f"  - 조인 테이블 Arrow 변환 실패: {e}")
+        if os.path.exists(arrow_path):
+            os.remove(arrow_path)
+        return False
+
+def run_logic_steps(join_table, step_args, file_directory, workers=None):
+    """
+    3~7단계를 프로세스 풀에서 병렬 실행 (8단계에서 결과를 합침)
+
+    조인 테이블은 작업마다 pickle로 전달하지 않고 월 디렉토리의 임시 Arrow 파일을
+    각 작업 프로세스가 메모리 맵으로 한 번 열어 공유하고, 단계별로 LOGIC_STEP_COLUMNS 의 컬럼만 변환한다.
+    pyarrow가 없거나, workers가 1 이하이거나, 병렬 실행에 실패하면 순차 실행한다.
+
+    Args:
+        join_table: HR-LMS 조인 테이블
+        step_args: {단계: 조인 테이블 뒤에 전달할 인자 tuple}
+        file_directory (str): 임시 Arrow 파일을 만들 디렉토리
+        workers (int): 프로세스 수 (None이면 CPU 수와 단계 수 중 작은 값)
+
+    Returns:
+        dict: {단계: 결과}
+    """
+    if workers is None:
+        workers = min(len(step_args), os.cpu_count() or 1)
+
+    if pa is not None and workers > 1:
+        arrow_path = os.path.join(file_directory, SHARED_JOIN_TABLE_FILE)
+        if _write_shared_join_table(join_table, arrow_path):
+            logger.info(f"3~7단계를 {workers}개 프로세스에서 병렬 실행합니다...")
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_step_worker,
+                                         initargs=(ANALYSIS_YEAR, ANALYSIS_MONTH)) as executor:
+                    futures = {
+                        step: executor.submit(_run_step_in_worker, step, arrow_path, args)
+                        for step, args in step_args.items()
+                    }
+                    step_results = {}
+                    for step, future in futures.items():
+                        step_results[step], worker_stages = future.result()
+                        run_report.merge_stages(worker_stages)
+                    return step_results
+            except Exception as e:
+                logger.warning(f"✗ 병렬 실행 실패, 순차 실행으로 대체합니다: {e}")
+            finally:
+                if os.path.exists(arrow_path):
+                    os.remove(arrow_path)
+
+    logger.info("3~7단계를 순차 실행합니다...")
+    step_results = {}
+    for step, args in step_args.items():
+        with run_report.stage(step):
+            step_results[step] = LOGIC_STEPS[step](join_table, *args)
+    return step_results
+
+def run_make_logic(file_directory, analysis_year, analysis_month, incremental=True, cumulative_mode='incremental', workers=None):
     """
     로직 생성 메인 실행 함수
 
@@ -3065,6 +3609,9 @@ def run_make_logic(file_directory, analysis_year, analysis_month):
         file_directory (str): 파일이 있는 디렉토리
         analysis_year (int): 분석 기준 년도
         analysis_month (int): 분석 기준 월
+        incremental (bool): 같은 년도 이전 월 조인 결과 재사용 여부
+        cumulative_mode (str): 누적 집계 모드 (incremental / full / verify, cumulative_checkpoint 참고)
+        workers (int): 3~7단계 병렬 프로세스 수 (None: 자동, 1: 순차 실행)
     """
     # 전역 변수 설정 (모든 함수에서 사용)
     global ANALYSIS_YEAR, ANALYSIS_MONTH, ANALYSIS_MONTH_STR
@@ -3076,7 +3623,10 @@ def run_make_logic(file_directory, analysis_year, analysis_month):
     logger.info(f"분석 기준: {ANALYSIS_YEAR}년 {ANALYSIS_MONTH}월")
 
     # 1단계: 전처리된 파일들 불러오기
-    processed_files = load_processed_files(file_directory)
+    with run_report.stage('load_processed_files', inputs=[os.path.join(file_directory, name) for name in (HR_FINAL_FILE, LMS_FINAL_FILE, HONG_PLAN_FINAL_FILE)]):
+        processed_files = load_processed_files(file_directory)
+        if processed_files is not None:
+            run_report.set_rows(rows_in=sum(len(df) for df in processed_files.values()))
 
     if processed_files is not None:
         logger.info("✓ 로직 생성 준비 완료")
@@ -3085,7 +3635,11 @@ def run_make_logic(file_directory, analysis_year, analysis_month):
         logger.info("2단계: 조인 테이블 생성을 시작합니다...")
 
         # 2단계: HR과 LMS 테이블 조인
-        join_table = create_join_table(processed_files['hr'], processed_files['lms'], file_directory)
+        previous_directory = previous_partition_dir(analysis_year, analysis_month, data_root_of(file_directory))
+        with run_report.stage('create_join_table', outputs=[os.path.join(file_directory, JOIN_TABLE_FILE)]):
+            join_table = create_join_table(processed_files['hr'], processed_files['lms'], file_directory, previous_directory if incremental else None)
+            run_report.set_rows(rows_in=len(processed_files['hr']) + len(processed_files['lms']),
+                                rows_out=len(join_table) if join_table is not None else None)
 
         if join_table is not None:
             logger.info("✓ 2단계 완료")
@@ -3093,81 +3647,68 @@ def run_make_logic(file_directory, analysis_year, analysis_month):
             logger.error("✗ 2단계 실패")
             return False
 
-        # 3단계: LMS 과정등록율 계산을 위한 과정
-        logger.info("3단계: LMS 과정등록율 계산을 위한 과정을 시작합니다...")
-
-        # 3.1단계: 이번달 교육계획 개수 계산
-        current_education_result = calculate_current_education_plans(processed_files['hong_plan'])
-
-        if current_education_result is not None:
-            logger.info("✓ 3.1단계 완료")
-
-            # 3.2단계: Final Sub.별 완료된 과정 개수 계산
-            completed_courses_result = calculate_completed_courses_by_subsidiary(join_table)
+        # 2.8단계: 과정별 집계 테이블 생성 (웹 과정리스트 API 용)
+        with run_report.stage('create_course_aggregates', outputs=[os.path.join(file_directory, COURSE_AGGREGATES_FILE)]):
+            course_aggregates = create_course_aggregates(join_table, file_directory)
+            run_report.set_rows(rows_in=len(join_table), rows_out=len(course_aggregates) if course_aggregates is not None else None)
 
-            if completed_courses_result is not None:
-                logger.info("✓ 3.2단계 완료")
-
-                # 3.3단계: 완료율 계산
-                completion_rate_result = calculate_completion_rate(current_education_result, completed_courses_result)
-
-                if completion_rate_result is not None:
-                    logger.info("✓ 3.3단계 완료")
-                else:
-                    logger.error("✗ 3.3단계 실패")
-                    return False
+        if course_aggregates is not None:
+            logger.info("✓ 2.8단계 완료")
         else:
-            logger.error("✗ 3.1단계 실패")
+            logger.error("✗ 2.8단계 실패")
             return False
 
-        # 4단계: 월별 법인별 Learning Hrs. 계획 시간 계산
-        monthly_learning_result = calculate_monthly_learning_hours(processed_files['hong_plan'])
-
-        if monthly_learning_result is not None:
-            logger.info("✓ 4.1단계 완료")
-
-            # 4.2단계: 법인별 월별 실제 수강 시간 계산
-            monthly_actual_result = calculate_monthly_actual_hours(join_table)
+        # 3~7단계: 조인 테이블 / HONG Plan만 읽는 서로 독립적인 지표 계산 (프로세스 풀 병렬 실행)
+        step_args = {
+            'step3': (processed_files['hong_plan'],),
+            'step4': (processed_files['hong_plan'], previous_directory, cumulative_mode),
+            'step5': (),
+            'step6': (),
+            'step7': (),
+        }
+        with run_report.stage('run_logic_steps'):
+            step_results = run_logic_steps(join_table, step_args, file_directory, workers)
 
-            if monthly_actual_result is not None:
-                logger.info("✓ 4.2단계 완료")
-            else:
-                logger.error("✗ 4.2단계 실패")
-                return False
-        else:
-            logger.error("✗ 4.1단계 실패")
+        step3_result = step_results['step3']
+        if step3_result is None:
+            logger.error("✗ 3단계 실패")
             return False
+        completion_rate_result = step3_result['completion_rate_result']
+        completed_courses_result = step3_result['completed_courses_result']
 
-        # 4.3단계: 법인별 월별 이수율 계산
-        monthly_completion_result = calculate_monthly_completion_rate(monthly_learning_result, monthly_actual_result)
-
-        if monthly_completion_result is not None:
-            logger.info("✓ 4.3단계 완료")
-        else:
-            logger.error("✗ 4.3단계 실패")
+        step4_result = step_results['step4']
+        if step4_result is None:
+            logger.error("✗ 4단계 실패")
             return False
-
-        # 5단계: 신입사원 교육 이수율 계산
-        new_hire_result = calculate_new_hire_completion_rate(join_table)
-
+        monthly_learning_result = step4_result['monthly_learning_result']
+        monthly_actual_result = step4_result['monthly_actual_result']
+        monthly_completion_result = step4_result['monthly_completion_result']
+
+        # 다음 달 실행을 위한 누적 집계 체크포인트 저장
+        with run_report.stage('save_checkpoint', outputs=[os.path.join(file_directory, CHECKPOINT_FILE)]):
+            save_checkpoint(
+                file_directory,
+                ANALYSIS_MONTH_STR,
+                monthly_learning_result['subsidiary_totals'],
+                monthly_actual_result['subsidiary_actual_totals'],
+                completed_courses_result['subsidiary_course_counts']
+            )
+
+        new_hire_result = step_results['step5']
         if new_hire_result is not None:
             logger.info("✓ 5단계 완료")
         else:
             logger.error("✗ 5단계 실패")
             return False
 
-        # 6단계: 핵심인재 교육 이수율 계산
-        hipo_result = calculate_hipo_completion_rate(join_table)
-
+        hipo_result = step_results['step6']
         if hipo_result is not None:
             logger.info("✓ 6단계 완료")
         else:
             logger.error("✗ 6단계 실패")
             return False
 
-        # 7단계: 신입 팀장 교육 이수율 계산
-        new_leader_result = calculate_new_leader_completion_rate(join_table)
-
+        new_leader_result = step_results['step7']
         if new_leader_result is not None:
             logger.info("✓ 7단계 완료")
         else:
@@ -3175,7 +3716,8 @@ def run_make_logic(file_directory, analysis_year, analysis_month):
             return False
 
         # 8단계: 최종 데이터 생성
-        final_result = create_final_logic_data(completion_rate_result, monthly_completion_result, new_hire_result, hipo_result, new_leader_result, file_directory)
+        with run_report.stage('create_final_logic_data', outputs=[os.path.join(file_directory, "logic.csv")]):
+            final_result = create_final_logic_data(completion_rate_result, monthly_completion_result, new_hire_result, hipo_result, new_leader_result, file_directory)
 
         if final_result is not None:
             logger.info("✓ 8단계 완료")
@@ -3183,6 +3725,19 @@ def run_make_logic(file_directory, analysis_year, analysis_month):
             logger.error("✗ 8단계 실패")
             return False
 
+        # 9단계: KPI 지표 큐브 생성 (웹 지역 / Global 지표 용)
+        with run_report.stage('create_logic_cube', outputs=[os.path.join(file_directory, LOGIC_CUBE_FILE)]):
+            logic_cube = create_logic_cube(file_directory)
+            run_report.set_rows(rows_out=len(logic_cube) if logic_cube is not None else None)
+
+        if logic_cube is not None:
+            logger.info("✓ 9단계 완료")
+        else:
+            logger.error("✗ 9단계 실패")
+            return False
+
+        # 10단계(월 누적 시계열 갱신)는 스냅샷 발행 후 main.py 에서 실행 (update_logic_timeseries)
+
         logger.info("=== 로직 생성 시스템 완료 ===")
         return True
     else:
@@ -3193,7 +3748,7 @@ if __name__ == "__main__":
     # 직접 실행 시 기본값 사용
     default_year = 2025
     default_month = 8
-    default_directory = f"data/{default_month}"
+    default_directory = partition_dir(default_year, default_month)
 
     print(f"직접 실행 모드: {default_year}년 {default_month}월 데이터 분석")
     success = run_make_logic(default_directory, default_year, default_month)
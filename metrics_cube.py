@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KPI 지표 큐브 모듈
+logic.csv(법인 단위)의 합산 가능한 값만 (년월, Final Region, Final Sub.) 단위 큐브로 저장하고,
+지역 / Global 등 어떤 단위의 비율이든 큐브를 합산한 뒤 derive_rates 한 곳에서 계산합니다.
+파이프라인(make_logic)과 웹(data_cache, 라우트)이 같은 모듈을 사용하므로 모든 화면의 비율이 일치합니다.
+"""
+
+import pandas as pd
+
+# 큐브 파일명 (logic.csv 와 같은 월 디렉토리)
+LOGIC_CUBE_FILE = "logic_cube.csv"
+
+# 월 누적 시계열 파일명 (data 루트 디렉토리, 파이프라인 실행마다 해당 년월 행 교체)
+LOGIC_TIMESERIES_FILE = "logic_timeseries.csv"
+
+# 큐브 차원
+CUBE_DIMENSIONS = ['Year_Month', 'Final Region', 'Final Sub.']
+
+# logic.csv 에서 그대로 합산하는 값
+SUM_COLUMNS = [
+    'Planned_Courses', 'Completed_Courses', 'Planned_Hours', 'Actual_Hours',
+    'New_Hire_Completed', 'New_Hire_Not_Completed', 'New_Hire_Pending', 'New_Hire_Total',
+    'EIP_Completed', 'EIP_Not_Completed', 'EIP_Total',
+    'GLP_Completed', 'GLP_Not_Completed', 'GLP_Total',
+    'New_Leader_Completed', 'New_Leader_Not_Completed', 'New_Leader_Total'
+]
+
+# Y/N 컬럼 {logic.csv 컬럼: 큐브의 Y 개수 컬럼}
+FLAG_COLUMNS = {
+    'JAM Member': 'JAM_Member_Y',
+    'Annual Plan Setup': 'Annual_Plan_Setup_Y',
+    'New LMS Course': 'New_LMS_Course_Y',
+    'LMS Mission': 'LMS_Mission_Y',
+    'Global L&D Council': 'Global_LD_Council_Y',
+    'Infra index response': 'Infra_Index_Response_Y',
+}
+
+# 법인 수 / Score 평균 계산용 값
+SUBSIDIARY_COUNT = 'Subsidiary_Count'
+SCORE_SUM = 'Score_Sum'
+SCORE_COUNT = 'Score_Count'
+
+CUBE_MEASURES = SUM_COLUMNS + list(FLAG_COLUMNS.values()) + [SUBSIDIARY_COUNT, SCORE_SUM, SCORE_COUNT]
+
+# 시계열에 함께 저장하는 법인 단위 logic.csv 비율 (100% 제한이 적용된 값 그대로)
+SUBSIDIARY_RATE_COLUMNS = [
+    'Course_Completion_Rate', 'Hours_Completion_Rate', 'New_Hire_Completion_Rate',
+    'EIP_Completion_Rate', 'GLP_Completion_Rate', 'New_Leader_Completion_Rate', 'Score'
+]
+
+# 비율 공식 {비율 컬럼: (분자 컬럼 목록, 분모 컬럼)} - 분모가 0이면 0
+RATE_FORMULAS = {
+    'Course_Completion_Rate': (['Completed_Courses'], 'Planned_Courses'),
+    'Hours_Completion_Rate': (['Actual_Hours'], 'Planned_Hours'),
+    'New_Hire_Completion_Rate': (['New_Hire_Completed', 'New_Hire_Pending'], 'New_Hire_Total'),
+    'EIP_Completion_Rate': (['EIP_Completed'], 'EIP_Total'),
+    'GLP_Completion_Rate': (['GLP_Completed'], 'GLP_Total'),
+    'New_Leader_Completion_Rate': (['New_Leader_Completed'], 'New_Leader_Total'),
+    # Y/N 비율: Y 법인 수 / 전체 법인 수
+    'JAM_Member_Rate': (['JAM_Member_Y'], SUBSIDIARY_COUNT),
+    'Annual_Plan_Setup_Rate': (['Annual_Plan_Setup_Y'], SUBSIDIARY_COUNT),
+    'New_LMS_Course_Rate': (['New_LMS_Course_Y'], SUBSIDIARY_COUNT),
+    'LMS_Mission_Rate': (['LMS_Mission_Y'], SUBSIDIARY_COUNT),
+    'Global_LD_Council_Rate': (['Global_LD_Council_Y'], SUBSIDIARY_COUNT),
+    'Infra_Index_Response_Rate': (['Infra_Index_Response_Y'], SUBSIDIARY_COUNT),
+}
+
+
+def build_logic_cube(logic_df, year_month=None):
+    """
+    logic.csv(법인 단위)에서 지표 큐브 생성
+
+    Args:
+        logic_df: logic.csv DataFrame ('Subsidiary', 'Final Region' 컬럼)
+        year_month: 분석 기준 년월 (예: '2025-09')
+
+    Returns:
+        DataFrame: CUBE_DIMENSIONS + CUBE_MEASURES 컬럼의 큐브
+    """
+    region = logic_df['Final Region'] if 'Final Region' in logic_df.columns else None
+    cube = pd.DataFrame({
+        'Year_Month': year_month,
+        'Final Region': region,
+        'Final Sub.': logic_df['Subsidiary'],
+    }, index=logic_df.index)
+
+    # 없는 컬럼은 0
+    for col in SUM_COLUMNS:
+        cube[col] = logic_df[col].fillna(0) if col in logic_df.columns else 0
+
+    for source, col in FLAG_COLUMNS.items():
+        if source in logic_df.columns:
+            cube[col] = (logic_df[source].astype(str).str.upper() == 'Y').astype(int)
+        else:
+            cube[col] = 0
+
+    cube[SUBSIDIARY_COUNT] = 1
+    if 'Score' in logic_df.columns:
+        cube[SCORE_SUM] = logic_df['Score'].fillna(0)
+        cube[SCORE_COUNT] = logic_df['Score'].notna().astype(int)
+    else:
+        cube[SCORE_SUM] = 0
+        cube[SCORE_COUNT] = 0
+
+    return cube.groupby(CUBE_DIMENSIONS, dropna=False, sort=False)[CUBE_MEASURES].sum().reset_index()
+
+
+def rollup(cube, by=None):
+    """
+    큐브 합산
+
+    Args:
+        cube: 지표 큐브 DataFrame
+        by: 그룹 컬럼 (None 이면 전체 합계 Series)
+
+    Returns:
+        by 지정 시 그룹별 합계 DataFrame (결측 그룹 제외), 아니면 합계 Series
+    """
+    if by is None:
+        return cube[CUBE_MEASURES].sum()
+    return cube.groupby(by)[CUBE_MEASURES].sum()
+
+
+def derive_rates(totals, decimals=2):
+    """
+    합계 값에서 비율과 Score 평균 계산 (모든 집계 단위 공통 공식)
+
+    Args:
+        totals: 큐브 합계 (dict 또는 Series)
+        decimals: 반올림 자릿수
+
+    Returns:
+        dict: {비율 컬럼: 값, 'Score': 평균} - 분모가 0이면 0
+    """
+    rates = {}
+    for rate, (numerators, denominator) in RATE_FORMULAS.items():
+        if totals[denominator] > 0:
+            rates[rate] = round(sum(totals[col] for col in numerators) / totals[denominator] * 100, decimals)
+        else:
+            rates[rate] = 0
+
+    if totals[SCORE_COUNT] > 0:
+        rates['Score'] = round(totals[SCORE_SUM] / totals[SCORE_COUNT], decimals)
+    else:
+        rates['Score'] = 0
+    return rates
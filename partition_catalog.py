@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+년/월 파티션 카탈로그 모듈
+파이프라인 결과를 data/year=YYYY/month=MM 디렉토리에 저장하고,
+발행된 파티션 목록을 data/catalog.json 에 기록합니다.
+웹 서버와 파이프라인은 월 폴더 12개를 탐색하지 않고 카탈로그에서 파티션을 찾습니다.
+
+카탈로그 구조:
+    {
+        "partitions": [
+            {"year": 2025, "month": 9, "path": "year=2025/month=09", "snapshot": "...", "updated_at": "..."}
+        ]
+    }
+"""
+
+import os
+import json
+import shutil
+from datetime import datetime
+
+# 데이터 루트 / 카탈로그 파일명
+DATA_ROOT = "data"
+CATALOG_FILE = "catalog.json"
+
+
+def partition_path(year, month):
+    """파티션 상대 경로 (데이터 루트 기준)"""
+    return f"year={year}/month={month:02d}"
+
+
+def partition_dir(year, month, data_root=DATA_ROOT):
+    """파티션 디렉토리 경로"""
+    return os.path.join(data_root, f"year={year}", f"month={month:02d}")
+
+
+def data_root_of(file_directory):
+    """월 작업 디렉토리의 데이터 루트 (파티션 / 이전 data/<월> 구조 모두 지원)"""
+    directory = os.path.normpath(file_directory)
+    if os.path.basename(directory).startswith("month="):
+        directory = os.path.dirname(directory)
+    return os.path.dirname(directory)
+
+
+def read_catalog(data_root=DATA_ROOT):
+    """
+    카탈로그의 파티션 목록 반환 ((년, 월) 정렬)
+
+    Returns:
+        list: 파티션 dict 목록 / 카탈로그가 없으면 None
+    """
+    catalog_path = os.path.join(data_root, CATALOG_FILE)
+    try:
+        with open(catalog_path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+    except FileNotFoundError:
+        return None
+    return sorted(catalog.get('partitions', []), key=lambda p: (p['year'], p['month']))
+
+
+def latest_partitions(partitions):
+    """월별 최신 년도 파티션 {월: 파티션} (대시보드의 월 선택은 최근 12개월 기준)"""
+    latest = {}
+    for partition in partitions or []:
+        current = latest.get(partition['month'])
+        if current is None or partition['year'] > current['year']:
+            latest[partition['month']] = partition
+    return latest
+
+
+def previous_partition_dir(year, month, data_root=DATA_ROOT):
+    """
+    같은 년도에서 해당 월 직전에 등록된 파티션 디렉토리 (없으면 None)
+    LMS 원본은 연초부터의 누적 자료이므로 이전 년도 파티션은 사용하지 않는다.
+    """
+    earlier = [
+        p for p in (read_catalog(data_root) or [])
+        if p['year'] == year and p['month'] < month
+    ]
+    if not earlier:
+        return None
+    return partition_dir(year, earlier[-1]['month'], data_root)
+
+
+def register_partition(year, month, data_root=DATA_ROOT, **info):
+    """
+    파티션을 카탈로그에 등록 (같은 년월은 교체, 임시 파일 작성 후 원자적 교체)
+
+    Args:
+        year, month: 파티션 년월
+        data_root: 데이터 루트
+        info: 함께 기록할 값 (예: snapshot 버전)
+
+    Returns:
+        dict: 등록된 파티션
+    """
+    partitions = [
+        p for p in (read_catalog(data_root) or [])
+        if (p['year'], p['month']) != (year, month)
+    ]
+    partition = {
+        'year': year,
+        'month': month,
+        'path': partition_path(year, month),
+        **info,
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    partitions.append(partition)
+    partitions.sort(key=lambda p: (p['year'], p['month']))
+
+    os.makedirs(data_root, exist_ok=True)
+    catalog_path = os.path.join(data_root, CATALOG_FILE)
+    tmp_path = f"{catalog_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'partitions': partitions}, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, catalog_path)
+    return partition
+
+
+def migrate_legacy_months(year, data_root=DATA_ROOT):
+    """
+    이전 data/<월> 폴더를 data/year=<년>/month=<MM> 으로 옮기고 카탈로그에 등록
+
+    Args:
+        year: 기존 월 폴더의 데이터 년도
+
+    Returns:
+        list: 옮긴 월 목록
+    """
+    moved = []
+    for month in range(1, 13):
+        legacy_dir = os.path.join(data_root, str(month))
+        if not os.path.isdir(legacy_dir):
+            continue
+        target_dir = partition_dir(year, month, data_root)
+        if os.path.exists(target_dir):
+            print(f"건너뜀 (이미 존재): {target_dir}")
+            continue
+        os.makedirs(os.path.dirname(target_dir), exist_ok=True)
+        shutil.move(legacy_dir, target_dir)
+        register_partition(year, month, data_root, migrated_from=legacy_dir)
+        moved.append(month)
+        print(f"이동 완료: {legacy_dir} → {target_dir}")
+    return moved
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 3 or sys.argv[1] != "migrate":
+        print("사용법: python partition_catalog.py migrate <기존 월 폴더의 년도>")
+        sys.exit(1)
+    migrate_legacy_months(int(sys.argv[2]))
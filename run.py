@@ -47,6 +47,11 @@ with app.app_context():
 # Apply all changes
 Migrate(app, db)
 
+# 파이프라인이 새 스냅샷을 발행하면 해당 월 캐시만 백그라운드에서 갱신
+# (gunicorn preload_app 사용 시에는 gunicorn-cfg.py의 post_fork에서 워커별로 시작)
+if os.getenv('DATA_WATCHER_POST_FORK') != '1':
+    data_cache.start_snapshot_watcher()
+
 if not DEBUG:
     Minify(app=app, html=True, js=False, cssless=False)
 
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 실행 리포트 모듈
+main.main() / run_make_logic() 의 각 단계에 대해 경과 시간, CPU 시간, 최대 RSS, tracemalloc 피크,
+입력 / 출력 행 수, 입력 / 출력 파일 크기를 기록하여 월 파티션의 run_reports/ 에 JSON 으로 저장하고,
+최근 N 회 실행을 비교하여 느려지거나 메모리를 더 쓰게 된 단계를 표시합니다.
+
+측정 방식:
+    - 최대 RSS: Linux 는 단계 시작 시 /proc/self/clear_refs 로 최고치를 초기화하여 단계별 피크를 기록
+      (지원하지 않는 환경에서는 프로세스 시작 이후 최고치, memory.rss_scope = 'process')
+    - tracemalloc 피크: Python / numpy 할당 피크 (main.RUN_REPORT_TRACEMALLOC = True 일 때만 기록, 추적 비용으로 실행이 수 배 느려짐)
+    - 상위 단계의 피크는 하위 단계의 피크를 포함
+    - 3~7단계를 프로세스 풀에서 실행하면 각 단계는 작업 프로세스에서 측정되어 합쳐짐 (process = 'worker')
+
+리포트 구조 (data/year=YYYY/month=MM/run_reports/run_<run_id>.json):
+    {
+        "run_id": "20251005093000", "analysis": "2025-09", "success": true, "settings": {...},
+        "memory": {"tracemalloc": false, "rss_scope": "stage"},
+        "stages": [
+            {"name": "main", "parent": null, "wall_s": 25.1, "cpu_s": 24.8, "rss_peak_mb": 412.0, "py_peak_mb": null, ...},
+            {"name": "run_hr_preprocessing", "parent": "main", "rows_in": 41235, "rows_out": 40980,
+             "inputs": {"hr_index.xlsx": 5123456}, "outputs": {"hr_index_final.csv": 8123456}, ...}
+        ]
+    }
+
+사용법 (최근 실행 비교):
+    python run_report.py --last 5
+    python run_report.py --last 10 --directory data/year=2025/month=09 --threshold 0.2
+"""
+
+import argparse
+import functools
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from logger_config import get_default_logger
+from partition_catalog import DATA_ROOT
+
+# resource 는 Unix 전용 (Windows 에서는 /proc 도 없으므로 RSS 를 기록하지 않음)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# 로거 설정
+logger = get_default_logger(__name__)
+
+# 리포트 디렉토리 (월 파티션 아래) / 보관 개수
+RUN_REPORT_DIR = "run_reports"
+KEEP_RUN_REPORTS = 30
+
+# 리포트 형식 버전
+REPORT_VERSION = 1
+
+# 전체 실행을 나타내는 최상위 단계
+ROOT_STAGE = "main"
+
+# 비교 기준: 이전 실행 중앙값 대비 증가 비율 / 이보다 작은 증가는 측정 잡음으로 봄
+DEFAULT_THRESHOLD = 0.20
+MIN_REGRESSION_SECONDS = 0.5
+MIN_REGRESSION_MB = 20.0
+
+# Linux 단계별 최대 RSS (VmHWM 초기화)
+PROC_STATUS = "/proc/self/status"
+PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def _read_peak_rss_kb():
+    """현재 최대 RSS (KB, 측정할 수 없으면 None)"""
+    try:
+        with open(PROC_STATUS, 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 byte 단위
+    return max_rss // 1024 if sys.platform == 'darwin' else max_rss
+
+
+def _reset_peak_rss():
+    """최대 RSS 를 현재 RSS 로 초기화 (Linux 4.0+, 실패하면 False)"""
+    try:
+        with open(PROC_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _children_cpu_seconds():
+    """종료된 자식 프로세스의 CPU 시간 합계 (프로세스 풀 작업 프로세스)"""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _file_sizes(paths):
+    """{파일명: byte} (없는 파일은 None)"""
+    return {
+        os.path.basename(path): (os.path.getsize(path) if os.path.exists(path) else None)
+        for path in paths
+    }
+
+
+def _mb(value, unit):
+    return None if value is None else round(value / unit, 1)
+
+
+class RunReport:
+    """
+    파이프라인 단계 측정 기록기
+
+    start() 로 실행을 시작하면 stage() 로 감싼 구간마다 측정값을 기록하고, finish() 에서 리포트를 저장한다.
+    start() 전에는 stage() / set_rows() 가 아무것도 하지 않으므로 run_make_logic 을 단독 실행해도 된다.
+    같은 이름의 단계가 여러 번 실행되면 호출 수와 시간은 합산하고 피크는 최댓값을 남긴다.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.file_directory = None
+        self.stages = {}
+        self._stack = []
+        self._info = {}
+        self._trace_memory = False
+        self._started_tracemalloc = False
+        self._rss_resettable = False
+
+    # ==================== 실행 ====================
+
+    def start(self, file_directory, analysis_year, analysis_month, trace_memory=True, settings=None):
+        """실행 시작 (최상위 단계 main 시작)"""
+        self.active = True
+        self.file_directory = file_directory
+        self.stages = {}
+        self._stack = []
+        self._trace_memory = trace_memory
+        self._started_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        self._rss_resettable = _reset_peak_rss()
+
+        started_at = datetime.now()
+        self._info = {
+            'version': REPORT_VERSION,
+            'run_id': started_at.strftime('%Y%m%d%H%M%S'),
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'analysis': f"{analysis_year}-{analysis_month:02d}",
+            'file_directory': file_directory,
+            'settings': settings or {},
+            'host': {'python': sys.version.split()[0], 'cpu_count': os.cpu_count(), 'platform': sys.platform},
+            'memory': {'tracemalloc': trace_memory, 'rss_scope': 'stage' if self._rss_resettable else 'process'},
+        }
+        self._enter(ROOT_STAGE, ())
+
+    def finish(self, success):
+        """
+        실행 종료: 리포트 저장 후 오래된 리포트 정리
+
+        Returns:
+            str: 저장된 리포트 경로 (시작하지 않았거나 저장에 실패하면 None)
+        """
+        if not self.active:
+            return None
+        while self._stack:
+            self._exit()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        self.active = False
+
+        report = {
+            **self._info,
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'success': bool(success),
+            'stages': list(self.stages.values()),
+        }
+        try:
+            path = save_report(report, self.file_directory)
+        except OSError as e:
+            logger.warning(f"✗ 실행 리포트 저장 실패: {e}")
+            return None
+        root = self.stages[ROOT_STAGE]
+        logger.info(f"✓ 실행 리포트 저장: {path} (전체 {root['wall_s']:.1f}초, 최대 RSS {root['rss_peak_mb']}MB)")
+        return path
+
+    # ==================== 단계 ====================
+
+    @contextmanager
+    def stage(self, name, inputs=(), outputs=()):
+        """
+        단계 측정 구간
+
+        Args:
+            name (str): 단계 이름 (보통 함수 이름)
+            inputs: 단계 시작 시 크기를 기록할 입력 파일 경로
+            outputs: 단계 종료 시 크기를 기록할 출력 파일 경로
+        """
+        if not self.active:
+            yield
+            return
+        self._enter(name, inputs)
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self._exit(outputs, error)
+
+    def wrap(self, name, func):
+        """함수를 단계로 측정하는 래퍼 (모듈 전역 함수 교체용, benchmarks.pipeline_bench 참고)"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def set_rows(self, rows_in=None, rows_out=None):
+        """현재 단계의 입력 / 출력 행 수 기록 (None 은 기존 값 유지)"""
+        if not self.active or not self._stack:
+            return
+        frame = self._stack[-1]
+        if rows_in is not None:
+            frame['rows_in'] = int(rows_in)
+        if rows_out is not None:
+            frame['rows_out'] = int(rows_out)
+
+    def current_stage(self):
+        return self._stack[-1]['name'] if self._stack else None
+
+    # ==================== 작업 프로세스 ====================
+
+    def begin_worker(self):
+        """프로세스 풀 작업 프로세스에서 단계 실행 전 호출 (fork 로 복사된 부모 기록 제거)"""
+        self.stages = {}
+        self._stack = []
+        if self.active:
+            self._rss_resettable = _reset_peak_rss()
+
+    def take_worker_stages(self):
+        """작업 프로세스에서 기록한 단계 목록 (부모 프로세스의 merge_stages 로 전달)"""
+        stages = list(self.stages.values())
+        self.stages = {}
+        for stage in stages:
+            stage['process'] = 'worker'
+        return stages
+
+    def merge_stages(self, stages):
+        """작업 프로세스의 단계 기록을 현재 단계 아래에 합침"""
+        if not self.active:
+            return
+        parent = self.current_stage()
+        for stage in stages:
+            if stage['parent'] is None:
+                stage['parent'] = parent
+            self.stages[stage['name']] = stage
+
+    # ==================== 측정 ====================
+
+    def _enter(self, name, inputs):
+        # 상위 단계의 피크를 보존한 뒤 이 단계 기준으로 피크 초기화
+        if self._stack:
+            parent = self._stack[-1]
+            parent['child_rss_kb'] = max(parent['child_rss_kb'], _read_peak_rss_kb() or 0)
+            if self._trace_memory:
+                parent['child_py_bytes'] = max(parent['child_py_bytes'], tracemalloc.get_traced_memory()[1])
+        if self._rss_resettable:
+            _reset_peak_rss()
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+
+        self._stack.append({
+            'name': name,
+            'parent': self._stack[-1]['name'] if self._stack else None,
+            'inputs': _file_sizes(inputs),
+            'rows_in': None,
+            'rows_out': None,
+            'child_rss_kb': 0,
+            'child_py_bytes': 0,
+            'wall': time.perf_counter(),
+            'cpu': time.process_time(),
+            'cpu_children': _children_cpu_seconds(),
+        })
+
+    def _exit(self, outputs=(), error=None):
+        frame = self._stack.pop()
+        wall = time.perf_counter() - frame['wall']
+        cpu = time.process_time() - frame['cpu']
+        cpu_children = _children_cpu_seconds() - frame['cpu_children']
+
+        rss_kb = max(_read_peak_rss_kb() or 0, frame['child_rss_kb']) or None
+        py_bytes = None
+        if self._trace_memory:
+            py_bytes = max(tracemalloc.get_traced_memory()[1], frame['child_py_bytes'])
+        if self._stack:
+            parent = self._stack[-1]
+            parent['child_rss_kb'] = max(parent['child_rss_kb'], rss_kb or 0)
+            parent['child_py_bytes'] = max(parent['child_py_bytes'], py_bytes or 0)
+        if self._rss_resettable:
+            _reset_peak_rss()
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+
+        record = self.stages.get(frame['name'])
+        if record is None:
+            record = self.stages[frame['name']] = {
+                'name': frame['name'],
+                'parent': frame['parent'],
+                'process': 'main',
+                'calls': 0,
+                'wall_s': 0.0,
+                'cpu_s': 0.0,
+                'cpu_children_s': 0.0,
+                'rss_peak_mb': None,
+                'py_peak_mb': None,
+                'rows_in': None,
+                'rows_out': None,
+                'inputs': {},
+                'outputs': {},
+                'error': None,
+            }
+        record['calls'] += 1
+        record['wall_s'] = round(record['wall_s'] + wall, 3)
+        record['cpu_s'] = round(record['cpu_s'] + cpu, 3)
+        record['cpu_children_s'] = round(record['cpu_children_s'] + cpu_children, 3)
+        for key, value in (('rss_peak_mb', _mb(rss_kb, 1024)), ('py_peak_mb', _mb(py_bytes, 1024 * 1024))):
+            if value is not None:
+                record[key] = max(record[key] or 0, value)
+        for key in ('rows_in', 'rows_out'):
+            if frame[key] is not None:
+                record[key] = (record[key] or 0) + frame[key]
+        record['inputs'].update(frame['inputs'])
+        record['outputs'].update(_file_sizes(outputs))
+        if error is not None:
+            record['error'] = error
+
+
+# ==================== 리포트 파일 ====================
+
+def save_report(report, file_directory, keep=KEEP_RUN_REPORTS):
+    """리포트 저장 (임시 파일 작성 후 원자적 교체) 및 최근 keep 개만 보관"""
+    report_dir = os.path.join(file_directory, RUN_REPORT_DIR)
+    os.makedirs(report_dir, exist_ok=True)
+    path = os.path.join(report_dir, f"run_{report['run_id']}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    for old_path in sorted(glob.glob(os.path.join(report_dir, "run_*.json")))[:-keep]:
+        os.remove(old_path)
+    return path
+
+
+def load_reports(directory=None, last=None, data_root=DATA_ROOT):
+    """
+    저장된 리포트 (실행 순서)
+
+    Args:
+        directory: 월 파티션 디렉토리 (None 이면 데이터 루트 아래 모든 파티션)
+        last (int): 최근 몇 개만 반환할지
+
+    Returns:
+        list: 리포트 dict 목록
+    """
+    if directory:
+        pattern = os.path.join(directory, RUN_REPORT_DIR, "run_*.json")
+    else:
+        pattern = os.path.join(data_root, "**", RUN_REPORT_DIR, "run_*.json")
+    reports = []
+    for path in glob.glob(pattern, recursive=True):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"✗ 리포트를 읽을 수 없습니다: {path} ({e})")
+            continue
+        report['path'] = path
+        reports.append(report)
+    reports.sort(key=lambda r: (r['run_id'], r['analysis']))
+    return reports[-last:] if last else reports
+
+
+def stage_tree(report):
+    """단계를 호출 트리 순서로 [(깊이, 단계)] 반환 (기록은 종료 순서)"""
+    children = {}
+    for order, stage in enumerate(report['stages']):
+        children.setdefault(stage['parent'], []).append((order, stage))
+
+    def walk(parent, depth):
+        for _, stage in sorted(children.get(parent, []), key=lambda item: item[0]):
+            yield depth, stage
+            yield from walk(stage['name'], depth + 1)
+
+    return list(walk(None, 0))
+
+
+def find_regressions(reports, threshold=DEFAULT_THRESHOLD):
+    """
+    마지막 실행을 이전 성공 실행들의 중앙값과 비교
+    (tracemalloc 은 경과 시간을 크게 늘리므로 tracemalloc 설정이 같은 실행끼리만 비교)
+
+    Returns:
+        list: [{'stage', 'metric', 'baseline', 'current', 'change'}]
+    """
+    latest = reports[-1]
+    previous = [r for r in reports[:-1] if r['success'] and r['memory']['tracemalloc'] == latest['memory']['tracemalloc']]
+    if not previous:
+        return []
+
+    regressions = []
+    for _, stage in stage_tree(latest):
+        for metric, minimum in (('wall_s', MIN_REGRESSION_SECONDS), ('rss_peak_mb', MIN_REGRESSION_MB), ('py_peak_mb', MIN_REGRESSION_MB)):
+            current = stage.get(metric)
+            history = [s[metric] for r in previous for s in r['stages'] if s['name'] == stage['name'] and s.get(metric) is not None]
+            if current is None or not history:
+                continue
+            baseline = statistics.median(history)
+            if current - baseline > minimum and current > baseline * (1 + threshold):
+                regressions.append({
+                    'stage': stage['name'],
+                    'metric': metric,
+                    'baseline': baseline,
+                    'current': current,
+                    'change': current / baseline - 1 if baseline else None,
+                })
+    return regressions
+
+
+def print_comparison(reports, regressions):
+    """단계별 경과 시간 / 최대 RSS 를 실행별로 나란히 출력 (회귀는 ▲ 표시)"""
+    latest = reports[-1]
+    regressed = {(r['stage'], r['metric']) for r in regressions}
+
+    print("실행: " + ', '.join(
+        f"[{i + 1}] {r['run_id']} {r['analysis']}{'' if r['success'] else ' (실패)'}" for i, r in enumerate(reports)
+    ))
+    for metric, title in (('wall_s', '경과 시간 (초)'), ('rss_peak_mb', '최대 RSS (MB)'), ('py_peak_mb', 'tracemalloc 피크 (MB)')):
+        print(f"\n{title}")
+        print(f"{'단계':<48}" + ''.join(f"{f'[{i + 1}]':>10}" for i in range(len(reports))))
+        for depth, stage in stage_tree(latest):
+            values = []
+            for report in reports:
+                match = next((s for s in report['stages'] if s['name'] == stage['name']), None)
+                value = match.get(metric) if match else None
+                values.append('-' if value is None else f"{value:.2f}" if metric == 'wall_s' else f"{value:.1f}")
+            marker = '  ▲' if (stage['name'], metric) in regressed else ''
+            print(f"{'  ' * depth + stage['name']:<48}" + ''.join(f"{v:>10}" for v in values) + marker)
+
+    print("\n마지막 실행 입력 / 출력")
+    for depth, stage in stage_tree(latest):
+        rows = f"{stage['rows_in'] if stage['rows_in'] is not None else '-'} → {stage['rows_out'] if stage['rows_out'] is not None else '-'}"
+        files = ', '.join(
+            f"{name} {size / 1024 / 1024:.1f}MB" for name, size in {**stage['inputs'], **stage['outputs']}.items() if size is not None
+        )
+        print(f"{'  ' * depth + stage['name']:<48} 행 {rows:<20} {files}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="최근 파이프라인 실행 리포트 비교 (느려진 단계 표시)")
+    parser.add_argument('--last', type=int, default=5, help="비교할 최근 실행 수 (기본값 5)")
+    parser.add_argument('--directory', default=None, help="월 파티션 디렉토리 (기본값: 모든 파티션)")
+    parser.add_argument('--data-root', default=DATA_ROOT, help="데이터 루트 (기본값: data)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="회귀로 볼 증가 비율 (기본값 0.20)")
+    args = parser.parse_args(argv)
+
+    reports = load_reports(args.directory, args.last, args.data_root)
+    if not reports:
+        print("저장된 실행 리포트가 없습니다.")
+        return 1
+
+    regressions = find_regressions(reports, args.threshold)
+    print_comparison(reports, regressions)
+
+    if len(reports) < 2:
+        print("\n비교할 이전 실행이 없습니다.")
+        return 0
+    if regressions:
+        print(f"\n✗ 이전 실행 중앙값 대비 {args.threshold:.0%} 이상 증가한 단계:")
+        for r in regressions:
+            print(f"  - {r['stage']} {r['metric']}: {r['baseline']:.2f} → {r['current']:.2f} ({r['change']:+.1%})")
+        return 1
+    print("\n✓ 회귀 없음")
+    return 0
+
+
+# 전역 인스턴스 생성
+run_report = RunReport()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
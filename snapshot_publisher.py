@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+월별 결과 스냅샷 발행 모듈
+파이프라인 결과 CSV를 버전별 스냅샷 디렉토리로 복사한 뒤
+CURRENT 포인터 파일을 원자적으로 교체하여 웹 서버에 공개합니다.
+"""
+
+import os
+import shutil
+import pandas as pd
+from datetime import datetime
+from logger_config import get_default_logger
+
+# pyarrow는 선택 의존성: 없으면 CSV만 발행하고 웹 서버도 CSV를 읽는다
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# 로거 설정
+logger = get_default_logger(__name__)
+
+# 스냅샷 설정 (apps/data_cache.py 와 동일한 이름을 사용해야 함)
+SNAPSHOT_DIR_NAME = "snapshots"  # 월별 디렉토리 아래 스냅샷 보관 디렉토리
+POINTER_FILE_NAME = "CURRENT"    # 현재 공개 중인 스냅샷 버전을 가리키는 포인터 파일
+KEEP_SNAPSHOTS = 3               # 보관할 최근 스냅샷 개수
+
+# 웹 서버가 읽는 파이프라인 결과 파일 목록
+PUBLISHED_FILES = [
+    "hr_index_final.csv",
+    "prev_hr_index_final.csv",
+    "lms_learning_final.csv",
+    "hong_data_manager_final.csv",
+    "hong_data_plan_final.csv",
+    "index_management_final.csv",
+    "join_hr_lms.csv",
+    "course_aggregates.csv",
+    "logic.csv",
+    "logic_cube.csv",
+]
+
+
+def write_arrow_copy(csv_path, arrow_path):
+    """
+    CSV를 비압축 Arrow IPC 파일로 변환 (웹 서버에서 메모리 맵으로 공유)
+    웹 서버의 read_csv 결과와 타입이 같도록 CSV를 다시 읽어서 변환한다.
+
+    Returns:
+        bool: 변환 성공 여부 (실패해도 CSV는 그대로 발행됨)
+    """
+    if pa is None:
+        return False
+
+    try:
+        df = pd.read_csv(csv_path)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(arrow_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return True
+    except Exception as e:
+        # 혼합 타입 컬럼 등 Arrow로 변환할 수 없는 파일은 CSV만 사용
+        logger.warning(f"  - Arrow 변환 실패 (CSV만 발행): {csv_path} ({e})")
+        if os.path.exists(arrow_path):
+            os.remove(arrow_path)
+        return False
+
+
+def read_current_version(file_directory):
+    """
+    현재 공개 중인 스냅샷 버전을 반환 (없으면 None)
+    """
+    pointer_path = os.path.join(file_directory, POINTER_FILE_NAME)
+    if not os.path.exists(pointer_path):
+        return None
+    with open(pointer_path, 'r', encoding='utf-8') as f:
+        version = f.read().strip()
+    return version or None
+
+
+def _new_version(snapshot_root):
+    """
+    새 스냅샷 버전명 생성 (타임스탬프, 같은 초에 중복되면 접미사 추가)
+    """
+    version = datetime.now().strftime('%Y%m%d%H%M%S')
+    candidate = version
+    suffix = 1
+    while os.path.exists(os.path.join(snapshot_root, candidate)):
+        candidate = f"{version}_{suffix}"
+        suffix += 1
+    return candidate
+
+
+def _prune_snapshots(snapshot_root, current_version, keep=KEEP_SNAPSHOTS):
+    """
+    오래된 스냅샷 삭제 (현재 버전과 최근 keep개는 유지)
+    """
+    versions = sorted(
+        name for name in os.listdir(snapshot_root)
+        if os.path.isdir(os.path.join(snapshot_root, name)) and not name.startswith('.')
+    )
+    for version in versions[:-keep]:
+        if version == current_version:
+            continue
+        shutil.rmtree(os.path.join(snapshot_root, version), ignore_errors=True)
+        logger.info(f"  - 오래된 스냅샷 삭제: {version}")
+
+
+def publish_month_snapshot(file_directory, files=None):
+    """
+    파이프라인 결과를 버전별 스냅샷으로 발행
+
+    1. snapshots/.<version>.tmp 에 결과 파일 복사 (+ 메모리 맵용 .arrow 사본)
+    2. 디렉토리 rename 으로 snapshots/<version> 완성 (반쯤 쓰인 파일이 보이지 않음)
+    3. CURRENT.tmp 작성 후 os.replace 로 포인터 원자적 교체
+
+    Args:
+        file_directory: 월별 작업 디렉토리 (예: data/9)
+        files: 발행할 파일 목록 (기본값: PUBLISHED_FILES)
+
+    Returns:
+        str: 발행된 스냅샷 버전 (실패 시 None)
+    """
+    logger.info("=== 결과 스냅샷 발행 시작 ===")
+    files = files or PUBLISHED_FILES
+
+    snapshot_root = os.path.join(file_directory, SNAPSHOT_DIR_NAME)
+    os.makedirs(snapshot_root, exist_ok=True)
+
+    version = _new_version(snapshot_root)
+    tmp_dir = os.path.join(snapshot_root, f".{version}.tmp")
+    final_dir = os.path.join(snapshot_root, version)
+
+    try:
+        os.makedirs(tmp_dir)
+        copied = 0
+        for file_name in files:
+            source_path = os.path.join(file_directory, file_name)
+            if not os.path.exists(source_path):
+                logger.warning(f"  - 발행 대상 파일 없음 (건너뜀): {source_path}")
+                continue
+            shutil.copy2(source_path, os.path.join(tmp_dir, file_name))
+            write_arrow_copy(source_path, os.path.join(tmp_dir, os.path.splitext(file_name)[0] + '.arrow'))
+            copied += 1
+
+        if copied == 0:
+            logger.error("✗ 발행할 결과 파일이 없습니다.")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+        # 스냅샷 디렉토리 완성
+        os.rename(tmp_dir, final_dir)
+
+        # 포인터 원자적 교체
+        pointer_path = os.path.join(file_directory, POINTER_FILE_NAME)
+        pointer_tmp = f"{pointer_path}.tmp"
+        with open(pointer_tmp, 'w', encoding='utf-8') as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(pointer_tmp, pointer_path)
+
+        logger.info(f"✓ 스냅샷 발행 완료: {final_dir} ({copied}개 파일)")
+
+        _prune_snapshots(snapshot_root, version)
+        logger.info("=== 결과 스냅샷 발행 완료 ===")
+        return version
+
+    except Exception as e:
+        logger.error(f"✗ 스냅샷 발행 중 오류 발생: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+
+
+if __name__ == "__main__":
+    import sys
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.path.join("data", "year=2025", "month=09")
+    sys.exit(0 if publish_month_snapshot(directory) else 1)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정적 JSON API 렌더링 모듈
+스냅샷 발행 후 읽기 전용 데이터 API 응답을 미리 렌더링하여
+nginx가 Flask를 거치지 않고 직접 제공할 수 있도록 .json / .json.gz 파일로 저장합니다.
+
+출력 구조 (nginx 의 try_files $uri.json 과 대응):
+    <STATIC_API_DIR>/api/global-logic-data/9.json
+    <STATIC_API_DIR>/api/global-logic-data/9.json.gz
+    <STATIC_API_DIR>/api/region-logic-data/North America/9.json
+    ...
+"""
+
+import os
+import gzip
+from logger_config import get_default_logger
+
+# 로거 설정
+logger = get_default_logger(__name__)
+
+# 정적 API 출력 디렉토리 (nginx 컨테이너에 읽기 전용으로 마운트)
+STATIC_API_DIR = os.getenv('STATIC_API_DIR', os.path.join("data", "static_api"))
+
+# 월 단위 API {URL: ApiPayloads 함수}
+MONTH_ENDPOINTS = {
+    "/api/subsidiaries/{month}": 'subsidiaries',
+    "/api/regions/{month}": 'regions',
+    "/api/subsidiary-summary/{month}": 'subsidiary_summary',
+    "/api/global-logic-data/{month}": 'global_logic_data',
+    "/api/global-region-metrics/{month}": 'global_region_metrics',
+    "/api/global-infos/{month}": 'global_infos',
+    "/api/all-subsidiary-metrics/{month}": 'all_subsidiary_metrics',
+    "/api/global-bundle/{month}": 'global_bundle',
+}
+
+# Region 단위 API
+REGION_ENDPOINTS = {
+    "/api/region-logic-data/{region}/{month}": 'region_logic_data',
+    "/api/region-infos/{region}/{month}": 'region_infos',
+    "/api/region-course-list/{region}/{month}": 'region_course_list',
+    "/api/region-subsidiary-list/{region}/{month}": 'region_subsidiary_list',
+    "/api/region-subsidiary-metrics/{region}/{month}": 'region_subsidiary_metrics',
+    "/api/region-summary/{region}/{month}": 'region_summary',
+    "/api/region-bundle/{region}/{month}": 'region_bundle',
+}
+
+# Subsidiary 단위 API
+SUBSIDIARY_ENDPOINTS = {
+    "/api/subsidiary-detail/{subsidiary}/{month}": 'subsidiary_detail',
+    "/api/logic-course-completion/{subsidiary}/{month}": 'logic_course_completion',
+    "/api/course-list/{subsidiary}/{month}": 'course_list',
+    "/api/subsidiary-bundle/{subsidiary}/{month}": 'subsidiary_bundle',
+}
+
+# 월과 무관한 API
+GLOBAL_ENDPOINTS = {
+    "/api/months": 'months',
+}
+
+
+def _write_atomic(path, data):
+    """임시 파일 작성 후 os.replace 로 교체 (nginx가 반쯤 쓰인 파일을 읽지 않도록)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_payload(output_dir, url_path, body):
+    """응답 본문을 <url_path>.json 과 사전 압축된 .json.gz 로 저장"""
+    file_path = os.path.join(output_dir, url_path.lstrip('/')) + ".json"
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    _write_atomic(file_path, body)
+    # mtime=0: 같은 본문이면 같은 압축 결과
+    _write_atomic(f"{file_path}.gz", gzip.compress(body, compresslevel=9, mtime=0))
+    return file_path
+
+
+def _render_paths(payloads, output_dir, requests):
+    """
+    (URL, payload 함수, 인자) 목록을 렌더링하여 저장 - 저장된 파일 경로 집합 반환
+    Flask 앱 / 라우트를 거치지 않고 웹 API와 같은 payload 함수를 직접 호출한다
+    """
+    from apps.serializers import dumps
+
+    written = set()
+    for url_path, name, args in requests:
+        result = getattr(payloads, name)(*args)
+        status = result[1] if isinstance(result, tuple) else 200
+        if status != 200:
+            # 데이터가 없거나 오류인 응답은 저장하지 않음 (nginx가 Flask로 전달)
+            logger.warning(f"  - 렌더링 건너뜀 ({status}): {url_path}")
+            continue
+        file_path = _write_payload(output_dir, url_path, dumps(result))
+        written.add(file_path)
+        written.add(f"{file_path}.gz")
+    return written
+
+
+def _remove_stale_files(output_dir, month, written):
+    """이번에 렌더링되지 않은 해당 월 파일 삭제 (사라진 Region/법인 등)"""
+    month_names = {f"{month}.json", f"{month}.json.gz"}
+    removed = 0
+    for root, _, files in os.walk(output_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            if name in month_names and path not in written:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def render_month(month, output_dir=STATIC_API_DIR):
+    """
+    특정 월의 모든 읽기 전용 API 응답을 렌더링
+    해당 월만 로드한 DataCache 로 섹션별 payload 를 한 번씩 계산하여 단독 API 와 번들 API 파일에 함께 사용한다
+
+    Returns:
+        int: 저장된 응답 수
+    """
+    from apps.data_cache import DataCache
+    from apps.payloads import ApiPayloads
+
+    payloads = ApiPayloads(DataCache(months=[month]), memoize=True)
+    regions = payloads.cache.get_regions_by_month(month)
+    subsidiaries = payloads.cache.get_subsidiaries_by_month(month)
+
+    requests = [(path.format(month=month), name, (month,)) for path, name in MONTH_ENDPOINTS.items()]
+    requests += [
+        (path.format(region=region, month=month), name, (region, month))
+        for region in regions if '/' not in str(region)
+        for path, name in REGION_ENDPOINTS.items()
+    ]
+    requests += [
+        (path.format(subsidiary=subsidiary, month=month), name, (subsidiary, month))
+        for subsidiary in subsidiaries if '/' not in str(subsidiary)
+        for path, name in SUBSIDIARY_ENDPOINTS.items()
+    ]
+
+    written = _render_paths(payloads, output_dir, requests)
+    removed = _remove_stale_files(output_dir, month, written)
+
+    logger.info(f"  - {month}월: {len(written) // 2}/{len(requests)}개 응답 렌더링 "
+                f"(Region {len(regions)}개, 법인 {len(subsidiaries)}개, 이전 파일 {removed}개 삭제)")
+    return len(written) // 2
+
+
+def render_static_api(months=None, output_dir=STATIC_API_DIR):
+    """
+    정적 JSON API 렌더링 (파이프라인 스냅샷 발행 이후 실행)
+
+    Args:
+        months: 렌더링할 월 목록 (기본값: 데이터가 있는 모든 월)
+        output_dir: 출력 디렉토리
+
+    Returns:
+        bool: 성공 여부
+    """
+    logger.info("=== 정적 JSON API 렌더링 시작 ===")
+
+    try:
+        from apps.data_cache import data_cache
+        from apps.payloads import ApiPayloads
+
+        months = months or data_cache.get_all_months_with_data()
+        total = 0
+        for month in months:
+            total += render_month(month, output_dir)
+        _render_paths(ApiPayloads(data_cache), output_dir, [(path, name, ()) for path, name in GLOBAL_ENDPOINTS.items()])
+
+        logger.info(f"✓ 정적 JSON API 렌더링 완료: {output_dir} ({total}개 응답)")
+        logger.info("=== 정적 JSON API 렌더링 완료 ===")
+        return True
+
+    except Exception as e:
+        logger.error(f"✗ 정적 JSON API 렌더링 중 오류 발생: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    import sys
+    target_months = [int(arg) for arg in sys.argv[1:]] or None
+    sys.exit(0 if render_static_api(target_months) else 1)